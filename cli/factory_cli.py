@@ -6,6 +6,7 @@ CLI for generating Cursor agent development systems.
 Usage:
     python factory_cli.py --config project.yaml --output C:\\Projects\\my-project
     python factory_cli.py --blueprint python-fastapi --output C:\\Projects\\my-project
+    python factory_cli.py --batch a.yaml b.json --output C:\\Projects
     python factory_cli.py --interactive --output C:\\Projects\\my-project
     python factory_cli.py --list-blueprints
 
@@ -25,6 +26,7 @@ from scripts.core.generate_project import (
     ProjectConfig,
     ProjectGenerator,
     create_quickstart_config,
+    generate_batch,
 )
 
 
@@ -928,6 +930,44 @@ def generate_from_config_file(config_path: str, output_dir: str) -> None:
         sys.exit(1)
 
 
+def generate_batch_from_config_files(
+    config_paths: list, output_dir: str, workers: int = None
+) -> None:
+    """Generate one project per configuration file.
+
+    Args:
+        config_paths: Paths to configuration files (YAML or JSON).
+        output_dir: Directory receiving one subdirectory per project.
+        workers: Number of worker processes (default: one per CPU).
+    """
+    missing = [path for path in config_paths if not os.path.exists(path)]
+    if missing:
+        for path in missing:
+            print(f"[ERROR] Configuration file not found: {path}")
+        sys.exit(1)
+
+    print(f"\n[*] Batch generating {len(config_paths)} projects into {output_dir}\n")
+    summary = generate_batch(config_paths, output_dir, workers=workers)
+
+    for project in summary["projects"]:
+        status = "OK" if project["success"] else "FAILED"
+        print(
+            f"   [{status}] {project['project_name'] or project['config']}"
+            f" - {project['files_created']} files in {project['seconds']:.2f}s"
+        )
+        for error in project["errors"]:
+            print(f"      - {error}")
+
+    print(
+        f"\n[*] {summary['succeeded']} succeeded, {summary['failed']} failed"
+        f" in {summary['total_seconds']:.2f}s ({summary['workers']} workers)"
+    )
+    print(f"   Summary: {summary['summary_path']}")
+
+    if summary["failed"]:
+        sys.exit(1)
+
+
 def analyze_repository(repo_path: str) -> None:
     """Analyze an existing repository for Cursor artifacts.
 
@@ -1105,11 +1145,16 @@ def _offer_knowledge_extension(blueprint_id: str = None) -> None:
     print("-" * 60)
 
     try:
-        from scripts.analysis.knowledge_gap_analyzer import KnowledgeGapAnalyzer
+        from scripts.analysis.knowledge_gap_analyzer import (
+            DEFAULT_INDEX_PATH,
+            KnowledgeGapAnalyzer,
+        )
 
         factory_root = get_factory_root()
         analyzer = KnowledgeGapAnalyzer(
-            factory_root / "knowledge", factory_root / "scripts" / "taxonomy"
+            factory_root / "knowledge",
+            factory_root / "scripts" / "taxonomy",
+            index_path=DEFAULT_INDEX_PATH,
         )
         result = analyzer.analyze("agent_taxonomy.json")
 
@@ -1295,6 +1340,7 @@ def analyze_knowledge_gaps(scope: str = "all", filter_value: str = None) -> None
         filter_value: Filter value for the scope
     """
     from scripts.analysis.knowledge_gap_analyzer import (
+        DEFAULT_INDEX_PATH,
         KnowledgeGapAnalyzer,
         GapPriority,
     )
@@ -1307,7 +1353,9 @@ def analyze_knowledge_gaps(scope: str = "all", filter_value: str = None) -> None
 
     factory_root = get_factory_root()
     analyzer = KnowledgeGapAnalyzer(
-        factory_root / "knowledge", factory_root / "scripts" / "taxonomy"
+        factory_root / "knowledge",
+        factory_root / "scripts" / "taxonomy",
+        index_path=DEFAULT_INDEX_PATH,
     )
 
     try:
@@ -1609,7 +1657,10 @@ def validate_dependencies() -> int:
     Returns:
         Exit code (0 = valid, 1 = errors found)
     """
-    from scripts.validation.dependency_validator import DependencyValidator
+    from scripts.validation.dependency_validator import (
+        DEFAULT_CACHE_PATH,
+        DependencyValidator,
+    )
 
     print()
     print("=" * 60)
@@ -1618,7 +1669,7 @@ def validate_dependencies() -> int:
     print()
 
     factory_root = Path(__file__).parent.parent
-    validator = DependencyValidator(factory_root)
+    validator = DependencyValidator(factory_root, cache_path=DEFAULT_CACHE_PATH)
     validator.scan_artifacts()
 
     result = validator.validate()
@@ -1658,7 +1709,10 @@ def show_dependents(node_id: str) -> None:
     Args:
         node_id: Node identifier (e.g., knowledge:fastapi-patterns.json)
     """
-    from scripts.validation.dependency_validator import DependencyValidator
+    from scripts.validation.dependency_validator import (
+        DEFAULT_CACHE_PATH,
+        DependencyValidator,
+    )
 
     print()
     print("=" * 60)
@@ -1667,7 +1721,7 @@ def show_dependents(node_id: str) -> None:
     print()
 
     factory_root = Path(__file__).parent.parent
-    validator = DependencyValidator(factory_root)
+    validator = DependencyValidator(factory_root, cache_path=DEFAULT_CACHE_PATH)
     validator.scan_artifacts()
 
     dependents = validator.reverse_lookup(node_id)
@@ -1687,7 +1741,10 @@ def show_impact_analysis(node_id: str) -> None:
     Args:
         node_id: Node identifier (e.g., skill:grounding)
     """
-    from scripts.validation.dependency_validator import DependencyValidator
+    from scripts.validation.dependency_validator import (
+        DEFAULT_CACHE_PATH,
+        DependencyValidator,
+    )
 
     print()
     print("=" * 60)
@@ -1696,7 +1753,7 @@ def show_impact_analysis(node_id: str) -> None:
     print()
 
     factory_root = Path(__file__).parent.parent
-    validator = DependencyValidator(factory_root)
+    validator = DependencyValidator(factory_root, cache_path=DEFAULT_CACHE_PATH)
     validator.scan_artifacts()
 
     affected = validator.impact_analysis(node_id)
@@ -1725,7 +1782,10 @@ def show_impact_analysis(node_id: str) -> None:
 
 def show_dependency_order() -> None:
     """Show topological installation order for all artifacts."""
-    from scripts.validation.dependency_validator import DependencyValidator
+    from scripts.validation.dependency_validator import (
+        DEFAULT_CACHE_PATH,
+        DependencyValidator,
+    )
     from graphlib import CycleError
 
     print()
@@ -1735,7 +1795,7 @@ def show_dependency_order() -> None:
     print()
 
     factory_root = Path(__file__).parent.parent
-    validator = DependencyValidator(factory_root)
+    validator = DependencyValidator(factory_root, cache_path=DEFAULT_CACHE_PATH)
     validator.scan_artifacts()
 
     try:
@@ -1753,7 +1813,10 @@ def show_dependency_order() -> None:
 
 def show_dependency_stats() -> None:
     """Show dependency graph statistics."""
-    from scripts.validation.dependency_validator import DependencyValidator
+    from scripts.validation.dependency_validator import (
+        DEFAULT_CACHE_PATH,
+        DependencyValidator,
+    )
 
     print()
     print("=" * 60)
@@ -1762,7 +1825,7 @@ def show_dependency_stats() -> None:
     print()
 
     factory_root = Path(__file__).parent.parent
-    validator = DependencyValidator(factory_root)
+    validator = DependencyValidator(factory_root, cache_path=DEFAULT_CACHE_PATH)
     validator.scan_artifacts()
 
     stats = validator.get_statistics()
@@ -1788,10 +1851,13 @@ def export_dependency_graph(output_file: str) -> None:
     Args:
         output_file: Path to output JSON file
     """
-    from scripts.validation.dependency_validator import DependencyValidator
+    from scripts.validation.dependency_validator import (
+        DEFAULT_CACHE_PATH,
+        DependencyValidator,
+    )
 
     factory_root = Path(__file__).parent.parent
-    validator = DependencyValidator(factory_root)
+    validator = DependencyValidator(factory_root, cache_path=DEFAULT_CACHE_PATH)
     validator.scan_artifacts()
 
     graph = validator.export_graph()
@@ -1824,6 +1890,7 @@ Examples:
   # Generate new project from scratch
   %(prog)s --blueprint python-fastapi --output C:\\Projects\\my-api
   %(prog)s --config project.yaml --output C:\\Projects\\my-project
+  %(prog)s --batch team-a.yaml team-b.yaml --output C:\\Projects --workers 4
   %(prog)s --interactive --output C:\\Projects\\my-project
 
   # Generate with Project Management System
@@ -1877,6 +1944,21 @@ Examples:
         help="Generate from a configuration file (YAML or JSON)",
     )
 
+    parser.add_argument(
+        "--batch",
+        type=str,
+        nargs="+",
+        metavar="FILE",
+        help="Generate one project per configuration file into --output",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="Worker processes for --batch (default: one per CPU)",
+    )
+
     parser.add_argument(
         "--interactive",
         action="store_true",
@@ -2150,7 +2232,7 @@ Examples:
         return
 
     # Validate output directory for generation commands
-    if args.blueprint or args.config or args.interactive:
+    if args.blueprint or args.config or args.batch or args.interactive:
         if not args.output:
             print("[ERROR] --output is required for generation")
             parser.print_help()
@@ -2171,6 +2253,8 @@ Examples:
         )
     elif args.config:
         generate_from_config_file(args.config, args.output)
+    elif args.batch:
+        generate_batch_from_config_files(args.batch, args.output, args.workers)
     else:
         parser.print_help()
 
@@ -6,7 +6,8 @@ Storage and lookup for agent contracts.
 
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+import heapq
 import json
 import logging
 import threading
@@ -26,6 +27,13 @@ class ContractRegistry:
     - Signature management
     - Optional persistence
 
+    Lookups are served from indexes maintained on add/remove
+    (agent -> contracts, (agent, role) -> contracts, and an expiry heap),
+    so their cost depends on an agent's own contracts rather than on the
+    size of the registry. Party lists are treated as immutable once a
+    contract is registered; re-add a contract after changing its parties
+    or expiry.
+
     Usage:
         registry = ContractRegistry()
         contract = registry.create_contract(parties, capabilities)
@@ -45,6 +53,11 @@ class ContractRegistry:
         self._contracts: Dict[str, AgentContract] = {}
         self._lock = threading.RLock()
 
+        # Indexes (dicts used as insertion-ordered sets of contract IDs)
+        self._by_agent: Dict[str, Dict[str, None]] = {}
+        self._by_role: Dict[Tuple[str, str], Dict[str, None]] = {}
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+
         if self.storage_path and self.storage_path.exists():
             self._load()
 
@@ -68,7 +81,9 @@ class ContractRegistry:
             contract: The contract to add.
         """
         with self._lock:
+            previous = self._contracts.get(contract.contract_id)
             self._contracts[contract.contract_id] = contract
+            self._reindex(contract.contract_id, previous, contract)
             logger.info(f"Added contract {contract.contract_id}")
 
             if self.storage_path:
@@ -99,7 +114,8 @@ class ContractRegistry:
         """
         with self._lock:
             if contract_id in self._contracts:
-                del self._contracts[contract_id]
+                contract = self._contracts.pop(contract_id)
+                self._reindex(contract_id, contract, None)
                 logger.info(f"Removed contract {contract_id}")
 
                 if self.storage_path:
@@ -150,7 +166,8 @@ class ContractRegistry:
                 )
                 return False
 
-            # Add signature
+            # Add signature (activity is checked per lookup, so the party
+            # indexes need no update here)
             contract.signatures[agent_id] = signature
             logger.info(f"Agent {agent_id} signed contract {contract_id}")
 
@@ -162,6 +179,45 @@ class ContractRegistry:
 
             return True
 
+    @staticmethod
+    def _index_keys(
+        contract: Optional[AgentContract],
+    ) -> Tuple[Dict[str, None], Dict[Tuple[str, str], None]]:
+        """Agent and (agent, role) index keys for a contract."""
+        if contract is None:
+            return {}, {}
+        agents = {p.agent_id: None for p in contract.parties}
+        roles = {(p.agent_id, p.role): None for p in contract.parties}
+        return agents, roles
+
+    def _reindex(
+        self,
+        contract_id: str,
+        old: Optional[AgentContract],
+        new: Optional[AgentContract],
+    ) -> None:
+        """Move a contract's index entries from ``old`` to ``new`` state."""
+        old_agents, old_roles = self._index_keys(old)
+        new_agents, new_roles = self._index_keys(new)
+
+        for index, old_keys, new_keys in (
+            (self._by_agent, old_agents, new_agents),
+            (self._by_role, old_roles, new_roles),
+        ):
+            for key in old_keys:
+                if key not in new_keys:
+                    bucket = index.get(key)
+                    if bucket is not None:
+                        bucket.pop(contract_id, None)
+                        if not bucket:
+                            del index[key]
+            for key in new_keys:
+                index.setdefault(key, {})[contract_id] = None
+
+        # Stale heap entries are skipped lazily in cleanup_expired
+        if new is not None and new.expires:
+            heapq.heappush(self._expiry_heap, (new.expires, contract_id))
+
     def find_contracts(
         self, agent_a: str, agent_b: Optional[str] = None, active_only: bool = True
     ) -> List[AgentContract]:
@@ -177,22 +233,19 @@ class ContractRegistry:
             Matching contracts.
         """
         with self._lock:
-            results = []
-
-            for contract in self._contracts.values():
-                if active_only and not contract.is_active:
-                    continue
+            candidates = self._by_agent.get(agent_a, {})
 
-                party_ids = {p.agent_id for p in contract.parties}
+            if agent_b:
+                # Walk the smaller bucket; both keep registration order
+                other = self._by_agent.get(agent_b, {})
+                small, large = sorted((candidates, other), key=len)
+                candidates = [cid for cid in small if cid in large]
 
-                # Check if agent_a is a party
-                if agent_a not in party_ids:
-                    continue
-
-                # If agent_b specified, check if it's also a party
-                if agent_b and agent_b not in party_ids:
+            results = []
+            for cid in candidates:
+                contract = self._contracts[cid]
+                if active_only and not contract.is_active:
                     continue
-
                 results.append(contract)
 
             return results
@@ -214,12 +267,12 @@ class ContractRegistry:
         with self._lock:
             results = []
 
-            for contract in self._contracts.values():
+            for cid in self._by_role.get((agent_id, role), {}):
+                contract = self._contracts[cid]
                 if active_only and not contract.is_active:
                     continue
-
-                agent_role = contract.get_role(agent_id)
-                if agent_role == role:
+                # First matching party decides the role, as in get_role()
+                if contract.get_role(agent_id) == role:
                     results.append(contract)
 
             return results
@@ -237,10 +290,10 @@ class ContractRegistry:
         with self._lock:
             roles = {}
 
-            for contract in self._contracts.values():
-                role = contract.get_role(agent_id)
+            for cid in self._by_agent.get(agent_id, {}):
+                role = self._contracts[cid].get_role(agent_id)
                 if role:
-                    roles[contract.contract_id] = role
+                    roles[cid] = role
 
             return roles
 
@@ -253,14 +306,17 @@ class ContractRegistry:
         """
         with self._lock:
             now = datetime.now(timezone.utc)
-            expired = [
-                cid
-                for cid, c in self._contracts.items()
-                if c.expires and c.expires < now
-            ]
+            expired = []
 
-            for cid in expired:
+            while self._expiry_heap and self._expiry_heap[0][0] < now:
+                expires, cid = heapq.heappop(self._expiry_heap)
+                contract = self._contracts.get(cid)
+                # Skip entries for removed or re-added contracts
+                if contract is None or contract.expires != expires:
+                    continue
                 del self._contracts[cid]
+                self._reindex(cid, contract, None)
+                expired.append(cid)
 
             if expired:
                 logger.info(f"Cleaned up {len(expired)} expired contracts")
@@ -295,4 +351,6 @@ class ContractRegistry:
             data = json.load(f)
 
         for cid, cdata in data.get("contracts", {}).items():
-            self._contracts[cid] = AgentContract.from_dict(cdata)
+            contract = AgentContract.from_dict(cdata)
+            self._reindex(cid, self._contracts.get(cid), contract)
+            self._contracts[cid] = contract
@@ -5,9 +5,11 @@ Verifies agent messages and actions against contracts.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import heapq
+import itertools
 import logging
 
 from lib.society.contracts.schema import AgentContract, Obligation
@@ -125,6 +127,9 @@ class ContractVerifier:
                 print(f"Violation: {v.message}")
     """
 
+    # Obligation timeout when the contract does not specify timeout_ms
+    DEFAULT_OBLIGATION_TIMEOUT_MS = 30000
+
     def __init__(self, registry: ContractRegistry):
         """
         Initialize verifier.
@@ -135,6 +140,11 @@ class ContractVerifier:
         self.registry = registry
         self._obligation_trackers: Dict[str, Dict[str, datetime]] = {}
 
+        # Deadline-ordered queue of triggered obligations:
+        # (deadline, seq, contract_id, agent_id, trigger, triggered_at)
+        self._deadlines: List[Tuple[datetime, int, str, str, str, datetime]] = []
+        self._deadline_seq = itertools.count()
+
     def verify_message(
         self, sender: str, receiver: str, message: Message
     ) -> ContractVerificationResult:
@@ -293,9 +303,95 @@ class ContractVerifier:
         if key not in self._obligation_trackers:
             self._obligation_trackers[key] = {}
 
-        self._obligation_trackers[key][trigger] = datetime.now(timezone.utc)
+        triggered_at = datetime.now(timezone.utc)
+        self._obligation_trackers[key][trigger] = triggered_at
+
+        deadline = triggered_at + timedelta(
+            milliseconds=self._trigger_timeout_ms(contract_id, agent_id, trigger)
+        )
+        heapq.heappush(
+            self._deadlines,
+            (
+                deadline,
+                next(self._deadline_seq),
+                contract_id,
+                agent_id,
+                trigger,
+                triggered_at,
+            ),
+        )
         logger.debug(f"Tracked obligation trigger: {trigger} for {agent_id}")
 
+    def _role_obligations(self, contract_id: str, agent_id: str) -> List[Obligation]:
+        """Obligations of the agent's role in a contract."""
+        contract = self.registry.get(contract_id)
+        if not contract:
+            return []
+
+        role = contract.get_role(agent_id)
+        if not role:
+            return []
+
+        return contract.obligations.get(role, [])
+
+    def _trigger_timeout_ms(
+        self, contract_id: str, agent_id: str, trigger: str
+    ) -> float:
+        """Earliest timeout among obligations activated by a trigger."""
+        timeouts = [
+            o.parameters.get("timeout_ms", self.DEFAULT_OBLIGATION_TIMEOUT_MS)
+            for o in self._role_obligations(contract_id, agent_id)
+            if o.trigger == trigger
+        ]
+        # Unknown contracts use the default so the entry is still revisited
+        return min(timeouts, default=self.DEFAULT_OBLIGATION_TIMEOUT_MS)
+
+    def get_overdue_obligations(
+        self, now: Optional[datetime] = None
+    ) -> List[Tuple[str, str, Obligation]]:
+        """
+        Get all overdue obligations across contracts.
+
+        Reads the deadline-ordered queue up to ``now`` instead of scanning
+        every tracked contract; entries for fulfilled triggers are dropped.
+
+        Args:
+            now: Reference time (defaults to current time).
+
+        Returns:
+            List of (contract_id, agent_id, obligation) tuples, earliest
+            deadline first.
+        """
+        now = now or datetime.now(timezone.utc)
+        overdue: List[Tuple[str, str, Obligation]] = []
+        still_due = []
+
+        while self._deadlines and self._deadlines[0][0] <= now:
+            entry = heapq.heappop(self._deadlines)
+            _, _, contract_id, agent_id, trigger, triggered_at = entry
+
+            tracked = self._obligation_trackers.get(f"{contract_id}:{agent_id}", {})
+            if tracked.get(trigger) != triggered_at:
+                continue  # Fulfilled or re-triggered since
+
+            elapsed_ms = (now - triggered_at).total_seconds() * 1000
+            for obligation in self._role_obligations(contract_id, agent_id):
+                if obligation.trigger != trigger:
+                    continue
+                timeout_ms = obligation.parameters.get(
+                    "timeout_ms", self.DEFAULT_OBLIGATION_TIMEOUT_MS
+                )
+                if elapsed_ms > timeout_ms:
+                    overdue.append((contract_id, agent_id, obligation))
+
+            # Still unfulfilled: keep it queued for later checks
+            still_due.append(entry)
+
+        for entry in still_due:
+            heapq.heappush(self._deadlines, entry)
+
+        return overdue
+
     def fulfill_obligation(self, contract_id: str, agent_id: str, action: str) -> bool:
         """
         Mark an obligation as fulfilled.
@@ -341,26 +437,21 @@ class ContractVerifier:
         Returns:
             List of pending obligations.
         """
-        contract = self.registry.get(contract_id)
-        if not contract:
-            return []
-
-        role = contract.get_role(agent_id)
-        if not role:
-            return []
-
         key = f"{contract_id}:{agent_id}"
-        tracked = self._obligation_trackers.get(key, {})
+        tracked = self._obligation_trackers.get(key)
+        if not tracked:
+            return []
 
+        now = datetime.now(timezone.utc)
         pending = []
-        for obligation in contract.obligations.get(role, []):
+        for obligation in self._role_obligations(contract_id, agent_id):
             if obligation.trigger in tracked:
                 # Check if timeout exceeded
                 triggered_at = tracked[obligation.trigger]
-                timeout_ms = obligation.parameters.get("timeout_ms", 30000)
-                elapsed_ms = (
-                    datetime.now(timezone.utc) - triggered_at
-                ).total_seconds() * 1000
+                timeout_ms = obligation.parameters.get(
+                    "timeout_ms", self.DEFAULT_OBLIGATION_TIMEOUT_MS
+                )
+                elapsed_ms = (now - triggered_at).total_seconds() * 1000
 
                 if elapsed_ms > timeout_ms:
                     pending.append(obligation)
@@ -42,7 +42,11 @@ SDG - Love - Truth - Beauty
 
 from lib.society.integration.context import SocietyContext
 from lib.society.integration.agent_bridge import AgentSocietyBridge, BridgeResult
-from lib.society.integration.message_router import MessageRouter, RoutedMessage
+from lib.society.integration.message_router import (
+    BackpressurePolicy,
+    MessageRouter,
+    RoutedMessage,
+)
 
 __all__ = [
     "SocietyContext",
@@ -50,4 +54,5 @@ __all__ = [
     "BridgeResult",
     "MessageRouter",
     "RoutedMessage",
+    "BackpressurePolicy",
 ]
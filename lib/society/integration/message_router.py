@@ -8,18 +8,39 @@ Provides:
 - Message routing with verification
 - Broadcast messaging to multiple agents
 - Message queue management
+- Optional asynchronous delivery with bounded per-agent queues
 """
 
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, TYPE_CHECKING
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from lib.society.integration.context import SocietyContext
 
+import json
 import logging
+import os
+import queue
+import re
+import threading
+import time
 import uuid
+import weakref
 
 from lib.society.events import AgentEvent, ActionType
 from lib.society.integration.agent_bridge import AgentSocietyBridge
@@ -35,6 +56,15 @@ class RouteStatus(Enum):
     FAILED = "failed"
     NO_RECIPIENT = "no_recipient"
     VERIFICATION_FAILED = "verification_failed"
+    DROPPED = "dropped"
+
+
+class BackpressurePolicy(Enum):
+    """What asynchronous delivery does when an agent's queue is full."""
+
+    DROP = "drop"  # Reject the new message
+    BLOCK = "block"  # Wait for space (up to block_timeout), then drop
+    SPILL = "spill"  # Append to an on-disk overflow file
 
 
 @dataclass
@@ -98,18 +128,76 @@ class MessageRouter:
         # Or manually route an event:
         result = router.route(event)
 
+        # Decouple delivery from EventStore.append:
+        router = MessageRouter(context, async_delivery=True, workers=4)
+        router.flush()  # Wait for in-flight deliveries
+
     SDG - Love - Truth - Beauty
     """
 
-    def __init__(self, context: "SocietyContext"):
+    # Number of recent delivery latencies kept for statistics
+    LATENCY_WINDOW = 1000
+
+    def __init__(
+        self,
+        context: "SocietyContext",
+        async_delivery: bool = False,
+        workers: int = 4,
+        queue_size: int = 1000,
+        batch_size: int = 32,
+        backpressure: BackpressurePolicy = BackpressurePolicy.DROP,
+        block_timeout: float = 5.0,
+        spill_dir: Optional[str] = None,
+    ):
         """
         Initialize message router.
 
         Args:
             context: Shared society context.
+            async_delivery: Deliver from a worker pool instead of inside
+                the event listener callback.
+            workers: Dispatcher worker threads (async delivery only).
+            queue_size: Per-agent queue bound (async delivery only).
+            batch_size: Messages a worker delivers per agent turn.
+            backpressure: Policy applied when an agent queue is full.
+            block_timeout: Seconds to wait for space with BLOCK policy.
+            spill_dir: Directory for SPILL overflow files. Files left by
+                an earlier router are only re-queued by replay_spilled().
         """
         self.context = context
 
+        # Asynchronous delivery settings
+        self.async_delivery = async_delivery
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.batch_size = max(1, batch_size)
+        self.backpressure = backpressure
+        self.block_timeout = block_timeout
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        if backpressure == BackpressurePolicy.SPILL and self.spill_dir is None:
+            raise ValueError("spill_dir is required for SPILL backpressure")
+
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._pending: Dict[str, Deque[Tuple[RoutedMessage, float]]] = {}
+        self._spilled: Dict[str, int] = {}
+        # Per agent: (record, serialized line) awaiting the spill file
+        self._spill_buffer: Dict[str, List[Tuple[Dict[str, Any], str]]] = {}
+        self._spill_locks: Dict[str, threading.Lock] = {}
+        self._spill_token = uuid.uuid4().hex[:12]
+        self._spilled_refs: "weakref.WeakValueDictionary[str, RoutedMessage]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._scheduled: Set[str] = set()
+        self._ready: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._in_flight = 0
+        self._dropped = 0
+        self._spill_count = 0
+        self._max_depth = 0
+        self._latencies: Deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+
         # Registered bridges
         self._bridges: Dict[str, AgentSocietyBridge] = {}
 
@@ -138,10 +226,14 @@ class MessageRouter:
         self._bridges[bridge.agent_id] = bridge
 
         # Deliver any queued messages
-        if bridge.agent_id in self._queues:
-            queued = self._queues.pop(bridge.agent_id)
-            for msg in queued:
-                self._deliver(msg, bridge)
+        with self._lock:
+            queued = self._queues.pop(bridge.agent_id, None)
+        if queued:
+            if self.async_delivery:
+                self._enqueue_many(queued)
+            else:
+                for msg in queued:
+                    self._deliver(msg, bridge)
             logger.info(f"Delivered {len(queued)} queued messages to {bridge.agent_id}")
 
         logger.debug(f"Agent registered with router: {bridge.agent_id}")
@@ -212,6 +304,18 @@ class MessageRouter:
             self._add_to_history(routed_msg)
             return routed_msg
 
+        if self.async_delivery:
+            routed_msg = RoutedMessage(
+                message_id=message_id,
+                event=event,
+                sender=sender,
+                recipient=target,
+                status=RouteStatus.QUEUED,
+            )
+            self._enqueue_many([routed_msg])
+            self._add_to_history(routed_msg)
+            return routed_msg
+
         # Deliver immediately
         bridge = self._bridges[target]
         routed_msg = RoutedMessage(
@@ -248,6 +352,25 @@ class MessageRouter:
 
         results = []
 
+        if self.async_delivery:
+            # Enqueue the whole fan-out under a single lock acquisition
+            results = [
+                RoutedMessage(
+                    message_id=str(uuid.uuid4()),
+                    event=event,
+                    sender=event.agent.id,
+                    recipient=agent_id,
+                    status=RouteStatus.QUEUED,
+                )
+                for agent_id in list(self._bridges)
+                if agent_id not in exclude
+            ]
+            self._enqueue_many(results)
+            for routed_msg in results:
+                self._add_to_history(routed_msg)
+            logger.info(f"Broadcast message queued for {len(results)} agents")
+            return results
+
         for agent_id, bridge in self._bridges.items():
             if agent_id in exclude:
                 continue
@@ -269,12 +392,359 @@ class MessageRouter:
         logger.info(f"Broadcast message to {len(results)} agents")
         return results
 
-    def _deliver(self, message: RoutedMessage, bridge: AgentSocietyBridge) -> None:
+    def _enqueue_many(self, messages: List[RoutedMessage]) -> None:
+        """Place messages on their recipients' delivery queues."""
+        self._ensure_workers()
+        now = time.monotonic()
+        spilled_agents: Set[str] = set()
+
+        with self._lock:
+            for message in messages:
+                agent_id = message.recipient
+                pending = self._pending.setdefault(agent_id, deque())
+
+                # Keep FIFO order: once spilling, keep spilling until drained
+                full = len(pending) >= self.queue_size or self._spilled.get(agent_id)
+                if full and self.backpressure == BackpressurePolicy.BLOCK:
+                    deadline = now + self.block_timeout
+                    while len(pending) >= self.queue_size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not self._space.wait(remaining):
+                            break
+                    full = len(pending) >= self.queue_size
+
+                if full and self.backpressure == BackpressurePolicy.SPILL:
+                    if not self._spill(message, now):
+                        continue
+                    spilled_agents.add(agent_id)
+                elif full:
+                    message.status = RouteStatus.DROPPED
+                    message.error = f"Delivery queue full for {agent_id}"
+                    self._dropped += 1
+                    logger.warning(f"Dropped message {message.message_id}: queue full")
+                    continue
+                else:
+                    message.status = RouteStatus.QUEUED
+                    pending.append((message, now))
+
+                self._in_flight += 1
+                self._max_depth = max(self._max_depth, len(pending))
+                if agent_id not in self._scheduled:
+                    self._scheduled.add(agent_id)
+                    self._ready.put(agent_id)
+
+        # Disk writes happen outside the router lock
+        for agent_id in spilled_agents:
+            self._write_spill(agent_id)
+
+    def _spill_path(self, agent_id: str) -> Path:
+        """Overflow file for an agent, private to this router instance."""
+        safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", agent_id)
+        return self.spill_dir / f"{safe_id}.{self._spill_token}.jsonl"
+
+    def _spill_file_lock(self, agent_id: str) -> threading.Lock:
+        """Lock serialising an agent's overflow file I/O (router lock not held)."""
+        with self._lock:
+            return self._spill_locks.setdefault(agent_id, threading.Lock())
+
+    def _spill(self, message: RoutedMessage, enqueued_at: float) -> bool:
+        """Buffer a message for its recipient's overflow file (lock held).
+
+        Returns:
+            False if the message cannot be serialized and was dropped.
+        """
+        record = {
+            "message_id": message.message_id,
+            "sender": message.sender,
+            "recipient": message.recipient,
+            "enqueued_at": enqueued_at,
+            "event": message.event.to_dict(),
+        }
+        try:
+            line = json.dumps(record)
+        except (TypeError, ValueError) as e:
+            message.status = RouteStatus.DROPPED
+            message.error = f"Cannot spill message: {e}"
+            self._dropped += 1
+            logger.warning(f"Dropped message {message.message_id}: {e}")
+            return False
+        self._spill_buffer.setdefault(message.recipient, []).append((record, line))
+
+        message.status = RouteStatus.QUEUED
+        self._spilled_refs[message.message_id] = message
+        self._spilled[message.recipient] = self._spilled.get(message.recipient, 0) + 1
+        self._spill_count += 1
+        return True
+
+    def _write_spill(self, agent_id: str) -> None:
+        """Append an agent's buffered overflow records to its spill file.
+
+        If the write fails the records are dropped and their accounting is
+        undone, so flush() and the workers don't wait for them.
+        """
+        with self._spill_file_lock(agent_id):
+            with self._lock:
+                records = self._spill_buffer.pop(agent_id, [])
+            if not records:
+                return
+            try:
+                self.spill_dir.mkdir(parents=True, exist_ok=True)
+                with open(self._spill_path(agent_id), "a", encoding="utf-8") as f:
+                    start = f.tell()
+                    try:
+                        f.write("".join(line + "\n" for _, line in records))
+                        f.flush()
+                    except OSError:
+                        f.truncate(start)  # don't leave a partial batch behind
+                        raise
+            except OSError as e:
+                with self._lock:
+                    self._drop_spilled(
+                        agent_id,
+                        len(records),
+                        f"Spill write failed: {e}",
+                        [record["message_id"] for record, _ in records],
+                    )
+
+    def _drop_spilled(
+        self,
+        agent_id: str,
+        count: int,
+        reason: str,
+        message_ids: Iterable[str] = (),
+    ) -> None:
+        """Forget spilled messages that can no longer be delivered (lock held)."""
+        for message_id in list(message_ids):
+            message = self._spilled_refs.pop(message_id, None)
+            if message is not None:
+                message.status = RouteStatus.DROPPED
+                message.error = reason
+        remaining = self._spilled.get(agent_id, 0) - count
+        if remaining > 0:
+            self._spilled[agent_id] = remaining
+        else:
+            self._spilled.pop(agent_id, None)
+        self._spill_count -= count
+        self._in_flight -= count
+        self._dropped += count
+        if self._in_flight == 0:
+            self._idle.notify_all()
+        logger.error(f"Dropped {count} spilled messages for {agent_id}: {reason}")
+
+    def _unspill(self, agent_id: str) -> int:
+        """Move spilled messages back into an agent's queue.
+
+        Called without the router lock; records still buffered in memory
+        are newer than anything on disk, so they are taken last. If nothing
+        can be found for an agent that still has spilled messages (e.g. the
+        file was removed), those messages are dropped.
+
+        Returns:
+            Number of messages moved back.
+        """
+        path = self._spill_path(agent_id)
+        with self._spill_file_lock(agent_id):
+            lines = []
+            if path.exists():
+                lines = path.read_text(encoding="utf-8").splitlines()
+            take, rest = lines[: self.queue_size], lines[self.queue_size :]
+            if rest:
+                path.write_text("\n".join(rest) + "\n", encoding="utf-8")
+            elif lines:
+                path.unlink()
+            records = [json.loads(line) for line in take]
+
+            with self._lock:
+                if len(records) < self.queue_size:
+                    buffered = self._spill_buffer.get(agent_id, [])
+                    count = self.queue_size - len(records)
+                    records.extend(record for record, _ in buffered[:count])
+                    del buffered[:count]
+
+                if not records:
+                    lost = self._spilled.get(agent_id, 0)
+                    if lost:
+                        self._drop_spilled(
+                            agent_id,
+                            lost,
+                            "Spilled messages missing from spill file",
+                            [
+                                message_id
+                                for message_id, message in self._spilled_refs.items()
+                                if message.recipient == agent_id
+                            ],
+                        )
+                    return 0
+
+                pending = self._pending.setdefault(agent_id, deque())
+                for record in records:
+                    message = self._spilled_refs.pop(record["message_id"], None)
+                    if message is None:
+                        message = self._message_from_record(record)
+                    pending.append((message, record["enqueued_at"]))
+
+                remaining = self._spilled.get(agent_id, 0) - len(records)
+                if remaining > 0:
+                    self._spilled[agent_id] = remaining
+                else:
+                    self._spilled.pop(agent_id, None)
+        return len(records)
+
+    @staticmethod
+    def _message_from_record(record: Dict[str, Any]) -> RoutedMessage:
+        """Rebuild a queued message from a spill record."""
+        return RoutedMessage(
+            message_id=record["message_id"],
+            event=AgentEvent.from_dict(record["event"]),
+            sender=record["sender"],
+            recipient=record["recipient"],
+            status=RouteStatus.QUEUED,
+        )
+
+    def replay_spilled(self, max_age: Optional[float] = None) -> int:
+        """
+        Re-queue messages spilled by an earlier router over the same spill_dir.
+
+        Spill files are private to the router that wrote them, so overflow
+        left by a crashed process is only delivered when this is called.
+        Files owned by another user, or older than max_age, are left alone.
+
+        Args:
+            max_age: Skip files last written more than this many seconds ago.
+
+        Returns:
+            Number of messages re-queued.
+        """
+        if self.spill_dir is None or not self.spill_dir.is_dir():
+            return 0
+
+        messages: List[RoutedMessage] = []
+        for path in sorted(self.spill_dir.glob("*.jsonl")):
+            if path.name.endswith(f".{self._spill_token}.jsonl"):
+                continue
+            stat = path.stat()
+            if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+                logger.warning(
+                    f"Not replaying spill file owned by another user: {path}"
+                )
+                continue
+            if max_age is not None and time.time() - stat.st_mtime > max_age:
+                logger.info(f"Not replaying stale spill file: {path}")
+                continue
+            for line in path.read_text(encoding="utf-8").splitlines():
+                if line.strip():
+                    messages.append(self._message_from_record(json.loads(line)))
+            path.unlink()
+
+        if messages:
+            self._enqueue_many(messages)
+            logger.info(f"Replayed {len(messages)} spilled messages")
+        return len(messages)
+
+    def _ensure_workers(self) -> None:
+        """Start dispatcher workers on first use."""
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"message-router-{i}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _worker_loop(self) -> None:
+        """Deliver batches for whichever agent is ready next."""
+        while True:
+            agent_id = self._ready.get()
+            if agent_id is None:
+                return
+
+            with self._lock:
+                unspill = not self._pending.get(agent_id) and self._spilled.get(
+                    agent_id
+                )
+            if unspill and not self._unspill(agent_id):
+                # Nothing came back from the spill file: only re-queue the
+                # agent for messages that arrived meanwhile
+                with self._lock:
+                    if self._pending.get(agent_id):
+                        self._ready.put(agent_id)
+                    else:
+                        self._scheduled.discard(agent_id)
+                continue
+
+            with self._lock:
+                pending = self._pending.get(agent_id)
+                batch = [
+                    pending.popleft()
+                    for _ in range(min(self.batch_size, len(pending or ())))
+                ]
+                self._space.notify_all()
+
+            for message, enqueued_at in batch:
+                bridge = self._bridges.get(agent_id)
+                if bridge is None:
+                    # Recipient went offline: park for redelivery on register
+                    message.status = RouteStatus.QUEUED
+                    with self._lock:
+                        self._queues.setdefault(agent_id, []).append(message)
+                    continue
+                self._deliver(message, bridge, enqueued_at)
+
+            with self._lock:
+                self._in_flight -= len(batch)
+                if self._pending.get(agent_id) or self._spilled.get(agent_id):
+                    self._ready.put(agent_id)
+                else:
+                    self._scheduled.discard(agent_id)
+                if self._in_flight == 0:
+                    self._idle.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all asynchronously queued messages are processed.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if all queues drained within the timeout.
+        """
+        with self._lock:
+            return self._idle.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Drain pending deliveries and stop dispatcher workers.
+
+        Args:
+            timeout: Maximum seconds to wait for the drain.
+        """
+        self.flush(timeout)
+        for _ in self._threads:
+            self._ready.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _deliver(
+        self,
+        message: RoutedMessage,
+        bridge: AgentSocietyBridge,
+        enqueued_at: Optional[float] = None,
+    ) -> None:
         """Deliver a message to a bridge."""
+        start = enqueued_at if enqueued_at is not None else time.monotonic()
         try:
             bridge.handle_incoming(message.event)
             message.status = RouteStatus.DELIVERED
             message.delivered_at = datetime.now(timezone.utc)
+            self._latencies.append(time.monotonic() - start)
 
             # Notify delivery handlers
             for handler in self._delivery_handlers:
@@ -313,7 +783,7 @@ class MessageRouter:
 
         # Trim history if needed
         if len(self._history) > self._max_history:
-            self._history = self._history[-self._max_history :]
+            del self._history[: -self._max_history]
 
     def add_delivery_handler(
         self,
@@ -323,8 +793,12 @@ class MessageRouter:
         self._delivery_handlers.append(handler)
 
     def get_queue_size(self, agent_id: str) -> int:
-        """Get number of queued messages for an agent."""
-        return len(self._queues.get(agent_id, []))
+        """Get number of queued messages for an agent (offline and in-flight)."""
+        with self._lock:
+            in_flight = len(self._pending.get(agent_id, ())) + self._spilled.get(
+                agent_id, 0
+            )
+        return len(self._queues.get(agent_id, [])) + in_flight
 
     def get_history(
         self,
@@ -356,6 +830,16 @@ class MessageRouter:
         failed = sum(1 for m in self._history if m.status == RouteStatus.FAILED)
         queued = sum(len(q) for q in self._queues.values())
 
+        with self._lock:
+            depths = {
+                agent_id: len(pending) + self._spilled.get(agent_id, 0)
+                for agent_id, pending in self._pending.items()
+            }
+            latencies = sorted(self._latencies)
+            dropped = self._dropped
+            spilled = self._spill_count
+            max_depth = self._max_depth
+
         return {
             "registered_agents": len(self._bridges),
             "total_messages": len(self._history),
@@ -363,4 +847,28 @@ class MessageRouter:
             "failed": failed,
             "queued": queued,
             "agents": list(self._bridges.keys()),
+            "async_delivery": self.async_delivery,
+            "queue_depth": sum(depths.values()),
+            "queue_depths": {a: d for a, d in depths.items() if d},
+            "max_queue_depth": max_depth,
+            "dropped": dropped,
+            "spilled": spilled,
+            "delivery_latency_ms": self._latency_summary(latencies),
+        }
+
+    @staticmethod
+    def _latency_summary(latencies: List[float]) -> Dict[str, float]:
+        """Summarize sorted latency samples (seconds) in milliseconds."""
+        if not latencies:
+            return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+
+        def percentile(q: float) -> float:
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+
+        return {
+            "count": len(latencies),
+            "mean": sum(latencies) / len(latencies) * 1000,
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "max": latencies[-1] * 1000,
         }
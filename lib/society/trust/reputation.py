@@ -7,12 +7,24 @@ Scoring and tracking agent reputation based on axiom compliance.
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import heapq
 import logging
 import math
 
 logger = logging.getLogger(__name__)
 
+# NumPy is optional; bulk decay falls back to a pure-Python loop without it
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+SECONDS_PER_DAY = 86400.0
+
 
 class ReputationType(Enum):
     """Types of reputation contributions."""
@@ -77,6 +89,36 @@ class ReputationScore:
     MAX_SCORE = 100.0
     DEFAULT_SCORE = 50.0
 
+    # Change listener installed by the owning ReputationSystem (not a field)
+    _listener = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in ("current_score", "last_updated") and self._listener is not None:
+            self._listener(self)
+
+    def score_at(self, when: datetime, half_life_days: float) -> float:
+        """
+        Evaluate the decayed score at a point in time.
+
+        The stored ``current_score`` is the value anchored at ``last_updated``;
+        its deviation from neutral halves every ``half_life_days``.
+
+        Args:
+            when: Time to evaluate the score at.
+            half_life_days: Decay half-life in days.
+
+        Returns:
+            Score at ``when`` (never decays backwards in time).
+        """
+        days_elapsed = (when - self.last_updated).total_seconds() / SECONDS_PER_DAY
+        if days_elapsed <= 0:
+            return self.current_score
+
+        decay_factor = math.pow(0.5, days_elapsed / half_life_days)
+        deviation = self.current_score - self.DEFAULT_SCORE
+        return self.DEFAULT_SCORE + deviation * decay_factor
+
     @property
     def trust_level(self) -> str:
         """Get human-readable trust level."""
@@ -165,6 +207,18 @@ class ReputationSystem:
         self._scores: Dict[str, ReputationScore] = {}
         self.decay_enabled = decay_enabled
 
+        # Ranking index. Each agent has a decay-invariant rank key
+        # (deviation from neutral scaled to a fixed epoch), so ordering never
+        # changes as time passes and only needs updating on score changes.
+        self._epoch = datetime.now(timezone.utc)
+        self._keys: Dict[str, float] = {}
+        self._versions: Dict[str, int] = {}
+        self._ordinals: Dict[str, int] = {}
+        self._heap: List[Tuple[float, int, int, str]] = []
+        self._indexed_decay = decay_enabled
+        self._top_cache: Optional[List[Tuple[str, float]]] = None
+        self._top_cache_limit = 0
+
     def get_score(self, agent_id: str) -> ReputationScore:
         """
         Get reputation score for an agent.
@@ -178,7 +232,11 @@ class ReputationSystem:
             ReputationScore for the agent.
         """
         if agent_id not in self._scores:
-            self._scores[agent_id] = ReputationScore(agent_id=agent_id)
+            score = ReputationScore(agent_id=agent_id)
+            self._scores[agent_id] = score
+            self._ordinals[agent_id] = len(self._ordinals)
+            score._listener = self._on_score_changed
+            self._on_score_changed(score)
 
         score = self._scores[agent_id]
 
@@ -284,47 +342,171 @@ class ReputationSystem:
 
         target_score.add_event(event)
 
-    def _apply_decay(self, score: ReputationScore) -> None:
-        """Apply time decay to move score toward neutral."""
-        if not score.history:
-            return
+    def _apply_decay(
+        self, score: ReputationScore, now: Optional[datetime] = None
+    ) -> None:
+        """
+        Materialize lazy decay toward neutral.
+
+        The score is evaluated in closed form from its anchor and re-anchored
+        at ``now``. Rank keys are invariant under decay, so the index is not
+        touched.
+        """
+        now = now or datetime.now(timezone.utc)
+        value = score.score_at(now, self.DECAY_HALF_LIFE_DAYS)
+        object.__setattr__(score, "current_score", value)
+        object.__setattr__(score, "last_updated", now)
 
-        last_update = score.last_updated
-        now = datetime.now(timezone.utc)
-        days_elapsed = (now - last_update).total_seconds() / 86400
+    def apply_decay_all(self, now: Optional[datetime] = None) -> int:
+        """
+        Materialize decay for every agent in one vectorized pass.
 
-        if days_elapsed < 1:
-            return
+        Uses NumPy when available and falls back to per-score evaluation.
+
+        Args:
+            now: Time to decay to (defaults to current time).
+
+        Returns:
+            Number of scores updated.
+        """
+        if not self.decay_enabled or not self._scores:
+            return 0
+
+        now = now or datetime.now(timezone.utc)
+        scores = list(self._scores.values())
+        count = len(scores)
+
+        if NUMPY_AVAILABLE:
+            current = np.fromiter(
+                (s.current_score for s in scores), dtype=np.float64, count=count
+            )
+            elapsed_days = (
+                np.fromiter(
+                    ((now - s.last_updated).total_seconds() for s in scores),
+                    dtype=np.float64,
+                    count=count,
+                )
+                / SECONDS_PER_DAY
+            )
+            factors = np.power(
+                0.5, np.clip(elapsed_days, 0.0, None) / self.DECAY_HALF_LIFE_DAYS
+            )
+            neutral = ReputationScore.DEFAULT_SCORE
+            values = (neutral + (current - neutral) * factors).tolist()
+        else:
+            values = [s.score_at(now, self.DECAY_HALF_LIFE_DAYS) for s in scores]
+
+        for score, value in zip(scores, values):
+            object.__setattr__(score, "current_score", value)
+            object.__setattr__(score, "last_updated", now)
 
-        # Decay factor: half-life decay toward neutral
-        decay_factor = math.pow(0.5, days_elapsed / self.DECAY_HALF_LIFE_DAYS)
+        # Re-anchor keys to shed accumulated rounding drift
+        self._rebuild_index()
+        return count
 
-        # Move toward neutral (50)
+    def _rank_key(self, score: ReputationScore) -> float:
+        """Compute the decay-invariant rank key for a score."""
         deviation = score.current_score - ReputationScore.DEFAULT_SCORE
-        decayed_deviation = deviation * decay_factor
-        score.current_score = ReputationScore.DEFAULT_SCORE + decayed_deviation
-        score.last_updated = now
+        if not self.decay_enabled:
+            return deviation
+        days = (score.last_updated - self._epoch).total_seconds() / SECONDS_PER_DAY
+        return deviation * math.pow(2.0, days / self.DECAY_HALF_LIFE_DAYS)
+
+    def _key_scale(self, now: datetime) -> float:
+        """Factor converting a score deviation at ``now`` into rank-key space."""
+        if not self.decay_enabled:
+            return 1.0
+        days = (now - self._epoch).total_seconds() / SECONDS_PER_DAY
+        return math.pow(2.0, days / self.DECAY_HALF_LIFE_DAYS)
+
+    def _on_score_changed(self, score: ReputationScore) -> None:
+        """Re-index an agent after its score or anchor changed."""
+        agent_id = score.agent_id
+        if self._scores.get(agent_id) is not score:
+            return
+
+        key = self._rank_key(score)
+        version = self._versions.get(agent_id, 0) + 1
+        self._versions[agent_id] = version
+        self._keys[agent_id] = key
+        heapq.heappush(self._heap, (-key, self._ordinals[agent_id], version, agent_id))
+        self._top_cache = None
+
+        # Stale entries are dropped lazily; compact once they dominate
+        if len(self._heap) > 2 * len(self._keys) + 64:
+            self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the ranking heap from the current scores."""
+        self._indexed_decay = self.decay_enabled
+        self._heap = []
+        for agent_id, score in self._scores.items():
+            key = self._rank_key(score)
+            version = self._versions.get(agent_id, 0) + 1
+            self._versions[agent_id] = version
+            self._keys[agent_id] = key
+            self._heap.append((-key, self._ordinals[agent_id], version, agent_id))
+        heapq.heapify(self._heap)
+        self._top_cache = None
+
+    def _take_ranked(
+        self, limit: Optional[int] = None, min_key: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Read agents in rank order without disturbing the heap.
+
+        Pops live entries until ``limit`` is reached or keys drop below
+        ``min_key``, discarding stale entries on the way, then pushes the
+        live entries back.
+        """
+        if self._indexed_decay != self.decay_enabled:
+            self._rebuild_index()
+
+        taken: List[Tuple[str, float]] = []
+        popped: List[Tuple[float, int, int, str]] = []
+        while self._heap and (limit is None or len(taken) < limit):
+            entry = self._heap[0]
+            neg_key, _, version, agent_id = entry
+            if self._versions.get(agent_id) != version:
+                heapq.heappop(self._heap)
+                continue
+            if min_key is not None and -neg_key < min_key:
+                break
+            popped.append(heapq.heappop(self._heap))
+            taken.append((agent_id, -neg_key))
+
+        for entry in popped:
+            heapq.heappush(self._heap, entry)
+        return taken
 
     def get_trusted_agents(self, min_score: float = 50.0) -> List[str]:
-        """Get list of trusted agents."""
-        return [
-            agent_id
-            for agent_id, score in self._scores.items()
-            if score.current_score >= min_score
-        ]
+        """Get list of trusted agents, highest reputation first."""
+        scale = self._key_scale(datetime.now(timezone.utc))
+        min_key = (min_score - ReputationScore.DEFAULT_SCORE) * scale
+        return [agent_id for agent_id, _ in self._take_ranked(min_key=min_key)]
 
     def get_rankings(self, limit: int = 10) -> List[tuple]:
         """
         Get top agents by reputation.
 
+        The top-k order is cached until a score changes; scores are
+        evaluated with decay at call time.
+
         Returns:
             List of (agent_id, score) tuples.
         """
-        rankings = [
-            (agent_id, score.current_score) for agent_id, score in self._scores.items()
+        if self._indexed_decay != self.decay_enabled:
+            self._rebuild_index()
+        if self._top_cache is None or limit > self._top_cache_limit:
+            self._top_cache = self._take_ranked(limit=limit)
+            self._top_cache_limit = limit
+
+        scale = self._key_scale(datetime.now(timezone.utc))
+        neutral = ReputationScore.DEFAULT_SCORE
+        return [
+            (agent_id, neutral + key / scale)
+            for agent_id, key in self._top_cache[:limit]
         ]
-        rankings.sort(key=lambda x: x[1], reverse=True)
-        return rankings[:limit]
 
     def export(self) -> Dict[str, Any]:
         """Export reputation data."""
@@ -7,6 +7,7 @@ Verifies all actions against foundational axioms (A0-A5).
 
 from lib.society.verification.monitor import (
     AxiomComplianceMonitor,
+    LatencyHistogram,
     VerificationResult,
     VerificationStatus,
     create_default_monitor,
@@ -25,6 +26,7 @@ from lib.society.verification.verifiers import (
 
 __all__ = [
     "AxiomComplianceMonitor",
+    "LatencyHistogram",
     "VerificationResult",
     "VerificationStatus",
     "create_default_monitor",
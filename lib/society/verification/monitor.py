@@ -4,11 +4,16 @@ Axiom Compliance Monitor
 Central monitor for verifying agent events against all axioms.
 """
 
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import json
 import logging
+import time
 
 from lib.society.events.schema import AgentEvent
 from lib.society.verification.verifiers.base import AxiomVerifier, AxiomResult
@@ -70,6 +75,119 @@ class VerificationResult:
 # Type alias for violation handlers
 ViolationHandler = Callable[[AgentEvent, VerificationResult], None]
 
+# Latency histogram bucket upper bounds in milliseconds
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    50.0,
+    100.0,
+)
+
+
+@dataclass
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram for a single verifier.
+
+    Attributes:
+        buckets: Bucket upper bounds in milliseconds.
+        counts: Observations per bucket, plus a trailing overflow bucket.
+        count: Total number of observations.
+        total_ms: Sum of all observed latencies.
+        max_ms: Largest observed latency.
+    """
+
+    buckets: Tuple[float, ...] = LATENCY_BUCKETS_MS
+    counts: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean observed latency in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        """Record a single latency observation."""
+        self.counts[bisect_left(self.buckets, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        labels = [f"<={bound}ms" for bound in self.buckets] + ["+inf"]
+        return {
+            "count": self.count,
+            "mean_ms": self.mean_ms,
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+def _verify_one(
+    verifier: AxiomVerifier, event: AgentEvent
+) -> Tuple[AxiomResult, float]:
+    """
+    Run one verifier on one event, converting errors into failing results.
+
+    Returns:
+        Tuple of (result, elapsed milliseconds).
+    """
+    start = time.perf_counter()
+    try:
+        result = verifier.verify(event)
+
+        if not result.passed:
+            logger.warning(
+                f"Axiom {result.axiom.value} violation: {result.reason} "
+                f"(event: {event.event_id}, agent: {event.agent.id})"
+            )
+    except Exception as e:
+        logger.error(f"Verifier {verifier.name} error: {e}")
+        # Create error result
+        result = AxiomResult(
+            axiom=verifier.axiom,
+            passed=False,
+            reason=f"Verification error: {str(e)}",
+            confidence=0.0,
+        )
+    return result, (time.perf_counter() - start) * 1000.0
+
+
+def _run_verifier(
+    verifier: AxiomVerifier, events: List[AgentEvent]
+) -> List[Tuple[AxiomResult, float]]:
+    """Run a verifier over a group of events (pool task entry point)."""
+    return [_verify_one(verifier, event) for event in events]
+
+
+def _verdict_key(event: AgentEvent) -> Optional[str]:
+    """
+    Build a memoization key from the parts of an event verifiers inspect.
+
+    Returns None when the payload cannot be serialized canonically.
+    """
+    try:
+        return json.dumps(
+            [
+                event.agent.type.value,
+                event.action.to_dict(),
+                event.axiom_context.to_dict(),
+            ],
+            sort_keys=True,
+        )
+    except (TypeError, ValueError):
+        return None
+
 
 class AxiomComplianceMonitor:
     """
@@ -88,6 +206,9 @@ class AxiomComplianceMonitor:
                 print(f"Violated {violation.axiom.name}: {violation.reason}")
     """
 
+    # Maximum number of memoized verdicts kept by verify_batch
+    VERDICT_CACHE_SIZE = 10000
+
     def __init__(
         self,
         escalation_threshold: int = 3,
@@ -106,6 +227,8 @@ class AxiomComplianceMonitor:
         self._verifiers: List[AxiomVerifier] = []
         self._violation_handlers: List[ViolationHandler] = []
         self._violation_history: Dict[str, List[datetime]] = {}  # agent_id -> times
+        self._latency: Dict[str, LatencyHistogram] = {}  # verifier name -> histogram
+        self._verdict_cache: "OrderedDict[str, List[AxiomResult]]" = OrderedDict()
 
     @property
     def verifiers(self) -> List[AxiomVerifier]:
@@ -120,6 +243,7 @@ class AxiomComplianceMonitor:
             verifier: The verifier to register.
         """
         self._verifiers.append(verifier)
+        self._verdict_cache.clear()
         logger.info(f"Registered verifier: {verifier.name}")
 
     def register_default_verifiers(self) -> None:
@@ -173,27 +297,16 @@ class AxiomComplianceMonitor:
 
         for verifier in self._verifiers:
             if verifier.applies_to(event):
-                try:
-                    result = verifier.verify(event)
-                    axiom_results.append(result)
-
-                    if not result.passed:
-                        logger.warning(
-                            f"Axiom {result.axiom.value} violation: {result.reason} "
-                            f"(event: {event.event_id}, agent: {event.agent.id})"
-                        )
-                except Exception as e:
-                    logger.error(f"Verifier {verifier.name} error: {e}")
-                    # Create error result
-                    axiom_results.append(
-                        AxiomResult(
-                            axiom=verifier.axiom,
-                            passed=False,
-                            reason=f"Verification error: {str(e)}",
-                            confidence=0.0,
-                        )
-                    )
+                result, elapsed_ms = _verify_one(verifier, event)
+                self._observe_latency(verifier, elapsed_ms)
+                axiom_results.append(result)
+
+        return self._finalize(event, axiom_results)
 
+    def _finalize(
+        self, event: AgentEvent, axiom_results: List[AxiomResult]
+    ) -> VerificationResult:
+        """Track violations, escalate and notify handlers for one event."""
         # Determine overall status
         has_violations = any(not r.passed for r in axiom_results)
         escalated = False
@@ -234,17 +347,176 @@ class AxiomComplianceMonitor:
 
         return result
 
-    def verify_batch(self, events: List[AgentEvent]) -> List[VerificationResult]:
+    def verify_batch(
+        self,
+        events: List[AgentEvent],
+        fail_fast: bool = False,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+        memoize: bool = True,
+        window_size: int = 1024,
+    ) -> List[VerificationResult]:
         """
         Verify multiple events.
 
+        Events are processed in windows. Within a window, events are grouped
+        by the verifiers that apply to them and each verifier runs over its
+        group, optionally in a worker pool. Violation tracking, escalation
+        and handlers still run in event order.
+
         Args:
             events: List of events to verify.
+            fail_fast: Stop after the first event with a violation.
+            max_workers: Worker pool size; None or 1 runs inline.
+            use_processes: Use a process pool instead of threads
+                (verifiers must be picklable).
+            memoize: Reuse verdicts for events with identical agent type,
+                action and axiom context.
+            window_size: Events verified per window (bounds wasted work
+                in fail-fast mode).
+
+        Returns:
+            List of verification results, in event order. In fail-fast
+            mode the list ends at the first violating event.
+        """
+        results: List[VerificationResult] = []
+        if not events:
+            return results
+
+        window_size = max(1, window_size)
+        executor: Optional[Executor] = None
+        if max_workers and max_workers > 1:
+            pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            executor = pool_cls(max_workers=max_workers)
+
+        try:
+            for start in range(0, len(events), window_size):
+                window = events[start : start + window_size]
+                verdicts = self._verify_window(window, executor, max_workers, memoize)
+
+                for event, axiom_results in zip(window, verdicts):
+                    result = self._finalize(event, axiom_results)
+                    results.append(result)
+                    if fail_fast and result.has_violations():
+                        return results
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        return results
+
+    def _verify_window(
+        self,
+        window: List[AgentEvent],
+        executor: Optional[Executor],
+        max_workers: Optional[int],
+        memoize: bool,
+    ) -> List[List[AxiomResult]]:
+        """Compute axiom results for a window of events, grouped by verifier."""
+        keys = [_verdict_key(event) if memoize else None for event in window]
+
+        # Unique events still needing verification (first occurrence per key)
+        pending: Dict[Any, AgentEvent] = {}
+        hits: Dict[str, List[AxiomResult]] = {}
+        for idx, (event, key) in enumerate(zip(window, keys)):
+            unit = key if key is not None else idx
+            if key is not None and key in self._verdict_cache:
+                self._verdict_cache.move_to_end(key)
+                hits[key] = self._verdict_cache[key]
+                continue
+            pending.setdefault(unit, event)
+
+        # Group pending events by the verifiers that apply to them
+        units = list(pending)
+        groups: List[Tuple[int, List[Any]]] = []
+        for v_idx, verifier in enumerate(self._verifiers):
+            applicable = [unit for unit in units if verifier.applies_to(pending[unit])]
+            if applicable:
+                groups.append((v_idx, applicable))
+
+        computed: Dict[Any, Dict[int, AxiomResult]] = {unit: {} for unit in units}
+        for v_idx, unit_chunk, outcomes in self._run_groups(
+            groups, pending, executor, max_workers
+        ):
+            verifier = self._verifiers[v_idx]
+            for unit, (result, elapsed_ms) in zip(unit_chunk, outcomes):
+                computed[unit][v_idx] = result
+                self._observe_latency(verifier, elapsed_ms)
+
+        verdicts: List[List[AxiomResult]] = []
+        for idx, key in enumerate(keys):
+            unit = key if key is not None else idx
+            if unit in computed:
+                axiom_results = [computed[unit][v] for v in sorted(computed[unit])]
+                if key is not None:
+                    self._remember_verdict(key, axiom_results)
+            else:
+                axiom_results = hits[key]
+            # Copy so results for separate events never alias each other
+            verdicts.append(
+                [replace(r, details=dict(r.details)) for r in axiom_results]
+            )
+        return verdicts
+
+    def _run_groups(
+        self,
+        groups: List[Tuple[int, List[Any]]],
+        pending: Dict[Any, AgentEvent],
+        executor: Optional[Executor],
+        max_workers: Optional[int],
+    ) -> List[Tuple[int, List[Any], List[Tuple[AxiomResult, float]]]]:
+        """Run verifier groups inline or split into chunks across the pool."""
+        if executor is None:
+            return [
+                (
+                    v_idx,
+                    unit_list,
+                    _run_verifier(
+                        self._verifiers[v_idx], [pending[u] for u in unit_list]
+                    ),
+                )
+                for v_idx, unit_list in groups
+            ]
+
+        tasks = []
+        for v_idx, unit_list in groups:
+            chunk_size = max(1, -(-len(unit_list) // max_workers))
+            for offset in range(0, len(unit_list), chunk_size):
+                chunk = unit_list[offset : offset + chunk_size]
+                future = executor.submit(
+                    _run_verifier,
+                    self._verifiers[v_idx],
+                    [pending[u] for u in chunk],
+                )
+                tasks.append((v_idx, chunk, future))
+
+        return [(v_idx, chunk, future.result()) for v_idx, chunk, future in tasks]
+
+    def _remember_verdict(self, key: str, axiom_results: List[AxiomResult]) -> None:
+        """Store a verdict in the bounded LRU cache."""
+        self._verdict_cache[key] = axiom_results
+        if len(self._verdict_cache) > self.VERDICT_CACHE_SIZE:
+            self._verdict_cache.popitem(last=False)
+
+    def clear_verdict_cache(self) -> None:
+        """Drop all memoized verdicts."""
+        self._verdict_cache.clear()
+
+    def _observe_latency(self, verifier: AxiomVerifier, elapsed_ms: float) -> None:
+        """Record a verifier latency observation."""
+        histogram = self._latency.get(verifier.name)
+        if histogram is None:
+            histogram = self._latency[verifier.name] = LatencyHistogram()
+        histogram.observe(elapsed_ms)
+
+    def get_verifier_latency(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-verifier latency histograms.
 
         Returns:
-            List of verification results.
+            Mapping of verifier name to histogram summary.
         """
-        return [self.verify(event) for event in events]
+        return {name: hist.to_dict() for name, hist in self._latency.items()}
 
     def _record_violation(self, agent_id: str) -> None:
         """Record a violation for tracking."""
@@ -4,7 +4,7 @@ import pandas as pd
 from core.database import DatabaseManager, Project
 from core.data_manager import DataManager
 from core.viz_manager import VizManager
-from core.analysis_manager import AnalysisManager
+from core.analysis_manager import AnalysisManager, result_cache
 from core.connectors.financial_connector import FinancialConnector
 from core.connectors.economic_connector import EconomicConnector
 from core.connectors.news_connector import NewsConnector
@@ -607,6 +607,8 @@ elif menu == "🔬 Advanced Analytics":
             ds = next(d for d in project.datasets if d.filename == selected_ds)
 
             df = data_manager.get_dataset_data(ds.id, db_manager)
+            # Analysis results are cached per dataset content across reruns
+            dataset_key = data_manager.dataset_key(ds)
 
             if df is not None:
                 analysis_tab, corr_tab, ts_tab, nlq_tab, template_tab = st.tabs(
@@ -636,7 +638,7 @@ elif menu == "🔬 Advanced Analytics":
 
                         if st.button("Run Regression"):
                             results = analysis_manager.run_linear_regression(
-                                df, x_var, y_var
+                                df, x_var, y_var, dataset_key=dataset_key
                             )
                             if results:
                                 c1, c2, c3 = st.columns(3)
@@ -681,7 +683,9 @@ elif menu == "🔬 Advanced Analytics":
                         "Values near **1.0** mean perfect positive correlation, while **-1.0** means perfect inverse correlation."
                     )
                     if len(num_cols) >= 2:
-                        corr_matrix = analysis_manager.get_correlation_matrix(df)
+                        corr_matrix = analysis_manager.get_correlation_matrix(
+                            df, dataset_key=dataset_key
+                        )
                         st.plotly_chart(
                             viz_manager.create_heatmap(
                                 corr_matrix, title="Feature Correlation Matrix"
@@ -701,7 +705,7 @@ elif menu == "🔬 Advanced Analytics":
 
                         if st.button("Calculate Trends"):
                             results = analysis_manager.run_time_series_baseline(
-                                df, target_col, window=window
+                                df, target_col, window=window, dataset_key=dataset_key
                             )
                             if results is not None:
                                 m1, m2 = st.columns(2)
@@ -1414,4 +1418,5 @@ elif menu == "⚙️ Settings":
     st.divider()
     if st.button("Reset Session Cache"):
         st.cache_resource.clear()
+        result_cache.clear(disk=True)
         st.success("Cache cleared!")
@@ -1,20 +1,216 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
 import pandas as pd
 import numpy as np
 from sklearn.linear_model import LinearRegression
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.metrics import r2_score, mean_squared_error
 from scipy import stats
 
+# Above this many rows, clustering and correlation switch to mini-batch/streaming
+LARGE_INPUT_ROWS = 100_000
+
+# Rows per chunk when accumulating streaming correlation sums
+CORRELATION_CHUNK_ROWS = 50_000
+
+RESULT_CACHE_MAX_ENTRIES = 64
+RESULT_CACHE_MAX_DISK_FILES = 256
+RESULT_CACHE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../data/analysis_cache")
+)
+
+
+class ResultCache:
+    """LRU of analysis results that spills evicted entries to disk.
+
+    Keys are hashed tuples of (method, data identity, columns, parameters),
+    prefixed with "ds<id>-" for results computed from a stored dataset so
+    they can be dropped when it is deleted. Cached results are shared
+    between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries=RESULT_CACHE_MAX_ENTRIES,
+        spill_dir=RESULT_CACHE_DIR,
+        max_disk_files=RESULT_CACHE_MAX_DISK_FILES,
+    ):
+        self.max_entries = max_entries
+        self.spill_dir = spill_dir
+        self.max_disk_files = max_disk_files
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts):
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def _spill_path(self, key):
+        return os.path.join(self.spill_dir, f"{key}.pkl")
+
+    def _spill(self, key, value):
+        if not self.spill_dir:
+            return
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            with open(self._spill_path(key), "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            files = sorted(
+                (
+                    os.path.join(self.spill_dir, name)
+                    for name in os.listdir(self.spill_dir)
+                    if name.endswith(".pkl")
+                ),
+                key=os.path.getmtime,
+            )
+            for path in files[: max(0, len(files) - self.max_disk_files)]:
+                os.remove(path)
+        except (OSError, pickle.PicklingError):
+            pass
+
+    def _load_spilled(self, key):
+        if not self.spill_dir:
+            return None
+        try:
+            with open(self._spill_path(key), "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        value = self._load_spilled(key)
+        if value is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            value = compute()
+        self._store(key, value)
+        return value
+
+    def _store(self, key, value):
+        evicted = []
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False))
+        for old_key, old_value in evicted:
+            if old_value is not None:
+                self._spill(old_key, old_value)
+
+    def invalidate_dataset(self, dataset_id):
+        """Drops in-memory and spilled results computed from a dataset."""
+        prefix = f"ds{dataset_id}-"
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+        if self.spill_dir and os.path.isdir(self.spill_dir):
+            for name in os.listdir(self.spill_dir):
+                if name.startswith(prefix) and name.endswith(".pkl"):
+                    try:
+                        os.remove(os.path.join(self.spill_dir, name))
+                    except OSError:
+                        pass
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+        if disk and self.spill_dir and os.path.isdir(self.spill_dir):
+            for name in os.listdir(self.spill_dir):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.spill_dir, name))
+
+
+result_cache = ResultCache()
+
+
+def _data_identity(df, columns, dataset_key):
+    """Identifies the analysed data: the dataset key when known, else a
+    content hash of the columns involved."""
+    if dataset_key is not None:
+        return ("dataset", dataset_key)
+    data = df[list(columns)] if columns is not None else df
+    digest = hashlib.sha256(
+        pd.util.hash_pandas_object(data, index=True).values.tobytes()
+    )
+    digest.update(repr(list(data.columns)).encode("utf-8"))
+    return ("content", digest.hexdigest())
+
+
+def _cache_key(method, df, columns, dataset_key, *params):
+    """Result cache key; tagged with the dataset id when there is one."""
+    key = result_cache.make_key(
+        method, _data_identity(df, columns, dataset_key), *params
+    )
+    return key if dataset_key is None else f"ds{dataset_key[0]}-{key}"
+
+
+def _streaming_corr(numeric_df, chunk_rows=CORRELATION_CHUNK_ROWS):
+    """Pearson correlation from chunked co-moments; needs NaN-free input.
+
+    Each chunk is centered on its own mean and merged pairwise (Chan et al.),
+    so large offsets such as epoch timestamps don't cancel out precision.
+    """
+    cols = numeric_df.columns
+    k = len(cols)
+    n = 0
+    mean = np.zeros(k)
+    comoment = np.zeros((k, k))
+    for start in range(0, len(numeric_df), chunk_rows):
+        block = numeric_df.iloc[start : start + chunk_rows].to_numpy(dtype=np.float64)
+        n_block = len(block)
+        block_mean = block.mean(axis=0)
+        centered = block - block_mean
+        delta = block_mean - mean
+        total = n + n_block
+        comoment += centered.T @ centered + np.outer(delta, delta) * (
+            n * n_block / total
+        )
+        mean += delta * (n_block / total)
+        n = total
+    cov = comoment / (n - 1)
+    std = np.sqrt(np.diag(cov))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov / np.outer(std, std)
+    corr = np.clip(corr, -1.0, 1.0)
+    np.fill_diagonal(corr, np.where(std > 0, 1.0, np.nan))
+    return pd.DataFrame(corr, index=cols, columns=cols)
+
 
 class AnalysisManager:
-    """Handles advanced statistical modeling and predictions."""
+    """Handles advanced statistical modeling and predictions.
+
+    Results are cached in `result_cache`. Pass `dataset_key` (from
+    `DataManager.dataset_key(dataset)`) to key on the stored dataset
+    instead of hashing the frame contents.
+    """
 
     @staticmethod
-    def run_linear_regression(df, x_col, y_col):
+    def run_linear_regression(df, x_col, y_col, dataset_key=None):
         """
         Performs a simple linear regression.
         Returns model details and coordinates for the regression line.
         """
+        key = _cache_key("regression", df, [x_col, y_col], dataset_key, x_col, y_col)
+        return result_cache.get_or_compute(
+            key, lambda: AnalysisManager._linear_regression(df, x_col, y_col)
+        )
+
+    @staticmethod
+    def _linear_regression(df, x_col, y_col):
         # Drop NaNs
         data = df[[x_col, y_col]].dropna()
         if data.empty:
@@ -40,16 +236,39 @@ class AnalysisManager:
         return results
 
     @staticmethod
-    def get_correlation_matrix(df):
-        """Returns the correlation matrix for numeric columns."""
+    def get_correlation_matrix(df, dataset_key=None):
+        """Returns the correlation matrix for numeric columns.
+
+        Large NaN-free inputs use a streaming computation over row chunks.
+        """
         numeric_df = df.select_dtypes(include=[np.number])
-        return numeric_df.corr()
+        key = _cache_key(
+            "correlation", numeric_df, None, dataset_key, tuple(numeric_df.columns)
+        )
+
+        def compute():
+            if (
+                len(numeric_df) > LARGE_INPUT_ROWS
+                and len(numeric_df.columns) > 0
+                and not numeric_df.isna().to_numpy().any()
+            ):
+                return _streaming_corr(numeric_df)
+            return numeric_df.corr()
+
+        return result_cache.get_or_compute(key, compute)
 
     @staticmethod
-    def run_time_series_baseline(df, col, window=7):
+    def run_time_series_baseline(df, col, window=7, dataset_key=None):
         """
         Calculates simple moving averages and rolling volatility.
         """
+        key = _cache_key("time-series", df, [col], dataset_key, col, window)
+        return result_cache.get_or_compute(
+            key, lambda: AnalysisManager._time_series_baseline(df, col, window)
+        )
+
+    @staticmethod
+    def _time_series_baseline(df, col, window):
         data = df[col].dropna()
         if data.empty:
             return None
@@ -66,10 +285,17 @@ class AnalysisManager:
         return results
 
     @staticmethod
-    def detect_outliers(df, col, method="iqr"):
+    def detect_outliers(df, col, method="iqr", dataset_key=None):
         """
         Detects outliers using IQR or Z-score.
         """
+        key = _cache_key("outliers", df, [col], dataset_key, col, method)
+        return result_cache.get_or_compute(
+            key, lambda: AnalysisManager._detect_outliers(df, col, method)
+        )
+
+    @staticmethod
+    def _detect_outliers(df, col, method):
         data = df[col].dropna()
         if data.empty:
             return []
@@ -88,18 +314,35 @@ class AnalysisManager:
         return outliers.index.tolist()
 
     @staticmethod
-    def run_clustering(df, n_clusters=3):
+    def run_clustering(df, n_clusters=3, dataset_key=None):
         """
         Performs K-Means clustering on numeric columns.
+
+        Inputs above LARGE_INPUT_ROWS use MiniBatchKMeans.
         """
         numeric_df = df.select_dtypes(include=[np.number]).dropna()
         if len(numeric_df) < n_clusters:
             return None
 
-        model = KMeans(n_clusters=n_clusters, random_state=42)
-        clusters = model.fit_predict(numeric_df)
+        key = _cache_key(
+            "clustering",
+            numeric_df,
+            None,
+            dataset_key,
+            tuple(numeric_df.columns),
+            n_clusters,
+        )
+
+        def compute():
+            if len(numeric_df) > LARGE_INPUT_ROWS:
+                model = MiniBatchKMeans(
+                    n_clusters=n_clusters, random_state=42, batch_size=4096, n_init=3
+                )
+            else:
+                model = KMeans(n_clusters=n_clusters, random_state=42)
+            return model.fit_predict(numeric_df)
 
-        return clusters
+        return result_cache.get_or_compute(key, compute)
 
     @staticmethod
     def run_hypothesis_test(group1, group2):
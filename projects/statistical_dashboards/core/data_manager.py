@@ -1,8 +1,147 @@
 import pandas as pd
+import hashlib
 import os
 import json
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from sqlalchemy import insert
 from .database import WarehouseInventory, WarehouseBinMaster
 
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow
+
+    PARQUET_AVAILABLE = True
+    # Raised for frames Arrow can't type, e.g. object columns mixing ints and str
+    _ARROW_CONVERSION_ERRORS = (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError)
+except ImportError:
+    PARQUET_AVAILABLE = False
+    _ARROW_CONVERSION_ERRORS = ()
+
+# Rows per Parquet row group; filters on load skip whole groups via their stats
+PARQUET_ROW_GROUP_SIZE = 100_000
+
+# Upper bound for the in-process cache of loaded frames
+FRAME_CACHE_MAX_BYTES = int(os.environ.get("DASHBOARD_FRAME_CACHE_MB", "512")) * (
+    1024 * 1024
+)
+
+# With copy-on-write, handing out shallow copies of cached frames is safe
+_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3 or bool(
+    getattr(pd.options.mode, "copy_on_write", False)
+)
+
+# Rows per executemany batch during domain ingestion
+INGEST_CHUNK_SIZE = 10_000
+
+# Bound parameters per IN (...) lookup; stays under SQLite's variable limit
+IN_QUERY_CHUNK_SIZE = 500
+
+_FILTER_OPS = {
+    "=": lambda s, v: s == v,
+    "==": lambda s, v: s == v,
+    "!=": lambda s, v: s != v,
+    "<": lambda s, v: s < v,
+    "<=": lambda s, v: s <= v,
+    ">": lambda s, v: s > v,
+    ">=": lambda s, v: s >= v,
+    "in": lambda s, v: s.isin(v),
+    "not in": lambda s, v: ~s.isin(v),
+}
+
+
+def _apply_filters(df, filters):
+    """Applies (column, op, value) filters in pandas, AND-combined."""
+    if not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        mask &= _FILTER_OPS[op](df[column], value)
+    return df[mask].reset_index(drop=True)
+
+
+def _coalesce(df, names):
+    """Vectorised `row.get(a) or row.get(b) or ...` over the present columns."""
+    result = None
+    for name in names:
+        if name not in df.columns:
+            continue
+        if result is None:
+            result = df[name]
+        else:
+            result = result.where(result.map(bool), df[name])
+    return result
+
+
+def _native(series):
+    """Converts a Series to Python values, with NaN/NaT mapped to None."""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class FrameCache:
+    """Process-level LRU of loaded DataFrames, bounded by their memory size.
+
+    Keys start with (dataset_id, data_version), so replacing a dataset's
+    content makes old entries unreachable; invalidate() drops them eagerly.
+    """
+
+    def __init__(self, max_bytes=FRAME_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._frames = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size_bytes(self):
+        return sum(self._sizes.values())
+
+    def get(self, key):
+        with self._lock:
+            df = self._frames.get(key)
+            if df is None:
+                self.misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return df
+
+    def put(self, key, df):
+        size = int(df.memory_usage(index=True, deep=False).sum())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._frames[key] = df
+            self._frames.move_to_end(key)
+            self._sizes[key] = size
+            while sum(self._sizes.values()) > self.max_bytes:
+                old_key, _ = self._frames.popitem(last=False)
+                self._sizes.pop(old_key, None)
+
+    def invalidate(self, dataset_id):
+        with self._lock:
+            for key in [k for k in self._frames if k[0] == dataset_id]:
+                del self._frames[key]
+                self._sizes.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+            self._sizes.clear()
+            self.hits = self.misses = 0
+
+
+frame_cache = FrameCache()
+
 
 class DataManager:
     def __init__(self, data_dir="projects/statistical_dashboards/data"):
@@ -40,8 +179,77 @@ class DataManager:
         df = df.dropna(how="all")
         return df
 
+    @property
+    def datasets_dir(self):
+        return os.path.abspath(os.path.join(self.data_dir, "datasets"))
+
+    def _write_dataset_file(self, df, project_id):
+        """Writes a frame to a new Parquet file and returns its path."""
+        os.makedirs(self.datasets_dir, exist_ok=True)
+        path = os.path.join(
+            self.datasets_dir, f"proj_{project_id}_{uuid.uuid4().hex}.parquet"
+        )
+        try:
+            df.to_parquet(
+                path,
+                engine="pyarrow",
+                index=False,
+                row_group_size=PARQUET_ROW_GROUP_SIZE,
+            )
+        except BaseException:
+            self._remove_dataset_file(path)
+            raise
+        return path
+
+    def _store_frame(self, df, project_id):
+        """Persists a frame's content.
+
+        Returns (data_path, file_type, data_json): a Parquet file when pyarrow
+        is installed and can type every column, else inline JSON as before
+        (data_path None), e.g. for object columns mixing numbers and text.
+        """
+        if PARQUET_AVAILABLE:
+            try:
+                return self._write_dataset_file(df, project_id), "parquet", None
+            except _ARROW_CONVERSION_ERRORS as e:
+                logger.warning(f"Storing dataset as JSON, not Parquet: {e}")
+        return None, "sqlite", df.to_json(orient="records", date_format="iso")
+
+    @staticmethod
+    def _remove_dataset_file(path):
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    @staticmethod
+    def dataset_key(ds):
+        """Cache key for analysis results computed from a stored dataset.
+
+        Besides id and version it fingerprints the content (Parquet file
+        name, size and mtime, or a hash of the inline JSON), since SQLite can
+        hand a deleted dataset's id to a new upload at version 1.
+        """
+        if ds.data_path:
+            try:
+                st = os.stat(ds.data_path)
+                content = (os.path.basename(ds.data_path), st.st_size, st.st_mtime_ns)
+            except OSError:
+                content = (os.path.basename(ds.data_path), None, None)
+        else:
+            content = hashlib.sha256((ds.data_json or "").encode("utf-8")).hexdigest()
+        return (ds.id, ds.data_version or 1, content)
+
+    @staticmethod
+    def _invalidate_results(dataset_id):
+        from . import analysis_manager
+
+        analysis_manager.result_cache.invalidate_dataset(dataset_id)
+
     def save_to_database(self, df, project_id, filename, db_manager):
-        """Saves dataset metadata AND the actual data directly to the DB as a JSON string."""
+        """Saves dataset metadata to the DB and the data as a Parquet file.
+
+        Falls back to storing the data inline as a JSON string when pyarrow
+        is not installed or cannot convert the frame.
+        """
         session = db_manager.get_session()
         from .database import Dataset
 
@@ -51,40 +259,136 @@ class DataManager:
             "types": df.dtypes.apply(lambda x: str(x)).to_dict(),
         }
 
-        # We store the data as a JSON string for simplicity in SQLite
-        # while keeping the app logic mostly unchanged.
-        data_json = df.to_json(orient="records", date_format="iso")
+        data_path, file_type, data_json = self._store_frame(df, project_id)
 
         ds = Dataset(
             project_id=project_id,
             filename=filename,
-            file_type="sqlite",
+            file_type=file_type,
             row_count=len(df),
             col_count=len(df.columns),
             metadata_json=json.dumps(metadata),
             data_json=data_json,
+            data_path=data_path,
+            data_version=1,
         )
-        session.add(ds)
-        session.commit()
-        session.close()
-        return "database"
+        try:
+            session.add(ds)
+            session.commit()
+        except Exception:
+            # Don't leave an unreferenced Parquet file behind
+            session.rollback()
+            self._remove_dataset_file(data_path)
+            raise
+        finally:
+            session.close()
+        return "parquet" if data_path else "database"
 
-    def get_dataset_data(self, dataset_id, db_manager):
-        """Retrieves actual dataset content from the database."""
+    def replace_dataset_data(self, dataset_id, df, db_manager):
+        """Replaces a dataset's content and bumps its version."""
+        session = db_manager.get_session()
+        from .database import Dataset
+
+        ds = session.query(Dataset).filter_by(id=dataset_id).first()
+        if not ds:
+            session.close()
+            return False
+
+        old_path = ds.data_path
+        ds.data_path, ds.file_type, ds.data_json = self._store_frame(df, ds.project_id)
+        ds.row_count = len(df)
+        ds.col_count = len(df.columns)
+        ds.metadata_json = json.dumps(
+            {
+                "columns": df.columns.tolist(),
+                "types": df.dtypes.apply(lambda x: str(x)).to_dict(),
+            }
+        )
+        ds.data_version = (ds.data_version or 1) + 1
+        new_path = ds.data_path
+        try:
+            session.commit()
+        except Exception:
+            session.rollback()
+            if new_path != old_path:
+                self._remove_dataset_file(new_path)
+            raise
+        finally:
+            session.close()
+
+        if old_path != new_path:
+            self._remove_dataset_file(old_path)
+        frame_cache.invalidate(dataset_id)
+        return True
+
+    def get_dataset_data(self, dataset_id, db_manager, columns=None, filters=None):
+        """Retrieves dataset content, served from the frame cache when possible.
+
+        Args:
+            dataset_id: Dataset row ID.
+            db_manager: DatabaseManager providing sessions.
+            columns: Optional list of columns to load (column projection).
+            filters: Optional list of (column, op, value) tuples, AND-combined.
+                Ops: =, ==, !=, <, <=, >, >=, in, not in. For Parquet datasets
+                row groups whose statistics exclude the filter are skipped.
+        """
         session = db_manager.get_session()
         from .database import Dataset
-        import io
 
         ds = session.query(Dataset).filter_by(id=dataset_id).first()
-        if ds and ds.data_json:
-            data = pd.read_json(io.StringIO(ds.data_json), orient="records")
+        if not ds or not (ds.data_path or ds.data_json):
             session.close()
-            return data
+            return None
+        version = ds.data_version or 1
+        data_path, data_json = ds.data_path, ds.data_json
         session.close()
-        return None
+
+        columns = list(columns) if columns else None
+        filters = [tuple(f) for f in filters] if filters else None
+        full_key = (dataset_id, version, None, None)
+        key = (
+            dataset_id,
+            version,
+            tuple(columns) if columns else None,
+            repr(filters) if filters else None,
+        )
+
+        df = frame_cache.get(key)
+        if df is None and key != full_key:
+            # Project and filter an already loaded full frame in memory
+            full = frame_cache.get(full_key)
+            if full is not None:
+                df = _apply_filters(full, filters)
+                if columns:
+                    df = df[columns]
+                frame_cache.put(key, df)
+
+        if df is None:
+            df = self._load_dataset(data_path, data_json, columns, filters)
+            frame_cache.put(key, df)
+
+        return df.copy(deep=not _COPY_ON_WRITE)
+
+    @staticmethod
+    def _load_dataset(data_path, data_json, columns, filters):
+        if data_path:
+            return pd.read_parquet(
+                data_path, engine="pyarrow", columns=columns, filters=filters
+            )
+
+        import io
+
+        df = pd.read_json(io.StringIO(data_json), orient="records")
+        df = _apply_filters(df, filters)
+        return df[columns] if columns else df
 
     def auto_ingest_domain_data(self, df, project_id, db_manager):
-        """Detects if the dataframe matches a domain model and populates specific tables."""
+        """Detects if the dataframe matches a domain model and populates specific tables.
+
+        Columns are mapped once with vectorised pandas; rows are written with
+        chunked executemany inserts and bins are upserted after a single
+        batched IN lookup of the existing ones.
+        """
         cols = [c.lower() for c in df.columns]
         session = db_manager.get_session()
         ingested_tables = []
@@ -95,47 +399,66 @@ class DataManager:
             and "location" in cols
             and any(k in cols for k in ["currentstock", "quantity"])
         ):
-            stocks = []
-            for _, row in df.iterrows():
-                # Map columns flexibly
-                sku = row.get("SKU") or row.get("sku")
-                loc = row.get("Location") or row.get("location")
-                qty = row.get("CurrentStock") or row.get("quantity")
-
-                stock = WarehouseInventory(
-                    project_id=project_id,
-                    sku=sku,
-                    bin_id=loc,
-                    quantity=int(qty) if pd.notnull(qty) else 0,
-                )
-                stocks.append(stock)
+            # Map columns flexibly
+            none = pd.Series(None, index=df.index, dtype=object)
+            sku = _coalesce(df, ["SKU", "sku"])
+            loc = _coalesce(df, ["Location", "location"])
+            qty = _coalesce(df, ["CurrentStock", "quantity"])
+            qty = (
+                pd.to_numeric(qty, errors="coerce").fillna(0)
+                if qty is not None
+                else pd.Series(0, index=df.index)
+            )
 
-            session.add_all(stocks)
+            rows = [
+                {"project_id": project_id, "sku": s, "bin_id": b, "quantity": q}
+                for s, b, q in zip(
+                    _native(sku if sku is not None else none),
+                    _native(loc if loc is not None else none),
+                    qty.astype("int64").tolist(),
+                )
+            ]
+            for chunk in _chunks(rows, INGEST_CHUNK_SIZE):
+                session.execute(insert(WarehouseInventory.__table__), chunk)
             ingested_tables.append("WarehouseInventory")
 
         # Bin Master Signature: Location
         if "location" in cols:
-            locations = df[
-                "Location" if "Location" in df.columns else "location"
-            ].unique()
-            bins = []
-            for loc in locations:
-                # Check if it already exists in the bin master for this project
-                existing = (
-                    session.query(WarehouseBinMaster)
-                    .filter_by(project_id=project_id, bin_id=loc)
-                    .first()
-                )
-                if not existing:
-                    bn = WarehouseBinMaster(
-                        project_id=project_id,
-                        bin_id=loc,
-                        zone=loc[0] if len(str(loc)) > 0 else "Gen",
-                        is_active=1,
+            column = "Location" if "Location" in df.columns else "location"
+            locations = df[column].dropna().unique().tolist()
+
+            # Check which already exist in the bin master for this project
+            existing = set()
+            for chunk in _chunks(locations, IN_QUERY_CHUNK_SIZE):
+                existing.update(
+                    bin_id
+                    for (bin_id,) in session.query(WarehouseBinMaster.bin_id).filter(
+                        WarehouseBinMaster.project_id == project_id,
+                        WarehouseBinMaster.bin_id.in_(chunk),
                     )
-                    bins.append(bn)
+                )
+
+            bins = [
+                {
+                    "project_id": project_id,
+                    "bin_id": loc,
+                    "zone": str(loc)[0] if len(str(loc)) > 0 else "Gen",
+                    "is_active": 1,
+                }
+                for loc in locations
+                if loc not in existing and str(loc) not in existing
+            ]
             if bins:
-                session.add_all(bins)
+                stmt = insert(WarehouseBinMaster.__table__)
+                if session.get_bind().dialect.name == "sqlite":
+                    # bin_id is globally unique; keep rows owned by other projects
+                    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+                    stmt = sqlite_insert(
+                        WarehouseBinMaster.__table__
+                    ).on_conflict_do_nothing(index_elements=["bin_id"])
+                for chunk in _chunks(bins, INGEST_CHUNK_SIZE):
+                    session.execute(stmt, chunk)
                 ingested_tables.append("WarehouseBinMaster")
 
         if ingested_tables:
@@ -172,9 +495,14 @@ class DataManager:
 
         project = session.query(Project).filter_by(id=project_id).first()
         if project:
+            datasets = [(d.id, d.data_path) for d in project.datasets]
             session.delete(project)
             session.commit()
             session.close()
+            for dataset_id, data_path in datasets:
+                self._remove_dataset_file(data_path)
+                frame_cache.invalidate(dataset_id)
+                self._invalidate_results(dataset_id)
             return True
         session.close()
         return False
@@ -201,9 +529,13 @@ class DataManager:
 
         dataset = session.query(Dataset).filter_by(id=dataset_id).first()
         if dataset:
+            data_path = dataset.data_path
             session.delete(dataset)
             session.commit()
             session.close()
+            self._remove_dataset_file(data_path)
+            frame_cache.invalidate(dataset_id)
+            self._invalidate_results(dataset_id)
             return True
         session.close()
         return False
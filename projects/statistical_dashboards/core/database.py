@@ -39,7 +39,9 @@ class Dataset(Base):
     row_count = Column(Integer)
     col_count = Column(Integer)
     metadata_json = Column(Text)  # JSON string of column names/types
-    data_json = Column(Text)  # The actual content of the dataset
+    data_json = Column(Text)  # Legacy inline content (pre-Parquet datasets)
+    data_path = Column(String(500))  # Parquet file holding the dataset content
+    data_version = Column(Integer, default=1)  # Bumped when the content changes
     uploaded_at = Column(DateTime, default=datetime.utcnow)
     project = relationship("Project", back_populates="datasets")
 
@@ -145,6 +147,12 @@ class DatabaseManager:
             columns = [info[1] for info in cursor.fetchall()]
             if "data_json" not in columns:
                 cursor.execute("ALTER TABLE datasets ADD COLUMN data_json TEXT")
+            if "data_path" not in columns:
+                cursor.execute("ALTER TABLE datasets ADD COLUMN data_path TEXT")
+            if "data_version" not in columns:
+                cursor.execute(
+                    "ALTER TABLE datasets ADD COLUMN data_version INTEGER DEFAULT 1"
+                )
 
             # Check for projects table (registry for multi-project vault)
             cursor.execute(
@@ -43,3 +43,64 @@ def test_time_series_baseline(sample_df):
     assert results is not None
     assert len(results["sma"]) == 10
     assert results["latest_sma"] == 18.0  # (17 + 19) / 2
+
+
+def test_results_are_cached_per_dataset_version(sample_df, monkeypatch):
+    from core import analysis_manager as am
+
+    cache = am.ResultCache(spill_dir=None)
+    monkeypatch.setattr(am, "result_cache", cache)
+
+    first = AnalysisManager.run_linear_regression(sample_df, "x", "y")
+    again = AnalysisManager.run_linear_regression(sample_df.copy(), "x", "y")
+    assert again is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    AnalysisManager.run_linear_regression(sample_df, "x", "y", dataset_key=(1, 1))
+    AnalysisManager.run_linear_regression(sample_df, "x", "y", dataset_key=(1, 2))
+    assert cache.misses == 3
+
+
+def test_result_cache_spills_evicted_entries(tmp_path):
+    from core.analysis_manager import ResultCache
+
+    cache = ResultCache(max_entries=1, spill_dir=str(tmp_path))
+    cache.get_or_compute("a", lambda: {"value": 1})
+    cache.get_or_compute("b", lambda: {"value": 2})
+    assert (tmp_path / "a.pkl").exists()
+
+    assert cache.get_or_compute("a", lambda: pytest.fail("recomputed")) == {"value": 1}
+
+
+def test_streaming_corr_is_stable_with_large_offsets():
+    from core import analysis_manager as am
+
+    rng = np.random.default_rng(1)
+    noise = rng.normal(size=200_000)
+    df = pd.DataFrame(
+        {
+            # Epoch-second timestamps with unit jitter
+            "ts": 1.7e9 + noise,
+            "v": noise + rng.normal(size=200_000),
+        }
+    )
+
+    corr = am._streaming_corr(df, chunk_rows=50_000)
+    pd.testing.assert_frame_equal(corr, df.corr(), atol=1e-9)
+
+
+def test_large_inputs_use_streaming_and_minibatch(monkeypatch):
+    from core import analysis_manager as am
+
+    monkeypatch.setattr(am, "result_cache", am.ResultCache(spill_dir=None))
+    monkeypatch.setattr(am, "LARGE_INPUT_ROWS", 100)
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(1000, 3)), columns=["a", "b", "c"])
+    df["d"] = df["a"] * 3 + rng.normal(scale=0.1, size=1000)
+
+    corr = am._streaming_corr(df, chunk_rows=128)
+    pd.testing.assert_frame_equal(corr, df.corr(), atol=1e-10)
+    assert AnalysisManager.get_correlation_matrix(df).shape == (4, 4)
+
+    clusters = AnalysisManager.run_clustering(df, n_clusters=2)
+    assert len(clusters) == 1000
@@ -0,0 +1,211 @@
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+import pandas as pd
+from core import data_manager as dm_module
+from core.data_manager import DataManager, frame_cache
+from core.database import DatabaseManager, Dataset
+
+
+@pytest.fixture
+def sample_df():
+    return pd.DataFrame(
+        {
+            "sku": [f"SKU-{i}" for i in range(20)],
+            "zone": ["A", "B"] * 10,
+            "qty": list(range(20)),
+        }
+    )
+
+
+@pytest.fixture
+def stores(tmp_path):
+    frame_cache.clear()
+    db = DatabaseManager(db_path=str(tmp_path / "test.db"))
+    yield DataManager(data_dir=str(tmp_path / "data")), db
+    frame_cache.clear()
+    db.engine.dispose()
+
+
+@pytest.fixture(params=["parquet", "json"])
+def storage(request, monkeypatch):
+    if request.param == "parquet":
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(dm_module, "PARQUET_AVAILABLE", False)
+    return request.param
+
+
+def _latest_dataset(db):
+    session = db.get_session()
+    ds = session.query(Dataset).order_by(Dataset.id.desc()).first()
+    session.close()
+    return ds
+
+
+def test_round_trip_uses_frame_cache(stores, storage, sample_df):
+    dm, db = stores
+    dm.save_to_database(sample_df, 1, "inventory.csv", db)
+    ds = _latest_dataset(db)
+    assert (ds.data_path is not None) == (storage == "parquet")
+
+    first = dm.get_dataset_data(ds.id, db)
+    pd.testing.assert_frame_equal(first, sample_df)
+    first.loc[0, "qty"] = -1  # callers may mutate what they get back
+
+    second = dm.get_dataset_data(ds.id, db)
+    assert second.loc[0, "qty"] == 0
+    assert frame_cache.hits == 1
+
+
+def test_projection_and_filters(stores, storage, sample_df):
+    dm, db = stores
+    dm.save_to_database(sample_df, 1, "inventory.csv", db)
+    ds = _latest_dataset(db)
+
+    df = dm.get_dataset_data(
+        ds.id,
+        db,
+        columns=["sku", "qty"],
+        filters=[("zone", "==", "A"), ("qty", ">=", 10)],
+    )
+    assert df.columns.tolist() == ["sku", "qty"]
+    assert df["qty"].tolist() == [10, 12, 14, 16, 18]
+
+
+def test_replace_and_delete_invalidate_cache(stores, storage, sample_df):
+    dm, db = stores
+    dm.save_to_database(sample_df, 1, "inventory.csv", db)
+    ds = _latest_dataset(db)
+    dm.get_dataset_data(ds.id, db)
+
+    assert dm.replace_dataset_data(ds.id, sample_df.head(3), db)
+    assert len(dm.get_dataset_data(ds.id, db)) == 3
+    assert _latest_dataset(db).data_version == 2
+
+    data_path = _latest_dataset(db).data_path
+    assert dm.delete_dataset(ds.id, db)
+    assert dm.get_dataset_data(ds.id, db) is None
+    if data_path:
+        assert not Path(data_path).exists()
+
+
+def test_reused_dataset_id_does_not_serve_stale_results(
+    stores, storage, monkeypatch, tmp_path
+):
+    from core import analysis_manager as am
+
+    results_dir = tmp_path / "results"
+    monkeypatch.setattr(
+        am, "result_cache", am.ResultCache(max_entries=1, spill_dir=str(results_dir))
+    )
+    dm, db = stores
+
+    def regression(ds):
+        df = dm.get_dataset_data(ds.id, db)
+        key = dm.dataset_key(ds)
+        # A second result evicts the regression to disk
+        am.AnalysisManager.get_correlation_matrix(df, dataset_key=key)
+        return am.AnalysisManager.run_linear_regression(df, "x", "y", dataset_key=key)
+
+    dm.save_to_database(pd.DataFrame({"x": [1, 2, 3], "y": [2, 4, 6]}), 1, "a", db)
+    old = _latest_dataset(db)
+    assert regression(old)["coefficient"] == pytest.approx(2.0)
+    assert list(results_dir.iterdir())
+
+    assert dm.delete_dataset(old.id, db)
+    assert not list(results_dir.iterdir())
+
+    dm.save_to_database(pd.DataFrame({"x": [1, 2, 3], "y": [3, 6, 9]}), 1, "b", db)
+    new = _latest_dataset(db)
+    assert (new.id, new.data_version) == (old.id, old.data_version)
+    assert dm.dataset_key(new) != dm.dataset_key(old)
+    assert regression(new)["coefficient"] == pytest.approx(3.0)
+
+
+def test_mixed_type_columns_fall_back_to_json(stores, sample_df):
+    pytest.importorskip("pyarrow")
+    dm, db = stores
+    mixed = pd.DataFrame({"a": [1, "x", 2.5]})
+
+    assert dm.save_to_database(mixed, 1, "upload.csv", db) == "database"
+    ds = _latest_dataset(db)
+    assert (ds.data_path, ds.file_type) == (None, "sqlite")
+    assert dm.get_dataset_data(ds.id, db)["a"].tolist() == [1, "x", 2.5]
+    assert not Path(dm.datasets_dir).exists() or not any(
+        Path(dm.datasets_dir).iterdir()
+    )
+
+    # Replacing with convertible data moves the dataset to Parquet
+    assert dm.replace_dataset_data(ds.id, sample_df, db)
+    assert _latest_dataset(db).file_type == "parquet"
+    assert dm.replace_dataset_data(ds.id, mixed, db)
+    assert _latest_dataset(db).data_path is None
+
+
+def test_failed_commit_removes_new_parquet_file(stores, sample_df, monkeypatch):
+    pytest.importorskip("pyarrow")
+    dm, db = stores
+    dm.save_to_database(sample_df, 1, "inventory.csv", db)
+    ds = _latest_dataset(db)
+    datasets_dir = Path(dm.datasets_dir)
+    before = sorted(datasets_dir.iterdir())
+
+    def failing_commit(self):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr("sqlalchemy.orm.Session.commit", failing_commit)
+    with pytest.raises(RuntimeError):
+        dm.save_to_database(sample_df, 1, "second.csv", db)
+    with pytest.raises(RuntimeError):
+        dm.replace_dataset_data(ds.id, sample_df.head(3), db)
+
+    assert sorted(datasets_dir.iterdir()) == before
+    monkeypatch.undo()
+    assert _latest_dataset(db).data_path == str(before[0])
+
+
+def test_auto_ingest_domain_data_bulk(stores):
+    from core.database import WarehouseBinMaster, WarehouseInventory
+
+    dm, db = stores
+    df = pd.DataFrame(
+        {
+            "SKU": ["A", "B", "C", "D"],
+            "Location": ["A-01", "A-02", "B-01", "A-01"],
+            "CurrentStock": [5, None, 7.9, 0],
+        }
+    )
+    session = db.get_session()
+    session.add(WarehouseBinMaster(project_id=1, bin_id="A-02", zone="A"))
+    session.commit()
+    session.close()
+
+    assert dm.auto_ingest_domain_data(df, 1, db) == [
+        "WarehouseInventory",
+        "WarehouseBinMaster",
+    ]
+    # All bins already known: inventory rows only
+    assert dm.auto_ingest_domain_data(df, 1, db) == ["WarehouseInventory"]
+
+    session = db.get_session()
+    inventory = session.query(WarehouseInventory).order_by(WarehouseInventory.id)
+    assert [(r.sku, r.bin_id, r.quantity) for r in inventory][:4] == [
+        ("A", "A-01", 5),
+        ("B", "A-02", 0),
+        ("C", "B-01", 7),
+        ("D", "A-01", 0),
+    ]
+    assert all(r.last_updated is not None for r in inventory)
+    bins = session.query(WarehouseBinMaster).order_by(WarehouseBinMaster.bin_id)
+    assert [(b.bin_id, b.zone) for b in bins] == [
+        ("A-01", "A"),
+        ("A-02", "A"),
+        ("B-01", "B"),
+    ]
+    session.close()
@@ -29,6 +29,7 @@ Version: 1.0.0
 
 from typing import Dict, Type, Optional
 from .base_adapter import BaseAdapter, AdapterConfig, KnowledgeUpdate, UpdateSource
+from .http_client import HttpClient
 
 # Adapter registry - populated by imports
 _ADAPTER_REGISTRY: Dict[str, Type[BaseAdapter]] = {}
@@ -128,6 +129,7 @@ __all__ = [
     "AdapterConfig",
     "KnowledgeUpdate",
     "UpdateSource",
+    "HttpClient",
     "register_adapter",
     "create_adapter",
     "get_available_adapters",
@@ -27,6 +27,8 @@ from typing import Any, Dict, List, Optional
 import hashlib
 import json
 
+from .http_client import HttpClient
+
 
 class UpdatePriority(Enum):
     """Priority levels for knowledge updates.
@@ -242,6 +244,7 @@ class BaseAdapter(ABC):
         self.config = config
         self._cache: Dict[str, Any] = {}
         self._last_fetch: Optional[datetime] = None
+        self._http: Optional[HttpClient] = None
 
     @property
     @abstractmethod
@@ -343,6 +346,18 @@ class BaseAdapter(ABC):
             raw_data=raw_data,
         )
 
+    def use_http_client(self, client: Optional[HttpClient]) -> None:
+        """Send this adapter's requests through a shared HttpClient.
+
+        While attached, _get_session() returns a view of the client's pooled
+        session, so requests share its connection limits and on-disk
+        conditional-request cache. Pass None to go back to a private session.
+
+        Args:
+            client: Shared client, or None to detach
+        """
+        self._http = client
+
     def _should_refresh_cache(self, cache_key: str) -> bool:
         """Check if cached data should be refreshed.
 
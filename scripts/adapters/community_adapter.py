@@ -137,14 +137,17 @@ class CommunityAdapter(BaseAdapter):
         if aiohttp is None:
             raise ImportError("aiohttp required for CommunityAdapter")
 
-        if self._session is None or self._session.closed:
-            headers = {
-                "User-Agent": "Antigravity-Agent-Factory/1.0",
-                "Accept": "application/vnd.github.v3+json",
-            }
-            if self.config.api_key:
-                headers["Authorization"] = f"token {self.config.api_key}"
+        headers = {
+            "User-Agent": "Antigravity-Agent-Factory/1.0",
+            "Accept": "application/vnd.github.v3+json",
+        }
+        if self.config.api_key:
+            headers["Authorization"] = f"token {self.config.api_key}"
+
+        if self._http is not None:
+            return self._http.view(headers)
 
+        if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds),
@@ -131,9 +131,14 @@ class DocsAdapter(BaseAdapter):
         if aiohttp is None:
             raise ImportError("aiohttp required for DocsAdapter")
 
+        headers = {"User-Agent": "Antigravity-Agent-Factory/1.0"}
+
+        if self._http is not None:
+            return self._http.view(headers)
+
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
-                headers={"User-Agent": "Antigravity-Agent-Factory/1.0"},
+                headers=headers,
                 timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds),
             )
 
@@ -0,0 +1,427 @@
+"""
+Shared HTTP Client for Knowledge Source Adapters
+
+Provides one pooled aiohttp session per aggregation run, with per-host
+connection limits, and a persistent on-disk cache of GET responses.
+Cached responses are revalidated with If-None-Match / If-Modified-Since,
+so an unchanged upstream feed costs a 304 instead of a full download.
+Rate-limited (429), failing (5xx) and dropped requests are retried with
+exponential backoff, honouring Retry-After.
+
+Adapters keep their request code: while a client is attached with
+BaseAdapter.use_http_client(), their _get_session() returns a SessionView,
+which offers the get/head/request subset of aiohttp.ClientSession they use.
+
+Usage:
+    async with HttpClient() as http:
+        adapter.use_http_client(http)
+        updates = await adapter.fetch_updates()
+    print(http.stats)
+
+Author: Antigravity Agent Factory
+Version: 1.0.0
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import aiohttp
+    from multidict import CIMultiDict
+except ImportError:
+    aiohttp = None  # Will be checked at runtime
+    CIMultiDict = dict
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / ".agent" / "cache" / "http"
+CACHE_VERSION = 1
+
+CONNECTION_LIMIT = 20
+PER_HOST_LIMIT = 4
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5  # seconds; doubled on every retry
+MAX_BACKOFF = 30.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class CacheEntry:
+    """A cached GET response and the validators needed to revalidate it.
+
+    Attributes:
+        url: Request URL
+        status: Original response status (always 200)
+        body: Decoded response body
+        headers: Response headers
+        etag: ETag validator, if the server sent one
+        last_modified: Last-Modified validator, if the server sent one
+        stored_at: When the response was last fetched or revalidated
+    """
+
+    url: str
+    status: int
+    body: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    )
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """Directory of cached GET responses, one JSON file per request."""
+
+    def __init__(self, directory: Path):
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (created on first write)
+        """
+        self.directory = Path(directory)
+
+    @staticmethod
+    def key(
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Cache key for a request.
+
+        The Accept and Authorization headers are part of the key because they
+        change what the server returns; only a hash of them is stored.
+        """
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        material = json.dumps(
+            [
+                url,
+                sorted((str(k), str(v)) for k, v in (params or {}).items()),
+                headers.get("accept"),
+                headers.get("authorization"),
+            ]
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Load a cached response, or None if missing or unreadable."""
+        try:
+            data = json.loads(self._path(key).read_text(encoding="utf-8"))
+            if data.pop("version", None) != CACHE_VERSION:
+                return None
+            return CacheEntry(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Store a response, replacing any previous entry atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps({"version": CACHE_VERSION, **asdict(entry)}),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+
+class CachedResponse:
+    """A fully read response with the aiohttp.ClientResponse subset adapters use.
+
+    Attributes:
+        status: HTTP status (200 for a revalidated cache hit)
+        headers: Case-insensitive response headers
+        url: Request URL
+        from_cache: Whether the body came from the cache after a 304
+    """
+
+    def __init__(
+        self,
+        status: int,
+        headers: Dict[str, str],
+        body: str,
+        url: str,
+        from_cache: bool = False,
+    ):
+        self.status = status
+        self.headers = CIMultiDict(headers)
+        self.url = url
+        self.from_cache = from_cache
+        self._body = body
+
+    async def json(self, **kwargs) -> Any:
+        return json.loads(self._body)
+
+    async def text(self, **kwargs) -> str:
+        return self._body
+
+    async def read(self) -> bytes:
+        return self._body.encode("utf-8")
+
+    async def __aenter__(self) -> "CachedResponse":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+class _RequestContext:
+    """Async context manager around a pending HttpClient request."""
+
+    def __init__(self, coro):
+        self._coro = coro
+
+    async def __aenter__(self) -> CachedResponse:
+        return await self._coro
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+class SessionView:
+    """aiohttp.ClientSession look-alike bound to an HttpClient.
+
+    Each adapter gets a view carrying its default headers; closing a view
+    leaves the shared pooled session open.
+    """
+
+    closed = False
+
+    def __init__(self, client: "HttpClient", headers: Optional[Dict[str, str]] = None):
+        self._client = client
+        self._headers = dict(headers or {})
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> _RequestContext:
+        return _RequestContext(
+            self._client.request(
+                method,
+                url,
+                params=params,
+                headers={**self._headers, **(headers or {})},
+                json_data=json,
+            )
+        )
+
+    def get(self, url: str, **kwargs) -> _RequestContext:
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> _RequestContext:
+        return self.request("HEAD", url, **kwargs)
+
+    async def close(self) -> None:
+        return None
+
+
+class HttpClient:
+    """Pooled HTTP session with a persistent conditional-request cache.
+
+    Example:
+        async with HttpClient(limit_per_host=2) as http:
+            async with http.view({"Accept": "application/json"}).get(url) as r:
+                data = await r.json()
+            print(http.stats["not_modified"])
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        limit: int = CONNECTION_LIMIT,
+        limit_per_host: int = PER_HOST_LIMIT,
+        timeout_seconds: float = 30,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE,
+    ):
+        """Initialize the client.
+
+        Args:
+            cache_dir: Response cache directory, or None to disable caching
+            limit: Maximum open connections in total
+            limit_per_host: Maximum concurrent connections per host
+            timeout_seconds: Total timeout for each attempt
+            max_retries: Retries after a 429/5xx response or connection error
+            backoff_base: First retry delay in seconds, doubled each retry
+        """
+        self.cache = HttpCache(cache_dir) if cache_dir is not None else None
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout_seconds = timeout_seconds
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "fetched": 0,
+            "not_modified": 0,
+            "retries": 0,
+            "errors": 0,
+        }
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    async def __aenter__(self) -> "HttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def view(self, headers: Optional[Dict[str, str]] = None) -> SessionView:
+        """Session look-alike that sends the given default headers."""
+        return SessionView(self, headers)
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Get or create the pooled session."""
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for HttpClient. Install with: pip install aiohttp"
+            )
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit, limit_per_host=self.limit_per_host
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+            )
+
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        json_data: Optional[Any] = None,
+    ) -> CachedResponse:
+        """Send a request, revalidating a cached GET response if there is one.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters
+            headers: Request headers
+            json_data: JSON body
+
+        Returns:
+            The response; a 304 for a cached request is returned as the
+            cached 200 response with ``from_cache`` set.
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: If every attempt failed
+        """
+        headers = dict(headers or {})
+        key = entry = None
+        if self.cache is not None and method == "GET" and json_data is None:
+            key = HttpCache.key(url, params, headers)
+            entry = self.cache.get(key)
+            if entry is not None:
+                headers.update(entry.validators())
+
+        response = await self._send(method, url, params, headers, json_data)
+
+        if response.status == 304 and entry is not None:
+            self.stats["not_modified"] += 1
+            merged = CIMultiDict(entry.headers)
+            merged.update(response.headers)
+            entry.headers = dict(merged)
+            entry.etag = response.headers.get("ETag", entry.etag)
+            entry.last_modified = response.headers.get(
+                "Last-Modified", entry.last_modified
+            )
+            entry.stored_at = datetime.now(timezone.utc).isoformat()
+            self.cache.put(key, entry)
+            return CachedResponse(
+                entry.status, entry.headers, entry.body, url, from_cache=True
+            )
+
+        self.stats["fetched"] += 1
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if key is not None and response.status == 200 and (etag or last_modified):
+            self.cache.put(
+                key,
+                CacheEntry(
+                    url=url,
+                    status=200,
+                    body=await response.text(),
+                    headers=dict(response.headers),
+                    etag=etag,
+                    last_modified=last_modified,
+                ),
+            )
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        json_data: Optional[Any],
+    ) -> CachedResponse:
+        """Send a request, retrying with backoff on 429/5xx and network errors."""
+        session = await self._get_session()
+        attempt = 0
+        while True:
+            self.stats["requests"] += 1
+            try:
+                async with session.request(
+                    method, url, params=params, headers=headers, json=json_data
+                ) as resp:
+                    body = await resp.read()
+                    response = CachedResponse(
+                        resp.status,
+                        dict(resp.headers),
+                        body.decode(resp.charset or "utf-8", errors="replace"),
+                        url,
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt >= self.max_retries:
+                    self.stats["errors"] += 1
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if response.status not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+                delay = self._backoff(attempt, response.headers.get("Retry-After"))
+
+            attempt += 1
+            self.stats["retries"] += 1
+            await asyncio.sleep(delay)
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Delay before the next attempt, preferring the server's Retry-After."""
+        if retry_after and retry_after.strip().isdigit():
+            return min(float(retry_after), MAX_BACKOFF)
+        return min(self.backoff_base * 2**attempt, MAX_BACKOFF)
@@ -128,14 +128,17 @@ class NPMAdapter(BaseAdapter):
                 "aiohttp is required for NPMAdapter. Install with: pip install aiohttp"
             )
 
-        if self._session is None or self._session.closed:
-            headers = {
-                "Accept": "application/json",
-                "User-Agent": "Antigravity-Agent-Factory/1.0",
-            }
-            if self.config.api_key:
-                headers["Authorization"] = f"Bearer {self.config.api_key}"
+        headers = {
+            "Accept": "application/json",
+            "User-Agent": "Antigravity-Agent-Factory/1.0",
+        }
+        if self.config.api_key:
+            headers["Authorization"] = f"Bearer {self.config.api_key}"
+
+        if self._http is not None:
+            return self._http.view(headers)
 
+        if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds),
@@ -139,11 +139,15 @@ class PyPIAdapter(BaseAdapter):
                 "aiohttp is required for PyPIAdapter. Install with: pip install aiohttp"
             )
 
+        headers = {
+            "Accept": "application/json",
+            "User-Agent": "Antigravity-Agent-Factory/1.0",
+        }
+
+        if self._http is not None:
+            return self._http.view(headers)
+
         if self._session is None or self._session.closed:
-            headers = {
-                "Accept": "application/json",
-                "User-Agent": "Antigravity-Agent-Factory/1.0",
-            }
             self._session = aiohttp.ClientSession(
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds),
@@ -42,9 +42,14 @@ if sys.platform == "win32":
 
 def cmd_search(args):
     """Semantic search across the entire RAG library."""
-    from scripts.ai.rag.rag_optimized import get_rag
+    from scripts.memory.warm_pool import attach_rag
 
-    rag = get_rag(warmup=False)
+    # Use the warm pool when it is running to skip model load and hydration
+    rag = attach_rag()
+    if rag is None:
+        from scripts.ai.rag.rag_optimized import get_rag
+
+        rag = get_rag(warmup=False)
     docs = rag.query(args.query, k=args.top_k)
 
     if not docs:
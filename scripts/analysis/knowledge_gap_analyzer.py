@@ -35,6 +35,11 @@ except ImportError:
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
     from scripts.taxonomy import TaxonomyLoader, TopicNode
 
+try:
+    from .knowledge_index import DEFAULT_INDEX_PATH, KnowledgeIndex
+except ImportError:
+    from scripts.analysis.knowledge_index import DEFAULT_INDEX_PATH, KnowledgeIndex
+
 
 class GapType(Enum):
     """Types of knowledge gaps that can be identified."""
@@ -253,17 +258,24 @@ class KnowledgeGapAnalyzer:
         },
     }
 
-    def __init__(self, knowledge_dir: Path, taxonomy_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        knowledge_dir: Path,
+        taxonomy_dir: Optional[Path] = None,
+        index_path: Optional[Path] = None,
+    ):
         """Initialize the gap analyzer.
 
         Args:
             knowledge_dir: Directory containing knowledge JSON files
             taxonomy_dir: Directory containing taxonomy files (optional)
+            index_path: File to persist the keyword index in (optional;
+                without it the index is rebuilt on every run)
         """
         self.knowledge_dir = Path(knowledge_dir)
         self.taxonomy_loader = TaxonomyLoader(taxonomy_dir)
         self._knowledge_cache: Dict[str, Dict[str, Any]] = {}
-        self._content_index: Dict[str, str] = {}  # file -> flattened content
+        self._index = KnowledgeIndex(index_path)
 
     def analyze(self, taxonomy_name: str = "agent_taxonomy.json") -> AnalysisResult:
         """Perform comprehensive gap analysis.
@@ -277,8 +289,8 @@ class KnowledgeGapAnalyzer:
         # Load taxonomy
         domains = self.taxonomy_loader.load_taxonomy(taxonomy_name)
 
-        # Load and index all knowledge files
-        self._load_knowledge_files()
+        # Load and index all knowledge files against every taxonomy keyword
+        self._load_knowledge_files(self._collect_keywords(domains.values()))
 
         # Analyze each domain
         all_scores: List[CoverageScore] = []
@@ -302,10 +314,33 @@ class KnowledgeGapAnalyzer:
             files_analyzed=list(self._knowledge_cache.keys()),
         )
 
-    def _load_knowledge_files(self) -> None:
-        """Load all JSON knowledge files into cache."""
+    @staticmethod
+    def _topic_keywords(topic: TopicNode) -> List[str]:
+        """Keywords searched for a topic (its name when none are defined)."""
+        return topic.keywords if topic.keywords else [topic.name.replace("_", " ")]
+
+    def _collect_keywords(self, nodes) -> Set[str]:
+        """Lowercased keywords of the given topics and all their subtopics."""
+        keywords: Set[str] = set()
+        stack = list(nodes)
+        while stack:
+            node = stack.pop()
+            keywords.update(kw.lower() for kw in self._topic_keywords(node))
+            stack.extend(node.subtopics.values())
+        return keywords
+
+    def _load_knowledge_files(self, keywords: Optional[Set[str]] = None) -> None:
+        """Load all JSON knowledge files into cache and index them.
+
+        Files whose persisted index entry is still fresh (same mtime and size)
+        are not rescanned; others are scanned once for all `keywords`.
+
+        Args:
+            keywords: Lowercased keywords to index up front (optional; missing
+                keywords are indexed on first use)
+        """
         self._knowledge_cache.clear()
-        self._content_index.clear()
+        self._index.clear()
 
         for file_path in self.knowledge_dir.rglob("*.json"):
             if file_path.name.startswith("_") or "schema" in file_path.name.lower():
@@ -315,11 +350,15 @@ class KnowledgeGapAnalyzer:
                 with open(file_path, "r", encoding="utf-8") as f:
                     content = json.load(f)
                     self._knowledge_cache[file_path.name] = content
-                    # Create flattened content string for searching
-                    self._content_index[file_path.name] = self._flatten_content(content)
+                    self._index.add_file(file_path.name, file_path)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Warning: Failed to load {file_path.name}: {e}")
 
+        self._index.ensure_terms(
+            keywords or (), self._knowledge_cache, self._flatten_content
+        )
+        self._index.save()
+
     def _flatten_content(self, obj: Any, depth: int = 0) -> str:
         """Recursively flatten JSON content to searchable string.
 
@@ -393,43 +432,42 @@ class KnowledgeGapAnalyzer:
             CoverageScore with analysis results
         """
         # Get all keywords to search for
-        keywords = topic.keywords if topic.keywords else [topic.name.replace("_", " ")]
+        keywords = self._topic_keywords(topic)
+        self._index.ensure_terms(
+            {kw.lower() for kw in keywords},
+            self._knowledge_cache,
+            self._flatten_content,
+        )
 
-        # Search across all knowledge files
+        # Look up matches in the keyword index
         matched_keywords: Set[str] = set()
-        source_files: List[str] = []
-        evidence: List[str] = []
+        matched_files: Set[str] = set()
         total_mentions = 0
         has_code_example = False
         has_best_practice = False
 
-        for filename, content_str in self._content_index.items():
-            file_matched = False
-            file_content = self._knowledge_cache.get(filename, {})
-
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                # Count occurrences
-                mentions = content_str.count(keyword_lower)
-                if mentions > 0:
-                    matched_keywords.add(keyword)
-                    total_mentions += mentions
-                    file_matched = True
-
-                    # Check for code examples
-                    if "code_example" in content_str and keyword_lower in content_str:
-                        has_code_example = True
-
-                    # Check for best practices
-                    if "best_practice" in content_str and keyword_lower in content_str:
-                        has_best_practice = True
-
-            if file_matched:
-                source_files.append(filename)
-                # Extract evidence snippet
-                evidence_snippet = self._extract_evidence(file_content, keywords)
-                if evidence_snippet:
-                    evidence.append(f"{filename}: {evidence_snippet}")
+        for keyword in keywords:
+            postings = self._index.postings(keyword.lower())
+            if postings:
+                matched_keywords.add(keyword)
+            for filename, mentions in postings.items():
+                total_mentions += mentions
+                matched_files.add(filename)
+                entry = self._index.files[filename]
+                # Check for code examples and best practices
+                has_code_example = has_code_example or entry.has_code_example
+                has_best_practice = has_best_practice or entry.has_best_practice
+
+        # Keep knowledge file load order for sources and evidence
+        source_files = [f for f in self._knowledge_cache if f in matched_files]
+        evidence: List[str] = []
+        for filename in source_files:
+            # Extract evidence snippet
+            evidence_snippet = self._index.evidence(filename, keywords)
+            if evidence_snippet:
+                evidence.append(f"{filename}: {evidence_snippet}")
+                if len(evidence) == 3:
+                    break
 
         # Calculate depth based on criteria
         depth = self._determine_depth(
@@ -662,7 +700,7 @@ def run_gap_analysis(
     if knowledge_dir is None:
         knowledge_dir = Path(__file__).parent.parent.parent / ".agent" / "knowledge"
 
-    analyzer = KnowledgeGapAnalyzer(knowledge_dir)
+    analyzer = KnowledgeGapAnalyzer(knowledge_dir, index_path=DEFAULT_INDEX_PATH)
     return analyzer.analyze(taxonomy_name)
 
 
@@ -0,0 +1,380 @@
+"""
+Knowledge Index for the Knowledge Gap Analyzer
+
+Inverted index over knowledge files: for every indexed keyword (a single
+term or a multi-word phrase) it stores per-file occurrence counts, and for
+every file the flags and evidence snippets the coverage scoring needs. All
+keywords are matched in a single Aho-Corasick pass per file, and the index
+is persisted with mtime/size invalidation so unchanged files are never
+rescanned.
+
+Counting follows ``str.count`` (leftmost, non-overlapping substring matches),
+so scores computed from the index equal those of a full text scan. Evidence
+follows ``KnowledgeGapAnalyzer._extract_evidence`` for the keywords found in
+the file's searchable text.
+
+Author: Antigravity Agent Factory
+Version: 1.0.0
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import ahocorasick  # pyahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+DEFAULT_INDEX_PATH = (
+    Path(__file__).parent.parent.parent / ".agent" / "cache" / "knowledge-index.json"
+)
+
+INDEX_VERSION = 1
+
+# Top-level fields checked first when extracting evidence
+EVIDENCE_SECTIONS = ("description", "use_when", "best_practices")
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher.
+
+    Uses pyahocorasick when installed and a pure-Python automaton otherwise.
+    iter_matches() yields (start, pattern) for every occurrence, including
+    overlapping ones, ordered by end position.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = sorted({p for p in patterns if p})
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for pattern in self.patterns:
+                self._automaton.add_word(pattern, pattern)
+            if self.patterns:
+                self._automaton.make_automaton()
+            return
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[str]] = [[]]
+        for pattern in self.patterns:
+            state = 0
+            for char in pattern:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(pattern)
+
+        # Breadth-first failure links; outputs are merged along them
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        if not self.patterns:
+            return
+        if AHOCORASICK_AVAILABLE:
+            for end, pattern in self._automaton.iter(text):
+                yield end - len(pattern) + 1, pattern
+            return
+
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                for pattern in out[state]:
+                    yield index - len(pattern) + 1, pattern
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Non-overlapping occurrence counts, identical to str.count."""
+        counts: Dict[str, int] = {}
+        next_free: Dict[str, int] = {}
+        for start, pattern in self.iter_matches(text):
+            if start >= next_free.get(pattern, 0):
+                counts[pattern] = counts.get(pattern, 0) + 1
+                next_free[pattern] = start + len(pattern)
+        return counts
+
+    def first_positions(self, text: str) -> Dict[str, int]:
+        """Index of the first occurrence of each matching pattern."""
+        first: Dict[str, int] = {}
+        for start, pattern in self.iter_matches(text):
+            if pattern not in first:
+                first[pattern] = start
+        return first
+
+
+@dataclass
+class FileIndex:
+    """Indexed facts about one knowledge file.
+
+    Attributes:
+        path: Source path
+        mtime_ns: Modification time when indexed
+        size: File size when indexed
+        has_code_example: Flattened content mentions 'code_example'
+        has_best_practice: Flattened content mentions 'best_practice'
+        terms: Keywords this file has been scanned for
+        scanned: Flags and sections computed (always true once persisted)
+        counts: Non-zero occurrence counts per keyword
+        sections: (snippet, keywords present) per evidence section, in order
+        snippets: Context snippet from the JSON dump per keyword present
+    """
+
+    path: str
+    mtime_ns: int
+    size: int
+    has_code_example: bool = False
+    has_best_practice: bool = False
+    terms: set = field(default_factory=set)
+    scanned: bool = False
+    counts: Dict[str, int] = field(default_factory=dict)
+    sections: List[Tuple[str, List[str]]] = field(default_factory=list)
+    snippets: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "has_code_example": self.has_code_example,
+            "has_best_practice": self.has_best_practice,
+            "terms": sorted(self.terms),
+            "counts": self.counts,
+            "sections": [[s, sorted(p)] for s, p in self.sections],
+            "snippets": self.snippets,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FileIndex":
+        return cls(
+            path=data["path"],
+            mtime_ns=data["mtime_ns"],
+            size=data["size"],
+            has_code_example=data["has_code_example"],
+            has_best_practice=data["has_best_practice"],
+            terms=set(data["terms"]),
+            scanned=True,
+            counts=data["counts"],
+            sections=[(s, list(p)) for s, p in data["sections"]],
+            snippets=data["snippets"],
+        )
+
+
+def _scan(text: str, matcher: AhoCorasick, terms: Iterable[str]) -> Dict[str, int]:
+    counts = matcher.count(text)
+    if "" in terms:
+        counts[""] = len(text) + 1
+    return counts
+
+
+class KnowledgeIndex:
+    """Inverted keyword index over knowledge files.
+
+    Example:
+        index = KnowledgeIndex(DEFAULT_INDEX_PATH)
+        index.add_file("patterns.json", path)
+        index.ensure_terms({"fastapi", "dependency injection"}, contents, flatten)
+        index.postings("fastapi")  # {"patterns.json": 4}
+    """
+
+    def __init__(self, index_path: Optional[Path] = None):
+        self.index_path = Path(index_path) if index_path else None
+        self.files: Dict[str, FileIndex] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._stored: Dict[str, FileIndex] = {}
+        self._dirty = False
+        self._load()
+
+    # -- persistence -----------------------------------------------------
+
+    def _load(self) -> None:
+        if not self.index_path or not self.index_path.exists():
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if data.get("version") != INDEX_VERSION:
+                return
+            self._stored = {
+                name: FileIndex.from_dict(entry)
+                for name, entry in data.get("files", {}).items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            self._stored = {}
+
+    def save(self) -> None:
+        """Persist the index if anything changed since it was loaded."""
+        if set(self._stored) != set(self.files):
+            self._dirty = True
+        if not self.index_path or not self._dirty:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": INDEX_VERSION,
+            "files": {name: entry.to_dict() for name, entry in self.files.items()},
+        }
+        tmp_path = self.index_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        tmp_path.replace(self.index_path)
+        self._stored = dict(self.files)
+        self._dirty = False
+
+    # -- building --------------------------------------------------------
+
+    def clear(self) -> None:
+        self.files.clear()
+        self._postings.clear()
+
+    def add_file(self, name: str, path: Path, stat_result=None) -> bool:
+        """Register a file; returns True when a stored entry is still fresh.
+
+        A fresh entry is reused as-is. Otherwise an empty entry is created and
+        the file is scanned by the next ensure_terms() call.
+        """
+        st = stat_result or path.stat()
+        stored = self._stored.get(name)
+        if (
+            stored is not None
+            and stored.path == str(path)
+            and stored.mtime_ns == st.st_mtime_ns
+            and stored.size == st.st_size
+        ):
+            entry = stored
+            fresh = True
+        else:
+            entry = FileIndex(path=str(path), mtime_ns=st.st_mtime_ns, size=st.st_size)
+            self._dirty = True
+            fresh = False
+
+        self._drop_postings(name)
+        self.files[name] = entry
+        if fresh:
+            for term, count in entry.counts.items():
+                self._postings.setdefault(term, {})[name] = count
+        return fresh
+
+    def _drop_postings(self, name: str) -> None:
+        old = self.files.get(name)
+        if old is None or not old.counts:
+            return
+        for term in old.counts:
+            self._postings.get(term, {}).pop(name, None)
+
+    def ensure_terms(
+        self,
+        terms: Iterable[str],
+        contents: Dict[str, Any],
+        flatten: Callable[[Any], str],
+    ) -> None:
+        """Scan files for any of `terms` they have not been indexed for.
+
+        Args:
+            terms: Lowercased keywords
+            contents: Parsed JSON content per file name
+            flatten: Function producing the lowercased searchable text
+        """
+        terms = set(terms)
+        matcher = None
+        for name, entry in self.files.items():
+            new = terms - entry.terms
+            if entry.scanned and not new:
+                continue
+            content = contents.get(name)
+            if content is None:
+                continue
+            if matcher is None:
+                # One automaton for the whole call, shared by every file
+                matcher = AhoCorasick(terms)
+            self._index_file(name, entry, content, flatten, new, matcher)
+            self._dirty = True
+
+    def _index_file(
+        self,
+        name: str,
+        entry: FileIndex,
+        content: Any,
+        flatten: Callable[[Any], str],
+        new_terms: set,
+        matcher: AhoCorasick,
+    ) -> None:
+        text = flatten(content)
+        if not entry.scanned:
+            entry.scanned = True
+            entry.has_code_example = "code_example" in text
+            entry.has_best_practice = "best_practice" in text
+            entry.sections = []
+            if isinstance(content, dict):
+                for key in EVIDENCE_SECTIONS:
+                    value = content.get(key)
+                    if key in content and isinstance(value, str):
+                        snippet = value[:100] + "..." if len(value) > 100 else value
+                        entry.sections.append((snippet, []))
+
+        # One multi-pattern pass over the flattened text; everything else only
+        # looks at the terms that actually occur in this file
+        found = {
+            term: count
+            for term, count in _scan(text, matcher, new_terms).items()
+            if term in new_terms
+        }
+        for term, count in found.items():
+            entry.counts[term] = count
+            self._postings.setdefault(term, {})[name] = count
+
+        if isinstance(content, dict):
+            values = [
+                content[key].lower()
+                for key in EVIDENCE_SECTIONS
+                if key in content and isinstance(content[key], str)
+            ]
+            for (_, present), value in zip(entry.sections, values):
+                present.extend(term for term in found if term in value)
+
+        dumped = json.dumps(content)
+        dumped_lower = dumped.lower()
+        for term in found:
+            idx = dumped_lower.find(term)
+            if idx == -1:
+                continue
+            start = max(0, idx - 50)
+            end = min(len(dumped), idx + len(term) + 50)
+            entry.snippets[term] = "..." + dumped[start:end] + "..."
+
+        entry.terms |= new_terms
+
+    # -- queries ---------------------------------------------------------
+
+    def postings(self, term: str) -> Dict[str, int]:
+        """Files containing `term` with their occurrence counts."""
+        return self._postings.get(term, {})
+
+    def evidence(self, name: str, keywords: List[str]) -> str:
+        """Evidence snippet for a file, as _extract_evidence would produce."""
+        entry = self.files[name]
+        lowered = [kw.lower() for kw in keywords]
+        for snippet, present in entry.sections:
+            if any(kw in present for kw in lowered):
+                return snippet
+        for kw in lowered:
+            if kw in entry.snippets:
+                return entry.snippets[kw]
+        return ""
@@ -17,11 +17,15 @@ Version: 1.0.0
 
 import json
 import hashlib
+import os
 import re
+import time
+from collections import deque
 from dataclasses import dataclass, field
+from fnmatch import fnmatch
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 
 class OnboardingScenario(Enum):
@@ -62,6 +66,26 @@ class AntigravityruleAnalysis:
     line_count: int = 0
 
 
+@dataclass
+class RepoFingerprint:
+    """Extension histogram and manifest inventory from one repository walk.
+
+    Attributes:
+        extension_counts: Lowercased file extension to number of files.
+        manifests: Manifest pattern to matching repo-relative POSIX paths.
+        files_scanned: Number of files visited.
+        truncated: Whether the walk hit the file count or time budget.
+        complete_evidence: Whether the walk stopped because every known
+            language and manifest had been seen.
+    """
+
+    extension_counts: Dict[str, int] = field(default_factory=dict)
+    manifests: Dict[str, List[str]] = field(default_factory=dict)
+    files_scanned: int = 0
+    truncated: bool = False
+    complete_evidence: bool = False
+
+
 @dataclass
 class McpAnalysis:
     """Analysis of MCP configuration.
@@ -265,6 +289,56 @@ class RepoAnalyzer:
         ".groovy": "groovy",
     }
 
+    # Directories never descended into when fingerprinting the repository
+    PRUNED_DIRS = frozenset(
+        {
+            ".git",
+            ".hg",
+            ".svn",
+            "node_modules",
+            "__pycache__",
+            ".venv",
+            "venv",
+            ".tox",
+            ".nox",
+            ".mypy_cache",
+            ".pytest_cache",
+            ".ruff_cache",
+            ".gradle",
+            ".idea",
+            ".vs",
+            ".next",
+            "vendor",
+            "site-packages",
+        }
+    )
+
+    # Common build-output names; these can also hold real sources (e.g. a
+    # Go cmd in bin/ or a build/ package), so they are only pruned when the
+    # repository's .gitignore ignores them
+    BUILD_OUTPUT_DIRS = frozenset({"bin", "obj", "dist", "build", "target"})
+
+    # Manifest files recorded during the walk (fnmatch patterns on file names)
+    MANIFEST_PATTERNS = (
+        "requirements.txt",
+        "pyproject.toml",
+        "package.json",
+        "tsconfig.json",
+        "pom.xml",
+        "build.gradle",
+        "build.gradle.kts",
+        "go.mod",
+        "Cargo.toml",
+        "Gemfile",
+        "*.csproj",
+        "*.sln",
+        "*.iflw",
+    )
+
+    # Walk budget; a truncated walk has still covered the shallowest levels
+    MAX_SCAN_FILES = 200_000
+    MAX_SCAN_SECONDS = 5.0
+
     # Factory version pattern in .agentrules
     FACTORY_VERSION_PATTERN = re.compile(
         r"Generated by[:\s]+Antigravity Agent Factory.*?v?(\d+\.\d+(?:\.\d+)?)",
@@ -281,16 +355,25 @@ class RepoAnalyzer:
     }
 
     def __init__(
-        self, repo_path: Union[str, Path], factory_root: Optional[Path] = None
+        self,
+        repo_path: Union[str, Path],
+        factory_root: Optional[Path] = None,
+        max_scan_files: Optional[int] = None,
+        max_scan_seconds: Optional[float] = None,
     ):
         """Initialize the analyzer.
 
         Args:
             repo_path: Path to the repository to analyze.
             factory_root: Optional path to factory root for blueprint matching.
+            max_scan_files: Stop fingerprinting after this many files.
+            max_scan_seconds: Stop fingerprinting after this many seconds.
         """
         self.repo_path = Path(repo_path)
         self.factory_root = factory_root or Path(__file__).parent.parent.parent
+        self.max_scan_files = max_scan_files or self.MAX_SCAN_FILES
+        self.max_scan_seconds = max_scan_seconds or self.MAX_SCAN_SECONDS
+        self.fingerprint: Optional[RepoFingerprint] = None
 
         if not self.repo_path.exists():
             raise ValueError(f"Repository path does not exist: {self.repo_path}")
@@ -315,6 +398,7 @@ class RepoAnalyzer:
         self._analyze_project_artifacts(inventory)
 
         # Detect tech stack
+        self.fingerprint = None
         inventory.tech_stack = self._detect_tech_stack()
 
         # Determine scenario
@@ -467,12 +551,14 @@ class RepoAnalyzer:
             TechStackDetection with languages, frameworks, and blueprint.
         """
         detection = TechStackDetection()
+        fingerprint = self._scan_repository()
 
         # Detect languages from file extensions
-        languages: Set[str] = set()
-        for ext, lang in self.LANGUAGE_EXTENSIONS.items():
-            if list(self.repo_path.rglob(f"*{ext}")):
-                languages.add(lang)
+        languages: Set[str] = {
+            lang
+            for ext, lang in self.LANGUAGE_EXTENSIONS.items()
+            if fingerprint.extension_counts.get(ext)
+        }
         detection.languages = sorted(languages)
 
         # Detect frameworks from config files
@@ -507,7 +593,7 @@ class RepoAnalyzer:
             frameworks.add("spring")
 
         # .NET frameworks
-        if list(self.repo_path.rglob("*.csproj")):
+        if fingerprint.manifests.get("*.csproj"):
             frameworks.add("dotnet")
             if self._any_file_contains("*.csproj", "Microsoft.AspNetCore"):
                 frameworks.add("aspnet")
@@ -521,6 +607,111 @@ class RepoAnalyzer:
 
         return detection
 
+    def _scan_repository(self) -> RepoFingerprint:
+        """Fingerprint the repository in one pruned, breadth-first walk.
+
+        Builds the extension histogram and manifest inventory together. The
+        walk skips PRUNED_DIRS, virtualenvs (directories holding a
+        pyvenv.cfg) and build-output directories the .gitignore ignores, and
+        stops once every known language and manifest has
+        been seen or the file/time budget is spent.
+
+        Returns:
+            RepoFingerprint for the repository (cached per analysis).
+        """
+        if self.fingerprint is not None:
+            return self.fingerprint
+
+        fingerprint = RepoFingerprint()
+        counts = fingerprint.extension_counts
+        manifests = fingerprint.manifests
+        exact = {p for p in self.MANIFEST_PATTERNS if "*" not in p}
+        suffixes = {p[1:]: p for p in self.MANIFEST_PATTERNS if p.startswith("*")}
+        wanted_exts = set(self.LANGUAGE_EXTENSIONS)
+        pruned_anywhere, pruned_at_root = self._ignored_build_dirs()
+        deadline = time.monotonic() + self.max_scan_seconds
+
+        queue = deque([(str(self.repo_path), "")])
+        while queue:
+            dir_path, rel_dir = queue.popleft()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            if rel_dir and any(e.name == "pyvenv.cfg" for e in entries):
+                continue  # virtualenv under a non-standard name
+
+            for entry in entries:
+                name = entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not (
+                            name in self.PRUNED_DIRS
+                            or name in pruned_anywhere
+                            or (not rel_dir and name in pruned_at_root)
+                        ):
+                            queue.append((entry.path, f"{rel_dir}{name}/"))
+                        continue
+                except OSError:
+                    continue
+
+                fingerprint.files_scanned += 1
+                ext = os.path.splitext(name)[1].lower()
+                if ext:
+                    counts[ext] = counts.get(ext, 0) + 1
+
+                pattern = name if name in exact else suffixes.get(ext)
+                if pattern is not None:
+                    manifests.setdefault(pattern, []).append(f"{rel_dir}{name}")
+
+            if fingerprint.files_scanned >= self.max_scan_files or (
+                time.monotonic() > deadline
+            ):
+                fingerprint.truncated = bool(queue)
+                break
+            if wanted_exts.issubset(counts) and len(manifests) == len(
+                self.MANIFEST_PATTERNS
+            ):
+                fingerprint.complete_evidence = bool(queue)
+                break
+
+        self.fingerprint = fingerprint
+        return fingerprint
+
+    def _ignored_build_dirs(self) -> Tuple[Set[str], Set[str]]:
+        """BUILD_OUTPUT_DIRS listed in the root .gitignore.
+
+        Returns:
+            Names ignored at any depth, and names ignored only at the root
+            (patterns with a leading slash).
+        """
+        anywhere: Set[str] = set()
+        at_root: Set[str] = set()
+        try:
+            lines = (self.repo_path / ".gitignore").read_text(
+                encoding="utf-8", errors="ignore"
+            )
+        except OSError:
+            return anywhere, at_root
+
+        for line in lines.splitlines():
+            pattern = line.strip()
+            if not pattern or pattern.startswith(("#", "!")):
+                continue
+            for suffix in ("/**", "/*", "/"):
+                if pattern.endswith(suffix):
+                    pattern = pattern[: -len(suffix)]
+                    break
+            rooted = pattern.startswith("/")
+            pattern = pattern.lstrip("/")
+            if pattern.startswith("**/"):
+                pattern, rooted = pattern[3:], False
+            if pattern in self.BUILD_OUTPUT_DIRS:
+                (at_root if rooted else anywhere).add(pattern)
+        return anywhere, at_root
+
     def _file_contains(self, filename: str, search_text: str) -> bool:
         """Check if a file contains specific text.
 
@@ -544,14 +735,23 @@ class RepoAnalyzer:
     def _any_file_contains(self, pattern: str, search_text: str) -> bool:
         """Check if any file matching pattern contains specific text.
 
+        Candidates come from the manifest inventory of the repository walk.
+
         Args:
-            pattern: Glob pattern for files.
+            pattern: Glob pattern for file names.
             search_text: Text to search for (case-insensitive).
 
         Returns:
             True if any matching file contains the text.
         """
-        for file_path in self.repo_path.rglob(pattern):
+        fingerprint = self._scan_repository()
+        candidates = [
+            self.repo_path / rel_path
+            for key, paths in fingerprint.manifests.items()
+            for rel_path in paths
+            if key == pattern or fnmatch(rel_path.rsplit("/", 1)[-1], pattern)
+        ]
+        for file_path in dict.fromkeys(candidates):
             try:
                 content = file_path.read_text(encoding="utf-8").lower()
                 if search_text.lower() in content:
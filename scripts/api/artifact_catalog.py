@@ -0,0 +1,298 @@
+"""
+Artifact Catalog for the Antigravity IDX API.
+
+Keeps the artifact listings served by the API (workflows, agents, skills,
+scripts, ...) in memory. Each collection is built by its loader on first
+request and rebuilt only after a change under one of its directories,
+reported by watch_changes(). Every build is serialised to JSON once and gets
+an ETag, so list endpoints serve the cached body and answer conditional
+requests with 304 Not Modified.
+
+Change detection uses watchfiles (inotify/FSEvents/ReadDirectoryChangesW)
+when installed and falls back to polling stat snapshots otherwise.
+watch_changes_supervised() keeps a watcher running across errors and roots
+that are created or removed later.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Set
+
+try:
+    from watchfiles import awatch
+
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
+
+POLL_INTERVAL = 2.0
+RESTART_BACKOFF = 1.0  # seconds; doubled after each consecutive failure
+MAX_RESTART_BACKOFF = 60.0
+
+logger = logging.getLogger(__name__)
+
+# Directories never worth watching or walking
+IGNORED_DIRS = {"__pycache__", ".git", ".venv", "node_modules", "site-packages"}
+
+
+def encode_json(data: Any) -> bytes:
+    """Serialise data the way FastAPI's JSONResponse does."""
+    return json.dumps(
+        data, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+def compute_etag(body: bytes) -> str:
+    """Return a strong ETag for a response body."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """A built collection: the loader's data, its JSON body and ETag."""
+
+    data: Any
+    body: bytes
+    etag: str
+
+
+@dataclass
+class _Collection:
+    """One catalog listing and the directories it is derived from."""
+
+    loader: Callable[[], Any]
+    roots: List[Path]
+    generation: int = 0
+    built_generation: int = -1
+    entry: Optional[CatalogEntry] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class ArtifactCatalog:
+    """In-memory artifact listings invalidated by filesystem changes.
+
+    Example:
+        catalog = ArtifactCatalog()
+        catalog.register("workflows", list_workflows, [WORKFLOWS_DIR])
+        entry = catalog.get("workflows")  # entry.body, entry.etag
+        catalog.invalidate_paths([WORKFLOWS_DIR / "research.md"])  # ["workflows"]
+    """
+
+    def __init__(self):
+        self._collections: Dict[str, _Collection] = {}
+
+    def register(
+        self, name: str, loader: Callable[[], Any], roots: Iterable[Path]
+    ) -> None:
+        """Register a collection built by `loader` from files under `roots`."""
+        self._collections[name] = _Collection(
+            loader=loader, roots=[Path(r).resolve() for r in roots]
+        )
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._collections)
+
+    @property
+    def roots(self) -> List[Path]:
+        """Every directory some collection depends on."""
+        roots: List[Path] = []
+        for collection in self._collections.values():
+            roots.extend(r for r in collection.roots if r not in roots)
+        return roots
+
+    def get(self, name: str) -> CatalogEntry:
+        """Return a collection, building it if stale.
+
+        A change reported while a build is running leaves the collection
+        stale, so the next call rebuilds it again.
+        """
+        collection = self._collections[name]
+        with collection.lock:
+            if collection.built_generation != collection.generation:
+                generation = collection.generation
+                data = collection.loader()
+                body = encode_json(data)
+                collection.entry = CatalogEntry(data, body, compute_etag(body))
+                collection.built_generation = generation
+            return collection.entry
+
+    def invalidate(self, name: str) -> None:
+        """Mark a collection stale."""
+        self._collections[name].generation += 1
+
+    def invalidate_paths(self, paths: Iterable[Path]) -> List[str]:
+        """Mark the collections containing any of `paths` stale.
+
+        Returns:
+            Names of the invalidated collections, in registration order.
+        """
+        resolved = [Path(p).resolve() for p in paths]
+        changed = []
+        for name, collection in self._collections.items():
+            if any(
+                path == root or root in path.parents
+                for path in resolved
+                for root in collection.roots
+            ):
+                collection.generation += 1
+                changed.append(name)
+        return changed
+
+
+def _snapshot(roots: Iterable[Path]) -> Dict[str, tuple]:
+    """Map every file under `roots` to its (mtime_ns, size)."""
+    snapshot: Dict[str, tuple] = {}
+    for root in roots:
+        if not root.exists():
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (st.st_mtime_ns, st.st_size)
+    return snapshot
+
+
+async def _poll_changes(
+    roots: List[Path], interval: float, stop_event: Optional[asyncio.Event]
+) -> AsyncIterator[Set[Path]]:
+    previous = await asyncio.to_thread(_snapshot, roots)
+    while stop_event is None or not stop_event.is_set():
+        if stop_event is None:
+            await asyncio.sleep(interval)
+        else:
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+        current = await asyncio.to_thread(_snapshot, roots)
+        changed = {
+            Path(path)
+            for path in previous.keys() | current.keys()
+            if previous.get(path) != current.get(path)
+        }
+        previous = current
+        if changed:
+            yield changed
+
+
+async def watch_changes(
+    roots: Iterable[Path],
+    poll_interval: float = POLL_INTERVAL,
+    stop_event: Optional[asyncio.Event] = None,
+    force_polling: bool = False,
+) -> AsyncIterator[Set[Path]]:
+    """Yield batches of changed file paths under `roots`.
+
+    Uses watchfiles when available; otherwise (or with force_polling) polls
+    stat snapshots every `poll_interval` seconds. Roots that do not exist
+    are ignored.
+    """
+    existing = [Path(r) for r in roots if Path(r).exists()]
+    if not existing:
+        return
+
+    if WATCHFILES_AVAILABLE and not force_polling:
+        async for changes in awatch(
+            *existing,
+            stop_event=stop_event,
+            watch_filter=lambda _change, path: not (
+                IGNORED_DIRS & set(Path(path).parts)
+            ),
+        ):
+            yield {Path(path) for _change, path in changes}
+        return
+
+    async for changed in _poll_changes(existing, poll_interval, stop_event):
+        yield changed
+
+
+async def _wait(stop_event: Optional[asyncio.Event], timeout: float) -> bool:
+    """Sleep up to `timeout`; True if stop_event was set meanwhile."""
+    if stop_event is None:
+        await asyncio.sleep(timeout)
+        return False
+    try:
+        await asyncio.wait_for(stop_event.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+async def _watch_roots(
+    roots: List[Path],
+    existing: List[Path],
+    interval: float,
+    stop_event: Optional[asyncio.Event],
+    restart: asyncio.Event,
+) -> None:
+    """Set `restart` once roots appear or vanish, or stop_event is set."""
+    while not await _wait(stop_event, interval):
+        if [r for r in roots if r.exists()] != existing:
+            break
+    restart.set()
+
+
+async def watch_changes_supervised(
+    roots: Iterable[Path],
+    poll_interval: float = POLL_INTERVAL,
+    stop_event: Optional[asyncio.Event] = None,
+    force_polling: bool = False,
+) -> AsyncIterator[Set[Path]]:
+    """watch_changes() that keeps running until stop_event is set.
+
+    The watcher is restarted after an error, with exponential backoff, and
+    whenever one of `roots` is created or removed. Changes made while no
+    watcher ran are unknown, so every restart first yields all roots.
+    """
+    roots = [Path(r) for r in roots]
+    failures = 0
+    restarted = False
+    while stop_event is None or not stop_event.is_set():
+        if restarted:
+            yield set(roots)
+        restarted = True
+
+        existing = [r for r in roots if r.exists()]
+        restart = asyncio.Event()
+        monitor = asyncio.create_task(
+            _watch_roots(roots, existing, poll_interval, stop_event, restart)
+        )
+        try:
+            async for changed in watch_changes(
+                existing, poll_interval, restart, force_polling
+            ):
+                failures = 0
+                yield changed
+            await restart.wait()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            delay = min(RESTART_BACKOFF * 2**failures, MAX_RESTART_BACKOFF)
+            failures += 1
+            logger.warning(f"Change watcher failed ({e}); restarting in {delay:.0f}s")
+            if await _wait(stop_event, delay):
+                return
+        finally:
+            monitor.cancel()
@@ -0,0 +1,208 @@
+"""
+WebSocket Broadcaster for the Antigravity IDX API.
+
+Fans JSON messages out to many websocket clients without letting one slow
+or dead client hold up the others. Every client has a bounded outbound
+buffer drained by its own writer task; publish() never awaits a socket.
+When a buffer is full the oldest message is dropped, and messages published
+with a coalesce key replace a pending message with the same key. Clients
+whose sends fail or exceed the send timeout are evicted.
+
+ThoughtStream shares one trace poll loop between all /ws/thoughts
+subscribers instead of running a poller per connection.
+"""
+
+import asyncio
+import itertools
+import logging
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CLIENT_QUEUE_SIZE = 100
+SEND_TIMEOUT = 10.0
+
+# Trace ids remembered by ThoughtStream to avoid re-sending runs
+SEEN_TRACE_LIMIT = 1000
+
+
+class _Client:
+    """Outbound buffer and writer task for one websocket."""
+
+    def __init__(self, websocket: Any, maxsize: int):
+        self.websocket = websocket
+        self.maxsize = maxsize
+        self.pending: "OrderedDict[Hashable, dict]" = OrderedDict()
+        self.ready = asyncio.Event()
+        self.dropped = 0
+        self.sent = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def enqueue(self, message: dict, key: Hashable) -> None:
+        if key in self.pending:
+            self.pending[key] = message  # coalesce, keeping the queue slot
+            return
+        if len(self.pending) >= self.maxsize:
+            self.pending.popitem(last=False)
+            self.dropped += 1
+        self.pending[key] = message
+        self.ready.set()
+
+
+class Broadcaster:
+    """Concurrent, fault-isolated fan-out to websocket clients.
+
+    Example:
+        events = Broadcaster()
+        await events.register(websocket)
+        events.publish({"type": "file_change", "path": p}, key=("file", p))
+        await events.unregister(websocket)
+    """
+
+    def __init__(
+        self,
+        queue_size: int = CLIENT_QUEUE_SIZE,
+        send_timeout: float = SEND_TIMEOUT,
+    ):
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self._clients: Dict[int, _Client] = {}
+        self._sequence = itertools.count()
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    async def register(
+        self, websocket: Any, backlog: Optional[List[dict]] = None
+    ) -> None:
+        """Start delivering to an accepted websocket.
+
+        Args:
+            websocket: Object with an async ``send_json`` (and ``close``).
+            backlog: Messages queued for this client before any new ones.
+        """
+        client = _Client(websocket, self.queue_size)
+        for message in backlog or []:
+            client.enqueue(message, next(self._sequence))
+        client.task = asyncio.create_task(self._writer(client))
+        self._clients[id(websocket)] = client
+
+    async def unregister(self, websocket: Any) -> None:
+        """Stop delivering to a websocket and cancel its writer."""
+        client = self._clients.pop(id(websocket), None)
+        if client is None or client.task is None:
+            return
+        if client.task is not asyncio.current_task():
+            client.task.cancel()
+            try:
+                await client.task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def publish(self, message: dict, key: Optional[Hashable] = None) -> None:
+        """Queue a message for every client without waiting on any socket.
+
+        Args:
+            message: JSON-serialisable payload.
+            key: Coalesce key; a pending message with the same key is
+                replaced instead of queueing another one.
+        """
+        slot = ("key", key) if key is not None else next(self._sequence)
+        for client in list(self._clients.values()):
+            client.enqueue(message, slot)
+
+    def stats(self) -> Dict[str, int]:
+        """Delivery counters across connected clients."""
+        clients = list(self._clients.values())
+        return {
+            "clients": len(clients),
+            "pending": sum(len(c.pending) for c in clients),
+            "sent": sum(c.sent for c in clients),
+            "dropped": sum(c.dropped for c in clients),
+            "evicted": self.evicted,
+        }
+
+    async def _writer(self, client: _Client) -> None:
+        try:
+            while True:
+                await client.ready.wait()
+                while client.pending:
+                    _, message = client.pending.popitem(last=False)
+                    await asyncio.wait_for(
+                        client.websocket.send_json(message), self.send_timeout
+                    )
+                    client.sent += 1
+                client.ready.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Evicting websocket client: {e!r}")
+            self.evicted += 1
+            self._clients.pop(id(client.websocket), None)
+            try:
+                await client.websocket.close()
+            except Exception:
+                pass
+
+
+class ThoughtStream:
+    """One shared trace poll loop feeding every thought-stream subscriber.
+
+    The loop runs only while someone is subscribed. New subscribers first
+    receive the most recent traces, as a fresh per-connection poller would
+    have sent them.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], List[dict]],
+        interval: float = 2.0,
+        replay: int = 5,
+        broadcaster: Optional[Broadcaster] = None,
+    ):
+        """
+        Args:
+            fetch: Blocking callable returning recent trace messages, each
+                with an ``id``; it runs in a worker thread.
+            interval: Seconds between polls.
+            replay: Number of recent traces sent to new subscribers.
+            broadcaster: Delivery fan-out (a new one by default).
+        """
+        self.fetch = fetch
+        self.interval = interval
+        self.broadcaster = broadcaster or Broadcaster()
+        self.polls = 0
+        self._recent: deque = deque(maxlen=replay)
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+
+    async def subscribe(self, websocket: Any) -> None:
+        await self.broadcaster.register(websocket, backlog=list(self._recent))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll())
+
+    async def unsubscribe(self, websocket: Any) -> None:
+        await self.broadcaster.unregister(websocket)
+        if not len(self.broadcaster) and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _poll(self) -> None:
+        while len(self.broadcaster):
+            try:
+                messages = await asyncio.to_thread(self.fetch)
+            except Exception as e:
+                logger.debug(f"Thought stream unavailable: {e}")
+                messages = []
+            self.polls += 1
+            for message in messages:
+                if message["id"] in self._seen:
+                    continue
+                self._seen[message["id"]] = None
+                if len(self._seen) > SEEN_TRACE_LIMIT:
+                    self._seen.popitem(last=False)
+                self._recent.append(message)
+                self.broadcaster.publish(message)
+            await asyncio.sleep(self.interval)
@@ -16,7 +16,7 @@ import asyncio
 from pathlib import Path
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, WebSocket, HTTPException
+from fastapi import FastAPI, WebSocket, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
@@ -43,14 +43,42 @@ from workflow_service import (
     get_agent_config,
     save_agent_config,
     PROJECT_ROOT,
+    SCRIPTS_DIR,
+    WORKFLOWS_DIR,
+    AGENTS_DIR,
+    SKILLS_DIR,
+    RULES_DIR,
+    BLUEPRINTS_DIR,
+    KNOWLEDGE_DIR,
+    ROOT_KNOWLEDGE_DIR,
+    PATTERNS_DIR,
 )
+from artifact_catalog import ArtifactCatalog, etag_matches, watch_changes_supervised
+from broadcaster import Broadcaster, ThoughtStream
 from llm_config import chat_with_aisuite, get_langchain_llm
 
 
 # ---------------------------------------------------------------------------
 # Globals & State
 # ---------------------------------------------------------------------------
-event_clients: list[WebSocket] = []
+event_broadcaster = Broadcaster()
+
+BRAIN_DIR = Path.home() / ".gemini" / "antigravity" / "brain"
+BRAIN_ARTIFACTS = {"task.md", "walkthrough.md"}
+
+# Artifact listings served from memory, rebuilt when watch_artifacts()
+# reports a change under their directories
+catalog = ArtifactCatalog()
+catalog.register("workflows", list_workflows, [WORKFLOWS_DIR])
+catalog.register("agents", list_agents, [AGENTS_DIR])
+catalog.register("skills", list_skills, [SKILLS_DIR])
+catalog.register("scripts", list_scripts, [SCRIPTS_DIR])
+catalog.register("rules", list_rules, [RULES_DIR])
+catalog.register("blueprints", list_blueprints, [BLUEPRINTS_DIR])
+catalog.register(
+    "knowledge-files", list_knowledge_files, [KNOWLEDGE_DIR, ROOT_KNOWLEDGE_DIR]
+)
+catalog.register("patterns", list_patterns, [PATTERNS_DIR])
 
 
 # ---------------------------------------------------------------------------
@@ -63,45 +91,58 @@ async def lifespan(app: FastAPI):
     os.environ.setdefault("LANGSMITH_TRACING", "true")
     os.environ.setdefault("LANGSMITH_PROJECT", "antigravity-idx")
 
-    # Start file watcher for Hot Reload
-    asyncio.create_task(watch_artifacts())
+    # Start file watcher for Hot Reload and catalog invalidation
+    watcher = asyncio.create_task(watch_artifacts())
     yield
+    watcher.cancel()
 
 
 async def watch_artifacts():
-    """Watch for changes in task.md and walkthrough.md to trigger UI refresh."""
-    brain_dir = Path.home() / ".gemini" / "antigravity" / "brain"
-    if not brain_dir.exists():
-        return
+    """Keep the artifact catalog current and push changes to UI clients.
 
-    mtimes = {}
-    while True:
+    Broadcasts ``file_change`` for task.md/walkthrough.md in the brain
+    directory and ``artifacts_changed`` with the invalidated catalog
+    collections for everything else. The watcher restarts after errors and
+    picks up directories created later; each restart invalidates the whole
+    catalog.
+    """
+    async for changed in watch_changes_supervised(catalog.roots + [BRAIN_DIR]):
         try:
-            for artifact in brain_dir.rglob("*.md"):
-                if artifact.name in ["task.md", "walkthrough.md"]:
-                    mtime = artifact.stat().st_mtime
-                    if mtimes.get(str(artifact)) != mtime:
-                        mtimes[str(artifact)] = mtime
-                        # Broadcast event
-                        await broadcast_event(
-                            {
-                                "type": "file_change",
-                                "file": artifact.name,
-                                "path": str(artifact),
-                            }
-                        )
-        except Exception:
-            pass
-        await asyncio.sleep(2)
+            for path in sorted(changed):
+                if path.name in BRAIN_ARTIFACTS and BRAIN_DIR in path.parents:
+                    await broadcast_event(
+                        {"type": "file_change", "file": path.name, "path": str(path)},
+                        key=("file_change", str(path)),
+                    )
+            collections = catalog.invalidate_paths(changed)
+            if collections:
+                await broadcast_event(
+                    {"type": "artifacts_changed", "collections": collections},
+                    key=("artifacts_changed", tuple(collections)),
+                )
+        except Exception as e:
+            # Keep watching; rebuild everything rather than risk stale listings
+            logging.warning(f"Artifact change batch failed: {e}")
+            for name in catalog.names:
+                catalog.invalidate(name)
 
 
-async def broadcast_event(data: dict):
-    """Send JSON data to all connected event clients."""
-    for ws in event_clients[:]:
-        try:
-            await ws.send_json(data)
-        except Exception:
-            event_clients.remove(ws)
+async def broadcast_event(data: dict, key=None):
+    """Queue JSON data for all connected event clients.
+
+    Events published with the same ``key`` coalesce while a client is
+    still behind, so a slow client receives only the latest one.
+    """
+    event_broadcaster.publish(data, key=key)
+
+
+async def catalog_response(request: Request, name: str) -> Response:
+    """Serve a catalog collection, honouring If-None-Match."""
+    entry = await asyncio.to_thread(catalog.get, name)
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
 
 
 app = FastAPI(title="Antigravity IDX Orchestrator", version="2.0.0", lifespan=lifespan)
@@ -150,9 +191,9 @@ async def health_check():
 # Workflows
 # ---------------------------------------------------------------------------
 @app.get("/api/workflows")
-async def api_list_workflows():
+async def api_list_workflows(request: Request):
     """List all Antigravity workflows."""
-    return list_workflows()
+    return await catalog_response(request, "workflows")
 
 
 @app.get("/api/workflows/{filename}")
@@ -176,22 +217,26 @@ class WorkflowSaveRequest(BaseModel):
 @app.put("/api/workflows/{filename}")
 async def api_save_workflow(filename: str, data: WorkflowSaveRequest):
     """Save/update a workflow."""
-    return save_workflow(filename, data.model_dump())
+    result = save_workflow(filename, data.model_dump())
+    catalog.invalidate("workflows")
+    return result
 
 
 @app.post("/api/workflows/{filename}")
 async def api_create_workflow(filename: str, data: WorkflowSaveRequest):
     """Create a new workflow."""
-    return save_workflow(filename, data.model_dump())
+    result = save_workflow(filename, data.model_dump())
+    catalog.invalidate("workflows")
+    return result
 
 
 # ---------------------------------------------------------------------------
 # Agents, Skills, Scripts
 # ---------------------------------------------------------------------------
 @app.get("/api/agents")
-async def api_list_agents():
+async def api_list_agents(request: Request):
     """List all agent definitions."""
-    return list_agents()
+    return await catalog_response(request, "agents")
 
 
 @app.get("/api/agents/{name}")
@@ -211,13 +256,15 @@ class ContentSaveRequest(BaseModel):
 @app.put("/api/agents/{name}")
 async def api_save_agent(name: str, data: ContentSaveRequest):
     """Save agent content."""
-    return save_agent(data.path, data.content)
+    result = save_agent(data.path, data.content)
+    catalog.invalidate_paths([PROJECT_ROOT / data.path])
+    return result
 
 
 @app.get("/api/skills")
-async def api_list_skills():
+async def api_list_skills(request: Request):
     """List all skill definitions."""
-    return list_skills()
+    return await catalog_response(request, "skills")
 
 
 @app.get("/api/skills/{name}")
@@ -232,13 +279,15 @@ async def api_get_skill(name: str):
 @app.put("/api/skills/{name}")
 async def api_save_skill(name: str, data: ContentSaveRequest):
     """Save skill content."""
-    return save_skill(data.path, data.content)
+    result = save_skill(data.path, data.content)
+    catalog.invalidate_paths([PROJECT_ROOT / data.path])
+    return result
 
 
 @app.get("/api/scripts")
-async def api_list_scripts():
+async def api_list_scripts(request: Request):
     """List all Python scripts."""
-    return list_scripts()
+    return await catalog_response(request, "scripts")
 
 
 @app.get("/api/scripts/{path:path}")
@@ -253,7 +302,9 @@ async def api_get_script(path: str):
 @app.put("/api/scripts/{path:path}")
 async def api_save_script(path: str, data: ContentSaveRequest):
     """Save script content."""
-    return save_script(data.path, data.content)
+    result = save_script(data.path, data.content)
+    catalog.invalidate_paths([PROJECT_ROOT / data.path])
+    return result
 
 
 # --- Generic Artifacts ---
@@ -271,30 +322,32 @@ async def api_get_artifact(path: str):
 @app.put("/api/artifacts")
 async def api_save_artifact(data: ContentSaveRequest):
     """Save any supported artifact content."""
-    return save_generic_artifact(data.path, data.content)
+    result = save_generic_artifact(data.path, data.content)
+    catalog.invalidate_paths([PROJECT_ROOT / data.path])
+    return result
 
 
 # --- Specialized Lists ---
 
 
 @app.get("/api/rules")
-async def api_list_rules():
-    return list_rules()
+async def api_list_rules(request: Request):
+    return await catalog_response(request, "rules")
 
 
 @app.get("/api/blueprints")
-async def api_list_blueprints():
-    return list_blueprints()
+async def api_list_blueprints(request: Request):
+    return await catalog_response(request, "blueprints")
 
 
 @app.get("/api/knowledge-files")
-async def api_list_knowledge_files():
-    return list_knowledge_files()
+async def api_list_knowledge_files(request: Request):
+    return await catalog_response(request, "knowledge-files")
 
 
 @app.get("/api/patterns")
-async def api_list_patterns():
-    return list_patterns()
+async def api_list_patterns(request: Request):
+    return await catalog_response(request, "patterns")
 
 
 @app.get("/api/agent-config")
@@ -512,73 +565,69 @@ async def api_get_traces(project: str = "antigravity-idx", limit: int = 20):
 # ---------------------------------------------------------------------------
 # WebSocket: Real-time Thought Streaming
 # ---------------------------------------------------------------------------
+_langsmith_client = None
+
+
+def fetch_recent_traces() -> list[dict]:
+    """Fetch the latest LangSmith runs as thought-stream messages."""
+    from langsmith import Client
+
+    global _langsmith_client
+    if _langsmith_client is None:
+        _langsmith_client = Client()
+    runs = _langsmith_client.list_runs(
+        project_name=os.environ.get("LANGSMITH_PROJECT", "antigravity-idx"),
+        limit=5,
+    )
+    return [
+        {
+            "type": "trace",
+            "id": str(run.id),
+            "name": run.name,
+            "run_type": run.run_type,
+            "status": run.status,
+            "latency_ms": getattr(run, "latency_ms", None),
+            "error": run.error,
+        }
+        for run in runs
+    ]
+
+
+thought_stream_hub = ThoughtStream(fetch_recent_traces)
+
+
 @app.websocket("/ws/thoughts")
 async def thought_stream(websocket: WebSocket):
     """Stream agent thoughts in real-time via WebSocket.
 
-    Polls LangSmith for new traces and forwards them to connected clients.
-    Falls back to local log file if LangSmith is unavailable.
+    All subscribers share one LangSmith poll loop; new traces are forwarded
+    to every connected client.
     """
     await websocket.accept()
-    seen_ids: set[str] = set()
-
+    await thought_stream_hub.subscribe(websocket)
     try:
         while True:
-            # Try LangSmith first
-            try:
-                from langsmith import Client
-
-                client = Client()
-                runs = list(
-                    client.list_runs(
-                        project_name=os.environ.get(
-                            "LANGSMITH_PROJECT", "antigravity-idx"
-                        ),
-                        limit=5,
-                    )
-                )
-                for run in runs:
-                    run_id = str(run.id)
-                    if run_id not in seen_ids:
-                        seen_ids.add(run_id)
-                        await websocket.send_json(
-                            {
-                                "type": "trace",
-                                "id": run_id,
-                                "name": run.name,
-                                "run_type": run.run_type,
-                                "status": run.status,
-                                "latency_ms": getattr(run, "latency_ms", None),
-                                "error": run.error,
-                            }
-                        )
-            except Exception as e:
-                # Fallback removed - thoughts.log is no longer used
-                logging.debug(f"LangSmith stream unavailable: {e}")
-
-            await asyncio.sleep(2)
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     except Exception:
         pass
     finally:
-        try:
-            await websocket.close()
-        except Exception:
-            pass
+        await thought_stream_hub.unsubscribe(websocket)
 
 
 @app.websocket("/ws/events")
 async def event_stream(websocket: WebSocket):
     """General event stream for hot-reloading and UI notifications."""
     await websocket.accept()
-    event_clients.append(websocket)
+    await event_broadcaster.register(websocket)
     try:
         while True:
             await websocket.receive_text()  # Keep alive
     except Exception:
         pass
     finally:
-        if websocket in event_clients:
-            event_clients.remove(websocket)
+        await event_broadcaster.unregister(websocket)
 
 
 # ---------------------------------------------------------------------------
@@ -627,6 +676,7 @@ Return ONLY the Python code, no markdown fences."""
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / f"{req.name.replace(' ', '_').lower()}.py"
     output_path.write_text(code, encoding="utf-8")
+    catalog.invalidate_paths([output_path])
 
     return {
         "status": "generated",
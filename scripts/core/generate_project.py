@@ -19,16 +19,29 @@ Usage:
     generator = ProjectGenerator(config, target_dir, onboarding_mode=True)
     generator.generate()
 
+    # Many projects at once, sharing caches across worker processes
+    summary = generate_batch(["a.yaml", "b.json"], "output/")
+
+Fresh generation renders every artifact into an in-memory plan first and
+then writes the plan out with a small thread pool. Blueprint, pattern and
+template files are parsed once per process (see load_json_cached()).
+
 Author: Antigravity Agent Factory
 Version: 2.0.0
 """
 
+import contextlib
+import io
 import json
+import os
 import shutil
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Import template engine
 try:
@@ -75,6 +88,94 @@ except ImportError:
     DB_AVAILABLE = False
 
 
+# Worker threads used to write a generation plan to disk
+WRITE_WORKERS = min(8, os.cpu_count() or 4)
+
+
+# =============================================================================
+# FACTORY FILE CACHE
+# Blueprints, patterns and templates are shared by every generation in the
+# process; entries are revalidated against mtime and size on each lookup.
+# =============================================================================
+
+_file_cache: Dict[Tuple[str, str], Tuple[int, int, Any]] = {}
+_file_cache_lock = threading.Lock()
+
+
+def _cached_file(path: Path, kind: str, parse: Callable[[str], Any]) -> Any:
+    st = path.stat()
+    key = (str(path), kind)
+    with _file_cache_lock:
+        entry = _file_cache.get(key)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+
+    value = parse(path.read_text(encoding="utf-8"))
+    with _file_cache_lock:
+        _file_cache[key] = (st.st_mtime_ns, st.st_size, value)
+    return value
+
+
+def load_json_cached(path: Path) -> Any:
+    """Load a JSON file, parsing it at most once per process.
+
+    The returned object is shared between callers and must not be modified.
+
+    Args:
+        path: Path to the JSON file.
+
+    Returns:
+        Parsed JSON content.
+    """
+    return _cached_file(path, "json", json.loads)
+
+
+def read_text_cached(path: Path) -> str:
+    """Read a UTF-8 text file, hitting the disk only when it changed.
+
+    Args:
+        path: Path to the text file.
+
+    Returns:
+        File content.
+    """
+    return _cached_file(path, "text", str)
+
+
+def clear_file_cache() -> None:
+    """Drop all cached blueprint, pattern and template files."""
+    with _file_cache_lock:
+        _file_cache.clear()
+
+
+class GenerationLog:
+    """Buffered writer for generation_debug.log.
+
+    Lines are collected in memory and appended to the file in one write by
+    flush(), instead of opening the log for every pattern load.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lines: List[str] = []
+        self._lock = threading.Lock()
+
+    def write(self, text: str) -> None:
+        with self._lock:
+            self._lines.append(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            lines, self._lines = self._lines, []
+        if not lines:
+            return
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+        except OSError:
+            pass  # Debug output must never fail a generation
+
+
 # =============================================================================
 # QUICKSTART CONFIGURATION
 # Pre-defined configuration for zero-config quick start experience
@@ -286,6 +387,8 @@ class ProjectGenerator:
         conflict_resolver: Optional[
             Callable[[ConflictPrompt], ConflictResolution]
         ] = None,
+        write_workers: int = WRITE_WORKERS,
+        template_engine: Optional["TemplateEngine"] = None,
     ):
         """Initialize the generator.
 
@@ -296,12 +399,21 @@ class ProjectGenerator:
             dry_run: If True, preview changes without making them.
             conflict_resolver: Optional callback for resolving conflicts.
                 If not provided, uses default recommendations.
+            write_workers: Threads used to write the generated files.
+            template_engine: Engine to reuse (e.g. across a batch); a new one
+                is created when omitted.
         """
         self.config = config
         self.target_dir = Path(target_dir)
         self.factory_root = Path(__file__).parent.parent.parent
         self.generated_files: List[str] = []
         self.errors: List[str] = []
+        self.write_workers = max(1, write_workers)
+        self.debug_log = GenerationLog(self.factory_root / "generation_debug.log")
+
+        # Pending writes (path -> content, or source path to copy); only set
+        # while generate() is rendering a fresh project
+        self._plan: Optional[Dict[Path, Union[str, Path]]] = None
 
         # Onboarding settings
         self.onboarding_mode = onboarding_mode
@@ -316,8 +428,8 @@ class ProjectGenerator:
         self.merged_artifacts: List[str] = []
 
         # Initialize template engine
-        self.template_engine: Optional[TemplateEngine] = None
-        if TEMPLATE_ENGINE_AVAILABLE:
+        self.template_engine: Optional[TemplateEngine] = template_engine
+        if self.template_engine is None and TEMPLATE_ENGINE_AVAILABLE:
             try:
                 self.template_engine = create_engine(self.factory_root)
             except Exception:
@@ -346,10 +458,21 @@ class ProjectGenerator:
         print(f"Generating project: {self.config.project_name}")
         print(f"Target directory: {self.target_dir}")
 
-        # Handle onboarding mode
-        if self.onboarding_mode:
-            return self._generate_onboarding()
+        try:
+            # Handle onboarding mode
+            if self.onboarding_mode:
+                return self._generate_onboarding()
+            return self._generate_fresh()
+        finally:
+            self.debug_log.flush()
+
+    def _generate_fresh(self) -> Dict[str, Any]:
+        """Generate a new project: render everything, then write the plan.
 
+        Returns:
+            Generation result dictionary (see generate()).
+        """
+        self._plan = {}
         try:
             # Create directory structure
             self._create_directories()
@@ -358,15 +481,13 @@ class ProjectGenerator:
             blueprint = self._load_blueprint()
 
             # DEBUG LOG
-            debug_path = self.factory_root / "generation_debug.log"
-            with open(debug_path, "a", encoding="utf-8") as f:
-                f.write(f"\n[DEBUG] Project: {self.config.project_name}\n")
-                f.write(f"  Target: {self.target_dir}\n")
-                f.write(
-                    f"  Blueprint: {blueprint.get('metadata', {}).get('name') if blueprint else 'None'}\n"
-                )
-                f.write(f"  Agents: {self.config.agents}\n")
-                f.write(f"  Skills: {self.config.skills}\n")
+            self.debug_log.write(
+                f"\n[DEBUG] Project: {self.config.project_name}\n"
+                f"  Target: {self.target_dir}\n"
+                f"  Blueprint: {blueprint.get('metadata', {}).get('name') if blueprint else 'None'}\n"
+                f"  Agents: {self.config.agents}\n"
+                f"  Skills: {self.config.skills}\n"
+            )
 
             # Generate .agentrules
             self._generate_cursorrules(blueprint)
@@ -391,6 +512,9 @@ class ProjectGenerator:
             # Generate diagrams folder with README
             self._generate_diagrams()
 
+            # Write everything rendered above
+            self._flush_plan()
+
             # Register in PMS if enabled
             if self.config.pm_enabled:
                 self._register_project_in_pms()
@@ -417,6 +541,8 @@ class ProjectGenerator:
                 "files_created": self.generated_files,
                 "errors": self.errors,
             }
+        finally:
+            self._plan = None
 
     def _create_directories(self) -> None:
         """Create the project directory structure."""
@@ -460,8 +586,7 @@ class ProjectGenerator:
             print(f"Warning: Blueprint {self.config.blueprint_id} not found")
             return None
 
-        with open(blueprint_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_cached(blueprint_path)
 
     def _load_pattern(
         self, pattern_type: str, pattern_id: str
@@ -483,28 +608,32 @@ class ProjectGenerator:
             / f"{pattern_id}.json"
         )
 
-        # DEBUG LOG
-        debug_path = self.factory_root / "generation_debug.log"
-        with open(debug_path, "a", encoding="utf-8") as f:
-            f.write(
-                f"  [LOAD] {pattern_type}/{pattern_id} from {pattern_path} exists? {pattern_path.exists()}\n"
-            )
-            if not pattern_path.exists():
-                f.write(f"    [!] Missing at: {pattern_path.resolve()}\n")
+        exists = pattern_path.exists()
 
-        if not pattern_path.exists():
+        # DEBUG LOG
+        self.debug_log.write(
+            f"  [LOAD] {pattern_type}/{pattern_id} from {pattern_path} exists? {exists}\n"
+        )
+        if not exists:
+            self.debug_log.write(f"    [!] Missing at: {pattern_path.resolve()}\n")
             return None
 
-        with open(pattern_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_cached(pattern_path)
 
     def _write_file(self, path: Path, content: str) -> None:
         """Write content to file.
 
+        During fresh generation the content is added to the write plan and
+        written by _flush_plan(); otherwise it is written immediately.
+
         Args:
             path: Path to the file.
             content: Content to write.
         """
+        if self._plan is not None:
+            self._plan[path] = content
+            return
+
         # Create parent directory if it doesn't exist
         path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -513,6 +642,50 @@ class ProjectGenerator:
 
         self.generated_files.append(str(path))
 
+    def _copy_file(self, source: Path, dest: Path) -> None:
+        """Copy a factory file into the project (planned like _write_file).
+
+        Args:
+            source: File to copy.
+            dest: Destination path.
+        """
+        if self._plan is not None:
+            self._plan[dest] = source
+            return
+
+        shutil.copy2(source, dest)
+        self.generated_files.append(str(dest))
+
+    def _path_exists(self, path: Path) -> bool:
+        """Check whether a path exists on disk or is already planned."""
+        return (self._plan is not None and path in self._plan) or path.exists()
+
+    def _emit(self, item: Tuple[Path, Union[str, Path]]) -> None:
+        path, payload = item
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(payload, Path):
+            shutil.copy2(payload, path)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(payload)
+
+    def _flush_plan(self) -> None:
+        """Write all planned files, using a bounded worker pool."""
+        if not self._plan:
+            return
+        items = list(self._plan.items())
+        self._plan = {}
+
+        if self.write_workers == 1 or len(items) == 1:
+            for item in items:
+                self._emit(item)
+        else:
+            with ThreadPoolExecutor(max_workers=self.write_workers) as pool:
+                # list() re-raises the first write error, if any
+                list(pool.map(self._emit, items))
+
+        self.generated_files.extend(str(path) for path, _ in items)
+
     def _generate_cursorrules(self, blueprint: Optional[Dict[str, Any]]) -> None:
         """Generate the .agentrules file.
         Args:
@@ -617,8 +790,7 @@ class ProjectGenerator:
             / "cursorrules-template.md"
         )
         if template_path.exists():
-            with open(template_path, "r", encoding="utf-8") as f:
-                return f.read()
+            return read_text_cached(template_path)
 
         # Default template
         return """# {PROJECT_NAME} - LLM Agent Instructions
@@ -772,16 +944,14 @@ Before implementation:
                 output_path = agents_dir / f"{name}.md"
 
                 # DEBUG LOG
-                debug_path = self.factory_root / "generation_debug.log"
-                with open(debug_path, "a", encoding="utf-8") as f:
-                    f.write(f"  [AGENT] Writing {name}.md to {output_path}\n")
+                self.debug_log.write(f"  [AGENT] Writing {name}.md to {output_path}\n")
 
                 self._write_file(output_path, content)
             else:
                 # DEBUG LOG
-                debug_path = self.factory_root / "generation_debug.log"
-                with open(debug_path, "a", encoding="utf-8") as f:
-                    f.write(f"  [AGENT] FAILED to load pattern for {agent_id}\n")
+                self.debug_log.write(
+                    f"  [AGENT] FAILED to load pattern for {agent_id}\n"
+                )
                 print(f"Warning: Agent pattern {agent_id} not found")
 
     def _render_agent_from_pattern(self, pattern: Dict[str, Any]) -> str:
@@ -932,15 +1102,12 @@ Before implementation:
                     )
                     name = frontmatter.get("name", skill_id)
                     skill_dir = self.target_dir / ".agent" / "skills" / name
-                    skill_dir.mkdir(parents=True, exist_ok=True)
                     output_path = skill_dir / "SKILL.md"
 
                     # DEBUG LOG
-                    debug_path = self.factory_root / "generation_debug.log"
-                    with open(debug_path, "a", encoding="utf-8") as f:
-                        f.write(
-                            f"  [SKILL-JINJA2] Writing {name}/SKILL.md to {output_path}\n"
-                        )
+                    self.debug_log.write(
+                        f"  [SKILL-JINJA2] Writing {name}/SKILL.md to {output_path}\n"
+                    )
 
                     self._write_file(output_path, content)
                     continue  # Skip the legacy pattern rendering
@@ -953,20 +1120,19 @@ Before implementation:
                 content = self._render_skill_from_pattern(pattern)
                 name = pattern.get("frontmatter", {}).get("name", skill_id)
                 skill_dir = self.target_dir / ".agent" / "skills" / name
-                skill_dir.mkdir(parents=True, exist_ok=True)
                 output_path = skill_dir / "SKILL.md"
 
                 # DEBUG LOG
-                debug_path = self.factory_root / "generation_debug.log"
-                with open(debug_path, "a", encoding="utf-8") as f:
-                    f.write(f"  [SKILL] Writing {name}/SKILL.md to {output_path}\n")
+                self.debug_log.write(
+                    f"  [SKILL] Writing {name}/SKILL.md to {output_path}\n"
+                )
 
                 self._write_file(output_path, content)
             else:
                 # DEBUG LOG
-                debug_path = self.factory_root / "generation_debug.log"
-                with open(debug_path, "a", encoding="utf-8") as f:
-                    f.write(f"  [SKILL] FAILED to load pattern for {skill_id}\n")
+                self.debug_log.write(
+                    f"  [SKILL] FAILED to load pattern for {skill_id}\n"
+                )
                 print(f"Warning: Skill pattern {skill_id} not found")
 
     def _render_skill_from_pattern(self, pattern: Dict[str, Any]) -> str:
@@ -1101,9 +1267,7 @@ Before implementation:
             for filename in files_to_copy:
                 src_file = source_knowledge / filename
                 if src_file.exists():
-                    dest = knowledge_dir / filename
-                    shutil.copy2(src_file, dest)
-                    self.generated_files.append(str(dest))
+                    self._copy_file(src_file, knowledge_dir / filename)
 
     def _generate_guardian_protocol(self, knowledge_dir: Path) -> None:
         """Generate guardian-protocol.json.
@@ -1124,7 +1288,7 @@ Before implementation:
             return
 
         try:
-            template_content = template_path.read_text(encoding="utf-8")
+            template_content = read_text_cached(template_path)
 
             # Context for replacements
             now = datetime.now()
@@ -1179,7 +1343,7 @@ Before implementation:
         factory_version = self._get_factory_version()
 
         # Read template and substitute placeholders
-        template_content = template_path.read_text(encoding="utf-8")
+        template_content = read_text_cached(template_path)
 
         now = datetime.now()
 
@@ -1211,7 +1375,7 @@ Before implementation:
 
         if manifest_path.exists():
             try:
-                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+                manifest = load_json_cached(manifest_path)
                 return manifest.get("factory_version", "0.0.0")
             except (json.JSONDecodeError, IOError):
                 pass
@@ -1232,7 +1396,7 @@ Before implementation:
         Returns:
             Rendered content string.
         """
-        template_content = template_path.read_text(encoding="utf-8")
+        template_content = read_text_cached(template_path)
 
         if self.template_engine:
             return self.template_engine.render_string(template_content, context)
@@ -1451,12 +1615,12 @@ Before implementation:
         # Create basic workflow files based on triggers (fallback)
         if "jira" in self.config.triggers:
             bugfix_path = workflows_dir / "bugfix_workflow.md"
-            if not bugfix_path.exists():
+            if not self._path_exists(bugfix_path):
                 self._write_file(bugfix_path, self._get_bugfix_workflow_template())
 
         if "confluence" in self.config.triggers:
             feature_path = workflows_dir / "feature_workflow.md"
-            if not feature_path.exists():
+            if not self._path_exists(feature_path):
                 self._write_file(feature_path, self._get_feature_workflow_template())
 
     def _copy_workflow_templates(
@@ -1512,15 +1676,13 @@ Before implementation:
             if template_path.exists():
                 # Render template
                 if self.template_engine:
-                    with open(template_path, "r", encoding="utf-8") as f:
-                        template_content = f.read()
+                    template_content = read_text_cached(template_path)
                     content = self.template_engine.render_string(
                         template_content, context
                     )
                 else:
                     # Simple placeholder replacement
-                    with open(template_path, "r", encoding="utf-8") as f:
-                        content = f.read()
+                    content = read_text_cached(template_path)
                     content = content.replace(
                         "{{PROJECT_NAME}}", self.config.project_name
                     )
@@ -2181,15 +2343,183 @@ def generate_from_config(config_path: str, target_dir: str) -> Dict[str, Any]:
     Returns:
         Generation result dictionary.
     """
-    if config_path.endswith(".yaml") or config_path.endswith(".yml"):
-        config = ProjectConfig.from_yaml_file(config_path)
-    else:
-        config = ProjectConfig.from_json_file(config_path)
-
+    config = load_config_file(config_path)
     generator = ProjectGenerator(config, target_dir)
     return generator.generate()
 
 
+def load_config_file(config_path: str) -> ProjectConfig:
+    """Load a ProjectConfig from a YAML (.yaml/.yml) or JSON file.
+
+    Args:
+        config_path: Path to configuration file.
+
+    Returns:
+        ProjectConfig instance.
+    """
+    if config_path.endswith(".yaml") or config_path.endswith(".yml"):
+        return ProjectConfig.from_yaml_file(config_path)
+    return ProjectConfig.from_json_file(config_path)
+
+
+# =============================================================================
+# BATCH GENERATION
+# =============================================================================
+
+BATCH_SUMMARY_FILENAME = "batch-summary.json"
+
+# Per-process engine reused by every project a batch worker generates
+_batch_engine: Optional["TemplateEngine"] = None
+
+
+def _warm_batch_caches(blueprint_ids: List[Optional[str]]) -> None:
+    """Load the blueprints, cursorrules template and engine once per process.
+
+    Called in the parent before the worker pool starts, so forked workers
+    inherit warm caches, and again as the pool initializer for platforms
+    that spawn fresh interpreters (where it does the actual loading).
+    """
+    global _batch_engine
+
+    factory_root = Path(__file__).parent.parent.parent
+    if _batch_engine is None and TEMPLATE_ENGINE_AVAILABLE:
+        try:
+            _batch_engine = create_engine(factory_root)
+        except Exception:
+            _batch_engine = None
+
+    for blueprint_id in set(blueprint_ids):
+        if blueprint_id:
+            path = factory_root / ".agent" / "blueprints" / blueprint_id
+            if (path / "blueprint.json").exists():
+                load_json_cached(path / "blueprint.json")
+
+    rules_template = (
+        factory_root / ".agent" / "templates" / "factory" / "cursorrules-template.md"
+    )
+    if rules_template.exists():
+        read_text_cached(rules_template)
+
+
+def _generate_batch_item(
+    config_path: str, config: ProjectConfig, target_dir: str
+) -> Dict[str, Any]:
+    """Generate one batch project and time it (runs in a worker process)."""
+    output = io.StringIO()
+    started = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            generator = ProjectGenerator(
+                config, target_dir, template_engine=_batch_engine
+            )
+            result = generator.generate()
+    except Exception as e:
+        result = {"success": False, "files_created": [], "errors": [str(e)]}
+
+    return {
+        "config": config_path,
+        "project_name": config.project_name,
+        "target_dir": target_dir,
+        "success": result["success"],
+        "seconds": round(time.perf_counter() - started, 4),
+        "files_created": len(result["files_created"]),
+        "errors": result["errors"],
+        "output": output.getvalue().splitlines(),
+    }
+
+
+def generate_batch(
+    config_paths: List[str],
+    output_root: str,
+    workers: Optional[int] = None,
+    summary_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Generate many projects from configuration files in one run.
+
+    Configs are loaded up front and each project is generated into
+    ``<output_root>/<project_name>`` (suffixed with the config file stem if
+    two configs share a name). Blueprints, patterns, templates and the
+    template engine are loaded once per process and reused for every
+    project; with more than one worker the projects are generated in a
+    process pool.
+
+    Args:
+        config_paths: YAML or JSON ProjectConfig files.
+        output_root: Directory that receives one subdirectory per project.
+        workers: Worker processes (default: one per CPU, at most one per
+            project); 1 generates sequentially in this process.
+        summary_path: Where to write the combined summary (default
+            ``<output_root>/batch-summary.json``).
+
+    Returns:
+        Summary dictionary with per-project results and timing.
+    """
+    started = time.perf_counter()
+    root = Path(output_root)
+    root.mkdir(parents=True, exist_ok=True)
+
+    jobs: List[Tuple[str, ProjectConfig, str]] = []
+    load_errors: List[Dict[str, Any]] = []
+    used_dirs = set()
+    for config_path in config_paths:
+        try:
+            config = load_config_file(str(config_path))
+        except Exception as e:
+            load_errors.append(
+                {
+                    "config": str(config_path),
+                    "project_name": None,
+                    "target_dir": None,
+                    "success": False,
+                    "seconds": 0.0,
+                    "files_created": 0,
+                    "errors": [f"Error loading configuration: {e}"],
+                    "output": [],
+                }
+            )
+            continue
+        target = root / config.project_name
+        if target in used_dirs:
+            target = root / f"{config.project_name}-{Path(config_path).stem}"
+        used_dirs.add(target)
+        jobs.append((str(config_path), config, str(target)))
+
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1)
+    workers = max(1, workers)
+
+    blueprint_ids = [config.blueprint_id for _, config, _ in jobs]
+    _warm_batch_caches(blueprint_ids)
+
+    if workers == 1 or len(jobs) <= 1:
+        results = [_generate_batch_item(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_warm_batch_caches,
+            initargs=(blueprint_ids,),
+        ) as pool:
+            futures = [pool.submit(_generate_batch_item, *job) for job in jobs]
+            results = [future.result() for future in futures]
+
+    projects = load_errors + results
+    summary = {
+        "generated_at": datetime.now().isoformat(),
+        "output_root": str(root),
+        "workers": workers,
+        "total_seconds": round(time.perf_counter() - started, 4),
+        "succeeded": sum(1 for r in projects if r["success"]),
+        "failed": sum(1 for r in projects if not r["success"]),
+        "projects": projects,
+    }
+
+    summary_file = Path(summary_path) if summary_path else root / BATCH_SUMMARY_FILENAME
+    summary_file.parent.mkdir(parents=True, exist_ok=True)
+    summary_file.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    summary["summary_path"] = str(summary_file)
+    return summary
+
+
 if __name__ == "__main__":
     # Example usage
     config = ProjectConfig(
@@ -14,15 +14,19 @@ Author: Antigravity Agent Factory
 Version: 1.0.0
 """
 
+import hashlib
 import re
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 
 # Jinja2 import with graceful fallback
 try:
     from jinja2 import Environment, FileSystemLoader, BaseLoader, TemplateNotFound
+    from jinja2 import FileSystemBytecodeCache, Template
     from jinja2 import select_autoescape, pass_context
 
     JINJA2_AVAILABLE = True
@@ -30,6 +34,13 @@ except ImportError:
     JINJA2_AVAILABLE = False
 
 
+# Compiled string templates kept in memory per engine
+TEMPLATE_CACHE_SIZE = 256
+
+# Any {NAME} occurrence; a superset of what both legacy patterns can rewrite
+_LEGACY_CANDIDATE_PATTERN = re.compile(r"\{([A-Z][A-Z0-9_]*)\}")
+
+
 # =============================================================================
 # CUSTOM FILTERS
 # =============================================================================
@@ -412,6 +423,8 @@ class TemplateEngine:
     - Custom globals for datetime, environment variables
     - Support for macros via template inheritance
     - Legacy placeholder support ({{UPPERCASE}} -> {{ lowercase }})
+    - Compiled string templates cached by content hash, with an optional
+      on-disk bytecode cache shared by render() and render_file()
 
     Attributes:
         env: Jinja2 Environment instance
@@ -427,6 +440,8 @@ class TemplateEngine:
         template_dirs: Optional[List[Path]] = None,
         enable_autoescape: bool = False,
         legacy_placeholder_support: bool = True,
+        template_cache_size: int = TEMPLATE_CACHE_SIZE,
+        bytecode_cache_dir: Optional[Path] = None,
     ):
         """
         Initialize the template engine.
@@ -435,6 +450,9 @@ class TemplateEngine:
             template_dirs: List of directories to search for templates
             enable_autoescape: Enable HTML autoescaping (default False for markdown)
             legacy_placeholder_support: Support {{UPPERCASE}} placeholders
+            template_cache_size: Compiled string templates kept in memory
+            bytecode_cache_dir: Directory for Jinja2 bytecode shared across
+                processes (disabled when None)
 
         Raises:
             ImportError: If Jinja2 is not installed
@@ -447,6 +465,25 @@ class TemplateEngine:
 
         self.template_dirs = template_dirs or []
         self.legacy_placeholder_support = legacy_placeholder_support
+        self.template_cache_size = template_cache_size
+
+        # Compiled templates keyed by (content hash, legacy placeholders
+        # converted), plus the placeholder names found per content hash
+        self._template_cache: "OrderedDict[Tuple[str, FrozenSet[str]], Template]" = (
+            OrderedDict()
+        )
+        self._placeholder_cache: Dict[str, FrozenSet[str]] = {}
+        self._stats = {"hits": 0, "misses": 0, "bytecode_hits": 0}
+        self._compile_seconds = 0.0
+
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            try:
+                Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+            except OSError:
+                # Read-only checkout: compile in memory only
+                bytecode_cache = None
 
         # Convert paths to strings for FileSystemLoader
         search_paths = [str(d) for d in self.template_dirs if d.exists()]
@@ -454,6 +491,7 @@ class TemplateEngine:
         # Create Jinja2 environment
         self.env = Environment(
             loader=FileSystemLoader(search_paths) if search_paths else None,
+            bytecode_cache=bytecode_cache,
             autoescape=select_autoescape(["html", "xml"])
             if enable_autoescape
             else False,
@@ -549,6 +587,96 @@ class TemplateEngine:
 
         return result
 
+    def _get_compiled(self, template_str: str, context: Dict[str, Any]) -> "Template":
+        """
+        Return the compiled template for a string, compiling it at most once.
+
+        The legacy conversion only depends on which {NAME} placeholders have a
+        matching context key, so that set is part of the cache key. On a miss
+        the converted source is looked up in the bytecode cache (if enabled)
+        before falling back to a full compile.
+
+        Args:
+            template_str: Template content as string
+            context: Context dictionary (before legacy key expansion)
+
+        Returns:
+            Compiled Jinja2 template
+        """
+        digest = hashlib.sha256(template_str.encode("utf-8")).hexdigest()
+
+        converted: FrozenSet[str] = frozenset()
+        if self.legacy_placeholder_support:
+            placeholders = self._placeholder_cache.get(digest)
+            if placeholders is None:
+                placeholders = frozenset(
+                    _LEGACY_CANDIDATE_PATTERN.findall(template_str)
+                )
+                self._placeholder_cache[digest] = placeholders
+            converted = frozenset(
+                name
+                for name in placeholders
+                if name.lower() in context or name in context
+            )
+
+        key = (digest, converted)
+        template = self._template_cache.get(key)
+        if template is not None:
+            self._template_cache.move_to_end(key)
+            self._stats["hits"] += 1
+            return template
+
+        self._stats["misses"] += 1
+        started = time.perf_counter()
+        source = template_str
+        if self.legacy_placeholder_support:
+            source = self._convert_legacy_placeholders(template_str, context)
+
+        bcc = self.env.bytecode_cache
+        if bcc is None:
+            template = self.env.from_string(source)
+        else:
+            # Same flow as jinja2.BaseLoader.load(), keyed by content hash
+            name = f"<string:{hashlib.sha256(source.encode('utf-8')).hexdigest()}>"
+            bucket = bcc.get_bucket(self.env, name, None, source)
+            code = bucket.code
+            if code is None:
+                code = self.env.compile(source)
+                bucket.code = code
+                bcc.set_bucket(bucket)
+            else:
+                self._stats["bytecode_hits"] += 1
+            template = self.env.template_class.from_code(
+                self.env, code, self.env.make_globals(None)
+            )
+        self._compile_seconds += time.perf_counter() - started
+
+        self._template_cache[key] = template
+        if len(self._template_cache) > self.template_cache_size:
+            self._template_cache.popitem(last=False)
+        return template
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get compiled-template cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, bytecode_hits, compile_seconds
+            and the number of cached templates
+        """
+        return {
+            **self._stats,
+            "compile_seconds": round(self._compile_seconds, 6),
+            "size": len(self._template_cache),
+        }
+
+    def clear_cache(self) -> None:
+        """Drop compiled templates held in memory and reset the counters."""
+        self._template_cache.clear()
+        self._placeholder_cache.clear()
+        self._stats = {"hits": 0, "misses": 0, "bytecode_hits": 0}
+        self._compile_seconds = 0.0
+
     def render(
         self, template_path: str, context: Optional[Dict[str, Any]] = None
     ) -> str:
@@ -590,10 +718,9 @@ class TemplateEngine:
             'Hello World!'
         """
         context = context or {}
+        template = self._get_compiled(template_str, context)
 
-        # Convert legacy placeholders if enabled
         if self.legacy_placeholder_support:
-            template_str = self._convert_legacy_placeholders(template_str, context)
             # Also add uppercase versions of context keys for legacy support
             legacy_context = {}
             for key, value in context.items():
@@ -601,7 +728,6 @@ class TemplateEngine:
                 legacy_context[key.upper()] = value
             context = legacy_context
 
-        template = self.env.from_string(template_str)
         return template.render(**context)
 
     def render_file(
@@ -680,7 +806,9 @@ class TemplateEngine:
 
 
 def create_engine(
-    factory_root: Optional[Path] = None, additional_dirs: Optional[List[Path]] = None
+    factory_root: Optional[Path] = None,
+    additional_dirs: Optional[List[Path]] = None,
+    use_bytecode_cache: bool = True,
 ) -> TemplateEngine:
     """
     Create a TemplateEngine with standard Factory configuration.
@@ -688,6 +816,8 @@ def create_engine(
     Args:
         factory_root: Root directory of the factory (auto-detected if None)
         additional_dirs: Additional template directories to include
+        use_bytecode_cache: Keep compiled templates under
+            .agent/cache/jinja-bytecode so later runs skip compilation
 
     Returns:
         Configured TemplateEngine instance
@@ -707,7 +837,13 @@ def create_engine(
     if additional_dirs:
         template_dirs.extend(additional_dirs)
 
-    return TemplateEngine(template_dirs=template_dirs)
+    bytecode_cache_dir = None
+    if use_bytecode_cache:
+        bytecode_cache_dir = factory_root / ".agent" / "cache" / "jinja-bytecode"
+
+    return TemplateEngine(
+        template_dirs=template_dirs, bytecode_cache_dir=bytecode_cache_dir
+    )
 
 
 def render_template(
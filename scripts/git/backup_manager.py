@@ -4,6 +4,12 @@ Antigravity Agent Factory - Backup Manager
 Handles backup creation, manifest tracking, and rollback functionality
 for the onboarding process.
 
+File contents are kept in a content-addressed object store shared by all
+sessions (``objects/<sha256[:2]>/<sha256>``, compressed with zstd when the
+zstandard package is installed and gzip otherwise), so identical content is
+stored once no matter how often it is backed up. Session manifests only
+reference objects; unreferenced objects are removed by collect_garbage().
+
 Usage:
     from scripts.git.backup_manager import BackupManager
 
@@ -17,12 +23,32 @@ Author: Antigravity Agent Factory
 Version: 1.0.0
 """
 
+import gzip
+import hashlib
 import json
+import os
 import shutil
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+CHUNK_SIZE = 1024 * 1024
+HASH_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+# Object suffix -> codec, in lookup order
+OBJECT_SUFFIXES = (".zst", ".gz")
 
 
 @dataclass
@@ -31,10 +57,13 @@ class BackupEntry:
 
     Attributes:
         original_path: Original path of the file (relative to repo).
-        backup_path: Path to the backup copy.
-        file_hash: MD5 hash of the original content.
+        backup_path: Path to the stored object (or, for sessions written
+            before the object store, the plain backup copy).
+        file_hash: SHA-256 of the original content (MD5 in older sessions).
         backed_up_at: Timestamp when backup was created.
         was_new: Whether this was a new file (didn't exist before).
+        mode: Permission bits of the original file.
+        mtime_ns: Modification time of the original file.
     """
 
     original_path: str
@@ -42,6 +71,8 @@ class BackupEntry:
     file_hash: str
     backed_up_at: str
     was_new: bool = False
+    mode: Optional[int] = None
+    mtime_ns: Optional[int] = None
 
 
 @dataclass
@@ -84,6 +115,8 @@ class BackupManifest:
                     "file_hash": e.file_hash,
                     "backed_up_at": e.backed_up_at,
                     "was_new": e.was_new,
+                    "mode": e.mode,
+                    "mtime_ns": e.mtime_ns,
                 }
                 for e in self.entries
             ],
@@ -118,12 +151,136 @@ class BackupManifest:
                     file_hash=entry_data["file_hash"],
                     backed_up_at=entry_data["backed_up_at"],
                     was_new=entry_data.get("was_new", False),
+                    mode=entry_data.get("mode"),
+                    mtime_ns=entry_data.get("mtime_ns"),
                 )
             )
 
         return manifest
 
 
+def _hash_file(file_path: Path) -> str:
+    """Return the SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ObjectStore:
+    """Content-addressed store of compressed file contents.
+
+    Objects are named by the SHA-256 of their uncompressed content and
+    written once, so storing content that is already present only costs a
+    hash. Objects are streamed in and out in chunks.
+
+    Attributes:
+        root: Directory holding the objects.
+    """
+
+    def __init__(self, root: Path):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the objects.
+        """
+        self.root = Path(root)
+
+    def object_path(self, digest: str, suffix: str) -> Path:
+        """Return where an object with this digest and codec lives."""
+        return self.root / digest[:2] / (digest + suffix)
+
+    def find(self, digest: str) -> Optional[Path]:
+        """Return the path of a stored object, or None if absent."""
+        if not digest:
+            return None
+        for suffix in OBJECT_SUFFIXES:
+            path = self.object_path(digest, suffix)
+            if path.exists():
+                return path
+        return None
+
+    def put(self, file_path: Path) -> Tuple[str, Path]:
+        """Store a file's content unless it is already present.
+
+        Args:
+            file_path: File to store.
+
+        Returns:
+            Tuple of (SHA-256 of the content, object path).
+        """
+        digest = _hash_file(file_path)
+        existing = self.find(digest)
+        if existing is not None:
+            try:
+                # Restart the GC grace period: the new reference only lands
+                # in a manifest once the whole backup is done
+                os.utime(existing)
+                return digest, existing
+            except FileNotFoundError:
+                pass  # collected meanwhile; store it again
+
+        # Compress and re-hash in one pass, so the object is named after the
+        # bytes actually stored even if the file changed after hashing
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.root / f".{uuid.uuid4().hex}.tmp"
+        suffix = ".zst" if ZSTD_AVAILABLE else ".gz"
+        stored_digest = hashlib.sha256()
+        try:
+            with open(file_path, "rb") as src, open(tmp_path, "wb") as raw:
+                if ZSTD_AVAILABLE:
+                    dst = zstandard.ZstdCompressor(level=3).stream_writer(
+                        raw, closefd=False
+                    )
+                else:
+                    dst = gzip.GzipFile(fileobj=raw, mode="wb", mtime=0)
+                with dst:
+                    for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+                        stored_digest.update(chunk)
+                        dst.write(chunk)
+            digest = stored_digest.hexdigest()
+            target = self.object_path(digest, suffix)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, target)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        return digest, target
+
+    def restore(self, object_path: Path, target: Path) -> None:
+        """Stream an object back to `target`, replacing it atomically."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with self._open(object_path) as src, open(tmp_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            os.replace(tmp_path, target)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def iter_objects(self) -> Iterable[Path]:
+        """Yield every stored object and leftover temporary file."""
+        if not self.root.exists():
+            return
+        for path in self.root.rglob("*"):
+            if path.is_file():
+                yield path
+
+    @staticmethod
+    def _open(object_path: Path):
+        if object_path.suffix == ".zst":
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError(
+                    f"zstandard is required to restore {object_path.name}"
+                )
+            return zstandard.ZstdDecompressor().stream_reader(
+                open(object_path, "rb"), closefd=True
+            )
+        return gzip.open(object_path, "rb")
+
+
 class BackupSession:
     """Active backup session for tracking file modifications.
 
@@ -170,43 +327,67 @@ class BackupSession:
         Returns:
             True if backup was successful, False otherwise.
         """
+        return self.backup_files([file_path], mark_as_new)
+
+    def backup_files(
+        self, file_paths: Iterable[Path], mark_as_new: bool = False
+    ) -> bool:
+        """Back up several files, hashing and storing them in parallel.
+
+        Entries are recorded in the given order and the manifest is written
+        once for the whole batch.
+
+        Args:
+            file_paths: Paths of the files to backup.
+            mark_as_new: If True, marks files as newly created.
+
+        Returns:
+            True if all backups were successful.
+        """
+        file_paths = list(file_paths)
+        if len(file_paths) > 1:
+            with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+                entries = list(
+                    executor.map(lambda p: self._make_entry(p, mark_as_new), file_paths)
+                )
+        else:
+            entries = [self._make_entry(p, mark_as_new) for p in file_paths]
+
+        self.manifest.entries.extend(e for e in entries if e is not None)
+        self._save_manifest()
+        return all(e is not None for e in entries)
+
+    def _make_entry(self, file_path: Path, mark_as_new: bool) -> Optional[BackupEntry]:
+        """Store a file's content and build its manifest entry."""
         # Calculate relative path
         try:
             relative_path = file_path.relative_to(self.manager.repo_path)
         except ValueError:
             relative_path = Path(file_path.name)
 
-        # Create backup directory structure
-        backup_path = self.session_dir / relative_path
-        backup_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Calculate hash and copy if file exists
         file_hash = ""
+        backup_path = ""
+        mode = mtime_ns = None
         if file_path.exists() and not mark_as_new:
             try:
-                import hashlib
-
-                content = file_path.read_bytes()
-                file_hash = hashlib.md5(content).hexdigest()
-                shutil.copy2(file_path, backup_path)
+                st = file_path.stat()
+                file_hash, object_path = self.manager.store.put(file_path)
+                backup_path = str(object_path)
+                mode, mtime_ns = st.st_mode & 0o7777, st.st_mtime_ns
             except Exception as e:
                 print(f"Warning: Could not backup {file_path}: {e}")
-                return False
+                return None
 
-        # Create entry
-        entry = BackupEntry(
+        return BackupEntry(
             original_path=str(relative_path),
-            backup_path=str(backup_path),
+            backup_path=backup_path,
             file_hash=file_hash,
             backed_up_at=datetime.now().isoformat(),
             was_new=mark_as_new,
+            mode=mode,
+            mtime_ns=mtime_ns,
         )
 
-        self.manifest.entries.append(entry)
-        self._save_manifest()
-
-        return True
-
     def backup_directory(self, dir_path: Path, mark_as_new: bool = False) -> bool:
         """Backup all files in a directory.
 
@@ -220,13 +401,13 @@ class BackupSession:
         if not dir_path.exists():
             return True
 
-        success = True
-        for file_path in dir_path.rglob("*"):
-            if file_path.is_file():
-                if not self.backup_file(file_path, mark_as_new):
-                    success = False
-
-        return success
+        backup_root = self.manager.backup_root
+        files = sorted(
+            p
+            for p in dir_path.rglob("*")
+            if p.is_file() and backup_root not in p.parents
+        )
+        return self.backup_files(files, mark_as_new)
 
     def rollback(self) -> bool:
         """Rollback all changes made in this session.
@@ -238,7 +419,6 @@ class BackupSession:
 
         for entry in reversed(self.manifest.entries):
             original_path = self.manager.repo_path / entry.original_path
-            backup_path = Path(entry.backup_path)
 
             try:
                 if entry.was_new:
@@ -248,10 +428,7 @@ class BackupSession:
                         # Clean up empty parent directories
                         self._cleanup_empty_dirs(original_path.parent)
                 else:
-                    # Restore from backup
-                    if backup_path.exists():
-                        original_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(backup_path, original_path)
+                    self._restore(entry, original_path)
             except Exception as e:
                 print(f"Warning: Could not rollback {entry.original_path}: {e}")
                 success = False
@@ -261,6 +438,23 @@ class BackupSession:
 
         return success
 
+    def _restore(self, entry: BackupEntry, original_path: Path) -> None:
+        """Restore one backed up file from the object store."""
+        object_path = self.manager.store.find(entry.file_hash)
+        if object_path is not None:
+            self.manager.store.restore(object_path, original_path)
+            if entry.mode is not None:
+                os.chmod(original_path, entry.mode)
+            if entry.mtime_ns is not None:
+                os.utime(original_path, ns=(entry.mtime_ns, entry.mtime_ns))
+            return
+
+        # Sessions written before the object store hold plain copies
+        backup_path = Path(entry.backup_path)
+        if entry.backup_path and backup_path.is_file():
+            original_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(backup_path, original_path)
+
     def complete(self) -> None:
         """Mark the session as successfully completed."""
         self.manifest.completed = True
@@ -308,6 +502,7 @@ class BackupManager:
     """
 
     BACKUP_DIR_NAME = ".agent-factory-backup"
+    OBJECTS_DIR_NAME = "objects"
 
     def __init__(self, repo_path: Path):
         """Initialize the backup manager.
@@ -317,6 +512,7 @@ class BackupManager:
         """
         self.repo_path = Path(repo_path)
         self.backup_root = self.repo_path / self.BACKUP_DIR_NAME
+        self.store = ObjectStore(self.backup_root / self.OBJECTS_DIR_NAME)
 
     def create_session(self, description: str = "") -> BackupSession:
         """Create a new backup session.
@@ -404,6 +600,9 @@ class BackupManager:
     def cleanup_old_sessions(self, keep_count: int = 5) -> int:
         """Remove old backup sessions, keeping the most recent ones.
 
+        Objects no longer referenced by any remaining session are garbage
+        collected afterwards.
+
         Args:
             keep_count: Number of recent sessions to keep.
 
@@ -424,6 +623,57 @@ class BackupManager:
             except Exception as e:
                 print(f"Warning: Could not remove session {session.session_id}: {e}")
 
+        if removed:
+            self.collect_garbage()
+        return removed
+
+    def collect_garbage(self, grace_seconds: float = 3600.0) -> int:
+        """Delete stored objects that no session manifest references.
+
+        Nothing is deleted if any manifest cannot be read, and objects (or
+        temporary files) younger than `grace_seconds` are kept so a backup
+        running concurrently cannot lose content it has just stored.
+
+        Args:
+            grace_seconds: Minimum age of an object before it may be removed.
+
+        Returns:
+            Number of objects removed.
+        """
+        if not self.backup_root.exists():
+            return 0
+
+        referenced = set()
+        for session_dir in self.backup_root.iterdir():
+            manifest_path = session_dir / "manifest.json"
+            if not manifest_path.is_file():
+                continue
+            try:
+                with open(manifest_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                referenced.update(e["file_hash"] for e in data.get("entries", []))
+            except Exception as e:
+                print(
+                    f"Warning: Skipping garbage collection, unreadable {manifest_path}: {e}"
+                )
+                return 0
+
+        cutoff = time.time() - grace_seconds
+        removed = 0
+        for object_path in list(self.store.iter_objects()):
+            name = object_path.name
+            if not name.startswith(".") and name.split(".", 1)[0] in referenced:
+                continue
+            try:
+                if object_path.stat().st_mtime > cutoff:
+                    continue
+                object_path.unlink()
+                removed += 1
+                if not any(object_path.parent.iterdir()):
+                    object_path.parent.rmdir()
+            except OSError:
+                pass
+
         return removed
 
     def get_backup_size(self) -> int:
@@ -499,6 +749,7 @@ if __name__ == "__main__":
         print("  list     - List all backup sessions")
         print("  size     - Show total backup size")
         print("  cleanup  - Remove old backup sessions")
+        print("  gc       - Remove stored objects no session references")
         sys.exit(1)
 
     repo_path = Path(sys.argv[1])
@@ -533,6 +784,10 @@ if __name__ == "__main__":
         removed = manager.cleanup_old_sessions()
         print(f"Removed {removed} old backup session(s).")
 
+    elif command == "gc":
+        removed = manager.collect_garbage()
+        print(f"Removed {removed} unreferenced object(s).")
+
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
@@ -10,6 +10,7 @@ Components:
     - secret_scanner: Detects credentials and secrets in content
     - conflict_detector: Detects potential agent conflicts
     - mutability_guard: Protects Layers 0-2 from modification
+    - rule_engine: Precompiled pattern rules shared by the checkers
 
 Usage:
     from scripts.guardian import axiom_checker, harm_detector, secret_scanner
@@ -5,12 +5,29 @@ This module provides fast, pattern-based validation without LLM calls.
 Execution time: <10ms for typical operations.
 """
 
-import re
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+try:
+    from .rule_engine import (
+        CLAIM_RULES,
+        CRITICAL_PATH_RULES,
+        DESTRUCTIVE_RULES,
+        SENSITIVE_PATH_RULES,
+        get_rule_engine,
+    )
+except ImportError:
+    # Allow running as standalone script for testing
+    from rule_engine import (
+        CLAIM_RULES,
+        CRITICAL_PATH_RULES,
+        DESTRUCTIVE_RULES,
+        SENSITIVE_PATH_RULES,
+        get_rule_engine,
+    )
+
 
 class AxiomViolation(Enum):
     """Types of axiom violations."""
@@ -45,44 +62,17 @@ class CheckResult:
         return self.level >= 4
 
 
-# Patterns for A4 (Non-Harm) violations
-DESTRUCTIVE_PATTERNS = [
-    # File system dangers
-    (r"\brm\s+-rf\s+[/~]", "Recursive deletion of root or home directory"),
-    (r"\brmdir\s+/s\s+/q\s+[A-Z]:\\", "Recursive Windows directory deletion"),
-    (r"Remove-Item.*-Recurse.*-Force.*[/\\]$", "PowerShell recursive root deletion"),
-    (r"\bformat\s+[A-Z]:", "Disk format command"),
-    (r"\bdd\s+.*of=/dev/", "Direct disk write"),
-    # Database dangers
-    (r"DROP\s+DATABASE", "Database drop command"),
-    (r"DROP\s+TABLE(?!.*IF\s+EXISTS)", "Table drop without IF EXISTS"),
-    (r"TRUNCATE\s+TABLE", "Table truncation"),
-    (r"DELETE\s+FROM\s+\w+\s*(?:;|$)", "DELETE without WHERE clause"),
-    # System dangers
-    (r"\bkill\s+-9\s+-1", "Kill all processes"),
-    (r"\bshutdown\b", "System shutdown"),
-    (r"\breboot\b", "System reboot"),
-]
+# Pattern tables, derived from the shared rule engine (see rule_engine.py)
+DESTRUCTIVE_PATTERNS = [(r.pattern, r.description) for r in DESTRUCTIVE_RULES]
 
 # Patterns for sensitive file access
-SENSITIVE_PATHS = [
-    r"\.env(?:\.local|\.prod(?:uction)?|\.secret)?$",
-    r"secrets?\.ya?ml$",
-    r"credentials?\.json$",
-    r"\.ssh/id_",
-    r"\.aws/credentials",
-    r"\.kube/config",
-]
+SENSITIVE_PATHS = [r.pattern for r in SENSITIVE_PATH_RULES]
 
 # Critical system paths
-CRITICAL_PATHS = [
-    r"^/etc/",
-    r"^/usr/",
-    r"^/bin/",
-    r"^/sbin/",
-    r"^C:\\Windows\\",
-    r"^C:\\Program Files",
-]
+CRITICAL_PATHS = [r.pattern for r in CRITICAL_PATH_RULES]
+
+# Patterns that suggest claims needing verification
+CLAIM_PATTERNS = [(r.pattern, r.description) for r in CLAIM_RULES]
 
 
 def check_command(command: str) -> CheckResult:
@@ -95,44 +85,28 @@ def check_command(command: str) -> CheckResult:
     Returns:
         CheckResult with violation details if any
     """
-    command_lower = command.lower()
-    # Check for destructive patterns (A4)
-    for pattern, description in DESTRUCTIVE_PATTERNS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return CheckResult(
-                passed=False,
-                level=4,
-                axiom="A4",
-                violation=AxiomViolation.A4_HARMFUL,
-                message=f"Potentially harmful command detected: {description}",
-                details={"command": command, "pattern": pattern},
-            )
-
-    # Check for operations on sensitive paths (A4, lower severity)
-    for pattern in SENSITIVE_PATHS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return CheckResult(
-                passed=False,
-                level=2,
-                axiom="A4",
-                violation=AxiomViolation.A4_HARMFUL,
-                message="Command involves sensitive file",
-                details={"command": command, "pattern": pattern},
-            )
-
-    # Check for operations on critical system paths
-    for pattern in CRITICAL_PATHS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return CheckResult(
-                passed=False,
-                level=3,
-                axiom="A4",
-                violation=AxiomViolation.A4_HARMFUL,
-                message="Command involves critical system path",
-                details={"command": command, "pattern": pattern},
-            )
-
-    return CheckResult(passed=True, level=0)
+    match = get_rule_engine().first(
+        command, categories=("destructive", "sensitive_path", "critical_path")
+    )
+    if match is None:
+        return CheckResult(passed=True, level=0)
+
+    if match.category == "destructive":
+        message = f"Potentially harmful command detected: {match.description}"
+    elif match.category == "sensitive_path":
+        # Operations on sensitive paths (A4, lower severity)
+        message = "Command involves sensitive file"
+    else:
+        message = "Command involves critical system path"
+
+    return CheckResult(
+        passed=False,
+        level=match.level,
+        axiom=match.axiom,
+        violation=AxiomViolation.A4_HARMFUL,
+        message=message,
+        details={"command": command, "pattern": match.pattern},
+    )
 
 
 def check_file_operation(operation: str, file_path: str) -> CheckResult:
@@ -148,45 +122,38 @@ def check_file_operation(operation: str, file_path: str) -> CheckResult:
     """
     path = Path(file_path)
     operation = operation.lower()
+    engine = get_rule_engine()
 
     # Deletion operations need extra scrutiny
     if operation in ("delete", "remove", "rm"):
-        # Check for sensitive files
-        for pattern in SENSITIVE_PATHS:
-            if re.search(pattern, str(path), re.IGNORECASE):
-                return CheckResult(
-                    passed=False,
-                    level=3,
-                    axiom="A4",
-                    violation=AxiomViolation.A4_HARMFUL,
-                    message=f"Deletion of sensitive file: {path}",
-                    details={"operation": operation, "path": str(path)},
-                )
-
-        # Check for critical system files
-        for pattern in CRITICAL_PATHS:
-            if re.search(pattern, str(path), re.IGNORECASE):
-                return CheckResult(
-                    passed=False,
-                    level=4,
-                    axiom="A4",
-                    violation=AxiomViolation.A4_HARMFUL,
-                    message=f"Deletion of critical system file: {path}",
-                    details={"operation": operation, "path": str(path)},
-                )
+        # Sensitive files first, then critical system files
+        match = engine.first(str(path), categories=("sensitive_path", "critical_path"))
+        if match is not None:
+            sensitive = match.category == "sensitive_path"
+            return CheckResult(
+                passed=False,
+                level=3 if sensitive else 4,
+                axiom="A4",
+                violation=AxiomViolation.A4_HARMFUL,
+                message=(
+                    f"Deletion of sensitive file: {path}"
+                    if sensitive
+                    else f"Deletion of critical system file: {path}"
+                ),
+                details={"operation": operation, "path": str(path)},
+            )
 
     # Write to sensitive locations
     if operation in ("write", "create", "overwrite"):
-        for pattern in CRITICAL_PATHS:
-            if re.search(pattern, str(path), re.IGNORECASE):
-                return CheckResult(
-                    passed=False,
-                    level=3,
-                    axiom="A4",
-                    violation=AxiomViolation.A4_HARMFUL,
-                    message=f"Write to critical system location: {path}",
-                    details={"operation": operation, "path": str(path)},
-                )
+        if engine.first(str(path), categories=("critical_path",)) is not None:
+            return CheckResult(
+                passed=False,
+                level=3,
+                axiom="A4",
+                violation=AxiomViolation.A4_HARMFUL,
+                message=f"Write to critical system location: {path}",
+                details={"operation": operation, "path": str(path)},
+            )
 
     return CheckResult(passed=True, level=0)
 
@@ -204,26 +171,16 @@ def check_content_for_claims(content: str) -> CheckResult:
     Returns:
         CheckResult with violation details if any
     """
-    # Patterns that suggest claims needing verification
-    claim_patterns = [
-        (r"\b(always|never|definitely|certainly|guaranteed)\b", "Absolute claim"),
-        (
-            r"\baccording to\s+(?!the\s+(?:documentation|source|file))",
-            "External reference claim",
-        ),
-        (r"\b\d+\s*%", "Statistical claim"),
-    ]
-
     # This is informational only - LLM context determines actual handling
-    for pattern, description in claim_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
-            return CheckResult(
-                passed=True,  # Not a block, just awareness
-                level=1,
-                axiom="A1",
-                message=f"Content contains {description} - verify if possible",
-                details={"pattern": pattern},
-            )
+    match = get_rule_engine().first(content, categories=("claim",))
+    if match is not None:
+        return CheckResult(
+            passed=True,  # Not a block, just awareness
+            level=1,
+            axiom="A1",
+            message=f"Content contains {match.description} - verify if possible",
+            details={"pattern": match.pattern},
+        )
 
     return CheckResult(passed=True, level=0)
 
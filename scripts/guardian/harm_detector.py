@@ -5,17 +5,18 @@ This module provides comprehensive harm detection without LLM calls.
 Combines axiom checking, secret scanning, and additional patterns.
 """
 
-import re
 from dataclasses import dataclass
 from typing import List, Optional
 
 try:
     from . import axiom_checker
     from . import secret_scanner
+    from .rule_engine import CAUTION_FILE_RULES, HARMFUL_CONTENT_RULES, get_rule_engine
 except ImportError:
     # Allow running as standalone script for testing
     import axiom_checker
     import secret_scanner
+    from rule_engine import CAUTION_FILE_RULES, HARMFUL_CONTENT_RULES, get_rule_engine
 
 
 @dataclass
@@ -35,48 +36,13 @@ class HarmReport:
         return f"[LEVEL {self.level}] {self.category}: {self.summary}"
 
 
-# Patterns for potentially harmful content generation
+# Pattern tables, derived from the shared rule engine (see rule_engine.py)
 HARMFUL_CONTENT_PATTERNS = [
-    # Deceptive patterns (A3 - Transparency)
-    (r"(?i)pretend\s+to\s+be\s+(?:a\s+)?human", "Deceptive identity claim", "A3"),
-    (r"(?i)don'?t\s+tell\s+(?:the\s+)?user", "Hidden information from user", "A3"),
-    # Instruction override attempts (A5 - Consistency)
-    (
-        r"(?i)ignore\s+(?:all\s+)?(?:previous\s+)?instructions",
-        "Instruction override attempt",
-        "A5",
-    ),
-    (
-        r"(?i)disregard\s+(?:all\s+)?(?:previous\s+)?(?:instructions|rules)",
-        "Instruction override attempt",
-        "A5",
-    ),
-    # Manipulation patterns (A4 - Non-Harm)
-    (r"(?i)manipulate\s+(?:the\s+)?user", "User manipulation", "A4"),
-    (r"(?i)trick\s+(?:the\s+)?user", "User deception", "A4"),
-    # Harmful action patterns (A4 - Non-Harm)
-    (
-        r"(?i)bypass\s+(?:security|authentication|authorization)",
-        "Security bypass",
-        "A4",
-    ),
-    (r"(?i)exfiltrate\s+data", "Data exfiltration", "A4"),
-    (r"(?i)cover\s+(?:up|your)\s+tracks", "Evidence concealment", "A3"),
+    (r.pattern, r.description, r.axiom) for r in HARMFUL_CONTENT_RULES
 ]
 
 # File patterns that should trigger extra caution
-CAUTION_FILE_PATTERNS = [
-    (r"\.agentrules$", "Modifying agent behavior rules"),
-    (r"\.env", "Environment/secrets file"),
-    (r"package\.json$", "Package dependencies"),
-    (r"requirements\.txt$", "Python dependencies"),
-    (r"Gemfile$", "Ruby dependencies"),
-    (r"go\.mod$", "Go dependencies"),
-    (r"Dockerfile", "Container configuration"),
-    (r"docker-compose", "Container orchestration"),
-    (r"\.github/workflows", "CI/CD pipeline"),
-    (r"gitlab-ci\.yml", "CI/CD pipeline"),
-]
+CAUTION_FILE_PATTERNS = [(r.pattern, r.description) for r in CAUTION_FILE_RULES]
 
 
 def analyze_command(command: str) -> HarmReport:
@@ -143,11 +109,10 @@ def analyze_file_operation(
         details.append(op_result.message)
 
     # Check for caution-worthy files
-    for pattern, reason in CAUTION_FILE_PATTERNS:
-        if re.search(pattern, path, re.IGNORECASE):
-            max_level = max(max_level, 2)  # At least pause level
-            details.append(f"Caution: {reason}")
-            recommendations.append(f"This file affects {reason.lower()}")
+    for match in get_rule_engine().evaluate(path, categories=("caution_file",)):
+        max_level = max(max_level, match.level)  # At least pause level
+        details.append(f"Caution: {match.description}")
+        recommendations.append(f"This file affects {match.description.lower()}")
 
     # If content provided, scan for secrets
     if content:
@@ -195,11 +160,10 @@ def analyze_content(content: str) -> HarmReport:
     axioms_involved = set()
 
     # Check for harmful content patterns
-    for pattern, description, axiom in HARMFUL_CONTENT_PATTERNS:
-        if re.search(pattern, content):
-            max_level = max(max_level, 3)  # Block level
-            details.append(f"{description} ({axiom})")
-            axioms_involved.add(axiom)
+    for match in get_rule_engine().evaluate(content, categories=("harmful_content",)):
+        max_level = max(max_level, match.level)  # Block level
+        details.append(f"{match.description} ({match.axiom})")
+        axioms_involved.add(match.axiom)
 
     # Check for secrets
     secrets = secret_scanner.scan_content(content)
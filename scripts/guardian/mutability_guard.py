@@ -22,15 +22,25 @@ Usage:
         pass
     else:
         print(f"Cannot modify: {result.reason}")
+
+    # Validate a whole change set (e.g. the staged diff) in one pass
+    denied = [r for r in guard.validate_staged_changes().values() if not r.allowed]
+
+Policy lookup is compiled once into a path-segment trie (protected layer and
+mutable prefixes) plus length-bucketed suffix sets (never-modify entries), and
+recent verdicts are kept in an LRU. Call rebuild_index() after mutating
+protected_layers, never_modify or mutable_paths on a live guard.
 """
 
 import json
 import logging
 import re
 import copy
-from dataclasses import dataclass
+import subprocess
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +139,63 @@ NEVER_MODIFY: List[str] = [
 ]
 
 
+@dataclass
+class _TrieNode:
+    """One path segment in the policy trie."""
+
+    children: Dict[str, "_TrieNode"] = field(default_factory=dict)
+    # Entries ending at this node with a trailing "/" (match any descendant)
+    dir_entries: List[Tuple[int, str]] = field(default_factory=list)
+    # Entries whose last component is a name prefix, e.g. "PURPOSE.md"
+    name_entries: List[Tuple[str, int, str]] = field(default_factory=list)
+
+
+class _PathTrie:
+    """
+    Segment trie answering "which configured prefix matches this path first".
+
+    Matching is exactly ``path.startswith(entry)`` for every entry; each entry
+    carries a priority (its configuration order) and the lowest one wins.
+    """
+
+    def __init__(self):
+        self.root = _TrieNode()
+
+    def add(self, entry: str, priority: int, value: str) -> None:
+        segments = entry.split("/")
+        node = self.root
+        for segment in segments[:-1]:
+            node = node.children.setdefault(segment, _TrieNode())
+        if segments[-1] == "":
+            node.dir_entries.append((priority, value))
+        else:
+            node.name_entries.append((segments[-1], priority, value))
+
+    def match(self, path: str) -> Optional[Tuple[int, str]]:
+        best = None
+        node = self.root
+        segments = path.split("/")
+        offset = 0
+        for i, segment in enumerate(segments):
+            if node.name_entries:
+                remainder = path[offset:]
+                for prefix, priority, value in node.name_entries:
+                    if remainder.startswith(prefix) and (
+                        best is None or priority < best[0]
+                    ):
+                        best = (priority, value)
+            node = node.children.get(segment)
+            if node is None:
+                break
+            offset += len(segment) + 1
+            # A trailing-slash entry needs at least one more "/" in the path
+            if node.dir_entries and i < len(segments) - 1:
+                candidate = min(node.dir_entries)
+                if best is None or candidate[0] < best[0]:
+                    best = candidate
+        return best
+
+
 class MutabilityGuard:
     """
     Guards against modifications to protected layers.
@@ -163,6 +230,9 @@ class MutabilityGuard:
         if "protection" in self.config:
             self._apply_custom_config(self.config["protection"])
 
+        self._verdicts: "OrderedDict[str, ValidationResult]" = OrderedDict()
+        self.rebuild_index()
+
     def _load_config(self, config_path: Optional[str]) -> dict:
         """Load configuration from file."""
         if config_path and Path(config_path).exists():
@@ -184,6 +254,33 @@ class MutabilityGuard:
                 if path not in self.mutable_paths:
                     self.mutable_paths.append(path)
 
+    VERDICT_CACHE_SIZE = 4096
+
+    def rebuild_index(self) -> None:
+        """Compile the policy lists into lookup structures and clear verdicts."""
+        self._layer_trie = _PathTrie()
+        priority = 0
+        for layer_id, layer_config in self.protected_layers.items():
+            for protected_path in layer_config["paths"]:
+                self._layer_trie.add(
+                    self._normalize_path(protected_path), priority, layer_id
+                )
+                priority += 1
+
+        self._mutable_trie = _PathTrie()
+        for index, mutable_path in enumerate(self.mutable_paths):
+            self._mutable_trie.add(self._normalize_path(mutable_path), index, "")
+
+        # never-modify entries match by suffix: bucket them by length
+        self._never_by_length: Dict[int, set] = {}
+        for never_path in self.never_modify:
+            never_normalized = self._normalize_path(never_path)
+            self._never_by_length.setdefault(len(never_normalized), set()).add(
+                never_normalized
+            )
+        self._never_lengths = sorted(self._never_by_length)
+        self._verdicts.clear()
+
     def _normalize_path(self, path: str) -> str:
         """Normalize a path for comparison."""
         # Convert to forward slashes and remove leading ./
@@ -199,40 +296,22 @@ class MutabilityGuard:
         Returns:
             Layer identifier (L0, L1, L2) or None if not in a protected layer.
         """
-        normalized = self._normalize_path(path)
-
-        for layer_id, layer_config in self.protected_layers.items():
-            for protected_path in layer_config["paths"]:
-                protected_normalized = self._normalize_path(protected_path)
-
-                # Check exact match or path starts with protected path
-                if normalized == protected_normalized:
-                    return layer_id
-                if normalized.startswith(protected_normalized):
-                    return layer_id
-
-        return None
+        match = self._layer_trie.match(self._normalize_path(path))
+        return match[1] if match else None
 
     def _is_in_mutable_path(self, path: str) -> bool:
         """Check if path is in an explicitly mutable location."""
-        normalized = self._normalize_path(path)
-
-        for mutable_path in self.mutable_paths:
-            mutable_normalized = self._normalize_path(mutable_path)
-            if normalized.startswith(mutable_normalized):
-                return True
-
-        return False
+        return self._mutable_trie.match(self._normalize_path(path)) is not None
 
     def _is_never_modify(self, path: str) -> bool:
         """Check if path is in the never-modify list."""
         normalized = self._normalize_path(path)
+        size = len(normalized)
 
-        for never_path in self.never_modify:
-            never_normalized = self._normalize_path(never_path)
-            if normalized == never_normalized:
-                return True
-            if normalized.endswith(never_normalized):
+        for length in self._never_lengths:
+            if length > size:
+                break
+            if normalized[size - length :] in self._never_by_length[length]:
                 return True
 
         return False
@@ -255,6 +334,69 @@ class MutabilityGuard:
         """
         normalized = self._normalize_path(path)
 
+        cached = self._verdicts.get(normalized)
+        if cached is not None:
+            self._verdicts.move_to_end(normalized)
+            return cached
+
+        result = self._evaluate(normalized)
+        self._verdicts[normalized] = result
+        if len(self._verdicts) > self.VERDICT_CACHE_SIZE:
+            self._verdicts.popitem(last=False)
+        return result
+
+    def can_modify_many(self, paths: Iterable[str]) -> Dict[str, ValidationResult]:
+        """
+        Check a whole change set in one pass.
+
+        Args:
+            paths: Paths to check (duplicates are evaluated once).
+
+        Returns:
+            Dict mapping each normalized path to its ValidationResult,
+            in first-seen order.
+        """
+        results: Dict[str, ValidationResult] = {}
+        for path in paths:
+            normalized = self._normalize_path(path)
+            if normalized not in results:
+                results[normalized] = self.can_modify(normalized)
+        return results
+
+    def validate_staged_changes(
+        self, repo_root: Optional[str] = None
+    ) -> Dict[str, ValidationResult]:
+        """
+        Check every path in the staged git diff (including rename sources).
+
+        Args:
+            repo_root: Repository to inspect (default: current directory).
+
+        Returns:
+            Dict mapping each staged path to its ValidationResult.
+        """
+        output = subprocess.run(
+            ["git", "diff", "--cached", "--name-status", "-z"],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        fields = [f for f in output.split("\0") if f]
+
+        paths = []
+        i = 0
+        while i < len(fields):
+            status = fields[i]
+            # Renames/copies list source and destination
+            count = 2 if status[:1] in ("R", "C") else 1
+            paths.extend(fields[i + 1 : i + 1 + count])
+            i += 1 + count
+
+        return self.can_modify_many(paths)
+
+    def _evaluate(self, normalized: str) -> ValidationResult:
+        """Compute the verdict for an already-normalized path."""
         # Check never-modify list first
         if self._is_never_modify(normalized):
             return ValidationResult(
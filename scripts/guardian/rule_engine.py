@@ -0,0 +1,485 @@
+"""
+Rule Engine - Precompiled pattern rules shared by the Guardian checkers.
+
+Every guardian regex (destructive commands, sensitive and critical paths,
+unverifiable claims, harmful content, caution files) is declared once here,
+compiled once, grouped by axiom and gated by literal keywords: a rule's regex
+only runs when one of its keywords occurs in the case-folded input, so typical
+agent output is rejected after a handful of substring checks.
+
+axiom_checker and harm_detector evaluate their categories through the shared
+engine; evaluate() runs every rule in one pass and returns all matches with
+their axiom and level. Per-rule hit and latency counters are kept for tuning.
+
+Usage:
+    from scripts.guardian.rule_engine import get_rule_engine
+
+    engine = get_rule_engine()
+    for match in engine.evaluate("rm -rf / && cat .env"):
+        print(match.axiom, match.level, match.description)
+    print(engine.get_stats())
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    A single guardian pattern rule.
+
+    Attributes:
+        rule_id: Stable identifier (category.name)
+        category: Rule group ('destructive', 'sensitive_path', ...)
+        axiom: Axiom the rule protects (A1-A5)
+        level: Default Guardian level (0-4) when the rule matches
+        pattern: Regular expression
+        description: Human-readable description
+        keywords: Lowercase literals; at least one occurs in any matching text.
+            Empty means the rule always runs.
+        flags: re flags used to compile the pattern
+    """
+
+    rule_id: str
+    category: str
+    axiom: str
+    level: int
+    pattern: str
+    description: str
+    keywords: Tuple[str, ...] = ()
+    flags: int = re.IGNORECASE
+
+
+@dataclass
+class RuleMatch:
+    """A rule that matched, with its first occurrence."""
+
+    rule_id: str
+    category: str
+    axiom: str
+    level: int
+    description: str
+    pattern: str
+    matched_text: str
+    start: int
+
+
+@dataclass
+class RuleStats:
+    """Counters for one rule."""
+
+    evaluations: int = 0
+    prefiltered: int = 0
+    hits: int = 0
+    total_ns: int = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "evaluations": self.evaluations,
+            "prefiltered": self.prefiltered,
+            "hits": self.hits,
+            "total_ms": round(self.total_ns / 1e6, 3),
+            "mean_us": round(self.total_ns / self.evaluations / 1e3, 3)
+            if self.evaluations
+            else 0.0,
+        }
+
+
+def _rules(category, axiom, level, entries, flags=re.IGNORECASE) -> List[Rule]:
+    return [
+        Rule(f"{category}.{name}", category, axiom, level, pattern, desc, kws, flags)
+        for name, pattern, desc, kws in entries
+    ]
+
+
+# Patterns for A4 (Non-Harm) violations
+DESTRUCTIVE_RULES = _rules(
+    "destructive",
+    "A4",
+    4,
+    [
+        # File system dangers
+        (
+            "rm_rf_root",
+            r"\brm\s+-rf\s+[/~]",
+            "Recursive deletion of root or home directory",
+            ("-rf",),
+        ),
+        (
+            "rmdir_windows",
+            r"\brmdir\s+/s\s+/q\s+[A-Z]:\\",
+            "Recursive Windows directory deletion",
+            ("rmdir",),
+        ),
+        (
+            "remove_item_root",
+            r"Remove-Item.*-Recurse.*-Force.*[/\\]$",
+            "PowerShell recursive root deletion",
+            ("remove-item",),
+        ),
+        ("format_disk", r"\bformat\s+[A-Z]:", "Disk format command", ("format",)),
+        ("dd_device", r"\bdd\s+.*of=/dev/", "Direct disk write", ("of=/dev/",)),
+        # Database dangers
+        ("drop_database", r"DROP\s+DATABASE", "Database drop command", ("database",)),
+        (
+            "drop_table",
+            r"DROP\s+TABLE(?!.*IF\s+EXISTS)",
+            "Table drop without IF EXISTS",
+            ("drop",),
+        ),
+        ("truncate_table", r"TRUNCATE\s+TABLE", "Table truncation", ("truncate",)),
+        (
+            "delete_all",
+            r"DELETE\s+FROM\s+\w+\s*(?:;|$)",
+            "DELETE without WHERE clause",
+            ("delete",),
+        ),
+        # System dangers
+        ("kill_all", r"\bkill\s+-9\s+-1", "Kill all processes", ("kill",)),
+        ("shutdown", r"\bshutdown\b", "System shutdown", ("shutdown",)),
+        ("reboot", r"\breboot\b", "System reboot", ("reboot",)),
+    ],
+)
+
+# Patterns for sensitive file access
+SENSITIVE_PATH_RULES = _rules(
+    "sensitive_path",
+    "A4",
+    2,
+    [
+        (
+            "env_file",
+            r"\.env(?:\.local|\.prod(?:uction)?|\.secret)?$",
+            "Environment file",
+            (".env",),
+        ),
+        ("secrets_yaml", r"secrets?\.ya?ml$", "Secrets file", ("secret",)),
+        (
+            "credentials_json",
+            r"credentials?\.json$",
+            "Credentials file",
+            ("credential",),
+        ),
+        ("ssh_key", r"\.ssh/id_", "SSH key", (".ssh/id_",)),
+        (
+            "aws_credentials",
+            r"\.aws/credentials",
+            "AWS credentials",
+            (".aws/credentials",),
+        ),
+        ("kube_config", r"\.kube/config", "Kubernetes config", (".kube/config",)),
+    ],
+)
+
+# Critical system paths
+CRITICAL_PATH_RULES = _rules(
+    "critical_path",
+    "A4",
+    3,
+    [
+        ("etc", r"^/etc/", "System configuration", ("/etc/",)),
+        ("usr", r"^/usr/", "System programs", ("/usr/",)),
+        ("bin", r"^/bin/", "System binaries", ("/bin/",)),
+        ("sbin", r"^/sbin/", "System binaries", ("/sbin/",)),
+        ("windows", r"^C:\\Windows\\", "Windows directory", ("c:\\windows\\",)),
+        (
+            "program_files",
+            r"^C:\\Program Files",
+            "Program Files",
+            ("c:\\program files",),
+        ),
+    ],
+)
+
+# Patterns that suggest claims needing verification (A1, informational)
+CLAIM_RULES = _rules(
+    "claim",
+    "A1",
+    1,
+    [
+        (
+            "absolute",
+            r"\b(always|never|definitely|certainly|guaranteed)\b",
+            "Absolute claim",
+            ("always", "never", "definitely", "certainly", "guaranteed"),
+        ),
+        (
+            "external_reference",
+            r"\baccording to\s+(?!the\s+(?:documentation|source|file))",
+            "External reference claim",
+            ("according to",),
+        ),
+        ("statistic", r"\b\d+\s*%", "Statistical claim", ("%",)),
+    ],
+)
+
+# Patterns for potentially harmful content generation
+HARMFUL_CONTENT_RULES = [
+    # Deceptive patterns (A3 - Transparency)
+    *_rules(
+        "harmful_content",
+        "A3",
+        3,
+        [
+            (
+                "pretend_human",
+                r"(?i)pretend\s+to\s+be\s+(?:a\s+)?human",
+                "Deceptive identity claim",
+                ("pretend",),
+            ),
+            (
+                "hide_from_user",
+                r"(?i)don'?t\s+tell\s+(?:the\s+)?user",
+                "Hidden information from user",
+                ("tell",),
+            ),
+        ],
+        flags=0,
+    ),
+    # Instruction override attempts (A5 - Consistency)
+    *_rules(
+        "harmful_content",
+        "A5",
+        3,
+        [
+            (
+                "ignore_instructions",
+                r"(?i)ignore\s+(?:all\s+)?(?:previous\s+)?instructions",
+                "Instruction override attempt",
+                ("ignore",),
+            ),
+            (
+                "disregard_instructions",
+                r"(?i)disregard\s+(?:all\s+)?(?:previous\s+)?(?:instructions|rules)",
+                "Instruction override attempt",
+                ("disregard",),
+            ),
+        ],
+        flags=0,
+    ),
+    # Manipulation and harmful action patterns (A4 - Non-Harm)
+    *_rules(
+        "harmful_content",
+        "A4",
+        3,
+        [
+            (
+                "manipulate_user",
+                r"(?i)manipulate\s+(?:the\s+)?user",
+                "User manipulation",
+                ("manipulate",),
+            ),
+            (
+                "trick_user",
+                r"(?i)trick\s+(?:the\s+)?user",
+                "User deception",
+                ("trick",),
+            ),
+            (
+                "security_bypass",
+                r"(?i)bypass\s+(?:security|authentication|authorization)",
+                "Security bypass",
+                ("bypass",),
+            ),
+            (
+                "exfiltrate",
+                r"(?i)exfiltrate\s+data",
+                "Data exfiltration",
+                ("exfiltrate",),
+            ),
+        ],
+        flags=0,
+    ),
+    *_rules(
+        "harmful_content",
+        "A3",
+        3,
+        [
+            (
+                "cover_tracks",
+                r"(?i)cover\s+(?:up|your)\s+tracks",
+                "Evidence concealment",
+                ("cover",),
+            ),
+        ],
+        flags=0,
+    ),
+]
+
+# File patterns that should trigger extra caution
+CAUTION_FILE_RULES = _rules(
+    "caution_file",
+    "A4",
+    2,
+    [
+        (
+            "agentrules",
+            r"\.agentrules$",
+            "Modifying agent behavior rules",
+            (".agentrules",),
+        ),
+        ("env", r"\.env", "Environment/secrets file", (".env",)),
+        ("package_json", r"package\.json$", "Package dependencies", ("package.json",)),
+        (
+            "requirements",
+            r"requirements\.txt$",
+            "Python dependencies",
+            ("requirements.txt",),
+        ),
+        ("gemfile", r"Gemfile$", "Ruby dependencies", ("gemfile",)),
+        ("go_mod", r"go\.mod$", "Go dependencies", ("go.mod",)),
+        ("dockerfile", r"Dockerfile", "Container configuration", ("dockerfile",)),
+        (
+            "docker_compose",
+            r"docker-compose",
+            "Container orchestration",
+            ("docker-compose",),
+        ),
+        (
+            "github_workflows",
+            r"\.github/workflows",
+            "CI/CD pipeline",
+            (".github/workflows",),
+        ),
+        ("gitlab_ci", r"gitlab-ci\.yml", "CI/CD pipeline", ("gitlab-ci.yml",)),
+    ],
+)
+
+GUARDIAN_RULES: List[Rule] = [
+    *DESTRUCTIVE_RULES,
+    *SENSITIVE_PATH_RULES,
+    *CRITICAL_PATH_RULES,
+    *CLAIM_RULES,
+    *HARMFUL_CONTENT_RULES,
+    *CAUTION_FILE_RULES,
+]
+
+
+class RuleEngine:
+    """
+    Compiled, keyword-gated evaluator for a set of rules.
+
+    Rules keep their declaration order; evaluate() reports matches in that
+    order and first() returns the earliest matching rule, which is what the
+    checkers' "first pattern wins" semantics rely on.
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules: List[Rule] = list(rules)
+        self._compiled = [re.compile(r.pattern, r.flags) for r in self.rules]
+        self._stats: Dict[str, RuleStats] = {r.rule_id: RuleStats() for r in self.rules}
+
+        self._by_category: Dict[str, List[int]] = {}
+        self._by_axiom: Dict[str, List[int]] = {}
+        for index, rule in enumerate(self.rules):
+            self._by_category.setdefault(rule.category, []).append(index)
+            self._by_axiom.setdefault(rule.axiom, []).append(index)
+
+    @property
+    def rules_by_axiom(self) -> Dict[str, List[Rule]]:
+        """Rules grouped by the axiom they protect."""
+        return {
+            axiom: [self.rules[i] for i in indexes]
+            for axiom, indexes in self._by_axiom.items()
+        }
+
+    def _candidates(
+        self, categories: Optional[Iterable[str]], axioms: Optional[Iterable[str]]
+    ) -> Sequence[int]:
+        if categories is None and axioms is None:
+            return range(len(self.rules))
+        selected = set()
+        for category in categories or ():
+            selected.update(self._by_category.get(category, ()))
+        for axiom in axioms or ():
+            selected.update(self._by_axiom.get(axiom, ()))
+        return sorted(selected)
+
+    def _scan(self, text: str, candidates, stop_at_first: bool) -> List[RuleMatch]:
+        # casefold() so IGNORECASE matches (e.g. U+017F for "s") pass the filter;
+        # U+0130 folds to "i" plus a combining dot, but the regex treats it as "i"
+        folded = text.replace("\u0130", "i").casefold()
+        matches = []
+        for index in candidates:
+            rule = self.rules[index]
+            stats = self._stats[rule.rule_id]
+            if rule.keywords and not any(k in folded for k in rule.keywords):
+                stats.prefiltered += 1
+                continue
+
+            started = time.perf_counter_ns()
+            found = self._compiled[index].search(text)
+            stats.total_ns += time.perf_counter_ns() - started
+            stats.evaluations += 1
+            if found is None:
+                continue
+
+            stats.hits += 1
+            matches.append(
+                RuleMatch(
+                    rule_id=rule.rule_id,
+                    category=rule.category,
+                    axiom=rule.axiom,
+                    level=rule.level,
+                    description=rule.description,
+                    pattern=rule.pattern,
+                    matched_text=found.group(0),
+                    start=found.start(),
+                )
+            )
+            if stop_at_first:
+                break
+        return matches
+
+    def evaluate(
+        self,
+        text: str,
+        categories: Optional[Iterable[str]] = None,
+        axioms: Optional[Iterable[str]] = None,
+    ) -> List[RuleMatch]:
+        """
+        Evaluate rules against text in one pass.
+
+        Args:
+            text: Command, path or content to check
+            categories: Restrict to these rule categories (default: all)
+            axioms: Restrict to rules for these axioms (combined with categories)
+
+        Returns:
+            Every matching rule (first occurrence each), in declaration order
+        """
+        return self._scan(text, self._candidates(categories, axioms), False)
+
+    def first(
+        self,
+        text: str,
+        categories: Optional[Iterable[str]] = None,
+        axioms: Optional[Iterable[str]] = None,
+    ) -> Optional[RuleMatch]:
+        """Return the earliest-declared matching rule, or None."""
+        matches = self._scan(text, self._candidates(categories, axioms), True)
+        return matches[0] if matches else None
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-rule evaluation, prefilter, hit and latency counters."""
+        return {rule_id: stats.to_dict() for rule_id, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        for rule_id in self._stats:
+            self._stats[rule_id] = RuleStats()
+
+
+_default_engine: Optional[RuleEngine] = None
+
+
+def get_rule_engine() -> RuleEngine:
+    """Get the shared engine holding all guardian rules."""
+    global _default_engine
+
+    if _default_engine is None:
+        _default_engine = RuleEngine(GUARDIAN_RULES)
+
+    return _default_engine
@@ -6,11 +6,15 @@ Logs every step to a file so we can see what the IDE's subprocess is doing.
 
 import os
 import sys
+import json
 import logging
 import warnings
 import asyncio
+import functools
 import threading
 import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 LOG_FILE = r"C:\Users\wpoga\.gemini\antigravity\rag_server_debug.log"
 
@@ -59,6 +63,15 @@ def _warmup_worker():
     log("Warmup thread starting...")
     try:
         t0 = time.time()
+        # Attach to a running warm pool instead of loading the model ourselves
+        from scripts.memory.warm_pool import attach_memory_store
+
+        remote = attach_memory_store()
+        if remote is not None:
+            _store = remote
+            log(f"  Attached to warm pool ({time.time()-t0:.2f}s)")
+            return
+
         # With lazy loading, these imports and get_memory_store() are near-instant
         from scripts.memory.memory_store import get_memory_store
 
@@ -101,6 +114,80 @@ def get_store(wait: bool = True):
     return get_memory_store()
 
 
+# ---------------------------------------------------------------------------
+# Store executor, per-tool limits and latency
+# ---------------------------------------------------------------------------
+# MemoryStore calls (embedding + Qdrant) are synchronous; they run on a bounded
+# pool so concurrent sessions never block the event loop behind each other.
+STORE_WORKERS = int(os.environ.get("RAG_STORE_WORKERS", "8"))
+
+# Max in-flight calls per tool family (writes are kept narrow)
+TOOL_CONCURRENCY = {
+    "search": 6,
+    "prepare_context": 4,
+    "add": 2,
+    "propose": 2,
+}
+
+LATENCY_WINDOW = 500
+
+_executor = ThreadPoolExecutor(
+    max_workers=STORE_WORKERS, thread_name_prefix="rag-store"
+)
+_tool_limits: dict = {}
+_tool_limits_loop = None
+_tool_latency: dict = defaultdict(lambda: deque(maxlen=LATENCY_WINDOW))
+_tool_errors: dict = defaultdict(int)
+
+
+def _tool_family(name: str) -> str:
+    if name == "prepare_context":
+        return name
+    for prefix in ("search", "add", "propose"):
+        if name.startswith(prefix + "_"):
+            return prefix
+    return name
+
+
+def _tool_limit(name: str) -> asyncio.Semaphore:
+    """Get the semaphore for a tool family, bound to the running loop."""
+    global _tool_limits, _tool_limits_loop
+    loop = asyncio.get_running_loop()
+    if loop is not _tool_limits_loop:
+        _tool_limits = {}
+        _tool_limits_loop = loop
+    family = _tool_family(name)
+    if family not in _tool_limits:
+        _tool_limits[family] = asyncio.Semaphore(TOOL_CONCURRENCY.get(family, 4))
+    return _tool_limits[family]
+
+
+async def _run_store(fn, *args, **kwargs):
+    """Run a blocking store call on the store executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
+
+def get_tool_stats() -> dict:
+    """Per-tool latency summary (ms) over the recent window."""
+    stats = {}
+    for name, samples in list(_tool_latency.items()):
+        ordered = sorted(samples)
+        if not ordered:
+            continue
+        stats[name] = {
+            "count": len(ordered),
+            "errors": _tool_errors.get(name, 0),
+            "mean_ms": round(sum(ordered) / len(ordered), 2),
+            "p50_ms": round(ordered[len(ordered) // 2], 2),
+            "p95_ms": round(
+                ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2
+            ),
+            "max_ms": round(ordered[-1], 2),
+        }
+    return stats
+
+
 # ---------------------------------------------------------------------------
 # Tool Definitions
 # ---------------------------------------------------------------------------
@@ -265,6 +352,11 @@ async def handle_list_tools():
                 "required": ["content", "reasoning"],
             },
         ),
+        types.Tool(
+            name="server_stats",
+            description="Report per-tool call counts and latency (ms) for this server.",
+            inputSchema={"type": "object", "properties": {}},
+        ),
     ]
 
 
@@ -278,41 +370,84 @@ def _search_tier(query: str, collection: str, k: int = 5) -> str:
     return "\n\n".join([f"**ID**: {r.id}\n{r.content}" for r in results])
 
 
+def _embed_query(query: str):
+    """Embed a query once so several tiers can reuse the vector."""
+    store = get_store()
+    return store, store.embedding_service.embed_single(query).tolist()
+
+
+async def _prepare_context(query: str) -> str:
+    """Embed once, then search all context tiers concurrently."""
+    tiers = ["memory_semantic", "memory_procedural", "memory_entity"]
+    store, embedding = await _run_store(_embed_query, query)
+    tier_results = await asyncio.gather(
+        *(
+            _run_store(
+                store.search,
+                query,
+                memory_type=tier,
+                k=3,
+                threshold=0.1,
+                query_embedding=embedding,
+            )
+            for tier in tiers
+        )
+    )
+
+    sections = []
+    for tier, results in zip(tiers, tier_results):
+        tier_label = tier.replace("memory_", "").upper()
+        content = "\n".join([r.content for r in results]) or "No matches."
+        sections.append(f"== {tier_label} ==\n{content}")
+    return "\n\n=========================\n\n".join(sections)
+
+
+def _add_memory(content, metadata, collection: str):
+    return get_store().add_memory(content, metadata, memory_type=collection)
+
+
+def _add_proposal(proposal):
+    return get_store().add_pending_proposal(proposal)
+
+
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict):
     log(f"call_tool({name}) called")
+    if name == "server_stats":
+        return [
+            types.TextContent(type="text", text=json.dumps(get_tool_stats(), indent=2))
+        ]
+
+    t0 = time.perf_counter()
+    try:
+        async with _tool_limit(name):
+            return await _dispatch_tool(name, arguments)
+    except Exception:
+        _tool_errors[name] += 1
+        raise
+    finally:
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        _tool_latency[name].append(elapsed_ms)
+        log(f"call_tool({name}) finished in {elapsed_ms:.1f}ms")
+
+
+async def _dispatch_tool(name: str, arguments: dict):
     query = arguments.get("query", "*")
 
     if name == "search_memory_semantic":
-        return [
-            types.TextContent(type="text", text=_search_tier(query, "memory_semantic"))
-        ]
+        text = await _run_store(_search_tier, query, "memory_semantic")
+        return [types.TextContent(type="text", text=text)]
     elif name == "search_memory_procedural":
-        return [
-            types.TextContent(
-                type="text", text=_search_tier(query, "memory_procedural")
-            )
-        ]
+        text = await _run_store(_search_tier, query, "memory_procedural")
+        return [types.TextContent(type="text", text=text)]
     elif name == "search_memory_entity":
-        return [
-            types.TextContent(type="text", text=_search_tier(query, "memory_entity"))
-        ]
+        text = await _run_store(_search_tier, query, "memory_entity")
+        return [types.TextContent(type="text", text=text)]
     elif name == "search_memory_summary":
-        return [
-            types.TextContent(type="text", text=_search_tier(query, "memory_summary"))
-        ]
+        text = await _run_store(_search_tier, query, "memory_summary")
+        return [types.TextContent(type="text", text=text)]
     elif name == "prepare_context":
-        sections = []
-        for tier in ["memory_semantic", "memory_procedural", "memory_entity"]:
-            results = get_store().search(query, memory_type=tier, k=3, threshold=0.1)
-            tier_label = tier.replace("memory_", "").upper()
-            content = "\n".join([r.content for r in results]) or "No matches."
-            sections.append(f"== {tier_label} ==\n{content}")
-        return [
-            types.TextContent(
-                type="text", text="\n\n=========================\n\n".join(sections)
-            )
-        ]
+        return [types.TextContent(type="text", text=await _prepare_context(query))]
     elif name.startswith("add_memory_"):
         collection = name.replace("add_", "")
         if collection == "memory_episodic":
@@ -320,7 +455,7 @@ async def handle_call_tool(name: str, arguments: dict):
 
         content = arguments.get("content")
         metadata = arguments.get("metadata", {})
-        memory_id = get_store().add_memory(content, metadata, memory_type=collection)
+        memory_id = await _run_store(_add_memory, content, metadata, collection)
         return [
             types.TextContent(
                 type="text",
@@ -343,7 +478,7 @@ async def handle_call_tool(name: str, arguments: dict):
             proposal = MemoryProposal(
                 id=str(uuid.uuid4()), content=full_content, source="agent"
             )
-            proposal_id = get_store().add_pending_proposal(proposal)
+            proposal_id = await _run_store(_add_proposal, proposal)
             return [
                 types.TextContent(
                     type="text",
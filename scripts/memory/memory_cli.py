@@ -28,6 +28,7 @@ from scripts.memory.experience_collector import ExperienceCollector
 from scripts.memory.reflection_engine import ReflectionEngine
 from scripts.memory.procedural_indexer import ProceduralIndexer
 from scripts.memory.entity_store import get_entity_store
+from scripts.memory.warm_pool import attach_memory_store
 
 logging.basicConfig(
     level=logging.WARNING, format="%(asctime)s [%(levelname)s] %(message)s"
@@ -47,7 +48,8 @@ def cmd_query_sql(args):
 
 
 def cmd_query_vector(args):
-    store = get_memory_store()
+    # Use the warm pool when it is running to skip model load
+    store = attach_memory_store() or get_memory_store()
     results = store.search(
         args.query, memory_type=args.collection, k=args.limit, threshold=0.1
     )
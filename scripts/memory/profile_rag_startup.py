@@ -1,7 +1,39 @@
+"""
+RAG startup profiling.
+
+By default profiles heavy imports and service initialization. With --commands
+it benchmarks cold versus warm CLI latency: each command runs N times with the
+warm pool disabled, then N times attached to a warm pool (started for the run
+unless one is already up).
+
+Usage:
+    python scripts/memory/profile_rag_startup.py
+    python scripts/memory/profile_rag_startup.py --commands --runs 5
+"""
+
+import argparse
+import statistics
+import subprocess
 import time
 import sys
 import os
 
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+BENCH_COMMANDS = {
+    "rag search": [
+        os.path.join("scripts", "ai", "rag", "rag_cli.py"),
+        "search",
+        "agent memory",
+    ],
+    "memory vector": [
+        os.path.join("scripts", "memory", "memory_cli.py"),
+        "vector",
+        "memory_semantic",
+        "agent memory",
+    ],
+}
+
 
 def profile_imports():
     print("--- Import Profiling ---")
@@ -59,6 +91,102 @@ def profile_services():
     print(f"MemoryStore.client access: {time.perf_counter() - start:.4f}s")
 
 
+def _time_command(argv, env) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable] + argv,
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    return time.perf_counter() - start
+
+
+def _summarize(samples) -> str:
+    return (
+        f"median {statistics.median(samples):.3f}s  "
+        f"min {min(samples):.3f}s  max {max(samples):.3f}s"
+    )
+
+
+def _ensure_warm_pool(timeout: float = 120.0):
+    """Start a warm pool if none is running; returns the process we started."""
+    if PROJECT_ROOT not in sys.path:
+        sys.path.append(PROJECT_ROOT)
+    from scripts.memory.warm_pool import WARM_POOL_SUPPORTED, WarmPoolClient
+
+    if not WARM_POOL_SUPPORTED:
+        return None, False
+
+    client = WarmPoolClient()
+    if client.ping() is not None:
+        return None, True
+
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join("scripts", "memory", "warm_pool.py"), "serve"],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = client.ping()
+        if status and status["memory_warm"] and status["rag_warm"]:
+            return proc, True
+        time.sleep(0.5)
+    return proc, client.ping() is not None
+
+
+def profile_commands(runs: int = 3):
+    print("\n--- Cold vs Warm Command Latency ---")
+
+    cold_env = dict(os.environ, ANTIGRAVITY_WARM_POOL="0")
+    warm_env = dict(os.environ, ANTIGRAVITY_WARM_POOL="1")
+
+    cold = {
+        name: [_time_command(argv, cold_env) for _ in range(runs)]
+        for name, argv in BENCH_COMMANDS.items()
+    }
+
+    proc, ready = _ensure_warm_pool()
+    if not ready:
+        print("Warm pool unavailable; reporting cold timings only.")
+    try:
+        warm = (
+            {
+                name: [_time_command(argv, warm_env) for _ in range(runs)]
+                for name, argv in BENCH_COMMANDS.items()
+            }
+            if ready
+            else {}
+        )
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    for name in BENCH_COMMANDS:
+        print(f"{name}:")
+        print(f"  cold: {_summarize(cold[name])}")
+        if name in warm:
+            speedup = statistics.median(cold[name]) / statistics.median(warm[name])
+            print(f"  warm: {_summarize(warm[name])}  ({speedup:.1f}x)")
+
+
 if __name__ == "__main__":
-    profile_imports()
-    profile_services()
+    parser = argparse.ArgumentParser(description="Profile RAG startup latency")
+    parser.add_argument(
+        "--commands",
+        action="store_true",
+        help="Benchmark cold vs warm-pool CLI command latency",
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Runs per command")
+    args = parser.parse_args()
+
+    if args.commands:
+        profile_commands(args.runs)
+    else:
+        profile_imports()
+        profile_services()
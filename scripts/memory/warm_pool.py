@@ -0,0 +1,649 @@
+"""
+Warm Pool Daemon
+Keeps embedding models, Qdrant clients and the hydrated RAG parent store warm
+in one long-lived local process, reachable over a Unix socket.
+
+CLIs (rag_cli.py, memory_cli.py) and the RAG MCP server attach to a running
+pool through attach_memory_store() / attach_rag() and fall back to their usual
+in-process initialization when no pool is present, or when an attached pool
+stops responding.
+
+The pool is ingestion-aware: before serving a RAG query it compares the parent
+store directory's mtime with the one it hydrated from and re-hydrates the
+in-memory docstore if another process has ingested (or deleted) documents.
+
+Usage:
+    python scripts/memory/warm_pool.py serve      # run in the foreground
+    python scripts/memory/warm_pool.py status
+    python scripts/memory/warm_pool.py stop
+
+The socket lives in a per-user 0700 directory ($XDG_RUNTIME_DIR, or a private
+directory in the temp dir), and clients only attach to a socket owned by, and
+served by a process running as, the current user.
+
+Protocol: one JSON request per line ({"op": ..., "args": {...}}), answered by
+one JSON line ({"ok": true, "result": ...} or {"ok": false, "error": ...}).
+"""
+
+import argparse
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Ensure the root directory is in PYTHONPATH for script execution
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+logger = logging.getLogger("warm_pool")
+
+WARM_POOL_SUPPORTED = hasattr(socket, "AF_UNIX")
+
+# Set ANTIGRAVITY_WARM_POOL=0 to never attach (e.g. for cold benchmarks)
+WARM_POOL_ENV = "ANTIGRAVITY_WARM_POOL"
+SOCKET_ENV = "ANTIGRAVITY_WARM_POOL_SOCKET"
+
+CONNECT_TIMEOUT = 0.25
+REQUEST_TIMEOUT = 120.0
+POOL_SIZE = 4  # client connections kept open per WarmPoolClient
+
+
+def default_socket_path() -> str:
+    """Socket path for this user (overridable via ANTIGRAVITY_WARM_POOL_SOCKET).
+
+    The socket sits in a per-user directory: $XDG_RUNTIME_DIR/antigravity when
+    the session provides one, else antigravity-warm-pool-<uid> in the temp dir.
+    """
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return override
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        directory = os.path.join(runtime_dir, "antigravity")
+    else:
+        uid = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "")
+        directory = os.path.join(tempfile.gettempdir(), f"antigravity-warm-pool-{uid}")
+    return os.path.join(directory, "warm-pool.sock")
+
+
+def _check_private(path: str, directory: bool) -> None:
+    """Raise PermissionError unless path is owned by us and, for a directory,
+    closed to group and others."""
+    st = os.lstat(path)
+    kind_ok = stat.S_ISDIR(st.st_mode) if directory else stat.S_ISSOCK(st.st_mode)
+    if not kind_ok or st.st_uid != os.getuid():
+        raise PermissionError(f"{path} is not owned by the current user")
+    if directory and st.st_mode & 0o077:
+        raise PermissionError(f"{path} is accessible to other users")
+
+
+def ensure_socket_dir(socket_path: str) -> None:
+    """Create the socket's directory with mode 0700 and verify ownership."""
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    _check_private(directory, directory=True)
+
+
+def _peer_uid(sock: socket.socket) -> Optional[int]:
+    """User id of the process serving a connected Unix socket, if known."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    return struct.unpack("3i", creds)[1]
+
+
+def _dir_mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+class WarmPool:
+    """
+    The warm resources held by the daemon.
+
+    Args:
+        memory_store_factory: Builds the MemoryStore (default: get_memory_store).
+        rag_factory: Builds the OptimizedRAG (default: OptimizedRAG(warmup=True)).
+        parent_store_path: Directory whose mtime signals RAG ingestion.
+    """
+
+    def __init__(
+        self,
+        memory_store_factory: Optional[Callable[[], Any]] = None,
+        rag_factory: Optional[Callable[[], Any]] = None,
+        parent_store_path: Optional[str] = None,
+    ):
+        self._memory_store_factory = memory_store_factory or self._default_store
+        self._rag_factory = rag_factory or self._default_rag
+        self._parent_store_path = parent_store_path
+        self._memory_store = None
+        self._rag = None
+        self._rag_mtime_ns: Optional[int] = None
+        self._memory_lock = threading.Lock()
+        self._rag_lock = threading.Lock()
+        self.started_at = time.time()
+        self.requests = 0
+        self.rehydrations = 0
+
+    @staticmethod
+    def _default_store():
+        from scripts.memory.memory_store import get_memory_store
+
+        store = get_memory_store()
+        # Force the embedding model to load now rather than on first request
+        store.embedding_service.embed_single("warmup")
+        return store
+
+    @staticmethod
+    def _default_rag():
+        from scripts.ai.rag.rag_optimized import OptimizedRAG
+
+        return OptimizedRAG(warmup=True)
+
+    def memory_store(self):
+        with self._memory_lock:
+            if self._memory_store is None:
+                self._memory_store = self._memory_store_factory()
+            return self._memory_store
+
+    def rag(self):
+        with self._rag_lock:
+            if self._rag is None:
+                self._rag = self._rag_factory()
+                if self._parent_store_path is None:
+                    self._parent_store_path = getattr(
+                        self._rag, "parent_store_path", None
+                    )
+                self._rag_mtime_ns = _dir_mtime_ns(self._parent_store_path or "")
+            else:
+                self._refresh_rag()
+            return self._rag
+
+    def _refresh_rag(self) -> None:
+        """Re-hydrate the parent docstore if the parent store changed on disk."""
+        mtime_ns = _dir_mtime_ns(self._parent_store_path or "")
+        if mtime_ns == self._rag_mtime_ns:
+            return
+
+        logger.info("Parent store changed on disk; re-hydrating docstore")
+        # Embeddings and the Qdrant client stay warm; only the docstore reloads
+        self._rag._store = None
+        self._rag._retriever = None
+        _ = self._rag.retriever
+        self._rag_mtime_ns = mtime_ns
+        self.rehydrations += 1
+
+    def warm(self) -> None:
+        """Load everything up front (errors are logged, not raised)."""
+        for name, loader in (("memory", self.memory_store), ("rag", self.rag)):
+            t0 = time.perf_counter()
+            try:
+                loader()
+                logger.info(f"Warmed {name} in {time.perf_counter() - t0:.2f}s")
+            except Exception as e:
+                logger.warning(f"Warmup of {name} failed: {e}")
+
+    # -- operations ---------------------------------------------------------
+
+    def handle(self, op: str, args: Dict[str, Any]) -> Any:
+        self.requests += 1
+        handler = getattr(self, "op_" + op.replace(".", "_"), None)
+        if handler is None:
+            raise ValueError(f"Unknown op: {op}")
+        return handler(**args)
+
+    def op_ping(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "requests": self.requests,
+            "memory_warm": self._memory_store is not None,
+            "rag_warm": self._rag is not None,
+            "rehydrations": self.rehydrations,
+        }
+
+    def op_memory_search(
+        self,
+        query: str,
+        memory_type: str,
+        k: int = 5,
+        threshold: float = 0.0,
+        where: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[dict]:
+        results = self.memory_store().search(
+            query,
+            memory_type=memory_type,
+            k=k,
+            threshold=threshold,
+            where=where,
+            query_embedding=query_embedding,
+        )
+        return [m.to_dict() for m in results]
+
+    def op_memory_add(
+        self, content: str, metadata: Optional[dict], memory_type: str
+    ) -> str:
+        return self.memory_store().add_memory(
+            content, metadata or {}, memory_type=memory_type
+        )
+
+    def op_memory_add_proposal(self, proposal: dict) -> str:
+        from scripts.memory.memory_store import MemoryProposal
+
+        return self.memory_store().add_pending_proposal(
+            MemoryProposal.from_dict(proposal)
+        )
+
+    def op_memory_embed(self, text: str) -> List[float]:
+        return self.memory_store().embedding_service.embed_single(text).tolist()
+
+    def op_rag_query(self, question: str, k: int = 5) -> List[dict]:
+        docs = self.rag().query(question, k=k)
+        return [{"page_content": d.page_content, "metadata": d.metadata} for d in docs]
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        pool: WarmPool = self.server.pool
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if request.get("op") == "shutdown":
+                    response = {"ok": True, "result": None}
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                else:
+                    result = pool.handle(request["op"], request.get("args") or {})
+                    response = {"ok": True, "result": result}
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write((json.dumps(response, default=str) + "\n").encode())
+            self.wfile.flush()
+
+
+if WARM_POOL_SUPPORTED:
+
+    class WarmPoolServer(socketserver.ThreadingUnixStreamServer):
+        """Threaded Unix-socket server around a WarmPool."""
+
+        daemon_threads = True
+
+        def __init__(self, socket_path: str, pool: WarmPool):
+            self.pool = pool
+            self.socket_path = socket_path
+            ensure_socket_dir(socket_path)
+            if os.path.exists(socket_path):
+                if WarmPoolClient(socket_path).ping() is not None:
+                    raise RuntimeError(f"Warm pool already running at {socket_path}")
+                os.unlink(socket_path)
+            super().__init__(socket_path, _Handler)
+            os.chmod(socket_path, 0o600)
+
+        def server_close(self):
+            super().server_close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+class WarmPoolError(RuntimeError):
+    """Raised when the warm pool reports an error for a request."""
+
+
+class _Connection:
+    """One connected, owner-verified client socket."""
+
+    def __init__(self, socket_path: str):
+        # Never talk to a socket another local user could have planted
+        _check_private(socket_path, directory=False)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(socket_path)
+            peer_uid = _peer_uid(sock)
+            if peer_uid is not None and peer_uid != os.getuid():
+                raise PermissionError(
+                    f"Warm pool at {socket_path} runs as uid {peer_uid}"
+                )
+        except BaseException:
+            sock.close()
+            raise
+        sock.settimeout(REQUEST_TIMEOUT)
+        self._sock = sock
+        self._file = sock.makefile("rwb")
+
+    def request(self, payload: bytes) -> bytes:
+        self._file.write(payload)
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Warm pool closed the connection")
+        return line
+
+    def close(self) -> None:
+        for handle in (self._file, self._sock):
+            try:
+                handle.close()
+            except OSError:
+                pass
+
+
+class WarmPoolClient:
+    """Line-oriented JSON client for a WarmPoolServer.
+
+    Keeps up to max_connections connections open so that concurrent callers
+    (e.g. the MCP server's executor threads) are served in parallel by the
+    pool's handler threads instead of queueing behind one socket.
+    """
+
+    def __init__(
+        self, socket_path: Optional[str] = None, max_connections: int = POOL_SIZE
+    ):
+        self.socket_path = socket_path or default_socket_path()
+        self._idle: List[_Connection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def _checkout(self) -> _Connection:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return _Connection(self.socket_path)
+
+    def _checkin(self, conn: _Connection) -> None:
+        with self._lock:
+            self._idle.append(conn)
+
+    def call(self, op: str, **args) -> Any:
+        """Send one request and return its result.
+
+        A connection that fails is closed and the request is retried once on a
+        fresh one (e.g. after the pool restarted). Timeouts are not retried:
+        the pool may still be working on the request.
+
+        Raises:
+            WarmPoolError: If the pool reports an error for the request
+            OSError: If the pool is unreachable
+        """
+        payload = (json.dumps({"op": op, "args": args}) + "\n").encode()
+        with self._slots:
+            for attempt in range(2):
+                conn = self._checkout()
+                try:
+                    line = conn.request(payload)
+                except OSError as e:
+                    # A half-read or timed-out connection can't be reused
+                    conn.close()
+                    if attempt or isinstance(e, TimeoutError):
+                        raise
+                    continue
+                except BaseException:
+                    conn.close()
+                    raise
+                self._checkin(conn)
+                break
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise WarmPoolError(response.get("error", "unknown error"))
+        return response.get("result")
+
+    def ping(self) -> Optional[Dict[str, Any]]:
+        """Pool status, or None if no pool is reachable."""
+        if not WARM_POOL_SUPPORTED or not os.path.exists(self.socket_path):
+            return None
+        try:
+            return self.call("ping")
+        except (OSError, ValueError, WarmPoolError):
+            return None
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+# Errors raised before a request reaches the pool (no socket, nobody listening)
+_NOT_SENT_ERRORS = (FileNotFoundError, ConnectionRefusedError)
+
+
+class _Failover:
+    """Serves calls from the warm pool until it becomes unreachable, then from
+    an in-process instance built by the fallback factory.
+
+    Timeouts never fail over: the pool may still complete the request. Writes
+    only fail over when the request provably never reached the pool.
+    """
+
+    def __init__(self, client: WarmPoolClient, fallback: Callable[[], Any]):
+        self._client = client
+        self._fallback = fallback
+        self._local = None
+        self._local_lock = threading.Lock()
+
+    def _dispatch(
+        self,
+        remote: Callable[[], Any],
+        local: Callable[[Any], Any],
+        idempotent: bool = True,
+    ):
+        if self._local is None:
+            try:
+                return remote()
+            except TimeoutError:
+                raise
+            except (OSError, ValueError) as e:
+                if not idempotent and not isinstance(e, _NOT_SENT_ERRORS):
+                    raise
+                with self._local_lock:
+                    if self._local is None:
+                        logger.warning(
+                            f"Warm pool unreachable ({e}); continuing in-process"
+                        )
+                        self._client.close()
+                        self._local = self._fallback()
+        return local(self._local)
+
+
+class _RemoteEmbeddingService:
+    def __init__(self, store: "RemoteMemoryStore"):
+        self._store = store
+
+    def embed_single(self, text: str):
+        import numpy as np
+
+        return self._store._dispatch(
+            lambda: np.asarray(self._store._client.call("memory.embed", text=text)),
+            lambda local: local.embedding_service.embed_single(text),
+        )
+
+
+def _local_memory_store():
+    from scripts.memory.memory_store import get_memory_store
+
+    return get_memory_store()
+
+
+def _local_rag():
+    from scripts.ai.rag.rag_optimized import get_rag
+
+    return get_rag(warmup=False)
+
+
+class RemoteMemoryStore(_Failover):
+    """The subset of MemoryStore used by the CLIs and MCP servers, served warm."""
+
+    def __init__(
+        self,
+        client: WarmPoolClient,
+        fallback: Callable[[], Any] = _local_memory_store,
+    ):
+        super().__init__(client, fallback)
+        self.embedding_service = _RemoteEmbeddingService(self)
+
+    def search(
+        self,
+        query: str,
+        memory_type: str = "memory_semantic",
+        k: int = 5,
+        threshold: float = 0.0,
+        where: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None,
+    ):
+        from scripts.memory.memory_store import Memory
+
+        kwargs = dict(
+            query=query,
+            memory_type=memory_type,
+            k=k,
+            threshold=threshold,
+            where=where,
+            query_embedding=query_embedding,
+        )
+        return self._dispatch(
+            lambda: [
+                Memory.from_dict(r)
+                for r in self._client.call("memory.search", **kwargs)
+            ],
+            lambda local: local.search(**kwargs),
+        )
+
+    def add_memory(self, content: str, metadata: dict, memory_type: str) -> str:
+        kwargs = dict(content=content, metadata=metadata, memory_type=memory_type)
+        return self._dispatch(
+            lambda: self._client.call("memory.add", **kwargs),
+            lambda local: local.add_memory(**kwargs),
+            idempotent=False,
+        )
+
+    def add_pending_proposal(self, proposal) -> str:
+        return self._dispatch(
+            lambda: self._client.call(
+                "memory.add_proposal", proposal=proposal.to_dict()
+            ),
+            lambda local: local.add_pending_proposal(proposal),
+            idempotent=False,
+        )
+
+
+class RemoteRAG(_Failover):
+    """Query-side view of OptimizedRAG served by the warm pool."""
+
+    def __init__(
+        self, client: WarmPoolClient, fallback: Callable[[], Any] = _local_rag
+    ):
+        super().__init__(client, fallback)
+
+    def query(self, question: str, k: int = 5):
+        from langchain_core.documents import Document
+
+        return self._dispatch(
+            lambda: [
+                Document(**d)
+                for d in self._client.call("rag.query", question=question, k=k)
+            ],
+            lambda local: local.query(question, k=k),
+        )
+
+    def search(self, question: str, k: int = 5):
+        """Alias for semantic search."""
+        return self.query(question, k)
+
+
+def get_warm_client(socket_path: Optional[str] = None) -> Optional[WarmPoolClient]:
+    """Return a connected client if a warm pool is running, else None."""
+    if os.environ.get(WARM_POOL_ENV, "1") == "0":
+        return None
+    client = WarmPoolClient(socket_path)
+    return client if client.ping() is not None else None
+
+
+def attach_memory_store(
+    socket_path: Optional[str] = None,
+) -> Optional[RemoteMemoryStore]:
+    client = get_warm_client(socket_path)
+    return RemoteMemoryStore(client) if client else None
+
+
+def attach_rag(socket_path: Optional[str] = None) -> Optional[RemoteRAG]:
+    client = get_warm_client(socket_path)
+    return RemoteRAG(client) if client else None
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Antigravity warm pool daemon")
+    parser.add_argument(
+        "command", choices=["serve", "status", "stop"], help="Action to perform"
+    )
+    parser.add_argument("--socket", default=None, help="Unix socket path")
+    parser.add_argument(
+        "--no-warm", action="store_true", help="Load resources on first use"
+    )
+    args = parser.parse_args()
+
+    if not WARM_POOL_SUPPORTED:
+        print("Warm pool requires Unix domain sockets (not available here).")
+        sys.exit(1)
+
+    socket_path = args.socket or default_socket_path()
+    client = WarmPoolClient(socket_path)
+
+    if args.command == "status":
+        status = client.ping()
+        print(json.dumps(status, indent=2) if status else "Warm pool not running.")
+        sys.exit(0 if status else 1)
+    elif args.command == "stop":
+        if client.ping() is None:
+            print("Warm pool not running.")
+            return
+        client.call("shutdown")
+        print("Warm pool stopping.")
+        return
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    pool = WarmPool()
+    server = WarmPoolServer(socket_path, pool)
+    if not args.no_warm:
+        threading.Thread(target=pool.warm, daemon=True).start()
+    logger.info(f"Warm pool listening on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
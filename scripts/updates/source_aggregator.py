@@ -7,6 +7,7 @@ the update engine.
 
 Features:
     - Parallel fetching from multiple adapters
+    - One pooled HTTP session per run with a persistent conditional-request cache
     - Intelligent deduplication
     - Priority-based sorting
     - Subscription filtering
@@ -22,13 +23,15 @@ Version: 1.0.0
 """
 
 import asyncio
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from pathlib import Path
 import fnmatch
 
 from .adapters import create_adapter, get_available_adapters
+from .adapters.http_client import DEFAULT_CACHE_DIR, PER_HOST_LIMIT, HttpClient
 from .adapters.base_adapter import (
     BaseAdapter,
     AdapterConfig,
@@ -68,6 +71,7 @@ class AggregationResult:
         total_fetched: Total updates before deduplication
         fetch_time_seconds: Time taken to fetch all updates
         errors: Any errors encountered
+        http_stats: Request counters from the shared HTTP client
     """
 
     updates: List[KnowledgeUpdate]
@@ -75,6 +79,7 @@ class AggregationResult:
     total_fetched: int = 0
     fetch_time_seconds: float = 0.0
     errors: List[str] = field(default_factory=list)
+    http_stats: Dict[str, int] = field(default_factory=dict)
 
     @property
     def by_priority(self) -> Dict[UpdatePriority, List[KnowledgeUpdate]]:
@@ -188,14 +193,27 @@ class SourceAggregator:
         self,
         config_manager: Optional[ConfigManager] = None,
         factory_root: Optional[Path] = None,
+        http_cache_dir: Optional[Path] = None,
+        per_host_limit: int = PER_HOST_LIMIT,
     ):
         """Initialize the source aggregator.
 
         Args:
             config_manager: Configuration manager instance
             factory_root: Factory root directory
+            http_cache_dir: HTTP response cache directory (defaults to
+                .agent/cache/http under the factory root)
+            per_host_limit: Maximum concurrent connections per upstream host
         """
         self._config = config_manager or ConfigManager.get_instance(factory_root)
+        if http_cache_dir is None:
+            http_cache_dir = (
+                Path(factory_root) / ".agent" / "cache" / "http"
+                if factory_root
+                else DEFAULT_CACHE_DIR
+            )
+        self._http_cache_dir = Path(http_cache_dir)
+        self._per_host_limit = per_host_limit
         self._adapters: Dict[str, BaseAdapter] = {}
         self._source_health: Dict[str, SourceHealth] = {}
         self._initialize_adapters()
@@ -283,16 +301,17 @@ class SourceAggregator:
         all_updates: List[KnowledgeUpdate] = []
         errors: List[str] = []
 
-        # Fetch from all adapters in parallel
+        # Fetch from all adapters in parallel over one pooled session
         tasks = []
         adapter_names = []
 
-        for name, adapter in self._adapters.items():
-            task = self._fetch_from_adapter(adapter, target_files, since)
-            tasks.append(task)
-            adapter_names.append(name)
+        async with self._shared_http_client() as http:
+            for name, adapter in self._adapters.items():
+                task = self._fetch_from_adapter(adapter, target_files, since)
+                tasks.append(task)
+                adapter_names.append(name)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Process results
         for name, result in zip(adapter_names, results):
@@ -324,8 +343,28 @@ class SourceAggregator:
             total_fetched=total_fetched,
             fetch_time_seconds=fetch_time,
             errors=errors,
+            http_stats=dict(http.stats),
         )
 
+    @asynccontextmanager
+    async def _shared_http_client(self) -> AsyncIterator[HttpClient]:
+        """Attach one pooled, cached HttpClient to every adapter for a run.
+
+        Yields:
+            The shared client; it is detached and closed afterwards
+        """
+        http = HttpClient(
+            cache_dir=self._http_cache_dir, limit_per_host=self._per_host_limit
+        )
+        for adapter in self._adapters.values():
+            adapter.use_http_client(http)
+        try:
+            yield http
+        finally:
+            for adapter in self._adapters.values():
+                adapter.use_http_client(None)
+            await http.close()
+
     async def _fetch_from_adapter(
         self,
         adapter: BaseAdapter,
@@ -393,18 +432,19 @@ class SourceAggregator:
         Returns:
             Dictionary of source health statuses
         """
-        for name, adapter in self._adapters.items():
-            try:
-                available = await adapter.validate_connection()
-                self._source_health[name].available = available
-                self._source_health[name].last_check = datetime.now(timezone.utc)
-                if not available:
-                    self._source_health[
-                        name
-                    ].last_error = "Connection validation failed"
-            except Exception as e:
-                self._source_health[name].available = False
-                self._source_health[name].last_error = str(e)
+        async with self._shared_http_client():
+            for name, adapter in self._adapters.items():
+                try:
+                    available = await adapter.validate_connection()
+                    self._source_health[name].available = available
+                    self._source_health[name].last_check = datetime.now(timezone.utc)
+                    if not available:
+                        self._source_health[
+                            name
+                        ].last_error = "Connection validation failed"
+                except Exception as e:
+                    self._source_health[name].available = False
+                    self._source_health[name].last_error = str(e)
 
         return self._source_health.copy()
 
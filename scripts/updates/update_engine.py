@@ -12,6 +12,7 @@ Features:
     - Conflict detection and resolution
     - Rollback support
     - Update history tracking
+    - Batches grouped per target file, written atomically and concurrently
 
 Design Patterns:
     - Strategy: Different merge strategies
@@ -23,7 +24,11 @@ Version: 1.0.0
 """
 
 import json
+import os
 import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -31,6 +36,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import copy
 
+# Upper bound on files processed concurrently by apply_batch
+BATCH_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
 
 class MergeStrategy(Enum):
     """Strategies for merging knowledge updates.
@@ -162,6 +170,7 @@ class UpdateEngine:
         )
         self.max_backups = max_backups
         self._history: List[BatchUpdateResult] = []
+        self._backup_lock = threading.Lock()
 
         # Ensure directories exist
         self.knowledge_dir.mkdir(parents=True, exist_ok=True)
@@ -216,8 +225,7 @@ class UpdateEngine:
                 return result
 
             # Write updated content
-            with open(target_path, "w", encoding="utf-8") as f:
-                json.dump(merged_content, f, indent=2, ensure_ascii=False)
+            self._write_json(target_path, merged_content)
 
             result.success = True
 
@@ -233,21 +241,44 @@ class UpdateEngine:
         self,
         updates: List["KnowledgeUpdate"],
         strategy: MergeStrategy = MergeStrategy.BALANCED,
+        max_workers: Optional[int] = None,
     ) -> BatchUpdateResult:
         """Apply multiple updates as a batch.
 
+        Updates are grouped by target file. Each file is loaded and backed
+        up once, has its updates merged in order and is written once,
+        atomically; different files are processed concurrently. A file whose
+        write fails is restored from its backup and all of its updates are
+        reported as failed, while other files keep their changes.
+
         Args:
             updates: List of updates to apply
             strategy: Merge strategy to use
+            max_workers: Maximum files processed at once (default BATCH_WORKERS)
 
         Returns:
-            BatchUpdateResult with all operation details
+            BatchUpdateResult with all operation details, in input order
         """
-        results: List[UpdateResult] = []
+        groups: Dict[str, List[int]] = {}
+        for index, update in enumerate(updates):
+            groups.setdefault(update.target_file, []).append(index)
 
-        for update in updates:
-            result = self.apply_update(update, strategy)
-            results.append(result)
+        results: List[Optional[UpdateResult]] = [None] * len(updates)
+
+        def run(indices: List[int]) -> None:
+            group_results = self._apply_file_updates(
+                [updates[i] for i in indices], strategy
+            )
+            for i, result in zip(indices, group_results):
+                results[i] = result
+
+        workers = min(max_workers or BATCH_WORKERS, len(groups))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(run, groups.values()))
+        else:
+            for indices in groups.values():
+                run(indices)
 
         batch_result = BatchUpdateResult(
             success=all(r.success for r in results),
@@ -257,6 +288,92 @@ class UpdateEngine:
         self._history.append(batch_result)
         return batch_result
 
+    def _apply_file_updates(
+        self,
+        updates: List["KnowledgeUpdate"],
+        strategy: MergeStrategy,
+    ) -> List[UpdateResult]:
+        """Apply updates that share a target file with a single write.
+
+        Each update is merged and validated against the content produced by
+        the previous one, exactly as if they were applied one at a time; an
+        update that fails validation is skipped without affecting the rest.
+
+        Args:
+            updates: Updates for one target file, in application order
+            strategy: Merge strategy to use
+
+        Returns:
+            One UpdateResult per update
+        """
+        target_file = updates[0].target_file
+        target_path = self.knowledge_dir / target_file
+        results = [
+            UpdateResult(
+                success=False,
+                target_file=target_file,
+                new_version=update.new_version,
+            )
+            for update in updates
+        ]
+        backup_path: Optional[Path] = None
+
+        try:
+            content: Dict[str, Any] = {}
+            if target_path.exists():
+                with open(target_path, "r", encoding="utf-8") as f:
+                    content = json.load(f)
+                with self._backup_lock:
+                    backup_path = self._create_backup(target_path)
+
+            for update, result in zip(updates, results):
+                result.backup_path = backup_path
+                result.old_version = content.get("version")
+                merged_content, result.operations = self._merge_content(
+                    content, update, strategy
+                )
+                validation_errors = self._validate_content(merged_content)
+                if validation_errors:
+                    result.errors = validation_errors
+                    continue
+                content = merged_content
+                result.success = True
+
+            if any(result.success for result in results):
+                self._write_json(target_path, content)
+
+        except Exception as e:
+            for result in results:
+                result.success = False
+                result.errors.append(str(e))
+            if backup_path:
+                self._restore_backup(backup_path, target_path)
+
+        return results
+
+    def _write_json(self, target_path: Path, content: Dict[str, Any]) -> None:
+        """Write a knowledge file atomically.
+
+        The content is serialised and written to a temporary file in the
+        same directory, which then replaces the target, so a crash never
+        leaves a half-written file behind.
+
+        Args:
+            target_path: File to write
+            content: JSON content
+        """
+        data = json.dumps(content, indent=2, ensure_ascii=False)
+        tmp_path = target_path.with_name(f".{target_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "x", encoding="utf-8") as f:
+                f.write(data)
+            if target_path.exists():
+                shutil.copymode(target_path, tmp_path)
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     def _create_backup(self, file_path: Path) -> Path:
         """Create a backup of a knowledge file.
 
@@ -416,6 +533,9 @@ class UpdateEngine:
     ) -> Dict[str, Any]:
         """Deep merge two dictionaries.
 
+        ``base`` is updated in place; _merge_content passes it a private
+        copy, so nested levels are not copied again on every recursion.
+
         Args:
             base: Base dictionary
             updates: Updates to merge
@@ -426,7 +546,7 @@ class UpdateEngine:
         Returns:
             Merged dictionary
         """
-        result = copy.deepcopy(base)
+        result = base
 
         for key, value in updates.items():
             current_path = f"{path}.{key}" if path else key
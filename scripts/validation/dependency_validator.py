@@ -2,11 +2,15 @@
 """
 Dependency Graph Validator for Antigravity Agent Factory.
 Validates dependencies between Factory artifacts using:
-- graphlib.TopologicalSorter (stdlib) for cycle detection and ordering
+- Tarjan's strongly connected components for cycle detection (all cycles
+  are reported in one pass)
+- graphlib.TopologicalSorter (stdlib) for ordering
 - packaging (PyPA standard) for version constraint validation
 
 This module scans all Factory artifacts and builds a unified dependency graph,
-enabling validation, impact analysis, and dependency ordering.
+enabling validation, impact analysis, and dependency ordering. What each file
+contributes to the graph can be persisted (see DEFAULT_CACHE_PATH) so later
+runs only re-parse files whose mtime and content hash changed.
 
 Node Types:
 - knowledge:<filename> - Knowledge JSON files
@@ -37,14 +41,16 @@ Version: 1.0.0
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import re
 import sys
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from graphlib import TopologicalSorter, CycleError
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import yaml
 
@@ -58,6 +64,15 @@ except ImportError:
     HAS_PACKAGING = False
 
 
+# Per-file scan results, relative to the factory root
+DEFAULT_CACHE_PATH = Path(".agent") / "cache" / "dependency-scan.json"
+
+SCAN_CACHE_VERSION = 1
+
+# Edge types that must not form cycles
+BLOCKING_EDGE_TYPES = ("requires", "extends")
+
+
 class EdgeType(Enum):
     """Types of dependency edges between artifacts."""
 
@@ -146,18 +161,31 @@ class DependencyValidator:
                 print(f"Cycle: {' -> '.join(cycle)}")
     """
 
-    def __init__(self, factory_root: Path):
+    def __init__(self, factory_root: Path, cache_path: Optional[Path] = None):
         """
         Initialize the validator.
 
         Args:
             factory_root: Root directory of the Factory
+            cache_path: JSON file persisting per-file scan results between
+                runs (relative paths are resolved against factory_root);
+                nothing is persisted when None
         """
         self.factory_root = factory_root
         self.nodes: dict[str, DependencyNode] = {}
         self.edges: list[DependencyEdge] = []
         self._adjacency: dict[str, set[str]] = {}  # from -> set(to)
         self._reverse_adjacency: dict[str, set[str]] = {}  # to -> set(from)
+        self._adjacency_edge_count = 0
+        self._impact_cache: dict[str, frozenset[str]] = {}
+
+        if cache_path is not None and not Path(cache_path).is_absolute():
+            cache_path = Path(factory_root) / cache_path
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self._scan_cache: dict[str, dict[str, Any]] = self._load_scan_cache()
+        self._seen_files: set[str] = set()
+        self._cache_dirty = False
+        self.cache_stats = {"reused": 0, "parsed": 0}
 
     def scan_artifacts(self) -> None:
         """
@@ -168,7 +196,11 @@ class DependencyValidator:
         - .agent/skills/*/SKILL.md for skill dependencies
         - .agent/agents/*.md for agent dependencies
         - .agent/blueprints/*/blueprint.json for blueprint references
+
+        Files whose mtime/size (or, failing that, content hash) match the scan
+        cache are not parsed again.
         """
+        self._seen_files = set()
         self._scan_knowledge_files()
         self._scan_skills()
         self._scan_agents()
@@ -176,6 +208,94 @@ class DependencyValidator:
         self._scan_patterns()
         self._scan_templates()
         self._build_adjacency()
+        self._save_scan_cache()
+
+    # -- scan cache --------------------------------------------------------
+
+    def _load_scan_cache(self) -> dict[str, dict[str, Any]]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != SCAN_CACHE_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def _save_scan_cache(self) -> None:
+        """Persist scan records, dropping files that no longer exist."""
+        stale = set(self._scan_cache) - self._seen_files
+        for key in stale:
+            del self._scan_cache[key]
+        if self.cache_path is None or not (self._cache_dirty or stale):
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({"version": SCAN_CACHE_VERSION, "files": self._scan_cache}),
+                encoding="utf-8",
+            )
+            tmp_path.replace(self.cache_path)
+            self._cache_dirty = False
+        except OSError:
+            pass  # The cache is an optimisation only
+
+    def _file_record(self, path: Path, extract: Callable[[bytes], Any]) -> Any:
+        """
+        Return what `extract` yields for a file, parsing it only if changed.
+
+        The record is reused when mtime and size match the cache, or when the
+        content hash does (e.g. after a checkout touched the file).
+
+        Args:
+            path: File to scan
+            extract: Function turning the raw bytes into a JSON-compatible record
+
+        Returns:
+            The (cached) record
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        try:
+            key = path.relative_to(self.factory_root).as_posix()
+        except ValueError:
+            key = path.as_posix()
+        key = f"{extract.__name__}:{key}"
+        self._seen_files.add(key)
+
+        st = path.stat()
+        entry = self._scan_cache.get(key)
+        if (
+            entry is not None
+            and entry["mtime_ns"] == st.st_mtime_ns
+            and entry["size"] == st.st_size
+        ):
+            self.cache_stats["reused"] += 1
+            return entry["record"]
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if entry is None or entry["sha256"] != digest:
+            # Round-trip through JSON so fresh and cached records are identical
+            record = json.loads(json.dumps(extract(data), default=str))
+            self.cache_stats["parsed"] += 1
+        else:
+            record = entry["record"]
+            self.cache_stats["reused"] += 1
+
+        self._scan_cache[key] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha256": digest,
+            "record": record,
+        }
+        self._cache_dirty = True
+        return record
+
+    # -- artifact scanners -------------------------------------------------
 
     def _scan_knowledge_files(self) -> None:
         """Scan knowledge/manifest.json for knowledge file dependencies."""
@@ -184,12 +304,12 @@ class DependencyValidator:
             return
 
         try:
-            with open(manifest_path, encoding="utf-8") as f:
-                manifest = json.load(f)
-        except (json.JSONDecodeError, IOError):
+            files = self._file_record(manifest_path, _extract_manifest_files)
+        except IOError:
+            return
+        if files is None:
             return
 
-        files = manifest.get("files", {})
         for filename, info in files.items():
             node_id = f"knowledge:{filename}"
             self.nodes[node_id] = DependencyNode(
@@ -243,7 +363,7 @@ class DependencyValidator:
         for skill_file in skills_dir.rglob("SKILL.md"):
             skill_dir = skill_file.parent
 
-            frontmatter = self._parse_frontmatter(skill_file)
+            frontmatter = self._cached_frontmatter(skill_file)
 
             # Use directory name for fallback, but preferred is path-based ID
             # to accommodate nested categories (e.g. verification/data-validation)
@@ -323,7 +443,7 @@ class DependencyValidator:
             return
 
         for agent_file in agents_dir.rglob("*.md"):
-            frontmatter = self._parse_frontmatter(agent_file)
+            frontmatter = self._cached_frontmatter(agent_file)
             if not frontmatter:
                 continue
 
@@ -378,12 +498,13 @@ class DependencyValidator:
                 continue
 
             try:
-                with open(bp_file, encoding="utf-8") as f:
-                    blueprint = json.load(f)
-            except (json.JSONDecodeError, IOError):
+                blueprint = self._file_record(bp_file, _extract_blueprint_refs)
+            except IOError:
+                continue
+            if blueprint is None:
                 continue
 
-            metadata = blueprint.get("metadata", {})
+            metadata = blueprint["metadata"]
             bp_id = metadata.get("blueprintId", bp_dir.name)
             node_id = f"blueprint:{bp_id}"
 
@@ -399,8 +520,7 @@ class DependencyValidator:
             )
 
             # Agent pattern references
-            for agent in blueprint.get("agents", []):
-                pattern_id = agent.get("patternId")
+            for pattern_id in blueprint["agents"]:
                 if pattern_id:
                     self.edges.append(
                         DependencyEdge(
@@ -411,8 +531,7 @@ class DependencyValidator:
                     )
 
             # Skill pattern references
-            for skill in blueprint.get("skills", []):
-                pattern_id = skill.get("patternId")
+            for pattern_id in blueprint["skills"]:
                 if pattern_id:
                     self.edges.append(
                         DependencyEdge(
@@ -423,13 +542,7 @@ class DependencyValidator:
                     )
 
             # Knowledge file references
-            for knowledge in blueprint.get("knowledge", []):
-                filename = None
-                if isinstance(knowledge, str):
-                    filename = knowledge
-                elif isinstance(knowledge, dict):
-                    filename = knowledge.get("filename")
-
+            for filename in blueprint["knowledge"]:
                 if filename:
                     self.edges.append(
                         DependencyEdge(
@@ -452,14 +565,12 @@ class DependencyValidator:
             node_id = f"pattern:{pattern_id}"
 
             # Extract metadata if possible
-            metadata = {}
             try:
-                with open(pattern_file, encoding="utf-8") as f:
-                    content = json.load(f)
-                    metadata["type"] = content.get("type")
-                    metadata["description"] = content.get("description")
-            except (json.JSONDecodeError, IOError):
-                pass
+                metadata = dict(
+                    self._file_record(pattern_file, _extract_pattern_metadata)
+                )
+            except IOError:
+                metadata = {}
 
             self.nodes[node_id] = DependencyNode(
                 id=node_id,
@@ -499,20 +610,21 @@ class DependencyValidator:
         except IOError:
             return None
 
-        # Match YAML frontmatter (between --- markers)
-        match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-        if not match:
-            return None
+        return _frontmatter_from_text(content)
 
+    def _cached_frontmatter(self, filepath: Path) -> Optional[dict]:
+        """_parse_frontmatter() backed by the scan cache."""
         try:
-            return yaml.safe_load(match.group(1))
-        except yaml.YAMLError:
+            return self._file_record(filepath, _extract_frontmatter)
+        except IOError:
             return None
 
     def _build_adjacency(self) -> None:
         """Build adjacency lists from edges for graph operations."""
         self._adjacency = {}
         self._reverse_adjacency = {}
+        self._adjacency_edge_count = len(self.edges)
+        self._impact_cache = {}
 
         for edge in self.edges:
             if edge.from_node not in self._adjacency:
@@ -527,34 +639,30 @@ class DependencyValidator:
         """
         Detect circular dependencies in the graph.
 
-        Uses graphlib.TopologicalSorter to detect cycles.
+        Finds every strongly connected component of the REQUIRES/EXTENDS
+        subgraph with Tarjan's algorithm (iterative, linear time), so all
+        cycles are reported at once. Each cycle is a closed walk along real
+        edges that starts and ends at the component's smallest node and
+        visits every node of the component.
 
         Returns:
             List of cycles (each cycle is a list of node IDs)
         """
-        ts = TopologicalSorter()
-
-        # Add all nodes (even those without dependencies)
-        for node_id in self.nodes:
-            ts.add(node_id)
-
-        # Add edges (note: TopologicalSorter expects (node, *predecessors))
+        graph: dict[str, list[str]] = {node_id: [] for node_id in self.nodes}
         for edge in self.edges:
-            if edge.edge_type in (EdgeType.REQUIRES, EdgeType.EXTENDS):
-                ts.add(edge.from_node, edge.to_node)
-
-        try:
-            list(ts.static_order())
-            return []
-        except CycleError as e:
-            # Extract cycle information from exception
-            cycle_info = str(e)
-            # Parse the cycle from the error message
-            match = re.search(r"nodes are in a cycle \[(.*?)\]", cycle_info)
-            if match:
-                cycle_nodes = [n.strip().strip("'") for n in match.group(1).split(",")]
-                return [cycle_nodes]
-            return [["cycle detected"]]
+            if edge.edge_type.value in BLOCKING_EDGE_TYPES:
+                graph.setdefault(edge.from_node, []).append(edge.to_node)
+                graph.setdefault(edge.to_node, [])
+        for targets in graph.values():
+            targets.sort()
+
+        cycles = []
+        for component in _strongly_connected_components(graph):
+            start = min(component)
+            if len(component) == 1 and start not in graph[start]:
+                continue
+            cycles.append(_closed_walk(graph, set(component), start))
+        return sorted(cycles)
 
     def find_broken_refs(self) -> list[str]:
         """
@@ -655,7 +763,8 @@ class DependencyValidator:
         """
         Find all nodes transitively affected by changes to the given node.
 
-        Uses BFS to find all downstream dependents.
+        Uses a deque-based BFS over the reverse adjacency lists; results are
+        cached until the adjacency lists are rebuilt.
 
         Args:
             node_id: The node to analyze impact for
@@ -663,15 +772,24 @@ class DependencyValidator:
         Returns:
             Set of all affected node IDs
         """
-        affected = set()
-        queue = list(self.reverse_lookup(node_id))
+        if self._adjacency_edge_count != len(self.edges):
+            self._build_adjacency()
+
+        cached = self._impact_cache.get(node_id)
+        if cached is not None:
+            return set(cached)
+
+        reverse = self._reverse_adjacency
+        affected: set[str] = set()
+        queue = deque(reverse.get(node_id, ()))
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             if current not in affected:
                 affected.add(current)
-                queue.extend(self.reverse_lookup(current))
+                queue.extend(reverse.get(current, ()))
 
+        self._impact_cache[node_id] = frozenset(affected)
         return affected
 
     def get_install_order(self) -> list[str]:
@@ -783,6 +901,161 @@ class DependencyValidator:
         }
 
 
+# =============================================================================
+# FILE EXTRACTORS (pure functions of the file bytes, cached per file)
+# =============================================================================
+
+
+def _frontmatter_from_text(content: str) -> Optional[dict]:
+    """Parse YAML frontmatter (between --- markers) from markdown text."""
+    match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
+    if not match:
+        return None
+
+    try:
+        return yaml.safe_load(match.group(1))
+    except yaml.YAMLError:
+        return None
+
+
+def _extract_frontmatter(data: bytes) -> Optional[dict]:
+    # Universal newlines, as Path.read_text() would apply
+    text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return _frontmatter_from_text(text)
+
+
+def _extract_manifest_files(data: bytes) -> Optional[dict]:
+    try:
+        manifest = json.loads(data.decode("utf-8"))
+    except json.JSONDecodeError:
+        return None
+    return manifest.get("files", {})
+
+
+def _extract_blueprint_refs(data: bytes) -> Optional[dict]:
+    try:
+        blueprint = json.loads(data.decode("utf-8"))
+    except json.JSONDecodeError:
+        return None
+
+    knowledge = []
+    for item in blueprint.get("knowledge", []):
+        if isinstance(item, str):
+            knowledge.append(item)
+        elif isinstance(item, dict):
+            knowledge.append(item.get("filename"))
+
+    metadata = blueprint.get("metadata", {})
+    return {
+        "metadata": {
+            key: metadata[key]
+            for key in ("blueprintId", "version", "blueprintName", "description")
+            if key in metadata
+        },
+        "agents": [agent.get("patternId") for agent in blueprint.get("agents", [])],
+        "skills": [skill.get("patternId") for skill in blueprint.get("skills", [])],
+        "knowledge": knowledge,
+    }
+
+
+def _extract_pattern_metadata(data: bytes) -> dict:
+    try:
+        content = json.loads(data.decode("utf-8"))
+    except json.JSONDecodeError:
+        return {}
+    return {"type": content.get("type"), "description": content.get("description")}
+
+
+# =============================================================================
+# GRAPH ALGORITHMS
+# =============================================================================
+
+
+def _strongly_connected_components(graph: dict[str, list[str]]) -> list[list[str]]:
+    """Tarjan's algorithm without recursion (safe for deep dependency chains)."""
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+    counter = 0
+
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, iter(graph[root]))]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = counter
+                    counter += 1
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(graph[succ])))
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def _shortest_path(
+    graph: dict[str, list[str]], members: set[str], source: str, target: str
+) -> list[str]:
+    """Nodes after `source` on a shortest path to `target` inside a component."""
+    parents: dict[str, str] = {}
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        for succ in graph[node]:
+            if succ not in members or succ in parents:
+                continue
+            parents[succ] = node
+            if succ == target:
+                path = [succ]
+                while parents[path[-1]] != source:
+                    path.append(parents[path[-1]])
+                return path[::-1]
+            queue.append(succ)
+    return [target]  # unreachable for members of one component
+
+
+def _closed_walk(
+    graph: dict[str, list[str]], members: set[str], start: str
+) -> list[str]:
+    """Walk from `start` through every member of a component and back."""
+    walk = [start]
+    visited = {start}
+    for member in sorted(members):
+        if member in visited:
+            continue
+        for node in _shortest_path(graph, members, walk[-1], member):
+            walk.append(node)
+            visited.add(node)
+    walk.extend(_shortest_path(graph, members, walk[-1], start))
+    return walk
+
+
 def main():
     """CLI entry point for dependency validation."""
     parser = argparse.ArgumentParser(description="Validate Factory dependency graph")
@@ -814,15 +1087,26 @@ def main():
     )
     parser.add_argument("--stats", action="store_true", help="Show graph statistics")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every artifact instead of using the scan cache",
+    )
 
     args = parser.parse_args()
 
     # Create validator and scan
-    validator = DependencyValidator(args.root)
+    validator = DependencyValidator(
+        args.root, cache_path=None if args.no_cache else DEFAULT_CACHE_PATH
+    )
     validator.scan_artifacts()
 
     if args.verbose:
         print(f"Scanned {len(validator.nodes)} nodes, {len(validator.edges)} edges")
+        print(
+            f"Scan cache: {validator.cache_stats['reused']} reused, "
+            f"{validator.cache_stats['parsed']} parsed"
+        )
 
     # Handle specific operations
     if args.stats:
@@ -21,6 +21,8 @@ Usage:
     python scripts/validation/schema_validator.py --type knowledge   # Validate knowledge only
     python scripts/validation/schema_validator.py --verbose          # Verbose output
     python scripts/validation/schema_validator.py --summary          # Summary only
+    python scripts/validation/schema_validator.py --workers 4        # Parallel
+    python scripts/validation/schema_validator.py --incremental      # Skip unchanged
 
 Exit Codes:
     0 - All validations pass
@@ -36,12 +38,14 @@ Version: 1.0.0
 """
 
 import argparse
+import hashlib
 import json
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from jsonschema import Draft7Validator
@@ -53,6 +57,8 @@ try:
     import yaml
 
     HAS_YAML = True
+    # libyaml's loader parses frontmatter roughly ten times faster
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     HAS_YAML = False
 
@@ -86,6 +92,33 @@ SCHEMA_MAP = {
 
 FRONTMATTER_RE = re.compile(r"^---\s*[\r\n]+(.*?)\r?\n---", re.DOTALL | re.MULTILINE)
 
+ALL_TYPES = [
+    "agent",
+    "skill",
+    "knowledge",
+    "blueprint",
+    "workflow",
+    "registry",
+    "catalog",
+]
+
+# Catalogs live in the knowledge directory with a -catalog.json suffix
+CATALOG_NAMES = [
+    "skill-catalog.json",
+    "pattern-catalog.json",
+    "template-catalog.json",
+    "blueprint-catalog.json",
+    "agent-catalog.json",
+    "workflow-catalog.json",
+    "registry-catalog.json",
+]
+
+# Files that passed in an earlier run, used by --incremental
+DEFAULT_CACHE_PATH = ROOT / ".agent" / "cache" / "schema-validation.json"
+VALIDATION_CACHE_VERSION = 1
+
+VALIDATOR_CACHE_SIZE = 64
+
 
 # ---------------------------------------------------------------------------
 @dataclass
@@ -96,6 +129,7 @@ class ValidationResult:
     artifact_type: str
     valid: bool
     errors: List[str] = field(default_factory=list)
+    cached: bool = False
 
 
 @dataclass
@@ -116,6 +150,10 @@ class ValidationReport:
     def failed(self) -> int:
         return sum(1 for r in self.results if not r.valid)
 
+    @property
+    def cached(self) -> int:
+        return sum(1 for r in self.results if r.cached)
+
     @property
     def ok(self) -> bool:
         return self.failed == 0
@@ -123,6 +161,8 @@ class ValidationReport:
     def summary(self) -> str:
         """Return a human-readable summary string."""
         lines = [f"Schema Validation: {self.passed}/{self.total} passed"]
+        if self.cached:
+            lines[0] += f" ({self.cached} unchanged since last run)"
         if not self.ok:
             for r in self.results:
                 if not r.valid:
@@ -151,17 +191,13 @@ def parse_yaml(text: str) -> Dict[str, Any]:
     """
     if HAS_YAML:
         try:
-            result = yaml.safe_load(text)
+            result = yaml.load(text, Loader=_YAML_LOADER)
             if isinstance(result, dict):
-                print(f"DEBUG: Parsed YAML: {list(result.keys())}")
                 return result
-        except yaml.YAMLError as e:
-            print(f"DEBUG: YAML Error: {e}")
+        except yaml.YAMLError:
             pass  # fall through to simple parser
 
-    simple_result = _parse_yaml_simple(text)
-    print(f"DEBUG: Parsed Simple YAML: {list(simple_result.keys())}")
-    return simple_result
+    return _parse_yaml_simple(text)
 
 
 def _parse_yaml_simple(text: str) -> Dict[str, Any]:
@@ -227,6 +263,39 @@ def load_schemas() -> Dict[str, Dict[str, Any]]:
     return schemas
 
 
+_validator_cache: Dict[int, Tuple[Dict[str, Any], Draft7Validator]] = {}
+
+
+def get_validator(schema: Dict[str, Any]) -> Draft7Validator:
+    """Return a compiled validator for a schema, building it only once.
+
+    Validators are cached per schema object, so callers that keep the dicts
+    returned by :func:`load_schemas` share one validator (and its resolved
+    ``$ref`` cache) across every artifact. Schemas must not be mutated after
+    their first use.
+
+    Args:
+        schema: The JSON Schema to validate against.
+
+    Returns:
+        A ``Draft7Validator`` for the schema.
+    """
+    cached = _validator_cache.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    if len(_validator_cache) >= VALIDATOR_CACHE_SIZE:
+        del _validator_cache[next(iter(_validator_cache))]
+    validator = Draft7Validator(schema)
+    _validator_cache[id(schema)] = (schema, validator)
+    return validator
+
+
+def schema_fingerprint(schema: Dict[str, Any]) -> str:
+    """Return a stable hash of a schema's content."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 # ---------------------------------------------------------------------------
 def discover_agents() -> List[Path]:
     """Discover all agent markdown files."""
@@ -274,6 +343,14 @@ def discover_registry() -> List[Path]:
     return [p] if p.exists() else []
 
 
+def discover_catalogs() -> List[Path]:
+    """Discover the catalog files in the knowledge directory."""
+    d = ARTIFACT_DIRS["knowledge"]
+    if not d.exists():
+        return []
+    return [d / name for name in CATALOG_NAMES if (d / name).exists()]
+
+
 # ---------------------------------------------------------------------------
 def validate_data(data: Dict[str, Any], schema: Dict[str, Any]) -> List[str]:
     """Validate a data dict against a JSON schema using Draft7Validator.
@@ -285,7 +362,7 @@ def validate_data(data: Dict[str, Any], schema: Dict[str, Any]) -> List[str]:
     Returns:
         List of human-readable error messages (empty if valid).
     """
-    validator = Draft7Validator(schema)
+    validator = get_validator(schema)
     errors: List[str] = []
     for error in sorted(
         validator.iter_errors(data), key=lambda e: list(e.absolute_path)
@@ -354,159 +431,237 @@ def validate_json_file(
     return ValidationResult(rel, artifact_type, len(errors) == 0, errors)
 
 
+class ValidationCache:
+    """Fingerprints of artifacts that passed validation in an earlier run.
+
+    A file is skipped when its schema is unchanged and either its mtime and
+    size match the stored entry or, failing that, its sha256 does (so fresh
+    checkouts in CI still hit). Only passing results are stored, so failing
+    files are re-validated on every run until they are fixed.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == VALIDATION_CACHE_VERSION:
+                self.entries = dict(data.get("files", {}))
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+
+    def check(
+        self, key: str, path: Path, schema_hash: str
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Return (unchanged, fingerprint) for a file about to be validated."""
+        try:
+            st = path.stat()
+        except OSError:
+            return False, None
+        entry = self.entries.get(key)
+        if entry is not None and entry.get("schema") != schema_hash:
+            entry = None
+        fingerprint = {
+            "schema": schema_hash,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+        }
+        if (
+            entry is not None
+            and entry.get("mtime_ns") == st.st_mtime_ns
+            and entry.get("size") == st.st_size
+        ):
+            fingerprint["sha256"] = entry["sha256"]
+            return True, fingerprint
+        try:
+            fingerprint["sha256"] = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            return False, None
+        unchanged = entry is not None and entry.get("sha256") == fingerprint["sha256"]
+        return unchanged, fingerprint
+
+    def update(
+        self,
+        types: List[str],
+        outcomes: List[Tuple[str, Optional[Dict[str, Any]], bool]],
+    ) -> None:
+        """Replace the entries of the validated types with this run's passes."""
+        prefixes = tuple(f"{t}:" for t in types)
+        self.entries = {
+            key: entry
+            for key, entry in self.entries.items()
+            if not key.startswith(prefixes)
+        }
+        for key, fingerprint, valid in outcomes:
+            if valid and fingerprint is not None:
+                self.entries[key] = fingerprint
+
+    def save(self) -> None:
+        """Write the cache, ignoring an unwritable location."""
+        data = {"version": VALIDATION_CACHE_VERSION, "files": self.entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError as exc:
+            print(f"WARNING: Could not write validation cache {self.path}: {exc}")
+
+
+@dataclass(frozen=True)
+class _Job:
+    """A single artifact scheduled for validation."""
+
+    artifact_type: str
+    schema_key: str
+    path: Path
+    rel: str
+    frontmatter: bool
+
+
+# Schemas handed to pool workers by _init_worker
+_worker_schemas: Dict[str, Dict[str, Any]] = {}
+
+
+def _init_worker(schemas: Dict[str, Dict[str, Any]]) -> None:
+    global _worker_schemas
+    _worker_schemas = schemas
+
+
+def _run_job(
+    job: _Job, schemas: Optional[Dict[str, Dict[str, Any]]] = None
+) -> ValidationResult:
+    schema = (schemas if schemas is not None else _worker_schemas)[job.schema_key]
+    if job.frontmatter:
+        result = validate_frontmatter_file(job.path, schema, job.artifact_type)
+    else:
+        result = validate_json_file(job.path, schema, job.artifact_type)
+    result.path = job.rel
+    return result
+
+
 # ---------------------------------------------------------------------------
 def validate_all(
     types: Optional[List[str]] = None,
     verbose: bool = False,
+    workers: Optional[int] = None,
+    cache_path: Optional[Path] = None,
 ) -> ValidationReport:
     """Run schema validation across all (or selected) artifact types.
 
+    Each schema is compiled into a validator once and reused for every file.
+    Results are always reported in discovery order, whether files are
+    validated serially or across a process pool.
+
     Args:
         types: List of artifact type keys to validate (e.g. ``["agent", "skill"]``).
                If None, validates all types.
         verbose: Print per-file status.
+        workers: Number of worker processes; ``None`` or 1 validates serially.
+        cache_path: Enables incremental mode. Files that passed in an earlier
+               run and whose content and schema are unchanged are reported
+               as passing without being parsed again.
 
     Returns:
         ValidationReport with results for every validated artifact.
     """
     schemas = load_schemas()
     report = ValidationReport()
-    all_types = types or [
-        "agent",
-        "skill",
-        "knowledge",
-        "blueprint",
-        "workflow",
-        "registry",
-        "catalog",
-    ]
-
-    # --- Agents ---
-    if "agent" in all_types:
-        schema = schemas.get("agent")
-        if schema:
-            files = discover_agents()
-            if verbose:
-                print(f"\nValidating {len(files)} agents against agent.schema.json ...")
-            for path in files:
-                result = validate_frontmatter_file(path, schema, "agent")
-                report.results.append(result)
-                if verbose:
-                    _print_result(result)
-        else:
-            print("WARNING: agent.schema.json not found, skipping agents")
-
-    # --- Skills ---
-    if "skill" in all_types:
-        schema = schemas.get("skill")
-        if schema:
-            files = discover_skills()
-            if verbose:
-                print(f"\nValidating {len(files)} skills against skill.schema.json ...")
-            for path in files:
-                result = validate_frontmatter_file(path, schema, "skill")
-                report.results.append(result)
-                if verbose:
-                    _print_result(result)
-        else:
-            print("WARNING: skill.schema.json not found, skipping skills")
-
-    # --- Knowledge ---
-    if "knowledge" in all_types:
-        schema = schemas.get("knowledge-file")
-        if schema:
-            files = discover_knowledge()
-            if verbose:
-                print(
-                    f"\nValidating {len(files)} knowledge files against knowledge-file.schema.json ..."
-                )
-            for path in files:
-                result = validate_json_file(path, schema, "knowledge")
-                report.results.append(result)
-                if verbose:
-                    _print_result(result)
-        else:
-            print("WARNING: knowledge-file.schema.json not found, skipping knowledge")
-
-    # --- Blueprints ---
-    if "blueprint" in all_types:
-        schema = schemas.get("blueprint")
-        if schema:
-            files = discover_blueprints()
-            if verbose:
-                print(
-                    f"\nValidating {len(files)} blueprints against blueprint.schema.json ..."
-                )
-            for path in files:
-                result = validate_json_file(path, schema, "blueprint")
-                report.results.append(result)
+    all_types = types or ALL_TYPES
+
+    # artifact type -> (schema key, discover, frontmatter?, plural label)
+    sections = {
+        "agent": ("agent", discover_agents, True, "agents"),
+        "skill": ("skill", discover_skills, True, "skills"),
+        "knowledge": ("knowledge-file", discover_knowledge, False, "knowledge"),
+        "blueprint": ("blueprint", discover_blueprints, False, "blueprints"),
+        "workflow": ("workflow", discover_workflows, True, "workflows"),
+        "registry": ("registry", discover_registry, False, "registry"),
+        "catalog": ("catalog", discover_catalogs, False, "catalogs"),
+    }
+
+    planned: List[Tuple[str, List[_Job]]] = []
+    validated_types: List[str] = []
+    for artifact_type in ALL_TYPES:
+        if artifact_type not in all_types:
+            continue
+        schema_key, discover, frontmatter, label = sections[artifact_type]
+        if not schemas.get(schema_key):
+            message = f"{schema_key}.schema.json not found, skipping {label}"
+            if artifact_type == "registry":
                 if verbose:
-                    _print_result(result)
+                    print(f"NOTE: {message}")
+            elif artifact_type != "catalog" or verbose:
+                print(f"WARNING: {message}")
+            continue
+        validated_types.append(artifact_type)
+        jobs = [
+            _Job(artifact_type, schema_key, path, _rel(path), frontmatter)
+            for path in discover()
+        ]
+        if artifact_type == "registry":
+            header = "Validating registry against registry.schema.json ..."
+        elif artifact_type == "knowledge":
+            header = (
+                f"Validating {len(jobs)} knowledge files against "
+                f"{schema_key}.schema.json ..."
+            )
         else:
-            print("WARNING: blueprint.schema.json not found, skipping blueprints")
-
-    # --- Workflows ---
-    if "workflow" in all_types:
-        schema = schemas.get("workflow")
-        if schema:
-            files = discover_workflows()
-            if verbose:
-                print(
-                    f"\nValidating {len(files)} workflows against workflow.schema.json ..."
+            header = (
+                f"Validating {len(jobs)} {label} against {schema_key}.schema.json ..."
+            )
+        planned.append((header, jobs))
+
+    jobs = [job for _, section_jobs in planned for job in section_jobs]
+
+    cache = ValidationCache(cache_path) if cache_path else None
+    fingerprints: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+    results: List[Optional[ValidationResult]] = [None] * len(jobs)
+    if cache is not None:
+        hashes = {key: schema_fingerprint(schema) for key, schema in schemas.items()}
+        for i, job in enumerate(jobs):
+            unchanged, fingerprints[i] = cache.check(
+                f"{job.artifact_type}:{job.rel}", job.path, hashes[job.schema_key]
+            )
+            if unchanged:
+                results[i] = ValidationResult(
+                    job.rel, job.artifact_type, True, cached=True
                 )
-            for path in files:
-                result = validate_frontmatter_file(path, schema, "workflow")
-                report.results.append(result)
-                if verbose:
-                    _print_result(result)
-        else:
-            print("WARNING: workflow.schema.json not found, skipping workflows")
 
-    # --- Registry ---
-    if "registry" in all_types:
-        schema = schemas.get("registry")
-        if schema:
-            files = discover_registry()
-            if verbose:
-                print("\nValidating registry against registry.schema.json ...")
-            for path in files:
-                result = validate_json_file(path, schema, "registry")
-                report.results.append(result)
-                if verbose:
-                    _print_result(result)
-        else:
-            if verbose:
-                print("NOTE: registry.schema.json not found, skipping registry")
-
-    # --- Catalogs ---
-    if "catalog" in all_types:
-        schema = schemas.get("catalog")
-        if schema:
-            # Catalogs are in knowledge dir with -catalog.json suffix
-            d = ARTIFACT_DIRS["knowledge"]
-            if d.exists():
-                catalog_names = [
-                    "skill-catalog.json",
-                    "pattern-catalog.json",
-                    "template-catalog.json",
-                    "blueprint-catalog.json",
-                    "agent-catalog.json",
-                    "workflow-catalog.json",
-                    "registry-catalog.json",
-                ]
-                files = [d / name for name in catalog_names if (d / name).exists()]
-                if verbose:
-                    print(
-                        f"\nValidating {len(files)} catalogs against catalog.schema.json ..."
-                    )
-                for path in files:
-                    result = validate_json_file(path, schema, "catalog")
-                    report.results.append(result)
-                    if verbose:
-                        _print_result(result)
-        else:
+    pending = [i for i, result in enumerate(results) if result is None]
+    if workers and workers > 1 and len(pending) > 1:
+        chunksize = max(1, len(pending) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(schemas,)
+        ) as executor:
+            fresh = executor.map(
+                _run_job, [jobs[i] for i in pending], chunksize=chunksize
+            )
+            for i, result in zip(pending, fresh):
+                results[i] = result
+    else:
+        for i in pending:
+            results[i] = _run_job(jobs[i], schemas)
+
+    position = 0
+    for header, section_jobs in planned:
+        if verbose:
+            print(f"\n{header}")
+        for result in results[position : position + len(section_jobs)]:
+            report.results.append(result)
             if verbose:
-                print("WARNING: catalog.schema.json not found, skipping catalogs")
+                _print_result(result)
+        position += len(section_jobs)
+
+    if cache is not None:
+        cache.update(
+            validated_types,
+            [
+                (f"{job.artifact_type}:{job.rel}", fingerprint, result.valid)
+                for job, fingerprint, result in zip(jobs, fingerprints, results)
+            ],
+        )
+        cache.save()
 
     return report
 
@@ -563,6 +718,17 @@ def main() -> int:
     parser.add_argument(
         "--summary", action="store_true", help="Print summary only (no per-file detail)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Validate files across N worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip files unchanged since they last passed validation",
+    )
     args = parser.parse_args()
 
     types = None if args.type == "all" else [args.type]
@@ -572,7 +738,12 @@ def main() -> int:
     print("  Schema Validation Pipeline")
     print("=" * 60)
 
-    report = validate_all(types=types, verbose=verbose)
+    report = validate_all(
+        types=types,
+        verbose=verbose,
+        workers=args.workers,
+        cache_path=DEFAULT_CACHE_PATH if args.incremental else None,
+    )
 
     print("\n" + report.summary())
     print()
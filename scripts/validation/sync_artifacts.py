@@ -21,11 +21,16 @@ Usage:
 """
 
 import ast
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
 from functools import lru_cache
+import hashlib
 import json
+import os
 import re
 import subprocess
 import sys
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, NamedTuple, Optional
@@ -121,11 +126,53 @@ class SyncResult:
 # =============================================================================
 
 
+# Default location of the persistent frontmatter metadata cache
+DEFAULT_METADATA_CACHE = Path(".agent") / "cache" / "sync-metadata-cache.json"
+
+# Files needing metadata before frontmatter extraction goes parallel
+PARALLEL_METADATA_THRESHOLD = 16
+
+
+def _glob_parts_match(
+    parts: tuple[str, ...], pattern_parts: tuple[str, ...], is_dir: bool
+) -> bool:
+    """Match relative path components against glob components (pathlib semantics)."""
+    if not pattern_parts:
+        return not parts
+
+    head, rest = pattern_parts[0], pattern_parts[1:]
+    if head == "**":
+        if not rest:
+            # A trailing ** only yields directories
+            return is_dir
+        return any(
+            _glob_parts_match(parts[i:], rest, is_dir) for i in range(len(parts) + 1)
+        )
+
+    return (
+        bool(parts)
+        and fnmatch(parts[0], head)
+        and _glob_parts_match(parts[1:], rest, is_dir)
+    )
+
+
 class ArtifactScanner:
-    """Scans directories for artifacts based on configuration."""
+    """Scans directories for artifacts based on configuration.
 
-    def __init__(self, root_path: Path):
+    Each source directory is walked at most once per scanner and every
+    configured pattern is matched against that in-memory listing. Frontmatter
+    metadata is read only up to the closing ``---`` and, when ``cache_path``
+    is set, persisted keyed by mtime/size with a content-hash fallback so
+    unchanged files are never re-parsed.
+    """
+
+    def __init__(self, root_path: Path, cache_path: Optional[Path] = None):
         self.root_path = root_path
+        self.cache_path = cache_path
+        self._walks: dict[Path, list[tuple[tuple[str, ...], bool]]] = {}
+        self._metadata_cache: Optional[dict[str, dict]] = None
+        self._cache_dirty = False
+        self._cache_lock = threading.Lock()
 
     def scan(self, config: ArtifactConfig) -> list[ArtifactInfo]:
         """Scan for artifacts based on configuration."""
@@ -133,32 +180,86 @@ class ArtifactScanner:
         if not source_dir.exists():
             return []
 
-        artifacts = []
-
-        if config.recursive:
-            matches = list(source_dir.rglob(config.pattern))
-        else:
-            matches = list(source_dir.glob(config.pattern))
-
-        for path in matches:
+        matches = []
+        for path, is_file in self._iter_matches(
+            source_dir, config.pattern, config.recursive
+        ):
             # Check exclusions
             if self._should_exclude(path, config.exclude, source_dir):
                 continue
 
             # Check file_types_only
-            if config.file_types_only and not path.is_file():
+            if config.file_types_only and not is_file:
                 continue
 
-            # Extract ID
-            artifact_id = self._extract_id(path, config.id_extractor, source_dir)
+            matches.append(path)
 
-            # Extract metadata
-            metadata = self._extract_metadata(path, config.metadata_extractor)
+        # Extract metadata (in parallel for larger sets)
+        if config.metadata_extractor and len(matches) >= PARALLEL_METADATA_THRESHOLD:
+            workers = min(8, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                metadata_list = list(
+                    executor.map(
+                        lambda p: self._extract_metadata(p, config.metadata_extractor),
+                        matches,
+                    )
+                )
+        else:
+            metadata_list = [
+                self._extract_metadata(p, config.metadata_extractor) for p in matches
+            ]
 
-            # Create artifact info
-            artifacts.append(ArtifactInfo(id=artifact_id, path=path, metadata=metadata))
+        return [
+            ArtifactInfo(
+                id=self._extract_id(path, config.id_extractor, source_dir),
+                path=path,
+                metadata=metadata,
+            )
+            for path, metadata in zip(matches, metadata_list)
+        ]
 
-        return artifacts
+    def _walk(self, directory: Path) -> list[tuple[tuple[str, ...], bool]]:
+        """List all entries below a directory once, as (relative parts, is_file)."""
+        directory = Path(os.path.abspath(directory))
+        if directory in self._walks:
+            return self._walks[directory]
+
+        # Reuse an ancestor's walk when one exists
+        for walked, entries in self._walks.items():
+            if walked in directory.parents:
+                prefix = directory.relative_to(walked).parts
+                n = len(prefix)
+                listing = [
+                    (parts[n:], is_file)
+                    for parts, is_file in entries
+                    if len(parts) > n and parts[:n] == prefix
+                ]
+                self._walks[directory] = listing
+                return listing
+
+        listing: list[tuple[tuple[str, ...], bool]] = []
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames.sort()
+            rel = Path(dirpath).relative_to(directory).parts
+            listing.extend((rel + (d,), False) for d in dirnames)
+            listing.extend((rel + (f,), True) for f in sorted(filenames))
+
+        self._walks[directory] = listing
+        return listing
+
+    def _iter_matches(
+        self, directory: Path, pattern: str, recursive: bool
+    ) -> list[tuple[Path, bool]]:
+        """Glob against the cached walk (``rglob`` when recursive)."""
+        pattern_parts = tuple(p for p in pattern.replace("\\", "/").split("/") if p)
+        if recursive:
+            pattern_parts = ("**",) + pattern_parts
+
+        return [
+            (directory.joinpath(*parts), is_file)
+            for parts, is_file in self._walk(directory)
+            if _glob_parts_match(parts, pattern_parts, not is_file)
+        ]
 
     def _extract_metadata(self, path: Path, extractor_config: Optional[dict]) -> dict:
         """Extract metadata from file based on configuration."""
@@ -173,41 +274,117 @@ class ArtifactScanner:
 
         return {}
 
+    @staticmethod
+    def _read_frontmatter_text(path: Path) -> Optional[str]:
+        """Read YAML frontmatter text, stopping at the closing ``---``."""
+        with open(path, "r", encoding="utf-8") as f:
+            if not f.readline().startswith("---"):
+                return None
+
+            lines = []
+            for line in f:
+                if line.strip() == "---":
+                    return "".join(lines)
+                lines.append(line)
+
+        return None
+
     def _extract_yaml_frontmatter(self, path: Path, fields: list[str]) -> dict:
         """Extract YAML frontmatter from markdown file."""
         try:
-            content = path.read_text(encoding="utf-8")
-
-            # Check for YAML frontmatter (--- ... ---)
-            if not content.startswith("---"):
-                return {}
-
-            # Find the closing ---
-            lines = content.split("\n")
-            end_idx = None
-            for i in range(1, len(lines)):
-                if lines[i].strip() == "---":
-                    end_idx = i
-                    break
+            key = f"{path}|{','.join(fields)}"
+            stat = path.stat()
+            cached = self._cache_lookup(key)
+            if (
+                cached
+                and cached["mtime_ns"] == stat.st_mtime_ns
+                and cached["size"] == stat.st_size
+            ):
+                return dict(cached["metadata"])
 
-            if end_idx is None:
+            frontmatter_text = self._read_frontmatter_text(path)
+            if frontmatter_text is None:
                 return {}
 
-            # Parse YAML
-            import yaml
+            # Touched but unchanged (e.g. after checkout): skip the YAML parse
+            digest = hashlib.sha256(frontmatter_text.encode("utf-8")).hexdigest()
+            if cached and cached["hash"] == digest:
+                metadata = cached["metadata"]
+            else:
+                # Parse YAML
+                import yaml
+
+                frontmatter = yaml.safe_load(frontmatter_text) or {}
+
+                # Extract requested fields
+                metadata = {}
+                for field in fields:
+                    if field in frontmatter:
+                        metadata[field] = frontmatter[field]
+
+            self._cache_store(
+                key,
+                {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "hash": digest,
+                    "metadata": metadata,
+                },
+            )
+            return dict(metadata)
+        except Exception:
+            return {}
 
-            frontmatter_text = "\n".join(lines[1:end_idx])
-            frontmatter = yaml.safe_load(frontmatter_text) or {}
+    def _cache_lookup(self, key: str) -> Optional[dict]:
+        """Get a cached metadata entry (loads the cache file on first use)."""
+        if self.cache_path is None:
+            return None
+
+        with self._cache_lock:
+            if self._metadata_cache is None:
+                self._metadata_cache = {}
+                if self.cache_path.exists():
+                    try:
+                        self._metadata_cache = json.loads(
+                            self.cache_path.read_text(encoding="utf-8")
+                        )
+                    except (OSError, ValueError):
+                        pass
+            return self._metadata_cache.get(key)
 
-            # Extract requested fields
-            metadata = {}
-            for field in fields:
-                if field in frontmatter:
-                    metadata[field] = frontmatter[field]
+    def _cache_store(self, key: str, entry: dict) -> None:
+        """Record a metadata entry, JSON-normalized so reloads compare equal."""
+        if self.cache_path is None:
+            return
 
-            return metadata
-        except Exception:
-            return {}
+        try:
+            entry = json.loads(json.dumps(entry, default=str))
+        except (TypeError, ValueError):
+            return
+
+        with self._cache_lock:
+            if self._metadata_cache is None:
+                self._metadata_cache = {}
+            self._metadata_cache[key] = entry
+            self._cache_dirty = True
+
+    def save_cache(self) -> None:
+        """Persist the metadata cache if anything changed."""
+        if self.cache_path is None or not self._cache_dirty:
+            return
+
+        with self._cache_lock:
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path.with_suffix(".tmp")
+                tmp_path.write_text(
+                    json.dumps(self._metadata_cache, sort_keys=True),
+                    encoding="utf-8",
+                )
+                os.replace(tmp_path, self.cache_path)
+                self._cache_dirty = False
+            except OSError:
+                pass
 
     def count_pytest(self, test_dir: Optional[str] = None) -> int:
         """Count tests using pytest --collect-only.
@@ -275,7 +452,9 @@ class ArtifactScanner:
         pattern = re.compile(r"^\s*(?:async\s+)?def\s+(test_\w+)", re.MULTILINE)
         count = 0
 
-        for py_file in tests_path.rglob("test_*.py"):
+        for py_file, is_file in self._iter_matches(tests_path, "test_*.py", True):
+            if not is_file:
+                continue
             try:
                 content = py_file.read_text(encoding="utf-8", errors="ignore")
                 count += len(pattern.findall(content))
@@ -937,7 +1116,9 @@ class SyncEngine:
             config_path = root_path / "scripts" / "validation" / "sync_config.json"
         self.config_path = config_path
 
-        self.scanner = ArtifactScanner(root_path)
+        self.scanner = ArtifactScanner(
+            root_path, cache_path=root_path / DEFAULT_METADATA_CACHE
+        )
         self.config = self._load_config()
 
         # Initialize strategies
@@ -1047,6 +1228,11 @@ class SyncEngine:
         config = self.config[artifact_name]
         results = []
 
+        # Scan once and reuse the artifacts for every target
+        artifacts_list: list[ArtifactInfo] = []
+        if config.count_method != "pytest_collect":
+            artifacts_list = self.scanner.scan(config)
+
         # Get count - use accurate pytest method by default, fast only when explicitly requested
         if config.count_method == "pytest_collect":
             if use_fast_count:
@@ -1057,18 +1243,12 @@ class SyncEngine:
         elif config.count_method == "file_count" and config.source_dir == "tests":
             count = self.scanner.count_test_functions()
         else:
-            artifacts = self.scanner.scan(config)
-            count = len(artifacts)
+            count = len(artifacts_list)
 
         # Process each target
         for target in config.targets:
             strategy = self.strategies.get(target.type)
             if strategy:
-                artifacts_list = (
-                    self.scanner.scan(config)
-                    if config.count_method != "pytest_collect"
-                    else []
-                )
                 result = strategy.sync(target, count, artifacts_list, dry_run)
                 result = SyncResult(
                     artifact=artifact_name,
@@ -1093,6 +1273,7 @@ class SyncEngine:
                     )
                 )
 
+        self.scanner.save_cache()
         return results
 
     def sync_all(
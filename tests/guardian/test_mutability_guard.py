@@ -263,3 +263,80 @@ class TestMutabilityGuardSingleton:
         guard2 = get_mutability_guard()
 
         assert guard1 is guard2
+
+
+class TestMutabilityGuardIndex:
+    """Tests for the compiled policy index and batch checks."""
+
+    @pytest.fixture
+    def guard(self):
+        from scripts.guardian.mutability_guard import MutabilityGuard
+
+        return MutabilityGuard()
+
+    def test_prefix_semantics_preserved(self, guard):
+        """Trie lookups keep plain string-prefix semantics."""
+        # Name entries match as string prefixes, directory entries need a "/"
+        assert guard._get_layer_for_path("PURPOSE.md.bak") == "L1"
+        assert guard._get_layer_for_path(".agent/patterns/axioms") is None
+        assert guard._get_layer_for_path(".agent/patterns/axioms/") == "L0"
+        assert guard._is_in_mutable_path("data/x.json") is True
+        assert guard._is_in_mutable_path("database/x.json") is False
+
+    def test_never_modify_matches_suffix(self, guard):
+        """Never-modify entries still match anywhere as a path suffix."""
+        assert guard._is_never_modify("nested/copy/.agentrules") is True
+        assert guard._is_never_modify(".agentrules.md") is False
+
+    def test_can_modify_many_deduplicates(self, guard):
+        """Batch checks normalize and evaluate each path once."""
+        results = guard.can_modify_many(
+            [
+                "knowledge/a.json",
+                ".\\knowledge\\a.json",
+                ".agent/patterns/axioms/core-axioms.json",
+            ]
+        )
+
+        assert list(results) == [
+            "knowledge/a.json",
+            ".agent/patterns/axioms/core-axioms.json",
+        ]
+        assert results["knowledge/a.json"].allowed is True
+        assert results[".agent/patterns/axioms/core-axioms.json"].allowed is False
+
+    def test_rebuild_index_applies_list_changes(self, guard):
+        """Mutating policy lists takes effect after rebuild_index()."""
+        assert guard.can_modify("custom/secret.json").allowed is True
+
+        guard.never_modify.append("custom/secret.json")
+        guard.rebuild_index()
+
+        assert guard.can_modify("custom/secret.json").allowed is False
+
+    def test_validate_staged_changes(self, guard, tmp_path):
+        """Staged files, including rename sources, are checked together."""
+        import subprocess
+
+        def git(*args):
+            subprocess.run(
+                ["git", *args], cwd=tmp_path, check=True, capture_output=True
+            )
+
+        git("init", "-q")
+        git("config", "user.email", "t@example.com")
+        git("config", "user.name", "t")
+        (tmp_path / "PURPOSE.md").write_text("# Purpose\n")
+        git("add", "PURPOSE.md")
+        git("commit", "-q", "-m", "init")
+
+        (tmp_path / "knowledge").mkdir()
+        (tmp_path / "knowledge" / "k.json").write_text("{}")
+        git("mv", "PURPOSE.md", "notes.md")
+        git("add", "knowledge/k.json")
+
+        results = guard.validate_staged_changes(str(tmp_path))
+
+        assert set(results) == {"PURPOSE.md", "notes.md", "knowledge/k.json"}
+        assert results["PURPOSE.md"].allowed is False
+        assert results["knowledge/k.json"].allowed is True
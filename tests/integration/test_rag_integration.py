@@ -2,6 +2,7 @@ import pytest
 import os
 import sys
 import time
+import json
 
 # Add project root to path
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
@@ -77,3 +78,17 @@ class TestRAGRetrieval:
         text = result[0].text
         assert "Proposed memory" in text
         assert "memory_semantic" in text
+
+    def test_server_stats_reports_tool_latency(self):
+        """Verify per-tool latency is recorded and reported by server_stats."""
+
+        async def run():
+            await asyncio.gather(
+                handle_call_tool("search_memory_semantic", {"query": "a"}),
+                handle_call_tool("search_memory_entity", {"query": "b"}),
+            )
+            return await handle_call_tool("server_stats", {})
+
+        stats = json.loads(asyncio.run(run())[0].text)
+        assert stats["search_memory_semantic"]["count"] >= 1
+        assert stats["search_memory_entity"]["p95_ms"] >= 0
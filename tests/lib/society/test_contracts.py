@@ -615,6 +615,51 @@ class TestContractRegistry:
             registry = ContractRegistry(storage_path=str(filepath))
             assert len(registry.contracts) == 0
 
+    def test_indexes_follow_add_and_remove(self):
+        """Test agent, pair and role lookups after re-add and remove."""
+        registry = ContractRegistry()
+        registry.add(self.create_contract("c1", ["a1", "a2"]))
+        registry.add(self.create_contract("c2", ["a1", "a3"]))
+
+        # Re-adding with different parties moves the index entries
+        registry.add(self.create_contract("c1", ["a1", "a4"]))
+
+        assert [
+            c.contract_id for c in registry.find_contracts("a1", active_only=False)
+        ] == [
+            "c1",
+            "c2",
+        ]
+        assert registry.find_contracts("a1", "a2", active_only=False) == []
+        assert len(registry.find_contracts("a4", "a1", active_only=False)) == 1
+        assert registry.get_agent_roles("a4") == {"c1": "member"}
+        assert len(registry.find_by_role("a1", "member", active_only=False)) == 2
+
+        registry.remove("c1")
+        assert registry.find_contracts("a4", active_only=False) == []
+        assert registry.find_by_role("a4", "member", active_only=False) == []
+
+    def test_cleanup_expired_uses_current_expiry(self):
+        """Test expiry cleanup honours re-added contracts."""
+        registry = ContractRegistry()
+        past = datetime.now(timezone.utc) - timedelta(hours=1)
+
+        expired = self.create_contract("c1", ["a1"])
+        expired.expires = past
+        registry.add(expired)
+
+        renewed = self.create_contract("c2", ["a2"])
+        renewed.expires = past
+        registry.add(renewed)
+        renewed_again = self.create_contract("c2", ["a2"])
+        renewed_again.expires = datetime.now(timezone.utc) + timedelta(hours=1)
+        registry.add(renewed_again)
+
+        assert registry.cleanup_expired() == 1
+        assert registry.get("c1") is None
+        assert registry.get("c2") is not None
+        assert registry.find_contracts("a1", active_only=False) == []
+
 
 class TestContractVerifier:
     """Tests for ContractVerifier."""
@@ -1005,6 +1050,40 @@ class TestContractVerifier:
         )
         assert len(pending) == 0
 
+    def test_get_overdue_obligations(self):
+        """Test deadline-ordered overdue obligation queue."""
+        contract = AgentContract(
+            contract_id="deadline-contract",
+            version="1.0.0",
+            created=datetime.now(timezone.utc),
+            parties=[Party(agent_id="agent-1", role="worker", public_key="pk_1")],
+            capabilities={"worker": []},
+            obligations={
+                "worker": [
+                    Obligation(
+                        trigger="fast", action="ack", parameters={"timeout_ms": 10}
+                    ),
+                    Obligation(trigger="slow", action="report", parameters={}),
+                ],
+            },
+            signatures={"agent-1": "sig1"},
+        )
+        self.registry.add(contract)
+
+        self.verifier.track_obligation("deadline-contract", "agent-1", "fast")
+        self.verifier.track_obligation("deadline-contract", "agent-1", "slow")
+
+        later = datetime.now(timezone.utc) + timedelta(seconds=1)
+        overdue = self.verifier.get_overdue_obligations(now=later)
+        assert [(c, a, o.action) for c, a, o in overdue] == [
+            ("deadline-contract", "agent-1", "ack")
+        ]
+
+        # Still overdue until fulfilled, then dropped from the queue
+        assert len(self.verifier.get_overdue_obligations(now=later)) == 1
+        self.verifier.fulfill_obligation("deadline-contract", "agent-1", "ack")
+        assert self.verifier.get_overdue_obligations(now=later) == []
+
 
 class TestContractVerificationResult:
     """Tests for ContractVerificationResult."""
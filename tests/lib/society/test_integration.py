@@ -4,12 +4,18 @@ Tests for the integration module.
 Tests SocietyContext, AgentSocietyBridge, and MessageRouter.
 """
 
+import json
+import os
 import tempfile
+import threading
+import time
 from datetime import datetime, timezone
+from pathlib import Path
 
 from lib.society.integration import (
     SocietyContext,
     AgentSocietyBridge,
+    BackpressurePolicy,
     BridgeResult,
     MessageRouter,
 )
@@ -436,6 +442,265 @@ class TestMessageRouter:
         assert len(router._delivery_handlers) == 1
 
 
+def create_message_event(sender: str, target: str, seq: int = 1):
+    """Create a message event addressed to target."""
+    from lib.society.events import (
+        Agent,
+        AgentType,
+        Action,
+        ActionType,
+        AxiomContext,
+        AgentEvent,
+    )
+
+    return AgentEvent(
+        event_id=f"evt-{seq}",
+        timestamp=datetime.now(timezone.utc),
+        sequence=seq,
+        previous_hash="",
+        agent=Agent(id=sender, type=AgentType.WORKER, public_key="pk"),
+        action=Action(
+            type=ActionType.MESSAGE,
+            description="Test",
+            payload={"seq": seq},
+            target=target,
+        ),
+        axiom_context=AxiomContext(),
+        signature="",
+        hash="",
+    )
+
+
+class TestAsyncMessageRouter:
+    """Tests for asynchronous, backpressured delivery."""
+
+    def test_async_route_delivers_in_order(self):
+        """Test that async routing delivers every message in order."""
+        context = SocietyContext.create_default()
+        router = MessageRouter(context, async_delivery=True, workers=2)
+        bridge_b = AgentSocietyBridge("agent-b", "worker", context)
+        router.register(bridge_b)
+
+        received = []
+        bridge_b.add_message_handler(lambda e: received.append(e.action.payload["seq"]))
+
+        results = [
+            router.route(create_message_event("agent-a", "agent-b", i))
+            for i in range(50)
+        ]
+
+        assert router.flush(timeout=5)
+        assert received == list(range(50))
+        assert all(r.status == RouteStatus.DELIVERED for r in results)
+
+        stats = router.get_stats()
+        assert stats["delivery_latency_ms"]["count"] == 50
+        assert stats["queue_depth"] == 0
+        router.close()
+
+    def test_async_broadcast(self):
+        """Test that broadcasts fan out through the worker pool."""
+        context = SocietyContext.create_default()
+        router = MessageRouter(context, async_delivery=True)
+        for agent_id in ("a", "b", "c"):
+            router.register(AgentSocietyBridge(agent_id, "worker", context))
+
+        results = router.broadcast(create_message_event("a", "b"))
+
+        assert router.flush(timeout=5)
+        assert sorted(r.recipient for r in results) == ["b", "c"]
+        router.close()
+
+    def test_drop_policy_when_queue_full(self):
+        """Test that a full queue drops new messages under DROP policy."""
+        context = SocietyContext.create_default()
+        router = MessageRouter(context, async_delivery=True, workers=1, queue_size=2)
+        bridge = AgentSocietyBridge("slow", "worker", context)
+        gate = threading.Event()
+        bridge.add_message_handler(lambda e: gate.wait(5))
+        router.register(bridge)
+
+        results = [
+            router.route(create_message_event("a", "slow", i)) for i in range(10)
+        ]
+        gate.set()
+
+        assert router.flush(timeout=5)
+        assert any(r.status == RouteStatus.DROPPED for r in results)
+        assert router.get_stats()["dropped"] >= 1
+        router.close()
+
+    def test_spill_policy_preserves_messages(self):
+        """Test that overflow spills to disk and is delivered later."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            context = SocietyContext.create_default()
+            router = MessageRouter(
+                context,
+                async_delivery=True,
+                workers=1,
+                queue_size=2,
+                backpressure=BackpressurePolicy.SPILL,
+                spill_dir=tmpdir,
+            )
+            bridge = AgentSocietyBridge("slow", "worker", context)
+            gate = threading.Event()
+            received = []
+
+            def handler(event):
+                gate.wait(5)
+                received.append(event.action.payload["seq"])
+
+            bridge.add_message_handler(handler)
+            router.register(bridge)
+
+            for i in range(20):
+                router.route(create_message_event("a", "slow", i))
+            gate.set()
+
+            assert router.flush(timeout=5)
+            assert received == list(range(20))
+            assert router.get_stats()["spilled"] > 0
+            router.close()
+
+    def _spilling_router(self, context, spill_dir):
+        return MessageRouter(
+            context,
+            async_delivery=True,
+            workers=1,
+            queue_size=2,
+            backpressure=BackpressurePolicy.SPILL,
+            spill_dir=spill_dir,
+        )
+
+    def test_spill_writes_happen_outside_router_lock(self):
+        """Test that spill file I/O does not hold the router lock."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            context = SocietyContext.create_default()
+            router = self._spilling_router(context, tmpdir)
+            bridge = AgentSocietyBridge("slow", "worker", context)
+            gate = threading.Event()
+            bridge.add_message_handler(lambda e: gate.wait(5))
+            router.register(bridge)
+
+            lock_held = []
+            write_spill = router._write_spill
+            unspill = router._unspill
+
+            def check_write(agent_id):
+                lock_held.append(router._lock.locked())
+                write_spill(agent_id)
+
+            def check_unspill(agent_id):
+                lock_held.append(router._lock.locked())
+                unspill(agent_id)
+
+            router._write_spill = check_write
+            router._unspill = check_unspill
+            for i in range(10):
+                router.route(create_message_event("a", "slow", i))
+            gate.set()
+
+            assert router.flush(timeout=5)
+            assert lock_held and not any(lock_held)
+            router.close()
+
+    def _blocked_spill(self, router, context, events):
+        """Route events while the recipient's handler is blocked."""
+        bridge = AgentSocietyBridge("slow", "worker", context)
+        gate = threading.Event()
+        bridge.add_message_handler(lambda e: gate.wait(5))
+        router.register(bridge)
+        routed = [router.route(event) for event in events]
+        return gate, routed
+
+    def test_unserializable_spill_is_dropped_not_raised(self):
+        """Test that a payload that can't be spilled is dropped cleanly."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            context = SocietyContext.create_default()
+            router = self._spilling_router(context, tmpdir)
+            events = [create_message_event("a", "slow", i) for i in range(6)]
+            for event in events:
+                event.action.payload["at"] = datetime.now(timezone.utc)
+
+            gate, routed = self._blocked_spill(router, context, events)
+            gate.set()
+
+            assert router.flush(timeout=3)
+            dropped = [m for m in routed if m.status == RouteStatus.DROPPED]
+            assert dropped and all("Cannot spill" in m.error for m in dropped)
+            assert router._spilled == {} and not router._scheduled
+            router.close()
+
+    def test_failed_spill_write_undoes_accounting(self):
+        """Test that records lost to a failed write don't block flush()."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            not_a_dir = Path(tmpdir) / "spill"
+            not_a_dir.write_text("")
+            context = SocietyContext.create_default()
+            router = self._spilling_router(context, not_a_dir)
+            events = [create_message_event("a", "slow", i) for i in range(6)]
+
+            gate, routed = self._blocked_spill(router, context, events)
+            gate.set()
+
+            assert router.flush(timeout=3)
+            assert any(m.status == RouteStatus.DROPPED for m in routed)
+            assert router._spilled == {} and router._spill_count == 0
+            router.close()
+
+    def test_missing_spill_file_does_not_spin_worker(self):
+        """Test that an agent isn't re-queued when its spill file is gone."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            context = SocietyContext.create_default()
+            router = self._spilling_router(context, tmpdir)
+            events = [create_message_event("a", "slow", i) for i in range(6)]
+
+            gate, _ = self._blocked_spill(router, context, events)
+            for path in Path(tmpdir).glob("*.jsonl"):
+                path.unlink()
+            gate.set()
+
+            assert router.flush(timeout=3)
+            assert router._spilled == {} and not router._scheduled
+            router.close()
+
+    def test_earlier_spill_files_replayed_only_on_request(self):
+        """Test that spill files from another router need replay_spilled()."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            context = SocietyContext.create_default()
+            # Overflow left behind by a router in a process that crashed
+            record = {
+                "message_id": "m-1",
+                "sender": "a",
+                "recipient": "slow",
+                "enqueued_at": 0.0,
+                "event": create_message_event("a", "slow", 7).to_dict(),
+            }
+            stale = Path(tmpdir) / "slow.oldrouter.jsonl"
+            stale.write_text(json.dumps(record) + "\n", encoding="utf-8")
+
+            router = self._spilling_router(context, tmpdir)
+            bridge = AgentSocietyBridge("slow", "worker", context)
+            received = []
+            bridge.add_message_handler(
+                lambda e: received.append(e.action.payload["seq"])
+            )
+            router.register(bridge)
+
+            router.route(create_message_event("a", "slow", 1))
+            assert router.flush(timeout=5)
+            assert received == [1]
+
+            old = time.time() - 3600
+            os.utime(stale, (old, old))
+            assert router.replay_spilled(max_age=60) == 0
+            assert router.replay_spilled() == 1
+            assert router.flush(timeout=5)
+            assert received == [1, 7]
+            assert not stale.exists()
+            router.close()
+
+
 class TestEndToEndCommunication:
     """End-to-end tests for agent communication."""
 
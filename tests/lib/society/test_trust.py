@@ -325,6 +325,79 @@ class TestReputationSystem:
         assert rankings[1][0] == "a"
         assert rankings[2][0] == "b"
 
+    def test_rankings_follow_score_updates(self):
+        """Test that cached rankings are invalidated when scores change."""
+        system = ReputationSystem(decay_enabled=False)
+
+        system.get_score("a").current_score = 80.0
+        system.get_score("b").current_score = 60.0
+        assert system.get_rankings(limit=1)[0] == ("a", 80.0)
+
+        system.get_score("b").current_score = 95.0
+        system.record_compliance("c", True)
+
+        rankings = system.get_rankings(limit=3)
+        assert [agent_id for agent_id, _ in rankings] == ["b", "a", "c"]
+        assert rankings[0][1] == 95.0
+
+    def test_lazy_decay_closed_form(self):
+        """Test that decay is evaluated from score and anchor timestamp."""
+        system = ReputationSystem(decay_enabled=True)
+        score = system.get_score("agent-1")
+        score.current_score = 90.0
+        score.last_updated = datetime.now(timezone.utc) - timedelta(
+            days=ReputationSystem.DECAY_HALF_LIFE_DAYS
+        )
+
+        decayed = system.get_score("agent-1").current_score
+
+        assert abs(decayed - 70.0) < 0.01
+        assert abs(system.get_rankings(limit=1)[0][1] - decayed) < 0.01
+
+    def test_decayed_rankings_and_trust(self):
+        """Test that rankings and trust thresholds account for decay."""
+        system = ReputationSystem(decay_enabled=True)
+        now = datetime.now(timezone.utc)
+
+        # Older high score decays below a fresher, lower one
+        stale = system.get_score("stale")
+        stale.current_score = 90.0
+        stale.last_updated = now - timedelta(days=60)
+        fresh = system.get_score("fresh")
+        fresh.current_score = 70.0
+        fresh.last_updated = now
+
+        rankings = system.get_rankings(limit=2)
+        assert [agent_id for agent_id, _ in rankings] == ["fresh", "stale"]
+        assert abs(rankings[1][1] - 60.0) < 0.01
+
+        trusted = system.get_trusted_agents(min_score=65.0)
+        assert trusted == ["fresh"]
+
+    def test_apply_decay_all(self):
+        """Test bulk decay matches per-score closed-form evaluation."""
+        system = ReputationSystem(decay_enabled=True)
+        now = datetime.now(timezone.utc)
+
+        expected = {}
+        for i in range(20):
+            score = system.get_score(f"agent-{i}")
+            score.current_score = float(i * 5)
+            score.last_updated = now - timedelta(days=i)
+            expected[score.agent_id] = score.score_at(
+                now, ReputationSystem.DECAY_HALF_LIFE_DAYS
+            )
+
+        assert system.apply_decay_all(now=now) == 20
+
+        for agent_id, value in expected.items():
+            score = system._scores[agent_id]
+            assert abs(score.current_score - value) < 1e-9
+            assert score.last_updated == now
+
+        top = system.get_rankings(limit=1)[0]
+        assert top[0] == max(expected, key=expected.get)
+
 
 class TestTrustDelegation:
     """Tests for TrustDelegation."""
@@ -288,6 +288,77 @@ class TestAxiomComplianceMonitor:
         assert hasattr(monitor, "_violation_handlers")
 
 
+class TestVerifyBatch:
+    """Tests for batched verification."""
+
+    def _events(self):
+        return [
+            create_event("Help user with their legitimate request"),
+            create_event("Deceive and manipulate user to cause harm"),
+            create_event("Help user with their legitimate request"),
+            create_event(
+                "Store memory of personal information",
+                action_type=ActionType.STATE_CHANGE,
+            ),
+        ]
+
+    def test_batch_matches_sequential(self):
+        """Test that batched results match per-event verification."""
+        events = self._events()
+        expected = [create_default_monitor().verify(e) for e in events]
+
+        for workers in (None, 4):
+            results = create_default_monitor().verify_batch(events, max_workers=workers)
+            assert [r.status for r in results] == [r.status for r in expected]
+            assert [
+                [(a.axiom, a.passed, a.reason) for a in r.axiom_results]
+                for r in results
+            ] == [
+                [(a.axiom, a.passed, a.reason) for a in r.axiom_results]
+                for r in expected
+            ]
+
+    def test_batch_fail_fast(self):
+        """Test that fail-fast stops at the first violating event."""
+        monitor = create_default_monitor()
+
+        results = monitor.verify_batch(self._events(), fail_fast=True, window_size=2)
+
+        assert len(results) == 2
+        assert results[-1].has_violations()
+
+    def test_batch_memoizes_identical_payloads(self):
+        """Test that identical events are verified only once."""
+        calls = []
+
+        class CountingVerifier(A1LoveVerifier):
+            def verify(self, event):
+                calls.append(event.event_id)
+                return super().verify(event)
+
+        monitor = AxiomComplianceMonitor()
+        monitor.register_verifier(CountingVerifier())
+        events = [create_event("Help user with their request") for _ in range(50)]
+
+        results = monitor.verify_batch(events)
+        monitor.verify_batch(events)
+
+        assert len(results) == 50
+        assert len(calls) == 1
+        assert results[0].axiom_results[0] is not results[1].axiom_results[0]
+
+    def test_verifier_latency_histograms(self):
+        """Test that per-verifier latency is recorded."""
+        monitor = create_default_monitor()
+        monitor.verify_batch(self._events(), memoize=False)
+
+        latency = monitor.get_verifier_latency()
+
+        assert "A1 Verifier" in latency
+        assert latency["A1 Verifier"]["count"] == 4
+        assert sum(latency["A1 Verifier"]["buckets"].values()) == 4
+
+
 class TestVerificationResult:
     """Tests for VerificationResult."""
 
@@ -0,0 +1,269 @@
+"""
+Tests for the Warm Pool daemon.
+
+Runs a WarmPoolServer on a temporary Unix socket with fake stores, so the
+protocol, attach helpers and ingestion-aware re-hydration are exercised
+without loading embedding models or Qdrant.
+"""
+
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from scripts.memory import warm_pool
+from scripts.memory.memory_store import Memory, MemoryProposal
+from scripts.memory.warm_pool import (
+    WARM_POOL_SUPPORTED,
+    RemoteMemoryStore,
+    WarmPool,
+    WarmPoolClient,
+    WarmPoolError,
+    attach_memory_store,
+)
+
+pytestmark = pytest.mark.skipif(
+    not WARM_POOL_SUPPORTED, reason="Unix domain sockets not available"
+)
+
+
+class FakeEmbeddingService:
+    def embed_single(self, text):
+        import numpy as np
+
+        return np.array([float(len(text)), 0.0])
+
+
+class FakeMemoryStore:
+    def __init__(self):
+        self.embedding_service = FakeEmbeddingService()
+        self.added = []
+        self.proposals = []
+        self.delay = 0.0
+
+    def search(self, query, memory_type, k=5, threshold=0.0, **kwargs):
+        time.sleep(self.delay)
+        return [
+            Memory(
+                id=f"{memory_type}-{i}",
+                content=query,
+                metadata={},
+                memory_type=memory_type,
+            )
+            for i in range(k)
+        ]
+
+    def add_memory(self, content, metadata, memory_type):
+        time.sleep(self.delay)
+        self.added.append((content, metadata, memory_type))
+        return f"id-{len(self.added)}"
+
+    def add_pending_proposal(self, proposal):
+        self.proposals.append(proposal)
+        return proposal.id
+
+
+class FakeRAG:
+    def __init__(self, parent_store_path):
+        self.parent_store_path = parent_store_path
+        self._store = "hydrated"
+        self._retriever = "retriever"
+        self.hydrations = 1
+
+    @property
+    def retriever(self):
+        if self._retriever is None:
+            self._store = "hydrated"
+            self._retriever = "retriever"
+            self.hydrations += 1
+        return self._retriever
+
+
+@pytest.fixture
+def pool_server(tmp_path):
+    """Start a warm pool on a temporary socket and tear it down afterwards."""
+    from scripts.memory.warm_pool import WarmPoolServer
+
+    parent_store = tmp_path / "parent_store"
+    parent_store.mkdir()
+    store = FakeMemoryStore()
+    rag = FakeRAG(str(parent_store))
+    pool = WarmPool(memory_store_factory=lambda: store, rag_factory=lambda: rag)
+
+    socket_path = str(tmp_path / "pool.sock")
+    server = WarmPoolServer(socket_path, pool)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path, pool, store, rag
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+class TestWarmPool:
+    """Tests for the warm pool server and client."""
+
+    def test_ping_reports_status(self, pool_server):
+        socket_path, *_ = pool_server
+        status = WarmPoolClient(socket_path).ping()
+
+        assert status["pid"] == os.getpid()
+        assert status["memory_warm"] is False
+
+    def test_ping_returns_none_without_pool(self, tmp_path):
+        assert WarmPoolClient(str(tmp_path / "missing.sock")).ping() is None
+
+    def test_remote_memory_store_round_trip(self, pool_server):
+        socket_path, _, store, _ = pool_server
+        remote = attach_memory_store(socket_path)
+
+        results = remote.search("hello", memory_type="memory_semantic", k=2)
+        assert [r.id for r in results] == ["memory_semantic-0", "memory_semantic-1"]
+        assert isinstance(results[0], Memory)
+
+        assert (
+            remote.add_memory("fact", {"a": 1}, memory_type="memory_entity") == "id-1"
+        )
+        assert store.added == [("fact", {"a": 1}, "memory_entity")]
+
+        proposal = MemoryProposal(id="p1", content="idea", source="agent")
+        assert remote.add_pending_proposal(proposal) == "p1"
+        assert remote.embedding_service.embed_single("abc").tolist() == [3.0, 0.0]
+
+    def test_attach_respects_disable_env(self, pool_server, monkeypatch):
+        socket_path, *_ = pool_server
+        monkeypatch.setenv("ANTIGRAVITY_WARM_POOL", "0")
+
+        assert attach_memory_store(socket_path) is None
+
+    def test_unknown_op_raises(self, pool_server):
+        socket_path, *_ = pool_server
+        with pytest.raises(WarmPoolError, match="Unknown op"):
+            WarmPoolClient(socket_path).call("nope")
+
+    def test_concurrent_calls_use_separate_connections(self, pool_server):
+        socket_path, _, store, _ = pool_server
+        store.delay = 0.3
+        client = WarmPoolClient(socket_path, max_connections=4)
+        results = []
+
+        def search():
+            results.append(client.call("memory.search", query="q", memory_type="m"))
+
+        threads = [threading.Thread(target=search) for _ in range(4)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        client.close()
+
+        assert len(results) == 4
+        # Serialized on one socket this would take 4 x 0.3s
+        assert elapsed < 0.9
+
+    def test_timed_out_connection_is_replaced(self, pool_server, monkeypatch):
+        socket_path, _, store, _ = pool_server
+        monkeypatch.setattr(warm_pool, "REQUEST_TIMEOUT", 0.1)
+        client = WarmPoolClient(socket_path)
+
+        store.delay = 0.5
+        with pytest.raises(TimeoutError):
+            client.call("memory.search", query="q", memory_type="m", k=1)
+        store.delay = 0.0
+
+        results = client.call("memory.search", query="q", memory_type="m", k=1)
+        assert results[0]["id"] == "m-0"
+
+    def test_stale_connection_is_retried_once(self, pool_server):
+        socket_path, *_ = pool_server
+        client = WarmPoolClient(socket_path)
+        client.call("ping")
+
+        # As if the pool had restarted since the connection went idle
+        client._idle[0]._sock.shutdown(socket.SHUT_RDWR)
+
+        assert client.call("ping")["pid"] == os.getpid()
+
+    def test_remote_store_falls_back_in_process(self, pool_server):
+        socket_path, *_ = pool_server
+        local = FakeMemoryStore()
+        remote = RemoteMemoryStore(WarmPoolClient(socket_path), fallback=lambda: local)
+        assert remote.add_memory("warm", {}, memory_type="memory_entity") == "id-1"
+
+        # The pool goes away while the MCP server keeps the remote store
+        remote._client.close()
+        remote._client.socket_path += ".gone"
+
+        assert remote.add_memory("cold", {}, memory_type="memory_entity") == "id-1"
+        assert remote.search("q", memory_type="m", k=1)[0].id == "m-0"
+        assert remote.embedding_service.embed_single("ab").tolist() == [2.0, 0.0]
+        assert local.added == [("cold", {}, "memory_entity")]
+
+    def test_timed_out_write_is_not_replayed_locally(self, pool_server, monkeypatch):
+        socket_path, _, store, _ = pool_server
+        monkeypatch.setattr(warm_pool, "REQUEST_TIMEOUT", 0.1)
+        local = FakeMemoryStore()
+        remote = RemoteMemoryStore(WarmPoolClient(socket_path), fallback=lambda: local)
+
+        store.delay = 0.3
+        with pytest.raises(TimeoutError):
+            remote.add_memory("fact", {}, memory_type="memory_entity")
+        time.sleep(0.4)
+
+        # The pool finished the write; it must not also land in-process
+        assert store.added == [("fact", {}, "memory_entity")]
+        assert local.added == [] and remote._local is None
+
+    def test_rag_rehydrates_after_ingestion(self, pool_server):
+        _, pool, _, rag = pool_server
+
+        pool.rag()
+        pool.rag()
+        assert rag.hydrations == 1
+
+        # Simulate another process persisting new parent documents
+        st = os.stat(rag.parent_store_path)
+        os.utime(rag.parent_store_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        pool.rag()
+        assert rag.hydrations == 2
+        assert pool.rehydrations == 1
+
+
+class TestSocketSecurity:
+    """Tests for the per-user socket directory and owner checks."""
+
+    def test_default_path_uses_private_runtime_dir(self, tmp_path, monkeypatch):
+        from scripts.memory.warm_pool import default_socket_path, ensure_socket_dir
+
+        monkeypatch.delenv("ANTIGRAVITY_WARM_POOL_SOCKET", raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        socket_path = default_socket_path()
+        ensure_socket_dir(socket_path)
+
+        assert socket_path == str(tmp_path / "antigravity" / "warm-pool.sock")
+        assert os.stat(tmp_path / "antigravity").st_mode & 0o777 == 0o700
+
+    def test_shared_socket_dir_is_refused(self, tmp_path):
+        from scripts.memory.warm_pool import ensure_socket_dir
+
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        os.chmod(shared, 0o777)
+
+        with pytest.raises(PermissionError):
+            ensure_socket_dir(str(shared / "pool.sock"))
+
+    def test_client_refuses_socket_owned_by_another_user(
+        self, pool_server, monkeypatch
+    ):
+        socket_path, *_ = pool_server
+        monkeypatch.setattr(os, "getuid", lambda: os.geteuid() + 1)
+
+        assert WarmPoolClient(socket_path).ping() is None
+        with pytest.raises(PermissionError):
+            WarmPoolClient(socket_path).call("ping")
@@ -0,0 +1,62 @@
+"""
+Benchmark for the content-addressed BackupManager.
+
+Backs up a generated tree of a few thousand small files (with the mix of
+duplicated boilerplate typical of .agent trees) several times, then rolls
+back, reporting timings and disk use.
+"""
+
+import time
+
+from scripts.git.backup_manager import BackupManager, BackupSession
+
+FILES = 3000
+DISTINCT = 600  # files share content the way generated artifacts do
+SESSIONS = 3
+
+
+def _make_tree(root):
+    for i in range(FILES):
+        path = root / ".agent" / f"group-{i % 30}" / f"artifact-{i}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        body = f"# Artifact {i % DISTINCT}\n\n" + "Shared guidance line.\n" * 200
+        path.write_text(body, encoding="utf-8")
+
+
+def test_repeated_backups_of_thousands_of_files(tmp_path):
+    _make_tree(tmp_path)
+    tree = tmp_path / ".agent"
+    raw_size = sum(p.stat().st_size for p in tree.rglob("*") if p.is_file())
+    manager = BackupManager(tmp_path)
+
+    timings = []
+    sessions = []
+    for n in range(SESSIONS):
+        # Explicit ids: create_session() ids only have one-second resolution
+        session = BackupSession(manager, f"benchmark_{n}")
+        start = time.perf_counter()
+        assert session.backup_directory(tree) is True
+        timings.append(time.perf_counter() - start)
+        sessions.append(session)
+
+    objects = list(manager.store.iter_objects())
+    assert len(objects) == DISTINCT
+    assert all(len(s.manifest.entries) == FILES for s in sessions)
+
+    for path in list(tree.rglob("*.md"))[:100]:
+        path.write_text("modified", encoding="utf-8")
+    start = time.perf_counter()
+    assert sessions[-1].rollback() is True
+    rollback_time = time.perf_counter() - start
+    assert all(
+        p.read_text(encoding="utf-8").startswith("# Artifact")
+        for p in tree.rglob("*.md")
+    )
+
+    store_size = sum(p.stat().st_size for p in objects)
+    print(
+        f"\n{FILES} files ({raw_size / 1024:.0f} KB) x {SESSIONS} backups: "
+        + ", ".join(f"{t:.2f}s" for t in timings)
+        + f"; rollback {rollback_time:.2f}s; object store {store_size / 1024:.0f} KB "
+        f"({len(objects)} objects)"
+    )
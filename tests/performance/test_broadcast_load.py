@@ -0,0 +1,103 @@
+"""
+Load test for the websocket Broadcaster.
+
+Serves a minimal FastAPI app on a local uvicorn server and fans events out
+to a few hundred real websocket clients, some of which never read, to check
+that every reading client gets every message promptly.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+import importlib.util
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+uvicorn = pytest.importorskip("uvicorn")
+if not any(importlib.util.find_spec(m) for m in ("websockets", "wsproto")):
+    pytest.skip("uvicorn has no websocket protocol library", allow_module_level=True)
+
+from fastapi import FastAPI, WebSocket  # noqa: E402
+
+from scripts.api.broadcaster import Broadcaster  # noqa: E402
+
+CLIENTS = 300
+STALLED = 10
+MESSAGES = 50
+
+
+@pytest.fixture
+def server_url():
+    broadcaster = Broadcaster(queue_size=MESSAGES)
+    app = FastAPI()
+
+    @app.websocket("/ws")
+    async def ws_endpoint(websocket: WebSocket):
+        await websocket.accept()
+        await broadcaster.register(websocket)
+        try:
+            while True:
+                await websocket.receive_text()
+        except Exception:
+            pass
+        finally:
+            await broadcaster.unregister(websocket)
+
+    @app.get("/clients")
+    async def clients():
+        return len(broadcaster)
+
+    @app.post("/publish/{count}")
+    async def publish(count: int):
+        for i in range(count):
+            broadcaster.publish({"n": i, "payload": "x" * 256})
+            await asyncio.sleep(0)
+        return broadcaster.stats()
+
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]})
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join(timeout=10)
+
+
+async def _fan_out(url):
+    connector = aiohttp.TCPConnector(limit=0)  # default caps connections at 100
+    async with aiohttp.ClientSession(connector=connector) as session:
+        readers = [await session.ws_connect(f"{url}/ws") for _ in range(CLIENTS)]
+        stalled = [await session.ws_connect(f"{url}/ws") for _ in range(STALLED)]
+        async with session.get(f"{url}/clients") as response:
+            assert await response.json() == CLIENTS + STALLED
+
+        async def read_all(ws):
+            return [(await ws.receive_json())["n"] for _ in range(MESSAGES)]
+
+        start = time.perf_counter()
+        async with session.post(f"{url}/publish/{MESSAGES}") as response:
+            assert response.status == 200
+        received = await asyncio.wait_for(
+            asyncio.gather(*(read_all(ws) for ws in readers)), timeout=60
+        )
+        elapsed = time.perf_counter() - start
+
+        for ws in readers + stalled:
+            await ws.close()
+        return received, elapsed
+
+
+def test_fan_out_to_hundreds_of_clients(server_url):
+    received, elapsed = asyncio.run(_fan_out(server_url))
+
+    assert all(messages == list(range(MESSAGES)) for messages in received)
+    print(
+        f"\n{CLIENTS} clients x {MESSAGES} messages delivered in {elapsed:.2f}s "
+        f"({CLIENTS * MESSAGES / elapsed:,.0f} msg/s)"
+    )
@@ -193,6 +193,94 @@ class TestArtifactScanner:
 
         assert len(artifacts) == 0
 
+    def test_scan_matches_pathlib_glob(self, tmp_path):
+        """
+        Verify that matching against the cached walk agrees with pathlib globbing.
+
+        How: Builds a small nested tree and compares scan results for several
+        glob/rglob patterns against Path.glob and Path.rglob.
+        Why: The scanner walks each source directory once and matches patterns
+        in memory; it must keep finding exactly what the previous glob-based
+        implementation found so documented counts do not drift.
+        """
+        root = tmp_path / "src"
+        for rel in ["a.md", "b/c.md", "b/d/e.md", "b/d/f.json", "g/SKILL.md"]:
+            (root / rel).parent.mkdir(parents=True, exist_ok=True)
+            (root / rel).write_text("x", encoding="utf-8")
+
+        scanner = ArtifactScanner(tmp_path)
+        cases = [
+            ("*.md", False, sorted(root.glob("*.md"))),
+            ("*/SKILL.md", False, sorted(root.glob("*/SKILL.md"))),
+            ("**/*.md", False, sorted(root.glob("**/*.md"))),
+            ("*.md", True, sorted(root.rglob("*.md"))),
+            ("*", True, sorted(root.rglob("*"))),
+        ]
+        for pattern, recursive, expected in cases:
+            config = ArtifactConfig(
+                name="t",
+                description="t",
+                source_dir="src",
+                pattern=pattern,
+                recursive=recursive,
+            )
+            found = sorted(a.path for a in scanner.scan(config))
+            assert found == expected, (pattern, recursive)
+
+    def test_frontmatter_metadata_is_cached(self, tmp_path):
+        """
+        Verify that frontmatter metadata is persisted and reused across runs.
+
+        How: Scans 20 markdown files (enough to take the parallel path) with a
+        cache file, then scans again with a fresh scanner while counting YAML
+        parses, including after touching a file without changing it.
+        Why: Parsing every artifact's frontmatter on each pre-commit run is the
+        dominant cost of a sync; unchanged files must be served from the cache.
+        """
+        import os
+
+        import yaml
+
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        for i in range(20):
+            (agents_dir / f"agent{i:02d}.md").write_text(
+                f"---\nname: agent{i}\ndescription: Agent {i}\n---\n# Body\n",
+                encoding="utf-8",
+            )
+
+        config = ArtifactConfig(
+            name="agents",
+            description="Test agents",
+            source_dir="agents",
+            pattern="*.md",
+            metadata_extractor={
+                "type": "markdown_frontmatter",
+                "fields": ["name", "description"],
+            },
+        )
+        cache_path = tmp_path / "cache.json"
+
+        first = ArtifactScanner(tmp_path, cache_path=cache_path)
+        artifacts = first.scan(config)
+        first.save_cache()
+
+        assert [a.id for a in artifacts] == [f"agent{i:02d}" for i in range(20)]
+        assert artifacts[3].metadata == {"name": "agent3", "description": "Agent 3"}
+        assert cache_path.exists()
+
+        # Touch one file: mtime changes, content does not
+        touched = agents_dir / "agent05.md"
+        stat = touched.stat()
+        os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch.object(yaml, "safe_load", wraps=yaml.safe_load) as safe_load:
+            second = ArtifactScanner(tmp_path, cache_path=cache_path)
+            again = second.scan(config)
+
+        assert safe_load.call_count == 0
+        assert [a.metadata for a in again] == [a.metadata for a in artifacts]
+
 
 # =============================================================================
 # COUNT SYNC STRATEGY TESTS
@@ -0,0 +1,187 @@
+"""
+Unit tests for scripts/api/artifact_catalog.py
+
+Tests for catalog invalidation, ETag handling, the polling watcher and its
+supervisor.
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from scripts.api import artifact_catalog
+from scripts.api.artifact_catalog import (
+    ArtifactCatalog,
+    etag_matches,
+    watch_changes,
+    watch_changes_supervised,
+)
+
+
+@pytest.fixture
+def catalog_dirs(tmp_path):
+    agents = tmp_path / "agents"
+    skills = tmp_path / "skills"
+    agents.mkdir()
+    skills.mkdir()
+    (agents / "a.md").write_text("agent a")
+    return agents, skills
+
+
+def _lister(directory, calls):
+    def load():
+        calls.append(directory.name)
+        return sorted(p.name for p in directory.iterdir())
+
+    return load
+
+
+class TestArtifactCatalog:
+    """Tests for the in-memory catalog."""
+
+    def test_built_once_until_invalidated(self, catalog_dirs):
+        agents, skills = catalog_dirs
+        calls = []
+        catalog = ArtifactCatalog()
+        catalog.register("agents", _lister(agents, calls), [agents])
+        catalog.register("skills", _lister(skills, calls), [skills])
+
+        first = catalog.get("agents")
+        assert catalog.get("agents") is first
+        assert json.loads(first.body) == ["a.md"]
+
+        (agents / "b.md").write_text("agent b")
+        assert catalog.invalidate_paths([agents / "b.md"]) == ["agents"]
+        second = catalog.get("agents")
+
+        assert json.loads(second.body) == ["a.md", "b.md"]
+        assert second.etag != first.etag
+        assert calls == ["agents", "agents"]
+
+    def test_unrelated_paths_do_not_invalidate(self, catalog_dirs, tmp_path):
+        agents, _ = catalog_dirs
+        catalog = ArtifactCatalog()
+        catalog.register("agents", _lister(agents, []), [agents])
+
+        assert catalog.invalidate_paths([tmp_path / "agents-old" / "x.md"]) == []
+
+    def test_change_during_build_leaves_collection_stale(self, catalog_dirs):
+        agents, _ = catalog_dirs
+        catalog = ArtifactCatalog()
+        builds = []
+
+        def load():
+            builds.append(1)
+            if len(builds) == 1:
+                catalog.invalidate("agents")  # a watcher event mid-build
+            return len(builds)
+
+        catalog.register("agents", load, [agents])
+
+        assert catalog.get("agents").data == 1
+        assert catalog.get("agents").data == 2
+        assert catalog.get("agents").data == 2
+
+    def test_unchanged_content_keeps_etag(self, catalog_dirs):
+        agents, _ = catalog_dirs
+        catalog = ArtifactCatalog()
+        catalog.register("agents", _lister(agents, []), [agents])
+
+        etag = catalog.get("agents").etag
+        catalog.invalidate("agents")
+        assert catalog.get("agents").etag == etag
+
+    def test_etag_matches(self):
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('"x", W/"abc"', '"abc"')
+        assert etag_matches("*", '"abc"')
+        assert not etag_matches(None, '"abc"')
+        assert not etag_matches('"abd"', '"abc"')
+
+
+class TestWatchChanges:
+    """Tests for the polling fallback watcher."""
+
+    def test_polling_reports_changed_files(self, catalog_dirs):
+        agents, _ = catalog_dirs
+
+        async def run():
+            stop = asyncio.Event()
+            watcher = watch_changes(
+                [agents], poll_interval=0.05, stop_event=stop, force_polling=True
+            )
+            batch = asyncio.ensure_future(watcher.__anext__())
+            await asyncio.sleep(0.1)
+            (agents / "new.md").write_text("new")
+            os.remove(agents / "a.md")
+            changed = await asyncio.wait_for(batch, timeout=5)
+            stop.set()
+            return changed
+
+        changed = asyncio.run(run())
+        assert {p.name for p in changed} == {"new.md", "a.md"}
+
+
+class TestSupervisedWatch:
+    """Tests for the restarting watcher."""
+
+    def test_restarts_after_watcher_error(self, catalog_dirs, monkeypatch):
+        agents, _ = catalog_dirs
+        real_watch = artifact_catalog.watch_changes
+        attempts = []
+
+        async def flaky_watch(*args, **kwargs):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("inotify watch limit reached")
+            async for changed in real_watch(*args, **kwargs):
+                yield changed
+
+        monkeypatch.setattr(artifact_catalog, "watch_changes", flaky_watch)
+        monkeypatch.setattr(artifact_catalog, "RESTART_BACKOFF", 0.01)
+
+        async def run():
+            stop = asyncio.Event()
+            watcher = watch_changes_supervised(
+                [agents], poll_interval=0.05, stop_event=stop, force_polling=True
+            )
+            resync = await asyncio.wait_for(watcher.__anext__(), timeout=5)
+            batch = asyncio.ensure_future(watcher.__anext__())
+            await asyncio.sleep(0.1)
+            (agents / "new.md").write_text("new")
+            changed = await asyncio.wait_for(batch, timeout=5)
+            stop.set()
+            await watcher.aclose()
+            return resync, changed
+
+        resync, changed = asyncio.run(run())
+        assert resync == {agents}
+        assert {p.name for p in changed} == {"new.md"}
+        assert len(attempts) == 2
+
+    def test_picks_up_roots_created_later(self, catalog_dirs, tmp_path):
+        agents, _ = catalog_dirs
+        later = tmp_path / "later"
+
+        async def run():
+            stop = asyncio.Event()
+            watcher = watch_changes_supervised(
+                [later], poll_interval=0.05, stop_event=stop, force_polling=True
+            )
+            resync = asyncio.ensure_future(watcher.__anext__())
+            await asyncio.sleep(0.1)
+            later.mkdir()
+            first = await asyncio.wait_for(resync, timeout=5)
+            batch = asyncio.ensure_future(watcher.__anext__())
+            await asyncio.sleep(0.1)
+            (later / "x.md").write_text("x")
+            changed = await asyncio.wait_for(batch, timeout=5)
+            stop.set()
+            await watcher.aclose()
+            return first, changed
+
+        first, changed = asyncio.run(run())
+        assert first == {later}
+        assert {p.name for p in changed} == {"x.md"}
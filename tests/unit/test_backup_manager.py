@@ -4,14 +4,20 @@ Unit tests for scripts/git/backup_manager.py
 Tests backup creation, manifest management, and rollback functionality.
 """
 
+import hashlib
 import json
+import os
+import shutil
 import sys
 import tempfile
+import time
 from pathlib import Path
 
+import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from scripts.git import backup_manager
 from scripts.git.backup_manager import (
     BackupEntry,
     BackupManifest,
@@ -553,3 +559,158 @@ class TestMainEntry:
             # Empty returns "0.0 B"
             formatted = manager.format_backup_size()
             assert "B" in formatted or "0" in formatted
+
+
+class TestObjectStore:
+    """Tests for the content-addressed object store."""
+
+    @pytest.fixture(params=["gzip", "zstd"])
+    def codec(self, request, monkeypatch):
+        """Run object store tests against both compression codecs."""
+        if request.param == "gzip":
+            monkeypatch.setattr(backup_manager, "ZSTD_AVAILABLE", False)
+        elif not backup_manager.ZSTD_AVAILABLE:
+            pytest.skip("zstandard not installed")
+        return request.param
+
+    def _objects(self, manager):
+        return sorted(manager.store.iter_objects())
+
+    def test_identical_content_is_stored_once(self, tmp_path, codec):
+        (tmp_path / "a.txt").write_text("same content " * 100)
+        (tmp_path / "b.txt").write_text("same content " * 100)
+        manager = BackupManager(tmp_path)
+
+        manager.create_session("one").backup_directory(tmp_path)
+        objects = self._objects(manager)
+        second = BackupSession(manager, "second")
+        second.backup_directory(tmp_path)
+
+        assert len(objects) == 1
+        assert self._objects(manager) == objects
+        assert objects[0].suffix == (".zst" if codec == "zstd" else ".gz")
+        assert objects[0].stat().st_size < 1300  # compressed
+        assert {e.file_hash for e in second.manifest.entries} == {
+            hashlib.sha256(b"same content " * 100).hexdigest()
+        }
+
+    def test_backup_directory_writes_manifest_once(self, tmp_path, monkeypatch):
+        for i in range(20):
+            (tmp_path / f"f{i}.txt").write_text(str(i))
+        session = BackupManager(tmp_path).create_session("batch")
+        writes = []
+        monkeypatch.setattr(
+            session,
+            "_save_manifest",
+            lambda: writes.append(len(session.manifest.entries)),
+        )
+
+        assert session.backup_directory(tmp_path) is True
+        assert writes == [20]
+        assert [e.original_path for e in session.manifest.entries] == sorted(
+            f"f{i}.txt" for i in range(20)
+        )
+
+    def test_backup_directory_skips_backup_store(self, tmp_path):
+        (tmp_path / "a.txt").write_text("a")
+        manager = BackupManager(tmp_path)
+        manager.create_session("first").backup_directory(tmp_path)
+
+        session = BackupSession(manager, "second")
+        session.backup_directory(tmp_path)
+
+        assert [e.original_path for e in session.manifest.entries] == ["a.txt"]
+
+    def test_rollback_streams_binary_content_and_metadata(self, tmp_path, codec):
+        data = os.urandom(3 * 1024 * 1024 + 17)
+        target = tmp_path / "bin" / "blob.dat"
+        target.parent.mkdir()
+        target.write_bytes(data)
+        os.chmod(target, 0o640)
+        os.utime(target, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+
+        session = BackupManager(tmp_path).create_session("binary")
+        session.backup_file(target)
+        target.write_bytes(b"changed")
+        os.chmod(target, 0o600)
+
+        assert session.rollback() is True
+        assert target.read_bytes() == data
+        assert target.stat().st_mode & 0o777 == 0o640
+        assert target.stat().st_mtime_ns == 1_600_000_000_000_000_000
+
+    def test_rollback_of_legacy_plain_copy(self, tmp_path):
+        manager = BackupManager(tmp_path)
+        session = manager.create_session("legacy")
+        legacy_copy = session.session_dir / "config.txt"
+        legacy_copy.write_text("original")
+        session.manifest.entries.append(
+            BackupEntry(
+                original_path="config.txt",
+                backup_path=str(legacy_copy),
+                file_hash="d41d8cd98f00b204e9800998ecf8427e",
+                backed_up_at="2024-01-01",
+            )
+        )
+        (tmp_path / "config.txt").write_text("modified")
+
+        assert session.rollback() is True
+        assert (tmp_path / "config.txt").read_text() == "original"
+
+    def test_garbage_collection_keeps_referenced_objects(self, tmp_path):
+        (tmp_path / "keep.txt").write_text("keep")
+        (tmp_path / "drop.txt").write_text("drop")
+        manager = BackupManager(tmp_path)
+        old = BackupSession(manager, "old")
+        old.backup_file(tmp_path / "drop.txt")
+        new = BackupSession(manager, "new")
+        new.backup_file(tmp_path / "keep.txt")
+        shutil.rmtree(old.session_dir)
+
+        assert manager.collect_garbage() == 0  # still within the grace period
+        assert manager.collect_garbage(grace_seconds=0) == 1
+        assert len(self._objects(manager)) == 1
+
+        (tmp_path / "keep.txt").write_text("changed")
+        assert manager.rollback_session("new") is True
+        assert (tmp_path / "keep.txt").read_text() == "keep"
+
+    def test_garbage_collection_during_backup_keeps_reused_objects(
+        self, tmp_path, monkeypatch
+    ):
+        (tmp_path / "a.txt").write_text("a")
+        manager = BackupManager(tmp_path)
+        old = BackupSession(manager, "old")
+        old.backup_file(tmp_path / "a.txt")
+        shutil.rmtree(old.session_dir)
+        (stored,) = self._objects(manager)
+        two_hours_ago = time.time() - 7200
+        os.utime(stored, (two_hours_ago, two_hours_ago))
+
+        # Another process collects garbage after the in-flight backup reused
+        # the object but before its manifest is written
+        session = BackupSession(manager, "in-flight")
+        save_manifest = session._save_manifest
+        collected = []
+        monkeypatch.setattr(
+            session,
+            "_save_manifest",
+            lambda: collected.append(manager.collect_garbage()) or save_manifest(),
+        )
+        session.backup_directory(tmp_path)
+
+        assert collected == [0]
+        (tmp_path / "a.txt").write_text("changed")
+        assert manager.rollback_session("in-flight") is True
+        assert (tmp_path / "a.txt").read_text() == "a"
+
+    def test_garbage_collection_aborts_on_unreadable_manifest(self, tmp_path):
+        (tmp_path / "a.txt").write_text("a")
+        manager = BackupManager(tmp_path)
+        manager.create_session("one").backup_file(tmp_path / "a.txt")
+        broken = manager.backup_root / "broken"
+        broken.mkdir()
+        (broken / "manifest.json").write_text("{not json")
+
+        assert manager.collect_garbage(grace_seconds=0) == 0
+        assert len(self._objects(manager)) == 1
@@ -0,0 +1,139 @@
+"""
+Unit tests for scripts/api/broadcaster.py
+
+Uses in-memory fake websockets to check that slow and dead clients are
+isolated, backlogs are bounded and coalesced, and that the thought stream
+polls once for all subscribers.
+"""
+
+import asyncio
+
+from scripts.api.broadcaster import Broadcaster, ThoughtStream
+
+
+class FakeSocket:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.received = []
+        self.closed = False
+
+    async def send_json(self, message):
+        if self.fail:
+            raise ConnectionResetError("gone")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received.append(message)
+
+    async def close(self):
+        self.closed = True
+
+
+async def _until(condition, timeout=5.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition() and loop.time() < deadline:
+        await asyncio.sleep(0.01)
+    return condition()
+
+
+class TestBroadcaster:
+    """Tests for the per-client queued broadcaster."""
+
+    async def test_fans_out_in_order_to_hundreds_of_clients(self):
+        broadcaster = Broadcaster()
+        sockets = [FakeSocket() for _ in range(300)]
+        for ws in sockets:
+            await broadcaster.register(ws)
+
+        for i in range(20):
+            broadcaster.publish({"n": i})
+        assert await _until(lambda: broadcaster.stats()["sent"] == 300 * 20)
+
+        expected = [{"n": i} for i in range(20)]
+        assert all(ws.received == expected for ws in sockets)
+
+    async def test_slow_client_does_not_stall_others(self):
+        broadcaster = Broadcaster(queue_size=5, send_timeout=30)
+        slow = FakeSocket(delay=10)
+        fast = [FakeSocket() for _ in range(50)]
+        await broadcaster.register(slow)
+        for ws in fast:
+            await broadcaster.register(ws)
+
+        for i in range(10):
+            broadcaster.publish({"n": i})
+            await asyncio.sleep(0.01)
+
+        assert await _until(lambda: all(len(ws.received) == 10 for ws in fast))
+        assert len(slow.received) == 0
+        # One message is in flight to the slow client and the 5 newest wait
+        assert broadcaster.stats()["dropped"] == 4
+        await broadcaster.unregister(slow)
+
+    async def test_dead_and_timed_out_clients_are_evicted(self):
+        broadcaster = Broadcaster(send_timeout=0.05)
+        dead = FakeSocket(fail=True)
+        hung = FakeSocket(delay=10)
+        alive = FakeSocket()
+        for ws in (dead, hung, alive):
+            await broadcaster.register(ws)
+
+        broadcaster.publish({"n": 1})
+        await asyncio.sleep(0.2)
+        broadcaster.publish({"n": 2})
+        await _until(lambda: len(alive.received) == 2)
+
+        assert len(broadcaster) == 1
+        assert dead.closed and hung.closed
+        assert alive.received == [{"n": 1}, {"n": 2}]
+        assert broadcaster.stats()["evicted"] == 2
+
+    async def test_keyed_messages_coalesce_while_pending(self):
+        broadcaster = Broadcaster()
+        ws = FakeSocket(delay=0.05)
+        await broadcaster.register(ws)
+
+        broadcaster.publish({"first": True})
+        await asyncio.sleep(0)  # writer picks up the first message
+        for i in range(5):
+            broadcaster.publish({"v": i}, key="state")
+        await _until(lambda: len(ws.received) == 2)
+        await asyncio.sleep(0.1)
+
+        assert ws.received == [{"first": True}, {"v": 4}]
+        await broadcaster.unregister(ws)
+
+
+class TestThoughtStream:
+    """Tests for the shared thought-stream poller."""
+
+    async def test_one_poll_loop_for_all_subscribers(self):
+        batches = [[{"id": "a"}, {"id": "b"}], [{"id": "b"}, {"id": "c"}]]
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return batches[min(len(calls), len(batches)) - 1]
+
+        stream = ThoughtStream(fetch, interval=0.05, replay=2)
+        first, second = FakeSocket(), FakeSocket()
+        await stream.subscribe(first)
+        await stream.subscribe(second)
+        await asyncio.sleep(0.12)
+
+        polls = stream.polls
+        assert polls == len(calls) <= 4
+        for ws in (first, second):
+            assert [m["id"] for m in ws.received] == ["a", "b", "c"]
+
+        late = FakeSocket()
+        await stream.subscribe(late)
+        await asyncio.sleep(0.01)
+        assert [m["id"] for m in late.received] == ["b", "c"]
+
+        for ws in (first, second, late):
+            await stream.unsubscribe(ws)
+        await asyncio.sleep(0.1)
+        assert stream.polls == len(calls)
+        assert stream._task is None
@@ -10,6 +10,7 @@ Tests cover:
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -21,6 +22,7 @@ from graphlib import CycleError
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from scripts.validation.dependency_validator import (
+    DEFAULT_CACHE_PATH,
     DependencyValidator,
     DependencyNode,
     DependencyEdge,
@@ -924,6 +926,36 @@ class TestDependencyValidatorDetectCycles:
         # EXTENDS edges should create cycles
         assert len(cycles) > 0
 
+    def test_detect_cycles_reports_every_cycle(self, tmp_path):
+        """All independent cycles are returned in one call, as closed walks."""
+        validator = DependencyValidator(tmp_path)
+        for from_node, to_node in [
+            ("a", "b"),
+            ("b", "a"),
+            ("c", "d"),
+            ("d", "e"),
+            ("e", "c"),
+            ("e", "f"),
+            ("x", "x"),
+        ]:
+            validator.edges.append(
+                DependencyEdge(from_node, to_node, EdgeType.REQUIRES)
+            )
+
+        cycles = validator.detect_cycles()
+
+        assert cycles == [["a", "b", "a"], ["c", "d", "e", "c"], ["x", "x"]]
+
+    def test_detect_cycles_deep_chain(self, tmp_path):
+        """Long acyclic chains do not hit the recursion limit."""
+        validator = DependencyValidator(tmp_path)
+        for i in range(5000):
+            validator.edges.append(
+                DependencyEdge(f"n:{i}", f"n:{i + 1}", EdgeType.REQUIRES)
+            )
+
+        assert validator.detect_cycles() == []
+
 
 class TestDependencyValidatorFindBrokenRefs:
     """Tests for find_broken_refs method."""
@@ -1568,3 +1600,72 @@ class TestDependencyValidatorScanArtifacts:
         assert validator._adjacency != {}
         assert "knowledge:file1.json" in validator._adjacency
         assert "knowledge:file2.json" in validator._adjacency["knowledge:file1.json"]
+
+
+class TestDependencyValidatorScanCache:
+    """Tests for the persisted per-file scan cache."""
+
+    @pytest.fixture
+    def factory(self, tmp_path):
+        skill_dir = tmp_path / ".agent" / "skills" / "alpha"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: alpha\nskills: [beta]\n---\n# Alpha"
+        )
+        bp_dir = tmp_path / ".agent" / "blueprints" / "bp"
+        bp_dir.mkdir(parents=True)
+        (bp_dir / "blueprint.json").write_text(
+            json.dumps(
+                {
+                    "metadata": {"version": "1.0.0"},
+                    "agents": [{"patternId": "reviewer"}],
+                    "knowledge": ["a.json", {"filename": "b.json"}],
+                }
+            )
+        )
+        return tmp_path
+
+    def _scan(self, root):
+        validator = DependencyValidator(root, cache_path=DEFAULT_CACHE_PATH)
+        validator.scan_artifacts()
+        return validator
+
+    def test_unchanged_files_are_not_parsed_again(self, factory):
+        first = self._scan(factory)
+        assert first.cache_stats == {"reused": 0, "parsed": 2}
+        assert (factory / DEFAULT_CACHE_PATH).exists()
+
+        second = self._scan(factory)
+        assert second.cache_stats == {"reused": 2, "parsed": 0}
+        assert second.export_graph() == first.export_graph()
+        assert "blueprint:bp" in second.nodes
+
+    def test_changed_file_is_rescanned(self, factory):
+        self._scan(factory)
+        skill_file = factory / ".agent" / "skills" / "alpha" / "SKILL.md"
+        skill_file.write_text("---\nname: alpha\nskills: [gamma, delta]\n---\n")
+
+        validator = self._scan(factory)
+
+        assert validator.cache_stats == {"reused": 1, "parsed": 1}
+        assert validator.reverse_lookup("skill:gamma") == {"skill:alpha"}
+        assert validator.reverse_lookup("skill:beta") == set()
+
+    def test_touched_file_with_same_content_is_reused(self, factory):
+        self._scan(factory)
+        bp_file = factory / ".agent" / "blueprints" / "bp" / "blueprint.json"
+        st = bp_file.stat()
+        os.utime(bp_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        validator = self._scan(factory)
+
+        assert validator.cache_stats == {"reused": 2, "parsed": 0}
+
+    def test_impact_analysis_cache_follows_new_edges(self, tmp_path):
+        validator = DependencyValidator(tmp_path)
+        validator.edges.append(DependencyEdge("a", "b", EdgeType.REQUIRES))
+        validator._build_adjacency()
+        assert validator.impact_analysis("b") == {"a"}
+
+        validator.edges.append(DependencyEdge("c", "a", EdgeType.REQUIRES))
+        assert validator.impact_analysis("b") == {"a", "c"}
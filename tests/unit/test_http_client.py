@@ -0,0 +1,236 @@
+"""
+Unit tests for scripts/adapters/http_client.py
+
+Runs the shared HttpClient against a local stub HTTP server to check the
+on-disk conditional-request cache, retry backoff, per-host connection
+limits and adapter integration without network access.
+"""
+
+import asyncio
+import socket
+
+import pytest
+
+web = pytest.importorskip("aiohttp.web")
+
+from scripts.adapters.base_adapter import AdapterConfig  # noqa: E402
+from scripts.adapters.http_client import HttpClient  # noqa: E402
+from scripts.adapters.pypi_adapter import PyPIAdapter  # noqa: E402
+
+
+class StubServer:
+    """State and request log of the stub upstream server."""
+
+    def __init__(self):
+        self.url = ""
+        self.version = 1
+        self.failures = 0
+        self.hits = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def count(self, name):
+        self.hits[name] = self.hits.get(name, 0) + 1
+
+    async def etag(self, request):
+        self.count("etag")
+        etag = f'"v{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(
+            {"version": self.version, "q": request.query.get("q")},
+            headers={"ETag": etag},
+        )
+
+    async def modified(self, request):
+        self.count("modified")
+        stamp = "Wed, 01 Jan 2025 00:00:00 GMT"
+        if request.headers.get("If-Modified-Since") == stamp:
+            return web.Response(status=304)
+        return web.json_response({"ok": True}, headers={"Last-Modified": stamp})
+
+    async def plain(self, request):
+        self.count("plain")
+        return web.json_response({"ok": True})
+
+    async def flaky(self, request):
+        self.count("flaky")
+        if self.failures > 0:
+            self.failures -= 1
+            return web.Response(status=503, headers={"Retry-After": "0"})
+        return web.json_response({"ok": True})
+
+    async def slow(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        return web.json_response({"ok": True})
+
+    async def pypi(self, request):
+        self.count("pypi")
+        etag = '"fastapi-1"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(
+            {"info": {"name": request.match_info["name"], "version": "0.115.0"}},
+            headers={"ETag": etag},
+        )
+
+
+@pytest.fixture
+async def stub_server():
+    """Serve a StubServer on an ephemeral localhost port."""
+    stub = StubServer()
+    app = web.Application()
+    app.router.add_get("/etag", stub.etag)
+    app.router.add_get("/modified", stub.modified)
+    app.router.add_get("/plain", stub.plain)
+    app.router.add_get("/flaky", stub.flaky)
+    app.router.add_get("/slow/{n}", stub.slow)
+    app.router.add_get("/pypi/{name}/json", stub.pypi)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    stub.url = f"http://127.0.0.1:{port}"
+    yield stub
+    await runner.cleanup()
+
+
+async def _get_json(http, url, **kwargs):
+    async with http.view({"Accept": "application/json"}).get(url, **kwargs) as resp:
+        return resp.status, await resp.json(), resp.from_cache
+
+
+class TestConditionalCache:
+    """Tests for the persistent ETag / Last-Modified cache."""
+
+    async def test_etag_revalidated_across_clients(self, stub_server, tmp_path):
+        url = f"{stub_server.url}/etag"
+        async with HttpClient(cache_dir=tmp_path) as http:
+            assert await _get_json(http, url) == (200, {"version": 1, "q": None}, False)
+
+        # A new client (as in the next aggregator run) reuses the disk cache
+        async with HttpClient(cache_dir=tmp_path) as http:
+            assert await _get_json(http, url) == (200, {"version": 1, "q": None}, True)
+            assert http.stats["not_modified"] == 1
+            assert http.stats["fetched"] == 0
+
+        assert stub_server.hits["etag"] == 2
+
+    async def test_changed_upstream_refreshes_entry(self, stub_server, tmp_path):
+        url = f"{stub_server.url}/etag"
+        async with HttpClient(cache_dir=tmp_path) as http:
+            await _get_json(http, url)
+            stub_server.version = 2
+            assert await _get_json(http, url) == (200, {"version": 2, "q": None}, False)
+            assert await _get_json(http, url) == (200, {"version": 2, "q": None}, True)
+
+    async def test_params_are_part_of_the_key(self, stub_server, tmp_path):
+        url = f"{stub_server.url}/etag"
+        async with HttpClient(cache_dir=tmp_path) as http:
+            await _get_json(http, url, params={"q": "a"})
+            status, data, from_cache = await _get_json(http, url, params={"q": "b"})
+
+        assert (data["q"], from_cache) == ("b", False)
+
+    async def test_last_modified_revalidation(self, stub_server, tmp_path):
+        url = f"{stub_server.url}/modified"
+        async with HttpClient(cache_dir=tmp_path) as http:
+            await _get_json(http, url)
+            assert await _get_json(http, url) == (200, {"ok": True}, True)
+
+    async def test_responses_without_validators_are_not_cached(
+        self, stub_server, tmp_path
+    ):
+        url = f"{stub_server.url}/plain"
+        async with HttpClient(cache_dir=tmp_path) as http:
+            await _get_json(http, url)
+            assert (await _get_json(http, url))[2] is False
+
+        assert not list(tmp_path.iterdir())
+
+    async def test_cache_can_be_disabled(self, stub_server, tmp_path):
+        url = f"{stub_server.url}/etag"
+        async with HttpClient(cache_dir=None) as http:
+            await _get_json(http, url)
+            assert (await _get_json(http, url))[2] is False
+
+
+class TestRetries:
+    """Tests for backoff on failing upstreams."""
+
+    async def test_retries_server_errors_then_succeeds(self, stub_server, tmp_path):
+        stub_server.failures = 2
+        async with HttpClient(cache_dir=tmp_path, backoff_base=0.01) as http:
+            status, data, _ = await _get_json(http, f"{stub_server.url}/flaky")
+
+            assert (status, data) == (200, {"ok": True})
+            assert http.stats["retries"] == 2
+        assert stub_server.hits["flaky"] == 3
+
+    async def test_gives_up_after_max_retries(self, stub_server, tmp_path):
+        stub_server.failures = 10
+        async with HttpClient(
+            cache_dir=tmp_path, max_retries=2, backoff_base=0.01
+        ) as http:
+            async with http.view().get(f"{stub_server.url}/flaky") as resp:
+                assert resp.status == 503
+        assert stub_server.hits["flaky"] == 3
+
+    async def test_connection_errors_are_retried_then_raised(self, tmp_path):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        async with HttpClient(
+            cache_dir=tmp_path, max_retries=1, backoff_base=0.01
+        ) as http:
+            with pytest.raises(Exception):
+                await _get_json(http, f"http://127.0.0.1:{port}/")
+            assert (http.stats["requests"], http.stats["errors"]) == (2, 1)
+
+    def test_backoff_prefers_retry_after(self, tmp_path):
+        http = HttpClient(cache_dir=tmp_path, backoff_base=0.5)
+
+        assert [http._backoff(n) for n in range(3)] == [0.5, 1.0, 2.0]
+        assert http._backoff(0, "7") == 7.0
+        assert http._backoff(10) == 30.0
+
+
+class TestPooling:
+    """Tests for the shared pooled session."""
+
+    async def test_per_host_limit(self, stub_server, tmp_path):
+        async with HttpClient(cache_dir=tmp_path, limit_per_host=3) as http:
+            await asyncio.gather(
+                *(_get_json(http, f"{stub_server.url}/slow/{n}") for n in range(12))
+            )
+
+        assert stub_server.max_in_flight == 3
+
+
+class TestAdapterIntegration:
+    """Tests for adapters attached to a shared client."""
+
+    async def test_adapter_requests_go_through_shared_cache(
+        self, stub_server, tmp_path
+    ):
+        adapter = PyPIAdapter(AdapterConfig())
+        adapter.API_BASE_URL = f"{stub_server.url}/pypi"
+
+        for expected_not_modified in (0, 1):
+            async with HttpClient(cache_dir=tmp_path) as http:
+                adapter.use_http_client(http)
+                info = await adapter._get_package_info("fastapi")
+                await adapter._close_session()  # leaves the pooled session open
+                assert info["info"]["version"] == "0.115.0"
+                assert http.stats["not_modified"] == expected_not_modified
+                assert http._session is not None and not http._session.closed
+
+        adapter.use_http_client(None)
+        assert adapter._http is None
+        assert stub_server.hits["pypi"] == 2
@@ -0,0 +1,162 @@
+"""
+Unit tests for scripts/analysis/knowledge_index.py
+
+Tests for the Aho-Corasick matcher and the persisted KnowledgeIndex.
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.analysis import knowledge_index
+from scripts.analysis.knowledge_gap_analyzer import KnowledgeGapAnalyzer
+from scripts.analysis.knowledge_index import AhoCorasick, KnowledgeIndex
+
+
+@pytest.fixture(params=["python", "pyahocorasick"])
+def backend(request, monkeypatch):
+    """Run matcher tests against both automaton implementations."""
+    if request.param == "python":
+        monkeypatch.setattr(knowledge_index, "AHOCORASICK_AVAILABLE", False)
+    elif not knowledge_index.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    return request.param
+
+
+class TestAhoCorasick:
+    """Tests for the multi-pattern matcher."""
+
+    def test_counts_match_str_count(self, backend):
+        """Counts equal str.count, including overlapping and nested patterns."""
+        rng = random.Random(7)
+        patterns = ["a", "aa", "aba", "ab", "bab", "b a", "abab"]
+        matcher = AhoCorasick(patterns)
+
+        for _ in range(200):
+            text = "".join(rng.choice("ab ") for _ in range(rng.randint(0, 40)))
+            counts = matcher.count(text)
+            for pattern in patterns:
+                assert counts.get(pattern, 0) == text.count(pattern), (text, pattern)
+
+    def test_first_positions(self, backend):
+        matcher = AhoCorasick(["fast", "api", "fastapi"])
+
+        assert matcher.first_positions("use fastapi for apis") == {
+            "fast": 4,
+            "fastapi": 4,
+            "api": 8,
+        }
+
+    def test_empty_patterns(self, backend):
+        assert AhoCorasick([]).count("anything") == {}
+
+
+class TestKnowledgeIndex:
+    """Tests for the persisted keyword index."""
+
+    @pytest.fixture
+    def knowledge_dir(self, tmp_path):
+        kdir = tmp_path / "knowledge"
+        kdir.mkdir()
+        (kdir / "api.json").write_text(
+            json.dumps(
+                {
+                    "description": "FastAPI patterns for APIs",
+                    "code_example": "app = FastAPI()",
+                    "best_practices": ["Use dependency injection"],
+                }
+            ),
+            encoding="utf-8",
+        )
+        (kdir / "db.json").write_text(
+            json.dumps({"description": "Database migrations", "notes": None}),
+            encoding="utf-8",
+        )
+        return kdir
+
+    def _analyzer(self, knowledge_dir, index_path):
+        analyzer = KnowledgeGapAnalyzer(knowledge_dir, index_path=index_path)
+        analyzer._load_knowledge_files({"fastapi", "migrations", "injection"})
+        return analyzer
+
+    def test_postings_and_flags(self, knowledge_dir, tmp_path):
+        analyzer = self._analyzer(knowledge_dir, tmp_path / "index.json")
+        index = analyzer._index
+
+        assert index.postings("fastapi") == {"api.json": 2}
+        assert index.postings("migrations") == {"db.json": 1}
+        assert index.files["api.json"].has_code_example is True
+        assert index.files["db.json"].has_code_example is False
+        assert index.evidence("api.json", ["FastAPI"]) == "FastAPI patterns for APIs"
+
+    def test_evidence_matches_extract_evidence(self, knowledge_dir, tmp_path):
+        analyzer = self._analyzer(knowledge_dir, None)
+        content = analyzer._knowledge_cache["api.json"]
+
+        for keywords in (["injection"], ["Injection", "fastapi"], ["missing"]):
+            analyzer._index.ensure_terms(
+                {k.lower() for k in keywords},
+                analyzer._knowledge_cache,
+                analyzer._flatten_content,
+            )
+            assert analyzer._index.evidence(
+                "api.json", keywords
+            ) == analyzer._extract_evidence(content, keywords)
+
+    def test_persisted_entries_are_reused_until_modified(self, knowledge_dir, tmp_path):
+        index_path = tmp_path / "index.json"
+        self._analyzer(knowledge_dir, index_path)
+        assert index_path.exists()
+
+        reloaded = KnowledgeIndex(index_path)
+        assert reloaded.add_file("api.json", knowledge_dir / "api.json") is True
+
+        db_file = knowledge_dir / "db.json"
+        db_file.write_text(json.dumps({"description": "Schema migrations x2"}))
+        assert reloaded.add_file("db.json", db_file) is False
+
+        analyzer = self._analyzer(knowledge_dir, index_path)
+        assert analyzer._index.postings("migrations") == {"db.json": 1}
+        assert analyzer._index.files["db.json"].snippets["migrations"]
+
+    def test_new_keywords_are_indexed_on_demand(self, knowledge_dir, tmp_path):
+        analyzer = self._analyzer(knowledge_dir, tmp_path / "index.json")
+
+        assert analyzer._index.postings("database") == {}
+        analyzer._index.ensure_terms(
+            {"database"}, analyzer._knowledge_cache, analyzer._flatten_content
+        )
+        assert analyzer._index.postings("database") == {"db.json": 1}
+
+    def test_one_automaton_per_ensure_terms_call(
+        self, knowledge_dir, tmp_path, monkeypatch
+    ):
+        analyzer = self._analyzer(knowledge_dir, tmp_path / "index.json")
+        index = analyzer._index
+        # db.json has not been indexed for "fastapi" under a fresh entry
+        index.files["db.json"].scanned = False
+        index.files["db.json"].terms = set()
+
+        built = []
+
+        class CountingAhoCorasick(AhoCorasick):
+            def __init__(self, patterns):
+                built.append(set(patterns))
+                super().__init__(patterns)
+
+        monkeypatch.setattr(knowledge_index, "AhoCorasick", CountingAhoCorasick)
+        index.ensure_terms(
+            {"fastapi", "database"},
+            analyzer._knowledge_cache,
+            analyzer._flatten_content,
+        )
+
+        assert built == [{"fastapi", "database"}]
+        assert index.postings("fastapi") == {"api.json": 2}
+        assert index.postings("database") == {"db.json": 1}
@@ -8,13 +8,23 @@ Tests cover:
 - Antigravityrules generation with variable substitution- File writing and tracking
 """
 
+import json
 import sys
 from pathlib import Path
 
+import pytest
+import yaml
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from scripts.core.generate_project import ProjectGenerator  # noqa: E402
+from scripts.core.generate_project import (  # noqa: E402
+    BATCH_SUMMARY_FILENAME,
+    ProjectGenerator,
+    clear_file_cache,
+    generate_batch,
+    load_json_cached,
+)
 
 
 class TestProjectGeneratorInit:
@@ -349,3 +359,107 @@ class TestFullGeneration:
 
         for file_path in result["files_created"]:
             assert Path(file_path).exists()
+
+    def test_generate_writes_through_plan(self, sample_generator, tmp_path):
+        """Files are emitted by the write pool; debug output is one flush."""
+        sample_generator.debug_log.path = tmp_path / "debug.log"
+        sample_generator.write_workers = 4
+
+        result = sample_generator.generate()
+
+        assert result["success"]
+        assert sample_generator._plan is None
+        assert len(result["files_created"]) == len(set(result["files_created"]))
+        assert "[DEBUG] Project: test-project" in (tmp_path / "debug.log").read_text()
+
+    def test_failed_generation_writes_nothing(
+        self, sample_generator, temp_output_dir, monkeypatch
+    ):
+        def fail(blueprint):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(sample_generator, "_generate_workflows", fail)
+        sample_generator.debug_log.path = temp_output_dir / "debug.log"
+
+        result = sample_generator.generate()
+
+        assert result["success"] is False
+        assert result["files_created"] == []
+        assert not (temp_output_dir / ".agentrules").exists()
+
+
+class TestFileCache:
+    """Tests for the process-wide factory file cache."""
+
+    def test_json_parsed_once_until_modified(self, tmp_path):
+        clear_file_cache()
+        path = tmp_path / "pattern.json"
+        path.write_text('{"a": 1}', encoding="utf-8")
+
+        first = load_json_cached(path)
+        assert load_json_cached(path) is first
+
+        path.write_text('{"a": 22}', encoding="utf-8")
+        assert load_json_cached(path) == {"a": 22}
+
+    def test_patterns_shared_between_generators(self, sample_config, temp_output_dir):
+        first = ProjectGenerator(sample_config, str(temp_output_dir))
+        second = ProjectGenerator(sample_config, str(temp_output_dir))
+
+        assert first._load_pattern("agents", "code-reviewer") is (
+            second._load_pattern("agents", "code-reviewer")
+        )
+
+
+class TestBatchGeneration:
+    """Tests for generate_batch()."""
+
+    @pytest.fixture(autouse=True)
+    def no_registry(self, monkeypatch):
+        """Keep batch projects out of the bundled dashboards database."""
+        monkeypatch.setattr(
+            "scripts.core.generate_project.DB_AVAILABLE", False, raising=False
+        )
+
+    @pytest.fixture
+    def config_files(self, tmp_path, sample_config_dict):
+        paths = []
+        for i, suffix in enumerate([".json", ".yaml", ".json"]):
+            data = dict(sample_config_dict, project_name=f"batch-{i % 2}")
+            path = tmp_path / "configs" / f"team{i}{suffix}"
+            path.parent.mkdir(exist_ok=True)
+            if suffix == ".yaml":
+                path.write_text(yaml.safe_dump(data), encoding="utf-8")
+            else:
+                path.write_text(json.dumps(data), encoding="utf-8")
+            paths.append(str(path))
+        return paths
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_generates_every_config(self, config_files, tmp_path, workers):
+        out = tmp_path / "out"
+        summary = generate_batch(config_files, str(out), workers=workers)
+
+        assert summary["succeeded"] == 3
+        assert summary["failed"] == 0
+        names = [Path(p["target_dir"]).name for p in summary["projects"]]
+        assert names == ["batch-0", "batch-1", "batch-0-team2"]
+        for project in summary["projects"]:
+            assert (Path(project["target_dir"]) / ".agentrules").exists()
+            assert project["seconds"] >= 0
+
+        written = json.loads((out / BATCH_SUMMARY_FILENAME).read_text())
+        assert written["succeeded"] == 3
+        assert len(written["projects"]) == 3
+
+    def test_unreadable_config_is_reported(self, config_files, tmp_path):
+        broken = tmp_path / "broken.json"
+        broken.write_text("{not json", encoding="utf-8")
+
+        summary = generate_batch(
+            [str(broken), config_files[0]], str(tmp_path / "out"), workers=1
+        )
+
+        assert summary["succeeded"] == 1
+        assert summary["failed"] == 1
+        assert "Error loading configuration" in summary["projects"][0]["errors"][0]
@@ -460,3 +460,83 @@ class TestMainEntry:
 
             assert "test-agent" in summary
             assert ".agentrules: Yes" in summary
+
+
+class TestRepoFingerprint:
+    """Tests for the single-walk repository fingerprint."""
+
+    def test_walk_prunes_dependency_and_virtualenv_dirs(self, tmp_path):
+        """Test that vendored and virtualenv files do not count as languages."""
+        (tmp_path / "main.py").write_text("print('hi')")
+        (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+        (tmp_path / "node_modules" / "lib" / "index.js").write_text("")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "hook.rb").write_text("")
+        venv = tmp_path / "my-env"
+        (venv / "lib").mkdir(parents=True)
+        (venv / "pyvenv.cfg").write_text("home = /usr/bin")
+        (venv / "lib" / "tool.go").write_text("")
+
+        analyzer = RepoAnalyzer(tmp_path)
+        inventory = analyzer.analyze()
+
+        assert inventory.tech_stack.languages == ["python"]
+        assert analyzer.fingerprint.extension_counts == {".py": 1}
+
+    def test_build_dirs_pruned_only_when_gitignored(self, tmp_path):
+        """Test that bin/ and build/ are walked unless .gitignore lists them."""
+        (tmp_path / "main.py").write_text("")
+        for rel in ("bin/tool.go", "build/gen.rs", "src/dist/lib.rb", "target/x.kt"):
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("")
+
+        analyzer = RepoAnalyzer(tmp_path)
+        analyzer.analyze()
+        assert set(analyzer.fingerprint.extension_counts) == {
+            ".py",
+            ".go",
+            ".rs",
+            ".rb",
+            ".kt",
+        }
+
+        (tmp_path / ".gitignore").write_text(
+            "# output\n/build/\ndist\ntarget/**\n!bin\n"
+        )
+        analyzer = RepoAnalyzer(tmp_path)
+        analyzer.analyze()
+        assert set(analyzer.fingerprint.extension_counts) == {".py", ".go"}
+
+    def test_manifest_inventory_feeds_dotnet_detection(self, tmp_path):
+        """Test that nested .csproj files are found without another walk."""
+        project = tmp_path / "src" / "Api"
+        project.mkdir(parents=True)
+        (project / "Api.csproj").write_text(
+            '<Project Sdk="Microsoft.NET.Sdk.Web">'
+            '<PackageReference Include="Microsoft.AspNetCore.OpenApi" />'
+            "</Project>"
+        )
+        (project / "Program.cs").write_text("")
+        (tmp_path / "App.sln").write_text("")
+
+        analyzer = RepoAnalyzer(tmp_path)
+        inventory = analyzer.analyze()
+
+        assert analyzer.fingerprint.manifests["*.csproj"] == ["src/Api/Api.csproj"]
+        assert analyzer.fingerprint.manifests["*.sln"] == ["App.sln"]
+        assert {"dotnet", "aspnet"} <= set(inventory.tech_stack.frameworks)
+        assert inventory.tech_stack.suggested_blueprint == "csharp-dotnet"
+
+    def test_walk_respects_file_budget(self, tmp_path):
+        """Test that a budgeted walk stops and keeps shallow evidence."""
+        (tmp_path / "main.py").write_text("")
+        deep = tmp_path / "a" / "b"
+        deep.mkdir(parents=True)
+        for i in range(20):
+            (deep / f"f{i}.rs").write_text("")
+
+        analyzer = RepoAnalyzer(tmp_path, max_scan_files=1)
+        analyzer.analyze()
+
+        assert analyzer.fingerprint.truncated is True
+        assert analyzer.fingerprint.extension_counts == {".py": 1}
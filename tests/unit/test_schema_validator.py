@@ -0,0 +1,122 @@
+"""
+Unit tests for scripts/validation/schema_validator.py
+
+Tests for compiled validator reuse, parallel validation ordering and the
+incremental validation cache.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.validation import schema_validator
+from scripts.validation.schema_validator import (
+    get_validator,
+    validate_all,
+    validate_data,
+)
+
+AGENT_SCHEMA = {
+    "type": "object",
+    "required": ["name"],
+    "properties": {"name": {"type": "string"}},
+}
+
+
+@pytest.fixture
+def artifact_tree(tmp_path, monkeypatch):
+    """A minimal factory with one schema and a handful of agents."""
+    schemas_dir = tmp_path / "schemas"
+    schemas_dir.mkdir()
+    (schemas_dir / "agent.schema.json").write_text(json.dumps(AGENT_SCHEMA))
+
+    agents_dir = tmp_path / ".agent" / "agents"
+    agents_dir.mkdir(parents=True)
+    for i in range(6):
+        (agents_dir / f"agent-{i}.md").write_text(f"---\nname: agent-{i}\n---\nBody\n")
+    (agents_dir / "broken.md").write_text("---\ndescription: no name\n---\n")
+
+    monkeypatch.setattr(schema_validator, "ROOT", tmp_path)
+    monkeypatch.setattr(schema_validator, "SCHEMAS_DIR", schemas_dir)
+    monkeypatch.setattr(
+        schema_validator, "ARTIFACT_DIRS", {"agent": agents_dir, "knowledge": tmp_path}
+    )
+    return tmp_path
+
+
+def _rows(report):
+    return [(r.path, r.valid, r.errors) for r in report.results]
+
+
+class TestCompiledValidators:
+    """Tests for per-schema validator reuse."""
+
+    def test_validator_is_reused_per_schema(self):
+        schema = dict(AGENT_SCHEMA)
+
+        assert get_validator(schema) is get_validator(schema)
+        assert get_validator(dict(AGENT_SCHEMA)) is not get_validator(schema)
+
+    def test_validate_data_reports_paths(self):
+        errors = validate_data({"name": 3}, AGENT_SCHEMA)
+
+        assert errors == ["name: 3 is not of type 'string'"]
+
+
+class TestValidateAll:
+    """Tests for parallel and incremental validation."""
+
+    def test_parallel_matches_serial_order(self, artifact_tree):
+        serial = validate_all(types=["agent"])
+        parallel = validate_all(types=["agent"], workers=2)
+
+        assert _rows(parallel) == _rows(serial)
+        assert serial.passed == 6 and serial.failed == 1
+
+    def test_incremental_skips_unchanged_passing_files(self, artifact_tree):
+        cache_path = artifact_tree / "cache.json"
+        first = validate_all(types=["agent"], cache_path=cache_path)
+        second = validate_all(types=["agent"], cache_path=cache_path)
+
+        assert first.cached == 0
+        assert second.cached == 6  # the failing file is always re-validated
+        assert _rows(second) == _rows(first)
+
+    def test_incremental_revalidates_changed_content(self, artifact_tree):
+        cache_path = artifact_tree / "cache.json"
+        validate_all(types=["agent"], cache_path=cache_path)
+
+        agent = artifact_tree / ".agent" / "agents" / "agent-0.md"
+        agent.write_text("---\nname: 42\n---\n")
+        report = validate_all(types=["agent"], cache_path=cache_path)
+
+        failed = [r.path for r in report.results if not r.valid]
+        assert str(Path(".agent/agents/agent-0.md")) in failed
+        assert report.cached == 5
+
+    def test_incremental_hits_on_hash_after_touch(self, artifact_tree):
+        cache_path = artifact_tree / "cache.json"
+        validate_all(types=["agent"], cache_path=cache_path)
+
+        for path in (artifact_tree / ".agent" / "agents").glob("*.md"):
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        assert validate_all(types=["agent"], cache_path=cache_path).cached == 6
+
+    def test_schema_change_invalidates_cache(self, artifact_tree):
+        cache_path = artifact_tree / "cache.json"
+        validate_all(types=["agent"], cache_path=cache_path)
+
+        schema = dict(AGENT_SCHEMA, required=["name", "version"])
+        (artifact_tree / "schemas" / "agent.schema.json").write_text(json.dumps(schema))
+        report = validate_all(types=["agent"], cache_path=cache_path)
+
+        assert report.cached == 0
+        assert report.passed == 0
@@ -425,6 +425,63 @@ class TestTemplateEngineRenderFile:
         assert result == "Hello World!"
 
 
+class TestTemplateEngineCompileCache:
+    """Tests for the compiled-template and bytecode caches."""
+
+    def test_repeated_render_compiles_once(self):
+        """Rendering the same content again reuses the compiled template."""
+        engine = TemplateEngine(template_dirs=[])
+        for name in ("a", "b", "c"):
+            assert engine.render_string("Hi {{ name }}", {"name": name}) == f"Hi {name}"
+
+        stats = engine.get_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["size"] == 1
+
+    def test_legacy_conversion_depends_on_context_keys(self):
+        """A placeholder is only converted when the context provides it."""
+        engine = TemplateEngine(template_dirs=[])
+        template = "{NAME} uses {TOOL}"
+
+        assert engine.render_string(template, {"name": "x"}) == "x uses {TOOL}"
+        assert engine.render_string(template, {"name": "y", "tool": "z"}) == (
+            "y uses z"
+        )
+        assert engine.render_string(template, {"name": "w"}) == "w uses {TOOL}"
+        assert engine.get_cache_stats()["misses"] == 2
+
+    def test_cache_is_bounded(self):
+        engine = TemplateEngine(template_dirs=[], template_cache_size=2)
+        for i in range(5):
+            engine.render_string(f"{i} {{{{ v }}}}", {"v": 1})
+
+        assert engine.get_cache_stats()["size"] == 2
+        engine.clear_cache()
+        assert engine.get_cache_stats() == {
+            "hits": 0,
+            "misses": 0,
+            "bytecode_hits": 0,
+            "compile_seconds": 0.0,
+            "size": 0,
+        }
+
+    def test_bytecode_cache_shared_across_engines(self, temp_template_dir, tmp_path):
+        """A second engine loads bytecode instead of compiling again."""
+        cache_dir = tmp_path / "bytecode"
+        template_file = temp_template_dir / "greeting.tmpl"
+        template_file.write_text("Hello {{NAME}}!")
+
+        first = TemplateEngine([temp_template_dir], bytecode_cache_dir=cache_dir)
+        assert first.render_file(template_file, {"name": "A"}) == "Hello A!"
+        assert first.render("greeting.tmpl", {"NAME": "B"}) == "Hello B!"
+        assert len(list(cache_dir.iterdir())) == 2  # string and loader templates
+
+        second = TemplateEngine([temp_template_dir], bytecode_cache_dir=cache_dir)
+        assert second.render_file(template_file, {"name": "C"}) == "Hello C!"
+        assert second.get_cache_stats()["bytecode_hits"] == 1
+
+
 class TestTemplateEngineAddFilter:
     """Tests for add_filter method."""
 
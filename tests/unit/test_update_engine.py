@@ -34,6 +34,9 @@ mock_adapters_module.get_available_adapters = MagicMock(return_value=[])
 mock_adapters_module.base_adapter = real_base_adapter
 sys.modules["scripts.updates.adapters"] = mock_adapters_module
 sys.modules["scripts.updates.adapters.base_adapter"] = real_base_adapter
+from scripts.adapters import http_client as real_http_client
+
+sys.modules["scripts.updates.adapters.http_client"] = real_http_client
 
 # Mock config_manager module - import the real one but make it available as relative import
 from scripts.core import config_manager as real_config_manager
@@ -880,6 +883,35 @@ class TestSourceAggregatorFetch:
                 # CRITICAL should come first (lower value = higher priority)
                 assert result.updates[0].priority == UpdatePriority.CRITICAL
 
+    @pytest.mark.asyncio
+    async def test_fetch_all_updates_shares_http_client(
+        self, mock_config_manager, mock_adapter, tmp_path
+    ):
+        """Test that adapters share one HTTP client for the run only."""
+        attached = []
+        mock_adapter.name = "github"
+        mock_adapter.use_http_client = Mock(side_effect=attached.append)
+
+        with patch(
+            "scripts.updates.source_aggregator.get_available_adapters",
+            return_value=["github"],
+        ):
+            with patch(
+                "scripts.updates.source_aggregator.create_adapter",
+                return_value=mock_adapter,
+            ):
+                aggregator = SourceAggregator(
+                    config_manager=mock_config_manager,
+                    http_cache_dir=tmp_path / "http",
+                )
+
+                result = await aggregator.fetch_all_updates()
+
+        client, detached = attached
+        assert client.cache.directory == tmp_path / "http"
+        assert detached is None
+        assert result.http_stats["requests"] == 0
+
 
 class TestSourceAggregatorHealth:
     """Tests for source health monitoring."""
@@ -1370,6 +1402,131 @@ class TestUpdateEngineBatch:
         assert batch_result.total_applied == 1
         assert batch_result.total_failed == 1
 
+    def _versioned_update(self, source, target_file, version, extra=None):
+        return KnowledgeUpdate(
+            target_file=target_file,
+            priority=UpdatePriority.MEDIUM,
+            source=source,
+            changes=[],
+            new_version=version,
+            proposed_content={"version": version, **(extra or {})},
+        )
+
+    def test_apply_batch_writes_each_file_once(
+        self, tmp_knowledge_dir, sample_knowledge_file, sample_update_source
+    ):
+        """Test that updates to one file are merged in order and written once."""
+        engine = UpdateEngine(tmp_knowledge_dir)
+        updates = [
+            self._versioned_update(
+                sample_update_source, "test-patterns.json", f"1.{i}.0", {f"k{i}": i}
+            )
+            for i in range(1, 4)
+        ] + [self._versioned_update(sample_update_source, "other.json", "2.0.0")]
+
+        with patch.object(engine, "_write_json", wraps=engine._write_json) as write:
+            batch_result = engine.apply_batch(updates)
+
+        assert batch_result.total_applied == 4
+        assert sorted(c.args[0].name for c in write.call_args_list) == [
+            "other.json",
+            "test-patterns.json",
+        ]
+        assert [r.old_version for r in batch_result.results[:3]] == [
+            "1.0.0",
+            "1.1.0",
+            "1.2.0",
+        ]
+        content = json.loads(sample_knowledge_file.read_text())
+        assert content["version"] == "1.3.0"
+        assert [content[f"k{i}"] for i in range(1, 4)] == [1, 2, 3]
+        assert [e["version"] for e in content["changelog"]] == [
+            "1.3.0",
+            "1.2.0",
+            "1.1.0",
+        ]
+        assert len(engine.list_backups("test-patterns")) == 1
+        assert not list(tmp_knowledge_dir.glob(".*.tmp"))
+
+    def test_apply_batch_invalid_update_skipped_within_file(
+        self, tmp_knowledge_dir, sample_knowledge_file, sample_update_source
+    ):
+        """Test that an invalid update does not block later ones for the file."""
+        engine = UpdateEngine(tmp_knowledge_dir)
+        updates = [
+            self._versioned_update(sample_update_source, "test-patterns.json", "bad"),
+            self._versioned_update(sample_update_source, "test-patterns.json", "1.1.0"),
+        ]
+
+        batch_result = engine.apply_batch(updates)
+
+        assert [r.success for r in batch_result.results] == [False, True]
+        assert batch_result.results[1].old_version == "1.0.0"
+        assert json.loads(sample_knowledge_file.read_text())["version"] == "1.1.0"
+
+    def test_apply_batch_write_failure_leaves_file_intact(
+        self, tmp_knowledge_dir, sample_knowledge_file, sample_update_source
+    ):
+        """Test that a failed write keeps the original file and other files."""
+        engine = UpdateEngine(tmp_knowledge_dir)
+        original = sample_knowledge_file.read_text()
+        real_write = engine._write_json
+
+        def failing_write(path, content):
+            if path == sample_knowledge_file:
+                raise OSError("disk full")
+            real_write(path, content)
+
+        updates = [
+            self._versioned_update(sample_update_source, "test-patterns.json", "1.1.0"),
+            self._versioned_update(sample_update_source, "test-patterns.json", "1.2.0"),
+            self._versioned_update(sample_update_source, "other.json", "2.0.0"),
+        ]
+        with patch.object(engine, "_write_json", side_effect=failing_write):
+            batch_result = engine.apply_batch(updates)
+
+        assert [r.success for r in batch_result.results] == [False, False, True]
+        assert all("disk full" in r.errors[0] for r in batch_result.results[:2])
+        assert sample_knowledge_file.read_text() == original
+        assert (tmp_knowledge_dir / "other.json").exists()
+
+    def test_apply_batch_many_files_concurrently(
+        self, tmp_knowledge_dir, sample_update_source
+    ):
+        """Test a batch spread over many files keeps results in input order."""
+        engine = UpdateEngine(tmp_knowledge_dir)
+        updates = [
+            self._versioned_update(sample_update_source, f"file-{i % 20}.json", v)
+            for i, v in enumerate(f"1.{n}.0" for n in range(60))
+        ]
+
+        batch_result = engine.apply_batch(updates, max_workers=4)
+
+        assert batch_result.total_applied == 60
+        assert [r.target_file for r in batch_result.results] == [
+            u.target_file for u in updates
+        ]
+        for i in range(20):
+            content = json.loads((tmp_knowledge_dir / f"file-{i}.json").read_text())
+            assert content["version"] == f"1.{40 + i}.0"
+            assert len(content["changelog"]) == 3
+
+    def test_rollback_batch_restores_state_before_batch(
+        self, tmp_knowledge_dir, sample_knowledge_file, sample_update_source
+    ):
+        """Test rollback of a batch with several updates to one file."""
+        engine = UpdateEngine(tmp_knowledge_dir)
+        original = sample_knowledge_file.read_text()
+        updates = [
+            self._versioned_update(sample_update_source, "test-patterns.json", v)
+            for v in ("1.1.0", "1.2.0")
+        ]
+
+        batch_result = engine.apply_batch(updates)
+
+        assert engine.rollback_batch(batch_result.batch_id) is True
+        assert sample_knowledge_file.read_text() == original
+
 
 class TestUpdateEngineRollback:
     """Tests for rollback functionality."""